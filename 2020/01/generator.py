@@ -0,0 +1,41 @@
+"""
+Expense reports: distinct positive numbers with exactly one pair and one triple summing to 2020.
+
+All other numbers are above 1010, so no two or three of them sum to 2020. Larger scales add more of
+them, spread over a range wide enough to keep them distinct.
+"""
+import itertools
+import random
+
+from aoc.generators import scaled
+
+TARGET = 2020
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    while True:
+        pair_small = rng.randint(100, TARGET // 2 - 1)
+        triple = rng.sample(range(100, 700), 2)
+        triple.append(TARGET - sum(triple))
+        planted = [pair_small, TARGET - pair_small, *triple]
+        pairs = sum(a + b == TARGET for a, b in itertools.combinations(planted, 2))
+        triples = sum(a + b + c == TARGET for a, b, c in itertools.combinations(planted, 3))
+        if len(set(planted)) == len(planted) and pairs == 1 and triples == 1:
+            break
+
+    # Numbers that would complete another pair or triple together with the planted numbers.
+    excluded = set(planted)
+    excluded.update(TARGET - a for a in planted)
+    excluded.update(TARGET - a - b for a, b in itertools.combinations(planted, 2))
+
+    count = scaled(199, scale) - len(planted)
+    low = TARGET // 2 + 1
+    high = low + max(1000, 4 * count)
+    fillers = []
+    while len(fillers) < count:
+        fillers.extend(n for n in rng.sample(range(low, high), count - len(fillers)) if n not in excluded)
+        fillers = list(dict.fromkeys(fillers))
+
+    numbers = planted + fillers
+    rng.shuffle(numbers)
+    return "\n".join(map(str, numbers)) + "\n"
@@ -1,5 +1,8 @@
 from typing import Optional, Tuple, Set
 
+# Expected growth of the phases with the input size (see `aoc.scaling`): `sum_of_k` is `O(n^(k-1))`.
+SCALING_BUDGET = {"parse": 1, "part1": 1, "part2": 2}
+
 
 def sum_of_k(numbers: Set[int], d: int, k: int) -> Optional[Tuple[int]]:
     """
@@ -26,13 +29,25 @@ def sum_of_k(numbers: Set[int], d: int, k: int) -> Optional[Tuple[int]]:
             return n_comp + (n,)
 
 
+def parse(text: str) -> Set[int]:
+    return {int(l) for l in text.splitlines()}
+
+
+def part1(numbers: Set[int]) -> int:
+    n1, n2 = sum_of_k(numbers, 2020, 2)
+    return n1 * n2
+
+
+def part2(numbers: Set[int]) -> int:
+    n1, n2, n3 = sum_of_k(numbers, 2020, 3)
+    return n1 * n2 * n3
+
+
 if __name__ == "__main__":
-    numbers = {int(l) for l in open("2020/01/input.txt", "r").readlines()}
+    numbers = parse(open("2020/01/input.txt", "r").read())
 
     # Part 1
-    n1, n2 = sum_of_k(numbers, 2020, 2)
-    print(f"Part 1: N1 = {n1}, N2 = {n2}, product = {n1 * n2}")
+    print(f"Part 1: product = {part1(numbers)}")
 
     # Part 2
-    n1, n2, n3 = sum_of_k(numbers, 2020, 3)
-    print(f"Part 2: N1 = {n1}, N2 = {n2}, N3 = {n3} product = {n1 * n2 * n3}")
+    print(f"Part 2: product = {part2(numbers)}")
@@ -0,0 +1,22 @@
+"""
+Password database: one `<min>-<max> <letter>: <password>` policy and password per line.
+"""
+import random
+import string
+
+from aoc.generators import scaled
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        low = rng.randint(1, 15)
+        high = rng.randint(low + 1, low + 8)
+        letter = rng.choice(string.ascii_lowercase)
+        length = rng.randint(high, high + 6)
+
+        # Real passwords tend to repeat the policy letter around the policy limits.
+        password = [letter if rng.random() < 0.45 else rng.choice(string.ascii_lowercase) for _ in range(length)]
+        lines.append(f"{low}-{high} {letter}: {''.join(password)}")
+
+    return "\n".join(lines) + "\n"
@@ -1,6 +1,7 @@
 from collections import Counter
 from dataclasses import dataclass
 from re import match
+from typing import List
 
 
 @dataclass
@@ -40,19 +41,31 @@ def parse_input_line(line: str, password_policy_class):
     return password_policy_class(int(groups[0]), int(groups[1]), groups[2]), groups[3]
 
 
+def count_valid_passwords(lines: List[str], password_policy_class) -> int:
+    pp_pairs = [parse_input_line(l, password_policy_class) for l in lines]
+    validity = [policy.verify_policy(password) for policy, password in pp_pairs]
+    return Counter(validity)[True]
+
+
+def parse(text: str) -> List[str]:
+    return text.splitlines()
+
+
+def part1(lines: List[str]) -> int:
+    return count_valid_passwords(lines, PasswordPolicy1)
+
+
+def part2(lines: List[str]) -> int:
+    return count_valid_passwords(lines, PasswordPolicy2)
+
+
 if __name__ == "__main__":
-    lines = open("2020/02/input.txt").readlines()
+    lines = parse(open("2020/02/input.txt").read())
 
     # Part 1
-    pp_pairs = [parse_input_line(l, PasswordPolicy1) for l in lines]
-    validity = [policy.verify_policy(password) for policy, password in pp_pairs]
-    valid_count = Counter(validity)[True]
     print("Password policy 1")
-    print(f"Total passwords: {len(pp_pairs)}, Valid passwords: {valid_count}")
+    print(f"Total passwords: {len(lines)}, Valid passwords: {part1(lines)}")
 
     # Part 2
-    pp_pairs = [parse_input_line(l, PasswordPolicy2) for l in lines]
-    validity = [policy.verify_policy(password) for policy, password in pp_pairs]
-    valid_count = Counter(validity)[True]
     print("Password policy 2")
-    print(f"Total passwords: {len(pp_pairs)}, Valid passwords: {valid_count}")
+    print(f"Total passwords: {len(lines)}, Valid passwords: {part2(lines)}")
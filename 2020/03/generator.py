@@ -0,0 +1,14 @@
+"""
+Toboggan map: a 31 columns wide pattern of open squares and trees, repeating to the right. Larger
+scales add rows.
+"""
+import random
+
+from aoc.generators import scaled
+
+WIDTH = 31
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    rows = ("".join("#" if rng.random() < 0.23 else "." for _ in range(WIDTH)) for _ in range(scaled(323, scale)))
+    return "\n".join(rows) + "\n"
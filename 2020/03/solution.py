@@ -1,7 +1,10 @@
 from functools import reduce
-from typing import List, Optional, Tuple
+from typing import Tuple
+
+import numpy as np
+
+from aoc.grid import Grid
 
-SEGMENT_WIDTH = 31
 MAP_TREE_MARK = "#"
 SLOPES = [
     (1, 1),
@@ -12,31 +15,34 @@ SLOPES = [
 ]
 
 
-def count_slope_trees(road_map: List[str], slope: Tuple[int, int]) -> int:
+def count_slope_trees(road_map: Grid, slope: Tuple[int, int]) -> int:
     """
     Slides down the road, starting at position `(0, 0)` in `road_map` and moving forward in steps
-    as defined by `slope` until reaching the bottom of the. On the way down the function counts
-    the number of trees encountered and return it.
+    as defined by `slope` until reaching the bottom of the map. The map repeats itself to the right.
+    Returns the number of trees encountered on the way down.
     """
-    trees = 0
+    rows = np.arange(0, road_map.height, slope[1])
+    cols = (np.arange(len(rows)) * slope[0]) % road_map.width
+    return int((road_map.cells[rows, cols] == ord(MAP_TREE_MARK)).sum())
+
+
+def parse(text: str) -> Grid:
+    return Grid.from_text(text, pad=0)
+
+
+def part1(road_map: Grid) -> int:
+    return count_slope_trees(road_map, SLOPES[1])
+
 
-    try:
-        cur_pos = (0, 0)
-        while True:
-            x, y = cur_pos[0] % SEGMENT_WIDTH, cur_pos[1]
-            trees += int(road_map[y][x] == MAP_TREE_MARK)
-            cur_pos = (cur_pos[0] + slope[0], cur_pos[1] + slope[1])
-    except IndexError:
-        return trees
+def part2(road_map: Grid) -> int:
+    return reduce(lambda a, b: a * b, map(lambda slope: count_slope_trees(road_map, slope), SLOPES))
 
 
 if __name__ == "__main__":
-    lines = open("2020/03/input.txt", "r").readlines()
+    road_map = parse(open("2020/03/input.txt", "r").read())
 
     # Part 1
-    trees_encountered = count_slope_trees(lines, SLOPES[1])
-    print(f"Trees encountered using slope {SLOPES[1]}: {trees_encountered}")
+    print(f"Trees encountered using slope {SLOPES[1]}: {part1(road_map)}")
 
     # Part 2
-    product = reduce(lambda a, b: a * b, map(lambda slope: count_slope_trees(lines, slope), SLOPES))
-    print(f"Product of trees encountered in each slope: {product}")
+    print(f"Product of trees encountered in each slope: {part2(road_map)}")
@@ -0,0 +1,66 @@
+"""
+Passport batch: blank-line separated passports of `key:value` fields, spread over a few lines in
+random order. Some passports miss required fields and some hold invalid values.
+"""
+import random
+
+from aoc.generators import scaled
+
+EYE_COLORS = ("amb", "blu", "brn", "gry", "grn", "hzl", "oth")
+
+
+def valid_field(rng: random.Random, key: str) -> str:
+    if key == "byr":
+        return str(rng.randint(1920, 2002))
+    elif key == "iyr":
+        return str(rng.randint(2010, 2020))
+    elif key == "eyr":
+        return str(rng.randint(2020, 2030))
+    elif key == "hgt":
+        return f"{rng.randint(150, 193)}cm" if rng.random() < 0.6 else f"{rng.randint(59, 76)}in"
+    elif key == "hcl":
+        return f"#{rng.getrandbits(24):06x}"
+    elif key == "ecl":
+        return rng.choice(EYE_COLORS)
+    elif key == "pid":
+        return f"{rng.randrange(10**9):09d}"
+    return str(rng.randint(50, 350))
+
+
+def invalid_field(rng: random.Random, key: str) -> str:
+    if key in ("byr", "iyr", "eyr"):
+        return str(rng.choice([rng.randint(1900, 2040), rng.randint(10, 99)]))
+    elif key == "hgt":
+        return rng.choice([str(rng.randint(59, 193)), f"{rng.randint(100, 200)}in", f"{rng.randint(40, 80)}cm"])
+    elif key == "hcl":
+        return rng.choice([f"{rng.getrandbits(24):06x}", f"#{rng.getrandbits(16):04x}", "z"])
+    elif key == "ecl":
+        return rng.choice(["utc", "xry", "zzz", "gmt", "#2ae1b1"])
+    elif key == "pid":
+        return str(rng.randrange(10**10))
+    return valid_field(rng, key)
+
+
+def generate_passport(rng: random.Random) -> str:
+    keys = ["byr", "iyr", "eyr", "hgt", "hcl", "ecl", "pid", "cid"]
+    if rng.random() < 0.3:
+        keys.remove(rng.choice(keys))
+    invalid = rng.random() < 0.3
+
+    fields = [f"{k}:{invalid_field(rng, k) if invalid and rng.random() < 0.3 else valid_field(rng, k)}" for k in keys]
+    rng.shuffle(fields)
+
+    lines, line = [], []
+    for field in fields:
+        line.append(field)
+        if rng.random() < 0.3:
+            lines.append(" ".join(line))
+            line = []
+    if line:
+        lines.append(" ".join(line))
+
+    return "\n".join(lines)
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    return "\n\n".join(generate_passport(rng) for _ in range(scaled(290, scale))) + "\n"
@@ -1,5 +1,5 @@
 from re import match
-from typing import Dict
+from typing import Dict, List
 
 
 def verify_birth_year(birth_year: str) -> bool:
@@ -71,13 +71,23 @@ def verify_passport_and_fields(passport: Dict[str, str]) -> bool:
         return False
 
 
+def parse(text: str) -> List[Dict[str, str]]:
+    return [create_passport(p) for p in text.split("\n\n")]
+
+
+def part1(passports: List[Dict[str, str]]) -> int:
+    return len(list(filter(verify_passport, passports)))
+
+
+def part2(passports: List[Dict[str, str]]) -> int:
+    return len(list(filter(verify_passport_and_fields, passports)))
+
+
 if __name__ == "__main__":
-    passports = [create_passport(p) for p in open("2020/04/input.txt", "r").read().split("\n\n")]
+    passports = parse(open("2020/04/input.txt", "r").read())
 
     # Part 1
-    valid_passports = filter(verify_passport, passports)
-    print(f"Valid passports: {len(list(valid_passports))}")
+    print(f"Valid passports: {part1(passports)}")
 
     # Part 2
-    valid_passports = filter(verify_passport_and_fields, passports)
-    print(f"Valid passports: {len(list(valid_passports))}")
+    print(f"Valid passports: {part2(passports)}")
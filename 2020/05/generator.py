@@ -0,0 +1,31 @@
+"""
+Boarding passes: binary space partitioning codes (`F`/`B` for rows, `L`/`R` for columns) of a full
+flight of consecutive seat IDs but one.
+
+Real passes have 7 row letters and 3 column letters, for 1024 seats. Larger scales need more seats
+so their passes have more row letters.
+"""
+import random
+
+from aoc.generators import scaled
+
+COLUMN_BITS = 3
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    count = scaled(844, scale)
+    row_bits = max(7, (count * 5 // 4).bit_length() - COLUMN_BITS)
+    seat_count = 2 ** (row_bits + COLUMN_BITS)
+
+    first = rng.randint(1, seat_count - count - 2)
+    seat_ids = list(range(first, first + count + 1))
+    del seat_ids[rng.randint(1, count - 1)]
+    rng.shuffle(seat_ids)
+
+    def to_boarding_pass(seat_id: int) -> str:
+        row, column = divmod(seat_id, 2**COLUMN_BITS)
+        row_code = f"{row:0{row_bits}b}".translate(str.maketrans("01", "FB"))
+        column_code = f"{column:0{COLUMN_BITS}b}".translate(str.maketrans("01", "LR"))
+        return row_code + column_code
+
+    return "\n".join(map(to_boarding_pass, seat_ids)) + "\n"
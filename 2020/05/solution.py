@@ -10,11 +10,23 @@ def find_hole_in_list(numbers: list) -> int:
     return int(expected_sum - sum(numbers))
 
 
+def parse(text: str) -> list:
+    return [boarding_pass_to_seat_id(l) for l in text.splitlines()]
+
+
+def part1(seat_ids: list) -> int:
+    return max(seat_ids)
+
+
+def part2(seat_ids: list) -> int:
+    return find_hole_in_list(seat_ids)
+
+
 if __name__ == "__main__":
-    seat_ids = [boarding_pass_to_seat_id(l) for l in open("2020/05/input.txt", "r").readlines()]
+    seat_ids = parse(open("2020/05/input.txt", "r").read())
 
     # Part 1
-    print(f"Highest taken seat ID {max(seat_ids)}")
+    print(f"Highest taken seat ID {part1(seat_ids)}")
 
     # Part 2
-    print(f"Your seat ID is: {find_hole_in_list(seat_ids)}")
+    print(f"Your seat ID is: {part2(seat_ids)}")
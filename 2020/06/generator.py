@@ -0,0 +1,25 @@
+"""
+Customs declarations: blank-line separated groups with the questions (`a` to `z`) every person of
+the group answered "yes" to, one person per line.
+"""
+import random
+import string
+
+from aoc.generators import scaled
+
+
+def generate_group(rng: random.Random) -> str:
+    # People of a group tend to share answers, so draw theirs mostly from a common pool.
+    common = rng.sample(string.ascii_lowercase, rng.randint(1, 20))
+    people = []
+    for _ in range(rng.choice([1, 1, 2, 3, 4, 5])):
+        answers = {q for q in common if rng.random() < 0.8} | set(rng.sample(string.ascii_lowercase, rng.randint(0, 3)))
+        if not answers:
+            answers = {rng.choice(common)}
+        people.append("".join(rng.sample(sorted(answers), len(answers))))
+
+    return "\n".join(people)
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    return "\n\n".join(generate_group(rng) for _ in range(scaled(490, scale))) + "\n"
@@ -1,5 +1,5 @@
 from functools import reduce
-from typing import Callable
+from typing import Callable, List
 
 
 def _get_group_answers_counter(group_answers: str, reducer: Callable) -> int:
@@ -15,13 +15,23 @@ def get_group_answers_counter_intersection(group_answers: str) -> int:
     return _get_group_answers_counter(group_answers, lambda g, a: g.intersection(a))
 
 
+def parse(text: str) -> List[str]:
+    return text.strip().split("\n\n")
+
+
+def part1(grouped_answers: List[str]) -> int:
+    return sum(map(get_group_answers_counter_union, grouped_answers))
+
+
+def part2(grouped_answers: List[str]) -> int:
+    return sum(map(get_group_answers_counter_intersection, grouped_answers))
+
+
 if __name__ == "__main__":
-    grouped_answers = open("2020/06/input.txt", "r").read().split("\n\n")
+    grouped_answers = parse(open("2020/06/input.txt", "r").read())
 
     # Part 1
-    part1_counters_sum = sum(map(get_group_answers_counter_union, grouped_answers))
-    print(f"Part 1 counters sum: {part1_counters_sum}")
+    print(f"Part 1 counters sum: {part1(grouped_answers)}")
 
     # Part 2
-    part2_counters_sum = sum(map(get_group_answers_counter_intersection, grouped_answers))
-    print(f"Part 2 counters sum: {part2_counters_sum}")
+    print(f"Part 2 counters sum: {part2(grouped_answers)}")
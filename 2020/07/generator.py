@@ -0,0 +1,58 @@
+"""
+Luggage rules: for every bag color (`<adjective> <color>`), the bags it must contain. Bags only
+contain bags that come later in a random order of the colors, so the rules never form a cycle, and
+`shiny gold` is placed around the middle of that order.
+
+Real inputs have 594 colors made of 18 adjectives and 33 colors. Larger scales add made up
+adjectives.
+"""
+import itertools
+import random
+from typing import Iterator
+
+from aoc.generators import scaled
+
+ADJECTIVES = (
+    "bright clear dark dim dotted drab dull faded light mirrored muted pale plaid posh shiny striped vibrant wavy"
+).split()
+COLORS = (
+    "aqua beige black blue bronze brown chartreuse coral crimson cyan fuchsia gold gray green indigo lavender lime"
+    " magenta maroon olive orange plum purple red salmon silver tan teal tomato turquoise violet white yellow"
+).split()
+SYLLABLES = [c + v for c in "bdfgklmnprstvz" for v in "aeiou"]
+
+LEAF_COUNT = 10
+
+
+def made_up_adjectives() -> Iterator[str]:
+    for length in itertools.count(2):
+        for syllables in itertools.product(SYLLABLES, repeat=length):
+            yield "".join(syllables)
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    count = scaled(len(ADJECTIVES) * len(COLORS), scale)
+    adjectives = itertools.chain(ADJECTIVES, made_up_adjectives())
+    bags = [f"{a} {c}" for a in itertools.islice(adjectives, -(-count // len(COLORS))) for c in COLORS][:count]
+    if "shiny gold" not in bags:
+        bags[-1] = "shiny gold"
+
+    rng.shuffle(bags)
+    gold = bags.index("shiny gold")
+    middle = rng.randint(len(bags) * 2 // 5, len(bags) * 3 // 5)
+    bags[gold], bags[middle] = bags[middle], bags[gold]
+
+    rules = []
+    for i, bag in enumerate(bags):
+        later = len(bags) - i - 1
+        if later < LEAF_COUNT:
+            rules.append(f"{bag} bags contain no other bags.")
+            continue
+
+        contained = [bags[i + 1 + j] for j in rng.sample(range(later), min(later, rng.randint(1, 4)))]
+        counts = [rng.randint(1, 5) for _ in contained]
+        contents = ", ".join(f"{n} {c} {'bag' if n == 1 else 'bags'}" for n, c in zip(counts, contained))
+        rules.append(f"{bag} bags contain {contents}.")
+
+    rng.shuffle(rules)
+    return "\n".join(rules) + "\n"
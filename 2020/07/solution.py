@@ -1,19 +1,35 @@
 from dataclasses import dataclass, field
-from regex import match
+from functools import cache
 from typing import Dict, Iterable, Optional, Set
 
+from aoc.graph import Digraph, NodeIndex, reachable, topological_sort
+from aoc.lazy import lazy_import
+
+regex = lazy_import("regex")
+
+# Expected growth of the phases with the input size (see `aoc.scaling`): building the graph is
+# `O(V*E)`, the searches are `O(V+E)`.
+SCALING_BUDGET = {"parse": 2, "part1": 1, "part2": 1}
+
+
+@cache
+def bag_patterns():
+    """
+    Returns the patterns of rules of empty bags and of non-empty bags, compiled on first use.
+    """
+    return (
+        regex.compile(r"^(\w+ \w+) bags contain no other bags\.$"),
+        regex.compile(r"^(\w+ \w+) bags contain ((\d+) (\w+ \w+) bags?, )*((\d+) (\w+ \w+) bags?\.)$"),
+    )
+
 
 @dataclass
 class Node:
     # Key of this node.
     color_name: str
 
-    # Directed edges of from this node to other nodes.
-    # There are 2 relations that connects a node to another:
-    # 1. Contains relation - Colors contained by this node. These edges are weighted.
-    # 2. Contained by relation - Colors that contain this node.
+    # Colors contained by this node along with the number of bags of each of them.
     contained_colors: Optional[Dict[str, int]] = None
-    contained_by_colors: Set[str] = field(default_factory=set)
 
     @property
     def total_contained_bags(self):
@@ -24,16 +40,14 @@ class Node:
 
     @staticmethod
     def from_rule_str(rule_str: str) -> "Node":
-        EMPTY_BAG_PATTERN = "^(\w+ \w+) bags contain no other bags\.$"
-        NON_EMPTY_BAG_PATTERN = "^(\w+ \w+) bags contain ((\d+) (\w+ \w+) bags?, )*((\d+) (\w+ \w+) bags?\.)$"
-
         # Assuming either one this would match.
-        m = match(EMPTY_BAG_PATTERN, rule_str) or match(NON_EMPTY_BAG_PATTERN, rule_str)
+        empty_bag_pattern, non_empty_bag_pattern = bag_patterns()
+        m = empty_bag_pattern.match(rule_str) or non_empty_bag_pattern.match(rule_str)
 
         groups = m.groups()
         color_name = groups[0]
         contained_colors = None
-        if m.re.pattern == NON_EMPTY_BAG_PATTERN:
+        if m.re is non_empty_bag_pattern:
             contained_colors = {color: int(count) for color, count in zip(m.captures(4), m.captures(3))}
             contained_colors[groups[6]] = int(groups[5])
 
@@ -44,51 +58,47 @@ class Node:
 class Graph:
     """
     A directed graph representing bag colors containment rules. Each node in the graph represents
-    a bag-color and it has 2 sets of directed edges connecting it to other bag-colors (nodes).
-        1. Contained colors - Set of outgoing edges connecting the node to bag-colors that are
-           contained by the bag-color the node represents. These edges are weighted, the edge weight
-           represents the number of bags of the specified color contained by the node's bag color.
-        2. Contained by colors - Set of incoming edges connecting the nodes to bag-colors that
-           contain at least one bag of the color the node represents.
+    a bag-color and its outgoing edges connect it to the bag-colors it contains. The edges are
+    weighted, the edge weight represents the number of bags of the specified color contained by the
+    node's bag color. `contained_by` is the same graph with its edges reversed.
     """
 
     nodes: Dict[str, Node] = field(default_factory=dict)
 
     def __post_init__(self):
-        self._update_contained_by_relations()
-
-    def _update_contained_by_relations(self):
-        for color, node in self.nodes.items():
-            if node.contained_colors:
-                for contained_color in node.contained_colors:
-                    self.nodes[contained_color].contained_by_colors.add(color)
+        self.colors = NodeIndex(self.nodes)
+        self.containment = Digraph.from_edges(
+            len(self.colors),
+            (
+                (self.colors[color], self.colors[contained_color], count)
+                for color, node in self.nodes.items()
+                for contained_color, count in (node.contained_colors or {}).items()
+            ),
+        )
+        self.contained_by = self.containment.reversed()
 
     def get_colors_containing_color(self, color: str) -> Set[str]:
         """
         Find all bag-colors that contain, directly or indirectly, a bag of the given `color`.
-        Assuming no circles in the graph the run-time complexity is O(V*E)
+        Run-time complexity is O(V+E).
         """
-        node = self.nodes[color]
-        containing_colors = set(node.contained_by_colors)
-        for color in node.contained_by_colors:
-            containing_colors.update(self.get_colors_containing_color(color))
-
-        return containing_colors
+        node = self.colors[color]
+        return {self.colors.labels[n] for n in reachable(self.contained_by, [node]) if n != node}
 
     def get_total_bag_count_for_color(self, color: str) -> int:
         """
         Count the number of bags that are, directly or indirectly, contained in a bag of the given
         `color`.
-        """
-        node = self.nodes[color]
-        if not node.contained_colors:
-            return 0
 
-        total_bags_required = node.total_contained_bags
-        for color, count in node.contained_colors.items():
-            total_bags_required += self.get_total_bag_count_for_color(color) * count
+        The colors contained in the bag are visited in reverse topological order, so the bags inside
+        every color are counted before the colors containing it.
+        """
+        node = self.colors[color]
+        bags_inside: Dict[int, int] = {}
+        for n in reversed(topological_sort(self.containment, reachable(self.containment, [node]))):
+            bags_inside[n] = sum(count * (1 + bags_inside[c]) for c, count in self.containment.edges(n))
 
-        return total_bags_required
+        return bags_inside[node]
 
     @staticmethod
     def from_rules(rules: Iterable[str]) -> "Graph":
@@ -99,13 +109,23 @@ class Graph:
         return Graph({node.color_name: node for node in nodes})
 
 
+def parse(text: str) -> Graph:
+    return Graph.from_rules(text.splitlines())
+
+
+def part1(graph: Graph) -> int:
+    return len(graph.get_colors_containing_color("shiny gold"))
+
+
+def part2(graph: Graph) -> int:
+    return graph.get_total_bag_count_for_color("shiny gold")
+
+
 if __name__ == "__main__":
-    graph = Graph.from_rules(open("2020/07/input.txt", "r").readlines())
+    graph = parse(open("2020/07/input.txt", "r").read())
 
     # Part 1
-    containing_colors = graph.get_colors_containing_color("shiny gold")
-    print(f"Number of bag-colors that contain at least one shiny gold bag: {len(containing_colors)}")
+    print(f"Number of bag-colors that contain at least one shiny gold bag: {part1(graph)}")
 
     # Part 2
-    total_bags_required = graph.get_total_bag_count_for_color("shiny gold")
-    print(f"Individual bags required inside a single shiny gold bag: {total_bags_required}")
+    print(f"Individual bags required inside a single shiny gold bag: {part2(graph)}")
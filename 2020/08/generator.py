@@ -0,0 +1,54 @@
+"""
+Boot code: a program of `acc`, `jmp` and `nop` instructions that loops forever, unless its one
+corrupted instruction (a `jmp` back to an earlier instruction that should have been a `nop`) is
+fixed, in which case it runs off its end.
+
+The program is built along the path the fixed program executes, jumping forward over instructions
+it never executes. Those jump back onto the path, as in real inputs.
+"""
+import random
+
+from aoc.generators import scaled
+
+
+def random_operand(rng: random.Random) -> int:
+    return rng.randint(-50, 50) or 1
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    size = scaled(640, scale)
+    program: list = [None] * size
+    path = []
+    ip = 0
+    while ip < size:
+        path.append(ip)
+        kind = rng.random()
+        if kind < 0.45:
+            program[ip] = ("acc", random_operand(rng))
+            ip += 1
+        elif kind < 0.6:
+            program[ip] = ("nop", random_operand(rng))
+            ip += 1
+        else:
+            offset = rng.randint(1, min(size - ip, 20))
+            program[ip] = ("jmp", offset)
+            ip += offset
+
+    # Corrupt a late instruction of the path that falls through to the next one into a jump back to
+    # an earlier one.
+    falls_through = [i for i in path if program[i][0] != "jmp"] or [path[-1]]
+    corrupted = rng.choice(falls_through[len(falls_through) * 3 // 4 :])
+    target = rng.choice(path[: path.index(corrupted) + 1])
+    program[corrupted] = ("jmp", target - corrupted)
+
+    for i, instruction in enumerate(program):
+        if instruction is None:
+            kind = rng.random()
+            if kind < 0.4:
+                program[i] = ("acc", random_operand(rng))
+            elif kind < 0.55:
+                program[i] = ("nop", random_operand(rng))
+            else:
+                program[i] = ("jmp", rng.choice(path[: max(1, len(path) // 2)]) - i or 1)
+
+    return "\n".join(f"{operation} {operand:+d}" for operation, operand in program) + "\n"
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
+
+from aoc import counters
 
 #####################################
 ## Models
@@ -82,6 +84,7 @@ def execute_program(
         return (trap_gate and trap_gate(instruction, context)) or execute_instruction(instruction, context)
 
     context = initial_context
+    executed = 0
     while True:
         instruction = program[context.ip]
         try:
@@ -89,9 +92,11 @@ def execute_program(
         except StopIteration:
             break
 
+        executed += 1
         if context.ip >= len(program):
             break
 
+    counters.add("instructions_executed", executed)
     return context
 
 
@@ -162,15 +167,38 @@ def get_patched_instruction(instruction: Instruction) -> Instruction:
 ######################################
 ## Solution
 
-if __name__ == "__main__":
-    program = [Instruction.from_str(line) for line in open("2020/08/input.txt", "r").readlines()]
 
-    # Part 1
-    loop_offsets = []
+def find_loop(program: List[Instruction]) -> Tuple[ExecutionContext, List[int]]:
+    """
+    Executes `program` until an instruction is about to be executed for the second time.
+
+    Returns the execution context at that point along with the offsets of all executed instructions.
+    """
+    loop_offsets: List[int] = []
     loop_break_trap = get_loop_breaking_trap(loop_offsets)
     context = execute_program(program, ExecutionContext(), trap_gate=loop_break_trap)
-    print(f"Loop identified at address {context.ip}, Accumulator={context.acc}")
+    return context, loop_offsets
+
+
+def parse(text: str) -> List[Instruction]:
+    return [Instruction.from_str(line) for line in text.splitlines()]
+
+
+def part1(program: List[Instruction]) -> int:
+    context, _ = find_loop(program)
+    return context.acc
+
+
+def part2(program: List[Instruction]) -> int:
+    _, loop_offsets = find_loop(program)
+    return patch_loop_and_execute_program(program, loop_offsets).acc
+
+
+if __name__ == "__main__":
+    program = parse(open("2020/08/input.txt", "r").read())
+
+    # Part 1
+    print(f"Accumulator when loop identified: {part1(program)}")
 
     # Part  2
-    context = patch_loop_and_execute_program(program, loop_offsets)
-    print(f"Program finished successfully at address {context.ip}, Accumulator={context.acc}")
+    print(f"Accumulator when program finished successfully: {part2(program)}")
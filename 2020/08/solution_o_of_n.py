@@ -46,19 +46,26 @@ class Program:
             self._fill_termination_value_for_instruction(i)
 
     def _fill_termination_value_for_instruction(self, instruction_index: int):
-        if self._instruction_termination_value[instruction_index] != -1:
-            return
-
-        next_instruction_index = self.next_instruction_index(instruction_index)
-        if next_instruction_index >= len(self.instructions):
-            self._instruction_termination_value[instruction_index] = 1
-            return
-
-        self._instruction_termination_value[instruction_index] = 0
-        self._fill_termination_value_for_instruction(next_instruction_index)
-        self._instruction_termination_value[instruction_index] = (
-            2 if self._instruction_termination_value[next_instruction_index] > 0 else 0
-        )
+        """
+        Follows the execution from `instruction_index` until reaching an instruction whose value is
+        already known (or being filled, i.e. a loop) or the last instruction, and then fills the
+        value of every instruction followed on the way.
+        """
+        path = []
+        i = instruction_index
+        while self._instruction_termination_value[i] == -1:
+            next_instruction_index = self.next_instruction_index(i)
+            if next_instruction_index >= len(self.instructions):
+                self._instruction_termination_value[i] = 1
+                break
+
+            self._instruction_termination_value[i] = 0
+            path.append(i)
+            i = next_instruction_index
+
+        terminates = self._instruction_termination_value[i] > 0
+        for i in path:
+            self._instruction_termination_value[i] = 2 if terminates else 0
 
     def next_instruction_index(self, instruction_index: int):
         return instruction_index + self.instructions[instruction_index].instruction_pointer_effect
@@ -180,13 +187,23 @@ def get_patched_instruction(instruction: Instruction) -> Instruction:
     )
 
 
+def parse(text: str) -> Program:
+    return Program([Instruction.from_str(line) for line in text.splitlines()])
+
+
+def part1(program: Program) -> int:
+    return execute_program(program, ExecutionContext(), get_loop_breaking_trap()).acc
+
+
+def part2(program: Program) -> int:
+    return execute_program(program, ExecutionContext(), get_instruction_patching_trap(program)).acc
+
+
 if __name__ == "__main__":
-    program = Program([Instruction.from_str(line) for line in open("2020/08/input.txt", "r").readlines()])
+    program = parse(open("2020/08/input.txt", "r").read())
 
     # Part 1
-    context = execute_program(program, ExecutionContext(), get_loop_breaking_trap())
-    print(f"Loop identified at address {context.ip}, Accumulator={context.acc}")
+    print(f"Accumulator when loop identified: {part1(program)}")
 
     # Part 2
-    context = execute_program(program, ExecutionContext(), get_instruction_patching_trap(program))
-    print(f"Program finished successfully at address {context.ip}, Accumulator={context.acc}")
+    print(f"Accumulator when program finished successfully: {part2(program)}")
@@ -0,0 +1,40 @@
+"""
+XMAS data: after a preamble of 25 numbers, every number is the sum of two different numbers among
+the 25 before it, up to the last number which isn't. A run of contiguous numbers earlier in the
+list sums to that invalid number.
+
+Every valid number is at least twice the smallest of the 25 numbers before it, so the numbers grow
+exponentially along the list (real inputs reach 10^14 at about their 1000th number). To keep inputs
+within reason the list is capped at 30,000 numbers (a few hundred digits each), which is reached at
+a scale of 30.
+"""
+import itertools
+import random
+
+from aoc.generators import scaled
+
+PREAMBLE_LEN = 25
+MAX_COUNT = 30_000
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    count = min(scaled(1000, scale), MAX_COUNT)
+    numbers = rng.sample(range(1, 51), PREAMBLE_LEN)
+    while len(numbers) < count:
+        window = numbers[-PREAMBLE_LEN:]
+        # Favour the smaller numbers of the window to keep the growth close to that of real inputs.
+        a, b = rng.sample(sorted(window)[: PREAMBLE_LEN * 2 // 3], 2)
+        if a + b not in window:
+            numbers.append(a + b)
+
+    window = numbers[-PREAMBLE_LEN:]
+    sums = {a + b for a, b in itertools.combinations(window, 2)}
+    while True:
+        run_length = rng.randint(3, 17)
+        run_start = rng.randint(len(numbers) * 3 // 4, len(numbers) - PREAMBLE_LEN - run_length)
+        invalid = sum(numbers[run_start : run_start + run_length])
+        if invalid not in sums:
+            break
+
+    numbers.append(invalid)
+    return "\n".join(map(str, numbers)) + "\n"
@@ -2,6 +2,9 @@ from typing import List, Optional, Set, Tuple
 
 PREAMBLE_LEN = 25
 
+# Expected growth of the phases with the input size (see `aoc.scaling`).
+SCALING_BUDGET = {"parse": 1, "part1": 1, "part2": 1}
+
 
 def sum_of_k(numbers: Set[int], d: int, k: int) -> Optional[Tuple[int]]:
     """
@@ -76,16 +79,25 @@ def find_seq_with_sum(numbers: List[int], target_sum: int) -> Optional[Tuple[int
             seq_sum = numbers[seq_start]
 
 
+def parse(text: str) -> List[int]:
+    return [int(line) for line in text.splitlines()]
+
+
+def part1(numbers: List[int]) -> int:
+    return numbers[find_xmas_break(numbers, PREAMBLE_LEN)]
+
+
+def part2(numbers: List[int]) -> int:
+    seq_range = find_seq_with_sum(numbers, part1(numbers))
+    seq = numbers[seq_range[0] : seq_range[1] + 1]
+    return min(seq) + max(seq)
+
+
 if __name__ == "__main__":
-    numbers = [int(line) for line in open("2020/09/input.txt", "r").readlines()]
+    numbers = parse(open("2020/09/input.txt", "r").read())
 
     # Part 1
-    xmas_break_index = find_xmas_break(numbers, PREAMBLE_LEN)
-    xmas_break_value = numbers[xmas_break_index]
-    print(f"XMAS is broken at index {xmas_break_index}, {xmas_break_value}")
+    print(f"XMAS is broken at value {part1(numbers)}")
 
     # Part 2
-    seq_range = find_seq_with_sum(numbers, xmas_break_value)
-    seq = numbers[seq_range[0] : seq_range[1] + 1]
-    xmas_weakness = min(seq) + max(seq)
-    print(f"XMAS encryption weakness value is: {xmas_weakness}")
+    print(f"XMAS encryption weakness value is: {part2(numbers)}")
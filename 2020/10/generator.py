@@ -0,0 +1,22 @@
+"""
+Joltage adapters: distinct ratings whose sorted chain (from the outlet's 0) only has differences
+of 1 and 3, with runs of 1 differences of up to 4 adapters, as in real inputs.
+"""
+import random
+
+from aoc.generators import scaled
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    count = scaled(90, scale)
+    adapters = []
+    rating = 0
+    while len(adapters) < count:
+        rating += 3
+        for _ in range(min(rng.choice([1, 1, 2, 3, 4, 4, 5]), count - len(adapters))):
+            adapters.append(rating)
+            rating += 1
+        rating -= 1
+
+    rng.shuffle(adapters)
+    return "\n".join(map(str, adapters)) + "\n"
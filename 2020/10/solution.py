@@ -1,12 +1,20 @@
 from collections import Counter
-from typing import Dict, Tuple, Iterable
+from typing import Tuple
 
 
-adapters = sorted([int(l[:-1]) for l in open("2020/10/input.txt").readlines()])
-adapters = [0] + adapters + [adapters[-1] + 3]
-diffs = [adapters[i + 1] - adapters[i] for i in range(len(adapters) - 1)]
-diffs_counter = Counter(diffs)
-print("Part 1 solution: ", diffs_counter[1] * diffs_counter[3])
+def parse(text: str) -> Tuple[int]:
+    """
+    Returns the sorted chain of all adapters, including the charging outlet (0) and the device's
+    built-in adapter (3 higher than the highest adapter).
+    """
+    adapters = sorted([int(l) for l in text.splitlines()])
+    return tuple([0] + adapters + [adapters[-1] + 3])
+
+
+def part1(adapters: Tuple[int]) -> int:
+    diffs = [adapters[i + 1] - adapters[i] for i in range(len(adapters) - 1)]
+    diffs_counter = Counter(diffs)
+    return diffs_counter[1] * diffs_counter[3]
 
 
 # In order to calculate all possible arrangements we will have to identify an "optional" adapter in
@@ -19,44 +27,34 @@ print("Part 1 solution: ", diffs_counter[1] * diffs_counter[3])
 # {0, 1, 4, 7}.
 # This split will be required for every optional adapter we find. This is basically means we have an
 # exponential runtime complexity with the number of optional adapters as the exponent.
-# One way to improve performance is to use dynamic programming approach - break down the problem to
-# smaller similar problems and use a cache to store results of values that we calculate over and
-# over again. To do this we examine the adapters one by one, if we identify an optional adapter we
-# will split the calculation and count the possible sets with and without this adapter by considering
-# only adapters left.
+# Instead, we count the arrangements bottom-up (dynamic programming): an arrangement reaching an
+# adapter continues an arrangement reaching one of the (at most 3) lower adapters that can connect
+# to it, so the number of arrangements reaching every adapter is the sum of those of these lower
+# adapters. This takes a single pass over the adapters, with no recursion.
 #
-# For example given this adapter-set {0, 1, 2, 4, 5, 8} the call tree will look like this:
-# 0, 1, 2, 4, 5, 8 -> 5
-#   1, 2, 4, 5, 8 -> 3
-#     2, 4, 5, 8 -> 2
-#       4, 5, 8 -> 1
-#         5, 8 -> 1
-#       2, 5, 8 -> 1
-#         5, 8 -> 1
-#     1, 4, 5, 8 -> 1
-#       4, 5, 8 -> 1
-#         5, 8 -> 1
-#   0, 2, 4, 5, 8 -> 2
-#     2, 4, 5, 8 -> 2
-#       4, 5, 8 -> 1
-#         5, 8 -> 1
-#       2, 5, 8 -> 1
-#         5, 8 -> 1
-def count_arrangements(adapters: Tuple[int], cache: Dict[Tuple[int], int] = {}):
-    if adapters in cache:
-        return cache[adapters]
-
-    if len(adapters) < 3:
-        return 1
-
-    res = count_arrangements(adapters[1:], cache)
-
-    is_optional = (adapters[2] - adapters[0]) <= 3
-    if is_optional:
-        res += count_arrangements((adapters[0],) + adapters[2:], cache)
-
-    cache[adapters] = res
-    return res
-
-
-print("Part 2 solution (fast): ", count_arrangements(tuple(adapters)))
+# For example given this adapter-set {0, 1, 2, 4, 5, 8} the arrangements reaching every adapter are:
+# 0 -> 1
+# 1 -> 1 (from 0)
+# 2 -> 2 (from 0 or 1)
+# 4 -> 3 (from 1 or 2)
+# 5 -> 5 (from 2 or 4)
+# 8 -> 5 (from 5)
+def count_arrangements(adapters: Tuple[int]) -> int:
+    arrangements = [1] + [0] * (len(adapters) - 1)
+    for i in range(1, len(adapters)):
+        j = i - 1
+        while j >= 0 and adapters[i] - adapters[j] <= 3:
+            arrangements[i] += arrangements[j]
+            j -= 1
+
+    return arrangements[-1]
+
+
+def part2(adapters: Tuple[int]) -> int:
+    return count_arrangements(adapters)
+
+
+if __name__ == "__main__":
+    adapters = parse(open("2020/10/input.txt").read())
+    print("Part 1 solution: ", part1(adapters))
+    print("Part 2 solution (fast): ", part2(adapters))
@@ -0,0 +1,29 @@
+"""
+Seat layout: a grid of empty seats (`L`) and floor (`.`). As in real inputs, blocks of seats are
+separated by aisle rows and columns. Larger scales grow both sides of the grid.
+
+Unlike in real inputs, the aisles are all floor and there is no floor within the blocks. Seating
+doesn't always settle on random layouts, it may end up flipping back and forth forever. With all
+floor aisles every block settles on its own when seats only look at their adjacent seats (which was
+checked for all block sizes), and seats that look further settled on all layouts tried.
+"""
+import random
+
+from aoc.generators import scaled_side
+
+
+def aisles(rng: random.Random, length: int, min_block: int, max_block: int) -> list[bool]:
+    """
+    Returns whether each of `length` rows (or columns) is an aisle.
+    """
+    is_aisle = []
+    while len(is_aisle) < length:
+        is_aisle += [False] * rng.randint(min_block, max_block) + [True]
+    return is_aisle[:length]
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    height, width = scaled_side(98, scale), scaled_side(91, scale)
+    aisle_columns = "".join("." if a else "L" for a in aisles(rng, width, 5, 8))
+    rows = ["." * width if aisle else aisle_columns for aisle in aisles(rng, height, 4, 7)]
+    return "\n".join(rows) + "\n"
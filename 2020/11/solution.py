@@ -1,160 +1,96 @@
-from typing import Dict, Iterable, List, Optional, Tuple
-
-SeatingMap = List[List[str]]
-Position = Tuple[int, int]
-Offset = Tuple[int, int]
-
-Neighboring = Iterable[Offset]
-Nearest8Neighboring = (
-    [-1, 0],
-    [-1, 1],
-    [0, 1],
-    [1, 1],
-    [1, 0],
-    [1, -1],
-    [0, -1],
-    [-1, -1],
-)
-
-EMPTY_SEAT = "L"
-OCCUPIED_SEAT = "#"
-FLOOR = "."
-
-
-def get_neighbors(
-    seating_area: SeatingMap,
-    seat_position: Position,
-    neighbors_offsets: Neighboring = Nearest8Neighboring,
-) -> Dict[Position, str]:
-    res: Dict[Position, str] = {}
-    for o in neighbors_offsets:
-        neighbor_pos = seat_position[0] + o[0], seat_position[1] + o[1]
-        if (
-            neighbor_pos[0] < 0
-            or neighbor_pos[0] >= len(seating_area)
-            or neighbor_pos[1] < 0
-            or neighbor_pos[1] >= len(seating_area[0])
-        ):
-            continue
-
-        res[neighbor_pos] = seating_area[neighbor_pos[0]][neighbor_pos[1]]
-
-    return res
+from typing import Callable
 
+import numpy as np
 
-def apply_offset(seating_area: SeatingMap, pos: Position, offset: Offset) -> Optional[Position]:
-    pos_with_offset = pos[0] + offset[0], pos[1] + offset[1]
-    if (
-        pos_with_offset[0] < 0
-        or pos_with_offset[0] >= len(seating_area)
-        or pos_with_offset[1] < 0
-        or pos_with_offset[1] >= len(seating_area[0])
-    ):
-        return None
-    return pos_with_offset
+from aoc.grid import ADJACENT_OFFSETS, Grid
 
+SeatingMap = Grid
 
-def get_neighbors2(
-    seating_area: SeatingMap,
-    seat_position: Position,
-    neighbors_offsets: Neighboring = Nearest8Neighboring,
-) -> Dict[Position, str]:
-    res: Dict[Position, str] = {}
-    for o in neighbors_offsets:
-        neighbor_pos = apply_offset(seating_area, seat_position, o)
-        if neighbor_pos is None:
-            continue
+EMPTY_SEAT = "L"
+OCCUPIED_SEAT = "#"
+FLOOR = "."
+SEATS = EMPTY_SEAT + OCCUPIED_SEAT
 
-        neighbor_state = seating_area[neighbor_pos[0]][neighbor_pos[1]]
-        while neighbor_state == FLOOR:
-            neighbor_pos = apply_offset(seating_area, neighbor_pos, o)
-            if neighbor_pos is None:
-                break
-            neighbor_state = seating_area[neighbor_pos[0]][neighbor_pos[1]]
 
-        if neighbor_pos == FLOOR:
-            continue
+def get_neighbors(seating_area: SeatingMap, seats: np.ndarray) -> np.ndarray:
+    """
+    Returns the flat indexes of the 8 cells adjacent to each of the `seats`.
+    """
+    return seating_area.neighbour_table(seats, ADJACENT_OFFSETS)
 
-        res[neighbor_pos] = neighbor_state
 
-    return res
+def get_neighbors2(seating_area: SeatingMap, seats: np.ndarray) -> np.ndarray:
+    """
+    Returns the flat indexes of the first seat seen in each of the 8 directions from each of the
+    `seats`, or of the padding cell past the edge of the map if there is no seat in that direction.
+    """
+    return seating_area.sight_table(seats, SEATS, ADJACENT_OFFSETS)
 
 
-def should_flip_seat(seating_area: SeatingMap, pos: Position) -> bool:
-    pos_state = seating_area[pos[0]][pos[1]]
-    if pos_state == FLOOR:
-        return False
+# A function returning, for each seat, the flat indexes of the cells that affect it, see
+# `get_neighbors` and `get_neighbors2`.
+NeighborsGetter = Callable[[SeatingMap, np.ndarray], np.ndarray]
 
-    neighbors = get_neighbors2(seating_area, pos)
-    occupied_neighbors = len(list(filter(lambda v: v == OCCUPIED_SEAT, neighbors.values())))
-    if pos_state == EMPTY_SEAT and occupied_neighbors == 0:
-        return True
-    elif pos_state == OCCUPIED_SEAT and occupied_neighbors >= 5:
-        return True
 
-    return False
+def print_seating_area(seating_area: SeatingMap):
+    print(seating_area.to_text())
+    print("\n\n")
 
 
-def get_seats_to_flip(seating_area: SeatingMap) -> List[Position]:
-    seats_to_flip = []
-    for r in range(len(seating_area)):
-        row = seating_area[r]
-        for c in range(len(row)):
-            if should_flip_seat(seating_area, (r, c)):
-                seats_to_flip.append((r, c))
+def flip_seats_till_equilibrium(
+    seating_area: SeatingMap, neighbors_getter: NeighborsGetter, occupied_threshold: int
+) -> int:
+    """
+    Flips seats in `seating_area` (in-place) round after round until no seat changes its state.
+    An empty seat with no occupied neighbors gets occupied and an occupied seat with at least
+    `occupied_threshold` occupied neighbors gets empty, all seats flip at once.
 
-    return seats_to_flip
+    Returns the number of rounds it took to reach equilibrium.
+    """
+    seats = seating_area.indexes(SEATS)
+    neighbors = neighbors_getter(seating_area, seats)
 
+    # Occupancy of every cell of the padded map, floor and padding are never occupied.
+    occupied = seating_area.flat == ord(OCCUPIED_SEAT)
+    rounds = 0
+    while True:
+        occupied_neighbors = occupied[neighbors].sum(axis=1)
+        seats_occupied = occupied[seats]
+        next_seats_occupied = np.where(seats_occupied, occupied_neighbors < occupied_threshold, occupied_neighbors == 0)
+        if np.array_equal(seats_occupied, next_seats_occupied):
+            break
+        occupied[seats] = next_seats_occupied
+        rounds += 1
 
-def flip_seat(seating_area: SeatingMap, pos: Position):
-    cur_state = seating_area[pos[0]][pos[1]]
-    if cur_state == EMPTY_SEAT:
-        seating_area[pos[0]][pos[1]] = OCCUPIED_SEAT
-    elif cur_state == OCCUPIED_SEAT:
-        seating_area[pos[0]][pos[1]] = EMPTY_SEAT
-    else:
-        raise ValueError(f"Unexpected seat state '{cur_state}' at position {pos}")
+    seating_area.flat[seats] = np.where(occupied[seats], ord(OCCUPIED_SEAT), ord(EMPTY_SEAT))
+    return rounds
 
 
-def flip_seats(seating_area: SeatingMap, seats: List[Position]):
-    for p in seats:
-        flip_seat(seating_area, p)
+def count_occupied_seats_at_equilibrium(
+    seating_area: SeatingMap, neighbors_getter: NeighborsGetter, occupied_threshold: int
+) -> int:
+    seating_area = seating_area.copy()
+    flip_seats_till_equilibrium(seating_area, neighbors_getter, occupied_threshold)
+    return seating_area.count(OCCUPIED_SEAT)
 
 
-def get_seats_with_state(seating_area: SeatingMap, state: str) -> List[Position]:
-    matching_seats = []
-    for r in range(len(seating_area)):
-        row = seating_area[r]
-        for c in range(len(row)):
-            seat = seating_area[r][c]
-            if seat == state:
-                matching_seats.append((r, c))
-
-    return matching_seats
+def parse(text: str) -> SeatingMap:
+    return Grid.from_text(text)
 
 
-def print_seating_area(seating_area: SeatingMap):
-    for r in range(len(seating_area)):
-        row = "".join(seating_area[r])
-        print(row)
-    print("\n\n")
+def part1(seating_area: SeatingMap) -> int:
+    return count_occupied_seats_at_equilibrium(seating_area, get_neighbors, 4)
 
 
-seating_area = [list(l.strip()) for l in open("2020/11/input.txt").readlines()]
+def part2(seating_area: SeatingMap) -> int:
+    return count_occupied_seats_at_equilibrium(seating_area, get_neighbors2, 5)
 
-print("Initial seat map")
-print_seating_area(seating_area)
 
-rounds = 0
-while True:
-    seats_to_flip = get_seats_to_flip(seating_area)
-    if len(seats_to_flip) == 0:
-        break
-    flip_seats(seating_area, seats_to_flip)
-    rounds += 1
-    print(f"{rounds} flip rounds done")
+if __name__ == "__main__":
+    seating_area = parse(open("2020/11/input.txt").read())
 
+    print("Initial seat map")
+    print_seating_area(seating_area)
 
-occupied_seats = get_seats_with_state(seating_area, OCCUPIED_SEAT)
-print(f"Reached equilibrium after {rounds} rounds")
-print(f"Total occupied seats: {len(occupied_seats)}")
+    print(f"Part 1: Total occupied seats: {part1(seating_area)}")
+    print(f"Part 2: Total occupied seats: {part2(seating_area)}")
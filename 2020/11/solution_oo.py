@@ -163,19 +163,17 @@ class SeatingAreaLifecycleAlgorithm:
     ) -> int:
         rounds = 0
         while True:
-            print(".", end="", flush=True)
             seats_to_flip = self.get_seats_to_flip(seating_area)
             if len(seats_to_flip) == 0:
                 break
             elif rounds >= max_rounds:
                 raise ValueError(f"Equilibrium was not reached within {max_rounds} rounds")
 
-            seat_flipping_algo.flip_seats(seating_area, seats_to_flip)
+            self.flip_seats(seating_area, seats_to_flip)
             rounds += 1
             if print_board:
                 print_seating_area(seating_area)
 
-        print("\n")
         return rounds
 
 
@@ -198,28 +196,32 @@ def print_seating_area(seating_area: SeatingMap):
     print("\n\n")
 
 
-g_seating_area = [list(l.strip()) for l in open("2020/11/input.txt").readlines()]
+def count_occupied_seats_at_equilibrium(seating_area: SeatingMap, seat_flipping_rules: SeatFlippingRules) -> int:
+    # Seats are flipped in place, so the parsed seating area is left untouched for the other part.
+    seating_area = [row.copy() for row in seating_area]
+    SeatingAreaLifecycleAlgorithm(seat_flipping_rules).flip_seats_till_equilibrium(seating_area)
+    return len(get_seats_with_state(seating_area, OCCUPIED_SEAT))
+
+
+def parse(text: str) -> SeatingMap:
+    return [list(l) for l in text.splitlines()]
 
-print("Initial seat map")
-print_seating_area(g_seating_area)
 
 ### Part 1
-print("Part 1: Trying to reach equilibrium with simple neighboring rules")
-seat_flipping_algo = SeatingAreaLifecycleAlgorithm(
-    VisibilityThresholdBasedSeatFlippingRules(0, 4, StaticOffsetNeighborsVisibility())
-)
-rounds = seat_flipping_algo.flip_seats_till_equilibrium(g_seating_area)
-occupied_seats = get_seats_with_state(g_seating_area, OCCUPIED_SEAT)
-print(f"Reached equilibrium after {rounds} rounds")
-print(f"Total occupied seats: {len(occupied_seats)}")
+def part1(seating_area: SeatingMap) -> int:
+    return count_occupied_seats_at_equilibrium(
+        seating_area, VisibilityThresholdBasedSeatFlippingRules(0, 4, StaticOffsetNeighborsVisibility())
+    )
+
 
 ### Part 2
-print("Part 2: Trying to reach equilibrium with complex occlusion based visibility rules")
-g_seating_area = [list(l.strip()) for l in open("2020/11/input.txt").readlines()]
-seat_flipping_algo = SeatingAreaLifecycleAlgorithm(
-    VisibilityThresholdBasedSeatFlippingRules(0, 5, OcclusionBasedVisibility())
-)
-rounds = seat_flipping_algo.flip_seats_till_equilibrium(g_seating_area)
-occupied_seats = get_seats_with_state(g_seating_area, OCCUPIED_SEAT)
-print(f"Reached equilibrium after {rounds} rounds")
-print(f"Total occupied seats: {len(occupied_seats)}")
+def part2(seating_area: SeatingMap) -> int:
+    return count_occupied_seats_at_equilibrium(
+        seating_area, VisibilityThresholdBasedSeatFlippingRules(0, 5, OcclusionBasedVisibility())
+    )
+
+
+if __name__ == "__main__":
+    seating_area = parse(open("2020/11/input.txt").read())
+    print(f"Total occupied seats with simple neighboring rules: {part1(seating_area)}")
+    print(f"Total occupied seats with occlusion based visibility rules: {part2(seating_area)}")
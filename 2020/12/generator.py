@@ -0,0 +1,19 @@
+"""
+Navigation instructions: moves in a compass direction (`N`, `S`, `E`, `W`) or forward (`F`), and
+turns (`L`, `R`) by multiples of 90 degrees.
+"""
+import random
+
+from aoc.generators import scaled
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    lines = []
+    for _ in range(scaled(770, scale)):
+        action = rng.choice("NSEWFFLR")
+        if action in "LR":
+            lines.append(f"{action}{rng.choice([90, 90, 90, 180, 270])}")
+        else:
+            lines.append(f"{action}{rng.randint(1, 100 if action == 'F' else 5)}")
+
+    return "\n".join(lines) + "\n"
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from enum import Enum
-from typing import Tuple
+from typing import List, Tuple
 
 Offset = Tuple[int, int]
 Direction = int
@@ -156,31 +156,32 @@ class FerryWithWayPoint:
             self._ferry_position = self._ferry_position + self._waypoint_offset
 
 
-instructions = [Instruction(l[:1], int(l[1:].strip())) for l in open("2020/12/input.txt").readlines()]
-
-initial_pos = Point(0, 0)
-ferry = Ferry(initial_pos, EAST)
-trajectory = [initial_pos]
-cur_pos = initial_pos
-for i in instructions:
-    ferry.apply_instruction(i)
-    trajectory.append(ferry.position)
-
-final_pos = trajectory[-1]
-md = initial_pos.manhattan_distance_from(final_pos)
-print(f"Manhattan distance after all instructions: {md}")
-
-### Part 2
-initial_pos = Point()
-waypoint_offset = (10, 1)
-ferry = FerryWithWayPoint(initial_pos, waypoint_offset)
-trajectory = [initial_pos]
-cur_pos = initial_pos
-for i in instructions:
-    ferry.apply_instruction(i)
-    trajectory.append(ferry.position)
-
-final_pos = trajectory[-1]
-md = initial_pos.manhattan_distance_from(final_pos)
-# print(f"Ferry trajectory: {trajectory}")
-print(f"Manhattan distance after all instructions: {md}")
+def parse(text: str) -> List[Instruction]:
+    return [Instruction(l[:1], int(l[1:].strip())) for l in text.splitlines()]
+
+
+def part1(instructions: List[Instruction]) -> int:
+    initial_pos = Point(0, 0)
+    ferry = Ferry(initial_pos, EAST)
+    for i in instructions:
+        ferry.apply_instruction(i)
+
+    return initial_pos.manhattan_distance_from(ferry.position)
+
+
+def part2(instructions: List[Instruction]) -> int:
+    initial_pos = Point()
+    waypoint_offset = (10, 1)
+    ferry = FerryWithWayPoint(initial_pos, waypoint_offset)
+    for i in instructions:
+        ferry.apply_instruction(i)
+
+    return initial_pos.manhattan_distance_from(ferry.position)
+
+
+if __name__ == "__main__":
+    instructions = parse(open("2020/12/input.txt").read())
+    print(f"Manhattan distance after all instructions: {part1(instructions)}")
+
+    ### Part 2
+    print(f"Manhattan distance after all instructions: {part2(instructions)}")
@@ -0,0 +1,21 @@
+"""
+Bus notes: the earliest departure time, then the schedule of buses with out of service ones marked
+`x`. Bus IDs are distinct primes, so they are pairwise coprime, as the Chinese remainder theorem
+used by part 2 requires. The first bus of the schedule is always in service.
+
+Real schedules have 9 buses among about 90 entries. Larger scales add buses, and more entries.
+"""
+import random
+
+from aoc.generators import primes, scaled
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    count = scaled(9, scale)
+    buses = rng.sample(primes(count * 3, 13), count)
+    entries = ["x"] * (count * 10)
+    positions = [0] + rng.sample(range(1, len(entries)), count - 1)
+    for position, bus in zip(positions, buses):
+        entries[position] = str(bus)
+
+    return f"{rng.randint(10**5, 10**7)}\n{','.join(entries)}\n"
@@ -1,35 +1,57 @@
-from sympy.ntheory.modular import crt
-
-
-with open("2020/13/input.txt") as f:
-    arrival_time = int(f.readline())
-    buses = [int(b) if b != "x" else -1 for b in f.readline().split(",")]
-
-print(f"Estimated arrival time to the bus station: {arrival_time}")
-
-earliest_possible_departure_time = -1
-bus_id = 0
-cur_time = arrival_time
-while earliest_possible_departure_time == -1:
-    for b in buses:
-        if b == -1:
-            continue
-        if cur_time % b == 0:
-            earliest_possible_departure_time = cur_time
-            bus_id = b
-            break
-    cur_time += 1
-
-wait_time = earliest_possible_departure_time - arrival_time
-score = wait_time * bus_id
-print(
-    f"Earliest possible departure at {earliest_possible_departure_time} (waiting for {wait_time} min.) on bus {bus_id}, score: {score}"
-)
-
-### Part 2:
-# requires sympy package for Chinese Remainder Theorem implementation.
-n = list(filter(lambda b: b != -1, buses))
-b = list(map(lambda ni: (ni - buses.index(ni)) % ni, n))
-
-golden_time = crt(n, b)[0]
-print(f"Golden time is {golden_time}")
+from typing import List, Tuple
+
+from aoc.lazy import lazy_import
+
+# Importing sympy takes longer than solving both parts, and only part 2 uses it.
+modular = lazy_import("sympy.ntheory.modular")
+
+# Buses that are out of service are marked with an 'x' in the schedule.
+OUT_OF_SERVICE = -1
+
+Schedule = Tuple[int, List[int]]
+
+
+def parse(text: str) -> Schedule:
+    lines = text.splitlines()
+    arrival_time = int(lines[0])
+    buses = [int(b) if b != "x" else OUT_OF_SERVICE for b in lines[1].split(",")]
+    return arrival_time, buses
+
+
+def find_earliest_departure(arrival_time: int, buses: List[int]) -> Tuple[int, int]:
+    """
+    Returns the earliest time, at or after `arrival_time`, at which some bus departs, along with the
+    id of that bus.
+    """
+    cur_time = arrival_time
+    while True:
+        for b in buses:
+            if b == OUT_OF_SERVICE:
+                continue
+            if cur_time % b == 0:
+                return cur_time, b
+        cur_time += 1
+
+
+def part1(schedule: Schedule) -> int:
+    arrival_time, buses = schedule
+    earliest_possible_departure_time, bus_id = find_earliest_departure(arrival_time, buses)
+    wait_time = earliest_possible_departure_time - arrival_time
+    return wait_time * bus_id
+
+
+def part2(schedule: Schedule) -> int:
+    # requires sympy package for Chinese Remainder Theorem implementation.
+    _, buses = schedule
+    n = list(filter(lambda b: b != OUT_OF_SERVICE, buses))
+    b = list(map(lambda ni: (ni - buses.index(ni)) % ni, n))
+    return int(modular.crt(n, b)[0])
+
+
+if __name__ == "__main__":
+    schedule = parse(open("2020/13/input.txt").read())
+    print(f"Estimated arrival time to the bus station: {schedule[0]}")
+    print(f"Earliest possible departure score: {part1(schedule)}")
+
+    ### Part 2:
+    print(f"Golden time is {part2(schedule)}")
@@ -0,0 +1,16 @@
+"""
+Memory game: a few distinct starting numbers.
+
+The game itself is as long for any input (30,000,000 turns for part 2), so larger scales only add
+starting numbers, up to the 2020 turns of part 1.
+"""
+import random
+
+from aoc.generators import scaled
+
+PART1_TURNS = 2020
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    count = min(scaled(6, scale), PART1_TURNS)
+    return ",".join(map(str, rng.sample(range(max(20, 3 * count)), count))) + "\n"
@@ -24,14 +24,24 @@ def memory_game(init_sequence, t):
     return cur
 
 
+def parse(text: str) -> list:
+    return [int(i) for i in text.split(",")]
+
+
+def part1(numbers: list) -> int:
+    return memory_game(numbers, 2020)
+
+
+def part2(numbers: list) -> int:
+    return memory_game(numbers, 30_000_000)
+
+
 if __name__ == "__main__":
-    numbers = [int(i) for i in open("2020/15/input.txt", "r").read().split(",")]
+    numbers = parse(open("2020/15/input.txt", "r").read())
     print(f"Initial sequence: {numbers}")
 
     # Part 1
-    n = memory_game(numbers, 2020)
-    print(f"2020th number is: {n}")
+    print(f"2020th number is: {part1(numbers)}")
 
     # Part 2
-    n = memory_game(numbers, 30_000_000)
-    print(f"30000000th number is: {n}")
+    print(f"30000000th number is: {part2(numbers)}")
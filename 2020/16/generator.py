@@ -0,0 +1,59 @@
+"""
+Ticket notes: 20 fields valid in two ranges each, your ticket and the nearby tickets, about a
+quarter of them holding a value no field allows.
+
+Every field's ranges are separated by a gap of its own. Columns hold values in the gaps of some
+fields, ruling them out, such that (as in real inputs) the `k`th field in a random order fits
+exactly `20 - k` columns and the fields can be matched to columns by elimination.
+"""
+import random
+
+from aoc.generators import scaled
+
+FIELDS = (
+    "departure location, departure station, departure platform, departure track, departure date,"
+    " departure time, arrival location, arrival station, arrival platform, arrival track, class,"
+    " duration, price, route, row, seat, train, type, wagon, zone"
+).split(", ")
+
+MIN_VALUE, MAX_VALUE = 50, 945
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    count = len(FIELDS)
+    gap_starts = sorted(rng.sample(range(100, 880, 39), count))
+    gaps = [range(start, start + rng.randint(5, 25)) for start in gap_starts]
+    rng.shuffle(gaps)
+
+    fields = rng.sample(FIELDS, count)
+    columns = rng.sample(range(count), count)
+    rules = {}
+    for field, gap in zip(fields, gaps):
+        rules[field] = (rng.randint(25, MIN_VALUE - 1), gap.start - 1, gap.stop, rng.randint(MAX_VALUE + 5, 974))
+
+    # Field `k` fits column `columns[j]` for every `j >= k`: that column avoids the gaps of fields
+    # 0 to `j` and holds a value in the gap of every later field.
+    allowed = [sorted(set(range(MIN_VALUE, MAX_VALUE + 1)).difference(*gaps[: j + 1])) for j in range(count)]
+    ticket_count = max(scaled(240, scale), 2 * count)
+    valid_count = ticket_count * 3 // 4
+    tickets = [[0] * count for _ in range(valid_count + 1)]
+    for j, column in enumerate(columns):
+        for ticket in tickets:
+            ticket[column] = rng.choice(allowed[j])
+        for k, row in zip(range(j + 1, count), rng.sample(range(1, len(tickets)), count - j - 1)):
+            tickets[row][column] = rng.choice(gaps[k])
+
+    your_ticket, nearby = tickets[0], tickets[1:]
+    for _ in range(ticket_count - valid_count):
+        ticket = list(rng.choice(nearby))
+        ticket[rng.randrange(count)] = rng.choice([rng.randint(0, 24), rng.randint(975, 999)])
+        nearby.append(ticket)
+    rng.shuffle(nearby)
+
+    lines = [
+        f"{field}: {a}-{b} or {c}-{d}"
+        for field, (a, b, c, d) in sorted(rules.items(), key=lambda r: FIELDS.index(r[0]))
+    ]
+    lines += ["", "your ticket:", ",".join(map(str, your_ticket)), "", "nearby tickets:"]
+    lines += [",".join(map(str, t)) for t in nearby]
+    return "\n".join(lines) + "\n"
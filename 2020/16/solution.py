@@ -1,54 +1,41 @@
 from dataclasses import dataclass
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Tuple
 
-#############################
-## Models
+import numpy as np
 
+from aoc.intervals import IntervalSet
 
-@dataclass
-class Range:
-    min_value: int
-    max_value: int
-
-    def is_value_in_range(self, value) -> bool:
-        return self.min_value <= value <= self.max_value
-
-    @classmethod
-    def from_str(cls, range_str: str) -> "Range":
-        min_value, max_value = range_str.split("-")
-        return cls(int(min_value), int(max_value))
-
-
-@dataclass
-class RangeSet:
-    ranges: List[Range]
+#############################
+## Models
 
-    def is_value_in_range_set(self, value):
-        return any([r.is_value_in_range(value) for r in self.ranges])
 
-    @classmethod
-    def from_str(cls, range_set_str: str) -> "RangeSet":
-        return cls([Range.from_str(r) for r in range_set_str.split(" or ")])
+def range_set_from_str(range_set_str: str) -> IntervalSet:
+    """
+    Parses inclusive ranges such as `1-3 or 5-7`.
+    """
+    ranges = [tuple(int(v) for v in r.split("-")) for r in range_set_str.split(" or ")]
+    return IntervalSet.from_intervals((min_value, max_value + 1) for min_value, max_value in ranges)
 
 
 @dataclass
 class Rule:
     field_name: str
-    valid_ranges: RangeSet
+    valid_ranges: IntervalSet
 
     def is_valid_value(self, value: int) -> bool:
-        return self.valid_ranges.is_value_in_range_set(value)
+        return value in self.valid_ranges
 
     def are_all_values_valid(self, values: Iterable[int]) -> bool:
-        return all([self.is_valid_value(v) for v in values])
+        return bool(self.valid_ranges.contains(np.asarray(values)).all())
 
     @classmethod
     def from_str(cls, rule_str: str) -> "Rule":
         name, ranges = rule_str.split(": ")
-        return cls(name, RangeSet.from_str(ranges))
+        return cls(name, range_set_from_str(ranges))
 
 
 Ticket = Iterable[int]
+Notes = Tuple[List[Rule], Ticket, List[Ticket]]
 
 #############################
 ## Logic
@@ -62,17 +49,20 @@ def parse_tickets(raw_tickets: Iterable[str]) -> List[Ticket]:
     return [[int(v) for v in t.split(",")] for t in raw_tickets]
 
 
-def is_valid_value(rules: Iterable[Rule], value: int) -> bool:
-    return any([r.is_valid_value(value) for r in rules])
+def valid_values(rules: Iterable[Rule]) -> IntervalSet:
+    """
+    Returns the values that are valid according to at least one of the `rules`.
+    """
+    return IntervalSet.union_all(r.valid_ranges for r in rules)
 
 
-def ticket_invalid_values(rules: Iterable[Rule], ticket: Ticket) -> List[int]:
+def ticket_invalid_values(valid: IntervalSet, ticket: Ticket) -> List[int]:
     """
-    Returns a list of all values in the given `ticket` that are not valid according to any of the
-    given set  of `rules`. If every value in `ticket` is valid according to at least one rule then
-    an empty list is returned.
+    Returns a list of all values in the given `ticket` that are not in the set of `valid` values
+    (see `valid_values`). If every value in `ticket` is valid then an empty list is returned.
     """
-    return list(filter(lambda v: not is_valid_value(rules, v), ticket))
+    values = np.asarray(ticket)
+    return values[~valid.contains(values)].tolist()
 
 
 def _get_matching_columns_per_field(rules: Iterable[Rule], columns: List[int]) -> Dict[str, List[int]]:
@@ -131,23 +121,38 @@ def ticket_departure_product(ticket: Ticket, field_to_col: Dict[str, int]) -> in
     departure_fields_product = 1
     for f, c in field_to_col.items():
         if f.startswith("departure"):
-            departure_fields_product *= my_ticket[c]
+            departure_fields_product *= ticket[c]
     return departure_fields_product
 
 
-if __name__ == "__main__":
-    sections = open("2020/16/input.txt", "r").read().split("\n\n")
+def parse(text: str) -> Notes:
+    sections = text.strip().split("\n\n")
     rules = parse_rules(raw_rules=sections[0].split("\n"))
     my_ticket = parse_tickets(sections[1].split("\n")[1:])[0]
     nearby_tickets = parse_tickets(sections[2].split("\n")[1:])
+    return rules, my_ticket, nearby_tickets
+
+
+def part1(notes: Notes) -> int:
+    rules, _, nearby_tickets = notes
+    valid = valid_values(rules)
+    invalid_values = [ticket_invalid_values(valid, t) for t in nearby_tickets]
+    return sum([sum(iv) for iv in invalid_values])
+
+
+def part2(notes: Notes) -> int:
+    rules, my_ticket, nearby_tickets = notes
+    valid = valid_values(rules)
+    valid_tickets = [t for t in nearby_tickets if not ticket_invalid_values(valid, t)]
+    field_to_col = identify_tickets_fields(rules, valid_tickets)
+    return ticket_departure_product(my_ticket, field_to_col)
+
+
+if __name__ == "__main__":
+    notes = parse(open("2020/16/input.txt", "r").read())
 
     # Part 1
-    invalid_values = [ticket_invalid_values(rules, t) for t in nearby_tickets]
-    invalid_values_sum = sum([sum(iv) for iv in invalid_values])
-    print(f"Sum of invalid values: {invalid_values_sum}")
+    print(f"Sum of invalid values: {part1(notes)}")
 
     # Part 2
-    valid_tickets = [nearby_tickets[i] for i in range(len(nearby_tickets)) if not invalid_values[i]]
-    field_to_col = identify_tickets_fields(rules, valid_tickets)
-    departure_fields_product = ticket_departure_product(my_ticket, field_to_col)
-    print(departure_fields_product)
+    print(f"Departure fields product: {part2(notes)}")
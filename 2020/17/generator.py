@@ -0,0 +1,13 @@
+"""
+Conway Cubes: the initial active (`#`) and inactive (`.`) cubes of a single plane, about half of
+them active. Larger scales grow both sides of the plane.
+"""
+import random
+
+from aoc.generators import scaled_side
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    side = scaled_side(8, scale)
+    rows = ("".join("#" if rng.random() < 0.5 else "." for _ in range(side)) for _ in range(side))
+    return "\n".join(rows) + "\n"
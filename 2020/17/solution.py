@@ -1,20 +1,20 @@
-from functools import cache
 from itertools import product
+from operator import add
 from typing import Dict, List, Tuple
 
 ACTIVE = "#"
 INACTIVE = "."
 
-# A multi-dimensional array of neighboring offsets.
-NEIGHBORING_OFFSETS: Dict[int, Tuple[Tuple[int]]] = {i: tuple(product([-1, 0, 1], repeat=i)) for i in range(3, 5)}
+# The offsets of the neighbors of a point, by dimension.
+NEIGHBORING_OFFSETS: Dict[int, Tuple[Tuple[int]]] = {
+    i: tuple(o for o in product([-1, 0, 1], repeat=i) if any(o)) for i in range(3, 5)
+}
 
 
-@cache
+# Not memoized: computing the neighbors of a point is faster than looking them up in a memo large
+# enough for the points of the 4D part 2, which would hold hundreds of MiB.
 def get_neighbors(point: tuple) -> set:
-    dim = len(point)
-    z = (0,) * dim
-    neighbors = {tuple(sum(i) for i in zip(point, no)) for no in NEIGHBORING_OFFSETS[dim] if no != z}
-    return neighbors
+    return {tuple(map(add, point, offset)) for offset in NEIGHBORING_OFFSETS[len(point)]}
 
 
 PocketSpace = Dict[Tuple[int], str]
@@ -93,16 +93,28 @@ def simulate_multiple_cycles(pocket_space: PocketSpace, count: int) -> PocketSpa
     return pocket_space
 
 
+def count_active_cubes_after_boot(lines: List[str], dimension: int) -> int:
+    pocket_space = init_pocket_space(lines, dimension)
+    pocket_space = simulate_multiple_cycles(pocket_space, 6)
+    return len(list(filter(lambda c: pocket_space[c] == ACTIVE, pocket_space)))
+
+
+def parse(text: str) -> List[str]:
+    return text.splitlines()
+
+
+def part1(lines: List[str]) -> int:
+    return count_active_cubes_after_boot(lines, 3)
+
+
+def part2(lines: List[str]) -> int:
+    return count_active_cubes_after_boot(lines, 4)
+
+
 if __name__ == "__main__":
-    lines = open("2020/17/input.txt", "r").readlines()
+    lines = parse(open("2020/17/input.txt", "r").read())
 
     # Part 1
-    pocket_space = init_pocket_space(lines, 3)
-    pocket_space = simulate_multiple_cycles(pocket_space, 6)
-    active_cubes = list(filter(lambda c: pocket_space[c] == ACTIVE, pocket_space))
-    print(f"Active cubes after 6 cycles: {len(active_cubes)}")
+    print(f"Active cubes after 6 cycles: {part1(lines)}")
 
-    pocket_space = init_pocket_space(lines, 4)
-    pocket_space = simulate_multiple_cycles(pocket_space, 6)
-    active_cubes = list(filter(lambda c: pocket_space[c] == ACTIVE, pocket_space))
-    print(f"Active cubes after 6 cycles: {len(active_cubes)}")
+    print(f"Active cubes after 6 cycles: {part2(lines)}")
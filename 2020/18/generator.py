@@ -0,0 +1,27 @@
+"""
+Homework: one expression per line, of single digit numbers, additions, multiplications and
+parentheses nested up to 3 levels deep.
+"""
+import random
+
+from aoc.generators import scaled
+
+MAX_DEPTH = 3
+
+
+def generate_expression(rng: random.Random, depth: int = 0) -> str:
+    terms = []
+    for _ in range(rng.randint(2, 5 if depth == 0 else 4)):
+        if depth < MAX_DEPTH and rng.random() < 0.3:
+            terms.append(f"({generate_expression(rng, depth + 1)})")
+        else:
+            terms.append(str(rng.randint(2, 9)))
+
+    expression = terms[0]
+    for term in terms[1:]:
+        expression += f" {rng.choice('+*')} {term}"
+    return expression
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    return "\n".join(generate_expression(rng) for _ in range(scaled(370, scale))) + "\n"
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import List, Tuple
 
 
 def apply_operator(lv, rv, operator) -> float:
@@ -72,14 +72,24 @@ def modify_expression(exp_str: str, start: int = 0) -> Tuple[str, int]:
     return exp, (ptr - start)
 
 
+def parse(text: str) -> List[str]:
+    return text.splitlines()
+
+
+def part1(expressions: List[str]) -> int:
+    return int(sum([eval_expression(e)[0] for e in expressions]))
+
+
+def part2(expressions: List[str]) -> int:
+    modified_expressions = [modify_expression(e)[0] for e in expressions]
+    return int(sum([eval_expression(e)[0] for e in modified_expressions]))
+
+
 if __name__ == "__main__":
-    expressions = [line[:-1] for line in open("2020/18/input.txt", "r").readlines()]
+    expressions = parse(open("2020/18/input.txt", "r").read())
 
     # Part 1
-    s = sum([eval_expression(e)[0] for e in expressions])
-    print(f"Sum of expressions: {s}")
+    print(f"Sum of expressions: {part1(expressions)}")
 
     # Part 2
-    modified_expressions = [modify_expression(e)[0] for e in expressions]
-    s = sum([eval_expression(e)[0] for e in modified_expressions])
-    print(f"Sum of expressions: {s}")
+    print(f"Sum of expressions: {part2(expressions)}")
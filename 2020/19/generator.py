@@ -0,0 +1,95 @@
+"""
+Monster messages: rules of a grammar over the letters `a` and `b`, then the messages to check
+against rule 0.
+
+As in real inputs, `0: 8 11`, `8: 42` and `11: 42 31`, while rules 42 and 31 match words of 8
+letters through a random tree of alternatives of pairs of shorter rules. Messages are made of a few
+words matching rule 42 followed by fewer words matching rule 31 (which is what rule 0 matches once
+rules 8 and 11 loop), some of them with a letter flipped. Larger scales add messages.
+"""
+import random
+
+from aoc.generators import scaled
+
+WORD_LENGTH = 8
+
+# Rule ids are assigned once the grammar is built, except for these.
+ROOT_RULES = (0, 8, 11, 42, 31)
+
+
+class Grammar:
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        # Every rule is either a letter or a list of alternatives, each a list of rule indexes.
+        self.rules: list = ["a", "b"]
+        self.rules.append([[0], [1]])
+        self.by_length: dict[int, list[int]] = {1: [0, 1, 2]}
+
+    def build(self, length: int) -> int:
+        """
+        Returns a rule matching (some) words of `length` letters, reusing an existing one at times.
+
+        As in real inputs, the alternatives of a rule differ in their first or last letter, so the
+        grammar is unambiguous.
+        """
+        existing = self.by_length.get(length, [])
+        if existing and (length == 1 or self.rng.random() < 0.1):
+            return self.rng.choice(existing)
+
+        if self.rng.random() < 0.8:
+            a_rest, b_rest = self.build(length - 1), self.build(length - 1)
+            if self.rng.random() < 0.5:
+                alternatives = [[0, a_rest], [1, b_rest]]
+            else:
+                alternatives = [[a_rest, 0], [b_rest, 1]]
+        else:
+            first = self.rng.randint(1, length - 1)
+            alternatives = [[self.build(first), self.build(length - first)]]
+
+        self.rules.append(alternatives)
+        self.by_length.setdefault(length, []).append(len(self.rules) - 1)
+        return len(self.rules) - 1
+
+    def word(self, rule: int) -> str:
+        """
+        Returns a random word matched by `rule`.
+        """
+        if isinstance(self.rules[rule], str):
+            return self.rules[rule]
+        return "".join(self.word(r) for r in self.rng.choice(self.rules[rule]))
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    grammar = Grammar(rng)
+    rule_42 = grammar.build(WORD_LENGTH)
+    rule_31 = grammar.build(WORD_LENGTH)
+    while rule_31 == rule_42:
+        rule_31 = grammar.build(WORD_LENGTH)
+
+    free_ids = [i for i in range(max(len(grammar.rules) + 3, max(ROOT_RULES) + 1)) if i not in ROOT_RULES]
+    rng.shuffle(free_ids)
+    ids = {rule_42: 42, rule_31: 31}
+    for rule in range(len(grammar.rules)):
+        if rule not in ids:
+            ids[rule] = free_ids.pop()
+
+    lines = ["0: 8 11", "8: 42", "11: 42 31"]
+    for rule, definition in enumerate(grammar.rules):
+        if isinstance(definition, str):
+            lines.append(f'{ids[rule]}: "{definition}"')
+        else:
+            lines.append(f"{ids[rule]}: " + " | ".join(" ".join(str(ids[r]) for r in a) for a in definition))
+    rng.shuffle(lines)
+
+    messages = []
+    for _ in range(scaled(450, scale)):
+        count_42 = 2 if rng.random() < 0.5 else rng.randint(2, 8)
+        count_31 = rng.randint(1, count_42 - 1)
+        message = [grammar.word(rule_42) for _ in range(count_42)] + [grammar.word(rule_31) for _ in range(count_31)]
+        message = list("".join(message))
+        if rng.random() < 0.5:
+            i = rng.randrange(len(message))
+            message[i] = "a" if message[i] == "b" else "b"
+        messages.append("".join(message))
+
+    return "\n".join(lines) + "\n\n" + "\n".join(messages) + "\n"
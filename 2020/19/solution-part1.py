@@ -1,7 +1,9 @@
 from enum import Enum
 from typing import Any, Iterable, Dict, Tuple, Callable, Protocol
 
-import regex
+from aoc.lazy import lazy_import
+
+regex = lazy_import("regex")
 
 
 class Rule(Protocol):
@@ -148,22 +150,54 @@ def _build_rule(rules, built_rules, rule_id):
     return built_rules[rule_id]
 
 
-def main():
-    lines = open("2020/19/input.txt", "r").readlines()
-    rules_strings_separator = lines.index("\n")
+Messages = Tuple[Dict[int, Rule], Tuple[str, ...]]
+
+
+def parse(text: str) -> Messages:
+    lines = text.splitlines()
+    rules_strings_separator = lines.index("")
     raw_rules = lines[:rules_strings_separator]
-    strings = [l[:-1] for l in lines[rules_strings_separator + 1 :]]
+    strings = tuple(lines[rules_strings_separator + 1 :])
+    return build_rules(parse_rules(raw_rules)), strings
+
+
+def part1(messages: Messages) -> int:
+    rules, strings = messages
+    return len(list(filter(lambda s: rules[0].match(s, 0, True) != 0, strings)))
 
-    print(f"# of rules: {len(raw_rules)}")
-    print(f"# of strings: {len(strings)}")
 
-    parsed_rules = parse_rules(raw_rules)
-    rules = build_rules(parsed_rules)
+def matches_looping_rule_0(rules: Dict[int, Rule], line: str) -> bool:
+    """
+    Rule 0 is `8 11`, which with the looping rules `8: 42 | 42 8` and `11: 42 31 | 42 11 31`
+    matches lines made of `n` repetitions of rule 42 followed by `m` repetitions of rule 31, where
+    `n > m >= 1`.
+    """
+    index, repetitions_42 = 0, 0
+    while digested := rules[42].match(line, index):
+        index += digested
+        repetitions_42 += 1
 
-    # Part 1:
-    lines_matching_rule_0 = list(filter(lambda s: rules[0].match(s, 0, True) != 0, strings))
-    print("\n".join(lines_matching_rule_0))
-    print(f"Number of lines matching rule #0: {len(list(lines_matching_rule_0))}")
+        rest_index, repetitions_31 = index, 0
+        while digested_31 := rules[31].match(line, rest_index):
+            rest_index += digested_31
+            repetitions_31 += 1
+            if rest_index == len(line) and repetitions_31 < repetitions_42:
+                return True
+
+    return False
+
+
+def part2(messages: Messages) -> int:
+    rules, strings = messages
+    return len(list(filter(lambda s: matches_looping_rule_0(rules, s), strings)))
+
+
+def main():
+    messages = parse(open("2020/19/input.txt", "r").read())
+    print(f"# of rules: {len(messages[0])}")
+    print(f"# of strings: {len(messages[1])}")
+    print(f"Number of lines matching rule #0: {part1(messages)}")
+    print(f"Number of lines matching rule #0 with looping rules: {part2(messages)}")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 from enum import Enum
 from typing import Iterable, Dict, Tuple, Callable, Union
-import regex
+
+from aoc.lazy import lazy_import
+
+regex = lazy_import("regex")
 
 
 class RuleType(Enum):
@@ -96,31 +99,51 @@ class RuleRegexifier:
         return rule_regex
 
 
-def solution_for_input(input_filename: str):
-    lines = open(input_filename, "r").readlines()
-    rules_strings_separator = lines.index("\n")
-    raw_rules = lines[:rules_strings_separator]
-    strings = [line[:-1] for line in lines[rules_strings_separator + 1 :]]
+# Part 2 replaces these rules with looping versions of themselves.
+LOOPING_RULES = ("8: 42 | 42 8", "11: 42 31 | 42 11 31")
 
-    print(f"# of rules: {len(raw_rules)}")
-    print(f"# of strings: {len(strings)}")
+Messages = Tuple[RulesMap, Tuple[str, ...]]
 
-    rules_map = RuleParser.parse_rules(raw_rules)
+
+def count_lines_matching_rule_0(rules_map: RulesMap, strings: Iterable[str]) -> int:
     regexifier = RuleRegexifier(rules_map)
 
     r0_regex = regexifier.regexify_rule(0)
     lines_matching_r0_regex = filter(lambda l: regex.match(r0_regex, l) is not None, strings)
-    print(f"Number of lines matching rule #0 regex: {len(list(lines_matching_r0_regex))}")
+    return len(list(lines_matching_r0_regex))
+
+
+def parse(text: str) -> Messages:
+    lines = text.splitlines()
+    rules_strings_separator = lines.index("")
+    raw_rules = lines[:rules_strings_separator]
+    strings = tuple(lines[rules_strings_separator + 1 :])
+    return RuleParser.parse_rules(raw_rules), strings
+
+
+def part1(messages: Messages) -> int:
+    rules_map, strings = messages
+    return count_lines_matching_rule_0(rules_map, strings)
+
+
+def part2(messages: Messages) -> int:
+    rules_map, strings = messages
+    looping_rules_map = {**rules_map, **RuleParser.parse_rules(LOOPING_RULES)}
+    return count_lines_matching_rule_0(looping_rules_map, strings)
 
 
 def main():
+    messages = parse(open("2020/19/input.txt", "r").read())
+    print(f"# of rules: {len(messages[0])}")
+    print(f"# of strings: {len(messages[1])}")
+
     # Part 1:
     print("********* Part 1:")
-    solution_for_input("2020/19/input.txt")
+    print(f"Number of lines matching rule #0 regex: {part1(messages)}")
 
     # Part 2:
     print("********** Part 2:")
-    solution_for_input("2020/19/input2.txt")
+    print(f"Number of lines matching rule #0 regex: {part2(messages)}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,16 @@
+"""
+Sonar sweep: depth measurements, one per line, mostly increasing with small ups and downs.
+"""
+import random
+
+from aoc.generators import scaled
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    depth = rng.randint(100, 200)
+    depths = []
+    for _ in range(scaled(2000, scale)):
+        depth = max(1, depth + rng.randint(-12, 20))
+        depths.append(depth)
+
+    return "\n".join(map(str, depths)) + "\n"
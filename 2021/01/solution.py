@@ -3,13 +3,26 @@ def find_positive_derivatives(seq, window_size):
     return list(filter(lambda d: d > 0, derivatives))
 
 
-with open("2021/01/input.txt") as f:
-    measurements = [int(l) for l in f.readlines()]
+def parse(text):
+    return [int(l) for l in text.splitlines()]
 
-# Part 1:
-print("***** Part 1:")
-print(f"Number of positives derivatives is {len(find_positive_derivatives(measurements, 1))}")
 
-# Part 2:
-print("***** Part 2:")
-print(f"Number of positives derivatives is {len(find_positive_derivatives(measurements, 3))}")
+def part1(measurements):
+    return len(find_positive_derivatives(measurements, 1))
+
+
+def part2(measurements):
+    return len(find_positive_derivatives(measurements, 3))
+
+
+if __name__ == "__main__":
+    with open("2021/01/input.txt") as f:
+        measurements = parse(f.read())
+
+    # Part 1:
+    print("***** Part 1:")
+    print(f"Number of positives derivatives is {part1(measurements)}")
+
+    # Part 2:
+    print("***** Part 2:")
+    print(f"Number of positives derivatives is {part2(measurements)}")
@@ -0,0 +1,12 @@
+"""
+Submarine course: `forward`, `down` and `up` commands of 1 to 9 units. There are fewer `up`
+commands than `down` ones so the submarine keeps diving.
+"""
+import random
+
+from aoc.generators import scaled
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    commands = rng.choices(["forward", "down", "up"], weights=[4, 4, 2], k=scaled(1000, scale))
+    return "\n".join(f"{command} {rng.randint(1, 9)}" for command in commands) + "\n"
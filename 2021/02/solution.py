@@ -26,19 +26,28 @@ def make_step_2(start_position, direction, offset):
     return new_position
 
 
-with open("2021/02/input.txt") as f:
-    instructions = f.readlines()
+def parse(text):
+    return text.splitlines()
 
-# Part 1
-position = reduce(lambda p, i: make_step_1(p, *(i.split())), instructions, None)
 
-print("***** Part 1:")
-print(f"Final position: {position}")
-print(f"Horizontal * Depth = {position['h'] * position['d']}")
+def part1(instructions):
+    position = reduce(lambda p, i: make_step_1(p, *(i.split())), instructions, None)
+    return position["h"] * position["d"]
 
-# Part 2
-position = reduce(lambda p, i: make_step_2(p, *(i.split())), instructions, None)
 
-print("***** Part 2:")
-print(f"Final position: {position}")
-print(f"Horizontal * Depth = {position['h'] * position['d']}")
+def part2(instructions):
+    position = reduce(lambda p, i: make_step_2(p, *(i.split())), instructions, None)
+    return position["h"] * position["d"]
+
+
+if __name__ == "__main__":
+    with open("2021/02/input.txt") as f:
+        instructions = parse(f.read())
+
+    # Part 1
+    print("***** Part 1:")
+    print(f"Horizontal * Depth = {part1(instructions)}")
+
+    # Part 2
+    print("***** Part 2:")
+    print(f"Horizontal * Depth = {part2(instructions)}")
@@ -0,0 +1,41 @@
+"""
+Diagnostic report: distinct binary numbers of the same width, 12 bits in real inputs. Larger scales
+widen the numbers as needed to keep them distinct.
+"""
+import random
+
+from aoc.generators import scaled
+
+
+def keeps_some_least_common(numbers: list[str]) -> bool:
+    """
+    Tests whether filtering `numbers` by their least common bits, position by position, ends with a
+    number. It doesn't when all the remaining numbers share the bit at some position.
+    """
+    for i in range(len(numbers[0])):
+        if len(numbers) == 1:
+            return True
+        ones = [n for n in numbers if n[i] == "1"]
+        zeros = [n for n in numbers if n[i] == "0"]
+        if not ones or not zeros:
+            return False
+        numbers = zeros if len(zeros) <= len(ones) else ones
+
+    return True
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    count = scaled(1000, scale)
+    width = max(12, (4 * count).bit_length())
+
+    # Bits are biased differently per position, as the gamma and epsilon rates depend on which
+    # value is more common at every position.
+    biases = [rng.uniform(0.3, 0.7) for _ in range(width)]
+    while True:
+        numbers: set[str] = set()
+        while len(numbers) < count:
+            numbers.add("".join("1" if rng.random() < b else "0" for b in biases))
+
+        numbers_list = rng.sample(sorted(numbers), count)
+        if keeps_some_least_common(numbers_list):
+            return "\n".join(numbers_list) + "\n"
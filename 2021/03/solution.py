@@ -30,29 +30,30 @@ def get_reads_matching_rule_at_index(reads, rule, i):
     return get_reads_matching_bit_at_index(reads, bit, i)
 
 
-with open("2021/03/input.txt") as f:
-    reads = [[int(b) for b in l.strip()] for l in f.readlines()]
+def parse(text):
+    return [[int(b) for b in l.strip()] for l in text.splitlines()]
 
 
-bit_count = len(reads[0])
-print(f"Total reads: {len(reads)}, read size: {bit_count}")
-gamma = [get_common_bit(zr) for zr in zip(*reads)]
-epsilon = [b ^ 1 for b in gamma]
-pwc = bits_array_to_int(gamma) * bits_array_to_int(epsilon)
-print(f"The Submarine power consumption is: {pwc} (gamma={gamma}, epsilon={epsilon})")
+def part1(reads):
+    gamma = [get_common_bit(zr) for zr in zip(*reads)]
+    epsilon = [b ^ 1 for b in gamma]
+    return bits_array_to_int(gamma) * bits_array_to_int(epsilon)
 
 
-ox_gen_rating_bits = reduce(lambda r, i: get_reads_matching_rule_at_index(r, "mcb", i), range(bit_count), reads)[0]
-co2_scrub_rating_bits = reduce(lambda r, i: get_reads_matching_rule_at_index(r, "lcb", i), range(bit_count), reads)[0]
+def part2(reads):
+    bits = range(len(reads[0]))
+    ox_gen_rating_bits = reduce(lambda r, i: get_reads_matching_rule_at_index(r, "mcb", i), bits, reads)[0]
+    co2_scrub_rating_bits = reduce(lambda r, i: get_reads_matching_rule_at_index(r, "lcb", i), bits, reads)[0]
 
-print(f"Oxygen generator rating value: {''.join([str(i) for i in ox_gen_rating_bits])}")
-print(f"CO2 scrubber rating value: {''.join([str(i) for i in co2_scrub_rating_bits])}")
+    ox_gen_rating = bits_array_to_int(ox_gen_rating_bits)
+    co2_scrub_rating = bits_array_to_int(co2_scrub_rating_bits)
+    return ox_gen_rating * co2_scrub_rating
 
 
-ox_gen_rating = bits_array_to_int(ox_gen_rating_bits)
-co2_scrub_rating = bits_array_to_int(co2_scrub_rating_bits)
-print(f"Oxygen generator rating value: {ox_gen_rating} {ox_gen_rating_bits}")
-print(f"CO2 scrubber rating value: {co2_scrub_rating} {co2_scrub_rating_bits}")
+if __name__ == "__main__":
+    with open("2021/03/input.txt") as f:
+        reads = parse(f.read())
 
-life_support_rating = ox_gen_rating * co2_scrub_rating
-print(f"Life support rating in the submarine is: {life_support_rating}")
+    print(f"Total reads: {len(reads)}, read size: {len(reads[0])}")
+    print(f"The Submarine power consumption is: {part1(reads)}")
+    print(f"Life support rating in the submarine is: {part2(reads)}")
@@ -0,0 +1,19 @@
+"""
+Bingo: the drawn numbers (all of 0 to 99, shuffled), then 5x5 boards of distinct numbers from the
+same range. Larger scales add boards.
+"""
+import random
+
+from aoc.generators import scaled
+
+NUMBERS = range(100)
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    drawn = rng.sample(NUMBERS, len(NUMBERS))
+    boards = []
+    for _ in range(scaled(100, scale)):
+        numbers = rng.sample(NUMBERS, 25)
+        boards.append("\n".join(" ".join(f"{n:>2}" for n in numbers[r * 5 : r * 5 + 5]) for r in range(5)))
+
+    return ",".join(map(str, drawn)) + "\n\n" + "\n\n".join(boards) + "\n"
@@ -52,27 +52,40 @@ class BingoBoard:
         return "\n".join(rows)
 
 
-with open("2021/04/input.txt") as f:
-    data = f.read()
-
-sections = data.split("\n\n")
-drawn_numbers = [int(n) for n in sections[0].split(",")]
-boards = [BingoBoard(b) for b in sections[1:]]
-
-first_winning_board = None
-last_winning_board = None
-for n in drawn_numbers:
-    for b in boards.copy():
-        if b.mark(n):
-            boards.remove(b)
-            if not first_winning_board:
-                first_winning_board = b
-
-    if len(boards) == 1:
-        last_winning_board = b
-
-print(f"First winning board:\n{first_winning_board}")
-print(f"marks: {first_winning_board.marks}, score: {first_winning_board.score}")
-
-print(f"Last winning board:\n{last_winning_board}")
-print(f"marks: {last_winning_board.marks}, score: {last_winning_board.score}")
+def play_bingo(drawn_numbers: list[int], raw_boards: list[str]) -> list[BingoBoard]:
+    """
+    Plays bingo with a fresh board for every one of `raw_boards`.
+
+    Returns the winning boards in the order they won.
+    """
+    boards = [BingoBoard(b) for b in raw_boards]
+    winning_boards = []
+    for n in drawn_numbers:
+        for b in boards.copy():
+            if b.mark(n):
+                boards.remove(b)
+                winning_boards.append(b)
+
+    return winning_boards
+
+
+def parse(text: str) -> tuple[list[int], list[str]]:
+    sections = text.strip().split("\n\n")
+    drawn_numbers = [int(n) for n in sections[0].split(",")]
+    return drawn_numbers, sections[1:]
+
+
+def part1(game: tuple[list[int], list[str]]) -> int:
+    return play_bingo(*game)[0].score
+
+
+def part2(game: tuple[list[int], list[str]]) -> int:
+    return play_bingo(*game)[-1].score
+
+
+if __name__ == "__main__":
+    with open("2021/04/input.txt") as f:
+        game = parse(f.read())
+
+    print(f"First winning board score: {part1(game)}")
+    print(f"Last winning board score: {part2(game)}")
@@ -0,0 +1,28 @@
+"""
+Hydrothermal vents: horizontal, vertical and diagonal (at 45 degrees) lines of vents. Larger scales
+add lines and grow the sides of the area they are in to keep the same density.
+"""
+import random
+
+from aoc.generators import scaled, scaled_side
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    side = scaled_side(1000, scale)
+    lines = []
+    for _ in range(scaled(500, scale)):
+        x1, y1 = rng.randrange(10, side - 10), rng.randrange(10, side - 10)
+        kind = rng.choice("hhhhvvvvddd")
+        if kind == "h":
+            x2, y2 = rng.randrange(10, side - 10), y1
+        elif kind == "v":
+            x2, y2 = x1, rng.randrange(10, side - 10)
+        else:
+            dx, dy = rng.choice([-1, 1]), rng.choice([-1, 1])
+            # The longest diagonal from (x1, y1) in that direction that stays in the area.
+            limit = min(x1 - 10 if dx < 0 else side - 11 - x1, y1 - 10 if dy < 0 else side - 11 - y1)
+            length = rng.randint(0, limit)
+            x2, y2 = x1 + dx * length, y1 + dy * length
+        lines.append(f"{x1},{y1} -> {x2},{y2}")
+
+    return "\n".join(lines) + "\n"
@@ -1,19 +1,16 @@
+from pathlib import Path
+import re
 from typing import Iterable, Generator
 
+from aoc.inputs import PuzzleInput, load_input
+
+BYTES_INPUT = True
 
 Point = tuple[int, int]
 Line = tuple[Point, Point]
 Vector = tuple[int, int]
 
-
-def parse_point(point: str) -> Point:
-    x1, y1 = [int(c) for c in point.split(",")]
-    return (x1, y1)
-
-
-def parse_line(line: str) -> Line:
-    start, end = [parse_point(p) for p in line.split(" -> ")]
-    return (start, end)
+LINE_PATTERN = re.compile(rb"(\d+),(\d+) -> (\d+),(\d+)")
 
 
 def line_direction(line: Line) -> str:
@@ -58,24 +55,36 @@ def mark_line_points(line: Line, board: dict[Point, int]) -> Iterable[Point]:
     return danger_points
 
 
-print("Part 1, ignoring diagonals")
-board = {}
-danger_points = set()
-lines = [parse_line(l) for l in open("2021/05/input.txt", "r").readlines()]
-for l in lines:
-    if line_direction(l) == "d":
-        print(f"Line: {l} is diagonal, skiping")
-        continue
+def count_danger_points(lines: list[Line], include_diagonals: bool) -> int:
+    board = {}
+    danger_points = set()
+    for l in lines:
+        if not include_diagonals and line_direction(l) == "d":
+            continue
+
+        danger_points = danger_points.union(mark_line_points(l, board))
+
+    return len(danger_points)
+
+
+def parse(puzzle_input: PuzzleInput) -> list[Line]:
+    # Lines are short enough that matching them all across the input beats going over them one by one.
+    return [((int(m[1]), int(m[2])), (int(m[3]), int(m[4]))) for m in LINE_PATTERN.finditer(puzzle_input.data)]
+
+
+def part1(lines: list[Line]) -> int:
+    return count_danger_points(lines, include_diagonals=False)
+
+
+def part2(lines: list[Line]) -> int:
+    return count_danger_points(lines, include_diagonals=True)
 
-    danger_points = danger_points.union(mark_line_points(l, board))
 
-print(f"Danger spots: {len(danger_points)}")
+if __name__ == "__main__":
+    lines = parse(load_input(Path("2021/05/input.txt")))
 
-print("Part 2, allowing diagonals")
-board = {}
-danger_points = set()
-lines = [parse_line(l) for l in open("2021/05/input.txt", "r").readlines()]
-for l in lines:
-    danger_points = danger_points.union(mark_line_points(l, board))
+    print("Part 1, ignoring diagonals")
+    print(f"Danger spots: {part1(lines)}")
 
-print(f"Danger spots: {len(danger_points)}")
+    print("Part 2, allowing diagonals")
+    print(f"Danger spots: {part2(lines)}")
@@ -0,0 +1,11 @@
+"""
+Lanternfish: the internal timers (1 to 5) of the initial fish, mostly 1s.
+"""
+import random
+
+from aoc.generators import scaled
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    timers = rng.choices([1, 2, 3, 4, 5], weights=[145, 39, 53, 33, 30], k=scaled(300, scale))
+    return ",".join(map(str, timers)) + "\n"
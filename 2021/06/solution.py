@@ -32,14 +32,27 @@ def simulate_spawn_cycles(initial_spawn_map, cycles):
     return spawn_map
 
 
-with open("2021/06/input.txt", "r") as f:
-    lf_horde = [int(n) for n in f.read().split(",")]
+def parse(text: str) -> SpawnMap:
+    lf_horde = [int(n) for n in text.split(",")]
+    spawn_map = reduce(spawn_map_reducer, lf_horde, {})
+    assert sum(spawn_map.values()) == len(lf_horde)
+    return spawn_map
+
+
+def part1(spawn_map: SpawnMap) -> int:
+    return sum(simulate_spawn_cycles(spawn_map, 80).values())
+
+
+def part2(spawn_map: SpawnMap) -> int:
+    return sum(simulate_spawn_cycles(spawn_map, DAYS_TO_SIMULATE).values())
+
+
+if __name__ == "__main__":
+    with open("2021/06/input.txt", "r") as f:
+        spawn_map = parse(f.read())
 
-spawn_map = reduce(spawn_map_reducer, lf_horde, {})
-assert sum(spawn_map.values()) == len(lf_horde)
-print(f"Initial horde size: {sum(spawn_map.values())}")
-print(spawn_map)
+    print(f"Initial horde size: {sum(spawn_map.values())}")
+    print(spawn_map)
 
-spawn_map = simulate_spawn_cycles(spawn_map, DAYS_TO_SIMULATE)
-print(f"After {DAYS_TO_SIMULATE} days: New fish={spawn_map[8]}, Horde size={sum(spawn_map.values())}")
-print(spawn_map)
+    print(f"After 80 days: Horde size={part1(spawn_map)}")
+    print(f"After {DAYS_TO_SIMULATE} days: Horde size={part2(spawn_map)}")
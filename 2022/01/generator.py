@@ -0,0 +1,18 @@
+"""
+Calorie counting: the calories of every item the elves carry, one per line, with a blank line
+between elves.
+"""
+import random
+
+from aoc.generators import scaled
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    elves = []
+    for _ in range(scaled(240, scale)):
+        items = rng.randint(1, 15)
+        # Elves carrying few items carry larger ones.
+        high = 60000 // items
+        elves.append("\n".join(str(rng.randint(1000, max(1000, high))) for _ in range(items)))
+
+    return "\n\n".join(elves) + "\n"
@@ -1,16 +1,33 @@
 from functools import reduce
 
-calories_carried_per_elf = sorted(
-    reduce(
-        lambda c, l: c + [0] if l == "\n" else c[:-1] + [c[-1] + int(l)],
-        open("2022/01/input.txt"),
-        [0],
-    ),
-    reverse=True,
-)
-
-### Part 1
-print(f"Max calories: {calories_carried_per_elf[0]}")
-
-### Part 2
-print(f"Sum of top 3 calories carrying elves: {sum(calories_carried_per_elf[0:3])}")
+
+def parse(text: str) -> list[int]:
+    """
+    Returns the total calories carried by every elf, sorted from highest to lowest.
+    """
+    return sorted(
+        reduce(
+            lambda c, l: c + [0] if l == "\n" else c[:-1] + [c[-1] + int(l)],
+            text.splitlines(keepends=True),
+            [0],
+        ),
+        reverse=True,
+    )
+
+
+def part1(calories_carried_per_elf: list[int]) -> int:
+    return calories_carried_per_elf[0]
+
+
+def part2(calories_carried_per_elf: list[int]) -> int:
+    return sum(calories_carried_per_elf[0:3])
+
+
+if __name__ == "__main__":
+    calories_carried_per_elf = parse(open("2022/01/input.txt").read())
+
+    ### Part 1
+    print(f"Max calories: {part1(calories_carried_per_elf)}")
+
+    ### Part 2
+    print(f"Sum of top 3 calories carrying elves: {part2(calories_carried_per_elf)}")
@@ -0,0 +1,14 @@
+"""
+Rock paper scissors strategy guide: the opponent's shape (`A`, `B` or `C`) and the response (`X`,
+`Y` or `Z`) of every round.
+"""
+import random
+
+from aoc.generators import scaled
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    count = scaled(2500, scale)
+    opponents = rng.choices("ABC", weights=[2, 3, 5], k=count)
+    responses = rng.choices("XYZ", weights=[5, 3, 2], k=count)
+    return "\n".join(f"{o} {r}" for o, r in zip(opponents, responses)) + "\n"
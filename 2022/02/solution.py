@@ -1,23 +1,40 @@
+from pathlib import Path
+import re
+
+from aoc.inputs import PuzzleInput, load_input
+
+BYTES_INPUT = True
+
+
 def score_for_round(opponent, you):
     return (ord(you) - ord("A") + 1) + (
         3 if opponent == you else 6 if (opponent, you) in (("A", "B"), ("B", "C"), ("C", "A")) else 0
     )
 
 
+Instruction = tuple[str, str]
+
+INSTRUCTION_PATTERN = re.compile(rb"([ABC]) ([XYZ])")
+
+
+def parse(puzzle_input: PuzzleInput) -> list[Instruction]:
+    return [(m[1].decode(), m[2].decode()) for m in INSTRUCTION_PATTERN.finditer(puzzle_input.data)]
+
+
 ### Part 1
-def instruction_to_round(l: str) -> tuple[str, str]:
-    t = str.maketrans({"X": "A", "Y": "B", "Z": "C"})
-    return l.translate(t).split()
+def instruction_to_round_1(instruction: Instruction) -> tuple[str, str]:
+    op, you = instruction
+    return op, {"X": "A", "Y": "B", "Z": "C"}[you]
 
 
-rounds = [instruction_to_round(l) for l in open("2022/02/input.txt").readlines()]
-total_score = sum([score_for_round(*r) for r in rounds])
-print(f"Total score: {total_score}")
+def part1(instructions: list[Instruction]) -> int:
+    rounds = [instruction_to_round_1(l) for l in instructions]
+    return sum([score_for_round(*r) for r in rounds])
 
 
 ### Part 2
-def instruction_to_round(l: str) -> tuple[str, str]:
-    op, res = l.split()
+def instruction_to_round_2(instruction: Instruction) -> tuple[str, str]:
+    op, res = instruction
     return (
         (op, op)
         if res == "Y"
@@ -25,6 +42,12 @@ def instruction_to_round(l: str) -> tuple[str, str]:
     )
 
 
-rounds = [instruction_to_round(l) for l in open("2022/02/input.txt").readlines()]
-total_score = sum([score_for_round(*r) for r in rounds])
-print(f"Total score: {total_score}")
+def part2(instructions: list[Instruction]) -> int:
+    rounds = [instruction_to_round_2(l) for l in instructions]
+    return sum([score_for_round(*r) for r in rounds])
+
+
+if __name__ == "__main__":
+    instructions = parse(load_input(Path("2022/02/input.txt")))
+    print(f"Total score: {part1(instructions)}")
+    print(f"Total score: {part2(instructions)}")
@@ -1,7 +1,5 @@
-instructions = [l.strip() for l in open("2022/02/input.txt")]
-
 ### Part 1
-instruction_to_score = {
+INSTRUCTION_TO_SCORE_1 = {
     "A X": 1 + 3,
     "A Y": 2 + 6,
     "A Z": 3 + 0,
@@ -12,11 +10,9 @@ instruction_to_score = {
     "C Y": 2 + 0,
     "C Z": 3 + 3,
 }
-total_score = sum([instruction_to_score[i] for i in instructions])
-print(f"Total score: {total_score}")
 
 ### Part 2
-instruction_to_score = {
+INSTRUCTION_TO_SCORE_2 = {
     "A X": 3 + 0,
     "A Y": 1 + 3,
     "A Z": 2 + 6,
@@ -27,5 +23,21 @@ instruction_to_score = {
     "C Y": 3 + 3,
     "C Z": 1 + 6,
 }
-total_score = sum([instruction_to_score[i] for i in instructions])
-print(f"Total score: {total_score}")
+
+
+def parse(text: str) -> list[str]:
+    return [l.strip() for l in text.splitlines()]
+
+
+def part1(instructions: list[str]) -> int:
+    return sum([INSTRUCTION_TO_SCORE_1[i] for i in instructions])
+
+
+def part2(instructions: list[str]) -> int:
+    return sum([INSTRUCTION_TO_SCORE_2[i] for i in instructions])
+
+
+if __name__ == "__main__":
+    instructions = parse(open("2022/02/input.txt").read())
+    print(f"Total score: {part1(instructions)}")
+    print(f"Total score: {part2(instructions)}")
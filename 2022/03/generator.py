@@ -0,0 +1,42 @@
+"""
+Rucksacks: items (`a` to `z` and `A` to `Z`) split into two equally sized compartments that share
+exactly one item type, in groups of three rucksacks that share exactly one item type (the badge).
+"""
+import random
+import string
+
+from aoc.generators import scaled
+
+ITEMS = string.ascii_letters
+
+
+def generate_rucksack(rng: random.Random, allowed: list[str], badge: str) -> str:
+    size = rng.randint(4, 24)
+    shared = rng.choice(allowed)
+    pool = [i for i in allowed if i not in (shared, badge)]
+    rng.shuffle(pool)
+    if badge != shared:
+        pool.insert(0, badge)
+
+    first_count = rng.randint(1, min(size - 1, len(pool) // 2))
+    second_count = rng.randint(1, min(size, len(pool) - first_count))
+    first_types, second_types = pool[:first_count], pool[first_count : first_count + second_count]
+
+    first = first_types + [shared] + rng.choices(first_types + [shared], k=size - first_count - 1)
+    second = [shared] + rng.choices(second_types + [shared], k=size - 1)
+    rng.shuffle(first)
+    rng.shuffle(second)
+    return "".join(first + second)
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    rucksacks = []
+    for _ in range(scaled(100, scale)):
+        badge = rng.choice(ITEMS)
+        first = generate_rucksack(rng, list(ITEMS), badge)
+        second = generate_rucksack(rng, list(ITEMS), badge)
+        common = set(first) & set(second) - {badge}
+        third = generate_rucksack(rng, [i for i in ITEMS if i not in common], badge)
+        rucksacks += [first, second, third]
+
+    return "\n".join(rucksacks) + "\n"
@@ -2,17 +2,29 @@ def get_item_priority(item: str) -> int:
     return 1 + ord(item) - (ord("a") if item >= "a" else ord("A") - 26)
 
 
+def parse(text: str) -> list[str]:
+    return [l.strip() for l in text.splitlines()]
+
+
 ### Part 1
-rucksacks = [l.strip() for l in open("2022/03/input.txt")]
-compartments = [(r[: len(r) // 2], r[len(r) // 2 :]) for r in rucksacks]
-items = [set(c1).intersection(c2).pop() for c1, c2 in compartments]
-priorities = [get_item_priority(i) for i in items]
-print(f"Sum of priorities: {sum(priorities)}")
+def part1(rucksacks: list[str]) -> int:
+    compartments = [(r[: len(r) // 2], r[len(r) // 2 :]) for r in rucksacks]
+    items = [set(c1).intersection(c2).pop() for c1, c2 in compartments]
+    priorities = [get_item_priority(i) for i in items]
+    return sum(priorities)
+
 
 ### Part 2
-badges = []
-for i in range(0, len(rucksacks), 3):
-    r1, r2, r3 = rucksacks[i : i + 3]
-    badges.append(set(r1).intersection(set(r2)).intersection(set(r3)).pop())
-badge_priorities = [get_item_priority(b) for b in badges]
-print(f"Sum of badges priorities: {sum(badge_priorities)}")
+def part2(rucksacks: list[str]) -> int:
+    badges = []
+    for i in range(0, len(rucksacks), 3):
+        r1, r2, r3 = rucksacks[i : i + 3]
+        badges.append(set(r1).intersection(set(r2)).intersection(set(r3)).pop())
+    badge_priorities = [get_item_priority(b) for b in badges]
+    return sum(badge_priorities)
+
+
+if __name__ == "__main__":
+    rucksacks = parse(open("2022/03/input.txt").read())
+    print(f"Sum of priorities: {part1(rucksacks)}")
+    print(f"Sum of badges priorities: {part2(rucksacks)}")
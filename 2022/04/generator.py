@@ -0,0 +1,29 @@
+"""
+Camp cleanup: pairs of section assignments (inclusive ranges of sections 1 to 99), overlapping or
+containing one another about half of the time.
+"""
+import random
+
+from aoc.generators import scaled
+
+
+def random_range(rng: random.Random, low: int = 1, high: int = 99) -> tuple[int, int]:
+    start = rng.randint(low, high)
+    return start, rng.randint(start, high)
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        first = random_range(rng)
+        kind = rng.random()
+        if kind < 0.5:
+            # Contained in the first range.
+            second = random_range(rng, *first)
+        else:
+            second = random_range(rng)
+        if rng.random() < 0.5:
+            first, second = second, first
+        lines.append(f"{first[0]}-{first[1]},{second[0]}-{second[1]}")
+
+    return "\n".join(lines) + "\n"
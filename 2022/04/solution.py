@@ -1,33 +1,36 @@
-import parse
+import numpy as np
 
-SectionRange = tuple[int, int]
-PairAssignment = tuple[SectionRange, SectionRange]
+from aoc.intervals import contain, overlap
+from aoc.lazy import lazy_import
 
+parse_format = lazy_import("parse")
 
-def are_section_ranges_fully_overlap(r1: SectionRange, r2: SectionRange) -> bool:
-    return (r1[0] <= r2[0] and r1[1] >= r2[1]) or (r2[0] <= r1[0] and r2[1] >= r1[1])
+# The sections ranges of all pairs of elves, as a `(pairs, 2, 2)` array of half-open intervals.
+PairAssignments = np.ndarray
 
+LINE_TEMPLATE = "{:d}-{:d},{:d}-{:d}"
 
-def are_section_ranges_overlap(r1: SectionRange, r2: SectionRange) -> bool:
-    return r2[0] <= r1[1]
 
+def parse(text: str) -> PairAssignments:
+    line_template = parse_format.compile(LINE_TEMPLATE)
+    sections = np.array([line_template.parse(l.strip()).fixed for l in text.splitlines()], dtype=np.int64)
+    pair_assignments = sections.reshape(-1, 2, 2)
 
-line_template = parse.compile("{:d}-{:d},{:d}-{:d}")
-pair_assignments = list(
-    map(
-        lambda a: a if a[0][0] < a[1][0] or (a[0][0] == a[1][0] and a[0][1] <= a[1][1]) else a[::-1],
-        map(
-            lambda r: (tuple(r.fixed[:2]), tuple(r.fixed[2:])),
-            map(
-                lambda l: line_template.parse(l.strip()),
-                open("2022/04/input.txt").readlines(),
-            ),
-        ),
-    )
-)
+    # Section ranges are inclusive.
+    pair_assignments[:, :, 1] += 1
+    return pair_assignments
 
-fully_overlapping_assignments = filter(lambda a: are_section_ranges_fully_overlap(a[0], a[1]), pair_assignments)
-print(len(list(fully_overlapping_assignments)))
 
-overlapping_assignments = filter(lambda a: are_section_ranges_overlap(a[0], a[1]), pair_assignments)
-print(len(list(overlapping_assignments)))
+def part1(pair_assignments: PairAssignments) -> int:
+    first, second = pair_assignments[:, 0], pair_assignments[:, 1]
+    return int((contain(first, second) | contain(second, first)).sum())
+
+
+def part2(pair_assignments: PairAssignments) -> int:
+    return int(overlap(pair_assignments[:, 0], pair_assignments[:, 1]).sum())
+
+
+if __name__ == "__main__":
+    pair_assignments = parse(open("2022/04/input.txt").read())
+    print(part1(pair_assignments))
+    print(part2(pair_assignments))
@@ -0,0 +1,36 @@
+"""
+Supply stacks: a drawing of 9 stacks of crates (`A` to `Z`), then the crane moves. Moves never
+take the last crate of a stack, so no stack ends up empty. Larger scales add crates (making the
+stacks taller) and moves.
+"""
+import random
+import string
+
+from aoc.generators import scaled
+
+STACK_COUNT = 9
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    crate_count = max(scaled(56, scale), STACK_COUNT)
+    # Every stack gets at least one crate, the rest are spread randomly.
+    heights = [1] * STACK_COUNT
+    for i in rng.choices(range(STACK_COUNT), k=crate_count - STACK_COUNT):
+        heights[i] += 1
+
+    stacks = [[rng.choice(string.ascii_uppercase) for _ in range(h)] for h in heights]
+    rows = []
+    for level in range(max(heights) - 1, -1, -1):
+        rows.append(" ".join(f"[{s[level]}]" if level < len(s) else "   " for s in stacks))
+    rows.append(" ".join(f" {i + 1} " for i in range(STACK_COUNT)))
+
+    moves = []
+    for _ in range(scaled(500, scale)):
+        source = rng.choice([i for i in range(STACK_COUNT) if heights[i] > 1])
+        target = rng.choice([i for i in range(STACK_COUNT) if i != source])
+        count = rng.randint(1, min(heights[source] - 1, rng.choice([3, 6, 10, 37])))
+        heights[source] -= count
+        heights[target] += count
+        moves.append(f"move {count} from {source + 1} to {target + 1}")
+
+    return "\n".join(rows) + "\n\n" + "\n".join(moves) + "\n"
@@ -1,6 +1,11 @@
 from functools import reduce
+from pathlib import Path
+import re
 from typing import Callable, Optional
-import parse
+
+from aoc.inputs import PuzzleInput, load_input
+
+BYTES_INPUT = True
 
 Instruction = tuple[int, int, int]
 CraneProgram = list[Instruction]
@@ -8,22 +13,22 @@ CrateStack = list[Optional[str]]
 CrateStacks = list[CrateStack]
 InstructionExecutor = Callable[[CrateStacks, Instruction], CrateStacks]
 
-INSTRUCTION_FORMAT = parse.compile("move {:d} from {:d} to {:d}")
+INSTRUCTION_PATTERN = re.compile(rb"\s*move (\d+) from (\d+) to (\d+)")
 
 
-def parse_input(raw_input: str) -> tuple[CrateStacks, CraneProgram]:
-    stacks, instructions = raw_input.split("\n\n")
-    stack_levels = [
-        [l[i + 1] if len(l[i : i + 3].strip()) > 0 else None for i in range(0, len(l), 4)]
-        for l in stacks.split("\n")[-2::-1]
-    ]
+def parse(puzzle_input: PuzzleInput) -> tuple[CrateStacks, CraneProgram]:
+    stacks, instructions = puzzle_input.blocks()
+    # Crates are drawn as "[X]" every 4 columns, the last line numbering the stacks.
+    stack_levels = [[chr(l[i]) if l[i] != ord(" ") else None for i in range(1, len(l), 4)] for l in stacks[-2::-1]]
     stacks = [list(filter(lambda c: c is not None, s)) for s in zip(*stack_levels)]
-    instructions = [tuple(INSTRUCTION_FORMAT.parse(i.strip()).fixed) for i in instructions.split("\n")]
+    instructions = [tuple(map(int, INSTRUCTION_PATTERN.match(i).groups())) for i in instructions]
     return stacks, instructions
 
 
-def execute_crane_program(path: str, executor: InstructionExecutor) -> tuple[CrateStacks, str]:
-    stacks, instructions = parse_input(open(path).read())
+def execute_crane_program(
+    stacks: CrateStacks, instructions: CraneProgram, executor: InstructionExecutor
+) -> tuple[CrateStacks, str]:
+    stacks = [s.copy() for s in stacks]
     reduce(executor, instructions, stacks)
     return stacks, "".join([s[-1] for s in stacks])
 
@@ -36,8 +41,9 @@ def execute_crane_instruction_fofi(stacks: CrateStacks, instruction: Instruction
     return stacks
 
 
-stacks, tops = execute_crane_program("2022/05/input.txt", execute_crane_instruction_fofi)
-print("Crates at the top of the stacks: ", tops)
+def part1(crane_input: tuple[CrateStacks, CraneProgram]) -> str:
+    _, tops = execute_crane_program(*crane_input, execute_crane_instruction_fofi)
+    return tops
 
 
 ### Part 2
@@ -48,5 +54,12 @@ def execute_crane_instruction_foli(stacks: CrateStacks, instruction: Instruction
     return stacks
 
 
-stacks, tops = execute_crane_program("2022/05/input.txt", execute_crane_instruction_foli)
-print("Crates at the top of the stacks: ", tops)
+def part2(crane_input: tuple[CrateStacks, CraneProgram]) -> str:
+    _, tops = execute_crane_program(*crane_input, execute_crane_instruction_foli)
+    return tops
+
+
+if __name__ == "__main__":
+    crane_input = parse(load_input(Path("2022/05/input.txt")))
+    print("Crates at the top of the stacks: ", part1(crane_input))
+    print("Crates at the top of the stacks: ", part2(crane_input))
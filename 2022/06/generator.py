@@ -0,0 +1,53 @@
+"""
+Datastream buffer: lowercase letters in which the first 4 distinct consecutive letters (the start
+of packet marker) appear about a third into the stream, and the first 14 distinct consecutive ones
+(the start of message marker) about three quarters into it.
+"""
+import random
+import string
+
+from aoc.generators import scaled
+
+LETTERS = string.ascii_lowercase
+
+
+def extend_without_distinct_run(rng: random.Random, stream: list[str], end: int, run: int) -> None:
+    """
+    Appends random letters to `stream` up to a length of `end`, never completing `run` distinct
+    consecutive letters: when the last `run - 1` letters are distinct, the next one repeats one of
+    them.
+    """
+    counts = dict.fromkeys(LETTERS, 0)
+    distinct = 0
+    window = stream[len(stream) - run + 1 :] if len(stream) >= run - 1 else list(stream)
+    for letter in window:
+        distinct += counts[letter] == 0
+        counts[letter] += 1
+
+    while len(stream) < end:
+        if len(window) == run - 1 and distinct == run - 1:
+            letter = rng.choice(window)
+        else:
+            letter = rng.choice(LETTERS)
+
+        stream.append(letter)
+        window.append(letter)
+        distinct += counts[letter] == 0
+        counts[letter] += 1
+        if len(window) == run:
+            dropped = window.pop(0)
+            counts[dropped] -= 1
+            distinct -= counts[dropped] == 0
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    length = max(scaled(4096, scale), 64)
+    packet_marker = int(length * rng.uniform(0.25, 0.45))
+    message_marker = int(length * rng.uniform(0.65, 0.85))
+
+    stream: list[str] = []
+    extend_without_distinct_run(rng, stream, packet_marker, 4)
+    extend_without_distinct_run(rng, stream, message_marker, 14)
+    stream.extend(rng.sample(LETTERS, 14))
+    stream.extend(rng.choices(LETTERS, k=length - len(stream)))
+    return "".join(stream) + "\n"
@@ -24,12 +24,23 @@ def find_first_distinct_sequence(data: str, k: int) -> int:
     return -1
 
 
-data = open("2022/06/input.txt").read()
+def parse(text: str) -> str:
+    return text.strip()
 
-# Part 1
-first_packet_index = find_first_distinct_sequence(data, 4)
-print(f"First packet starts at index: {first_packet_index}")
 
-# Part 2
-first_message_index = find_first_distinct_sequence(data, 14)
-print(f"First message starts at index: {first_message_index}")
+def part1(data: str) -> int:
+    return find_first_distinct_sequence(data, 4)
+
+
+def part2(data: str) -> int:
+    return find_first_distinct_sequence(data, 14)
+
+
+if __name__ == "__main__":
+    data = parse(open("2022/06/input.txt").read())
+
+    # Part 1
+    print(f"First packet starts at index: {part1(data)}")
+
+    # Part 2
+    print(f"First message starts at index: {part2(data)}")
@@ -0,0 +1,61 @@
+"""
+Terminal output: a walk through a filesystem, listing every directory with `ls` and moving around
+with `cd`. Directories form a random tree up to 12 levels deep, and the files (of up to 300,000
+bytes) are spread over them. At a scale of 1 the disk is somewhat over 40,000,000 bytes full, as in
+real inputs, so that some space has to be freed.
+"""
+import random
+import string
+
+from aoc.generators import scaled
+
+MAX_DEPTH = 12
+
+
+def random_name(rng: random.Random, taken: set[str], extension: bool = False) -> str:
+    while True:
+        name = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+        if extension and rng.random() < 0.6:
+            name += "." + "".join(rng.choices(string.ascii_lowercase, k=3))
+        if name not in taken:
+            taken.add(name)
+            return name
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    # Every directory is a `(depth, taken names, subdirectories, files)` tuple.
+    root: tuple = (0, set(), [], [])
+    directories = [root]
+    for _ in range(scaled(182, scale)):
+        parent = rng.choice(directories)
+        while parent[0] >= MAX_DEPTH:
+            parent = rng.choice(directories)
+        directory = (parent[0] + 1, set(), [], [])
+        parent[2].append((random_name(rng, parent[1]), directory))
+        directories.append(directory)
+
+    for _ in range(scaled(286, scale)):
+        directory = rng.choice(directories)
+        directory[3].append((rng.randint(1000, 300_000), random_name(rng, directory[1], extension=True)))
+
+    lines = ["$ cd /"]
+    # An explicit stack of `(name, directory)` to visit rather than recursion, `None` marking the way
+    # back up to a parent directory.
+    stack = [(None, root)]
+    while stack:
+        entry = stack.pop()
+        if entry is None:
+            lines.append("$ cd ..")
+            continue
+
+        name, (_, _, subdirectories, files) = entry
+        if name is not None:
+            lines.append(f"$ cd {name}")
+
+        listing = [f"dir {name}" for name, _ in subdirectories] + [f"{size} {name}" for size, name in files]
+        rng.shuffle(listing)
+        lines += ["$ ls"] + listing
+        for subdirectory in reversed(subdirectories):
+            stack += [None, subdirectory]
+
+    return "\n".join(lines) + "\n"
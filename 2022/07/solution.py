@@ -11,7 +11,15 @@ class Directory:
 
     @property
     def size(self) -> int:
-        return sum([c.size for c in self.children.values()])
+        size = 0
+        pending = [self]
+        while pending:
+            for c in pending.pop().children.values():
+                if isinstance(c, File):
+                    size += c.size
+                else:
+                    pending.append(c)
+        return size
 
 
 @dataclass
@@ -58,12 +66,15 @@ def process_command(lines: list[str], index: int, cwd: Directory, root: Director
 
 
 def walk_fs(root: Directory, visit: Callable):
-    visit(root)
-    for c in root.children.values():
-        if isinstance(c, File):
-            visit(c)
-        else:
-            walk_fs(c, visit)
+    """
+    Visits `root` and everything under it depth-first, every directory before its children.
+    """
+    pending: list[Directory | File] = [root]
+    while pending:
+        item = pending.pop()
+        visit(item)
+        if isinstance(item, Directory):
+            pending.extend(reversed(item.children.values()))
 
 
 def filter_fs_items(root: Directory, predicate: Callable[[Directory | File], bool]) -> list[Directory | File]:
@@ -77,23 +88,47 @@ def filter_fs_items(root: Directory, predicate: Callable[[Directory | File], boo
     return items
 
 
+def directory_sizes(root: Directory) -> list[int]:
+    """
+    Returns the sizes of `root` and of every directory under it, in the order they're walked in.
+    Directories are sized in the reverse order, so that the sizes of the directories inside a
+    directory are known by the time it's sized.
+    """
+    directories = filter_fs_items(root, lambda i: isinstance(i, Directory))
+    sizes: dict[int, int] = {}
+    for d in reversed(directories):
+        sizes[id(d)] = sum(sizes[id(c)] if isinstance(c, Directory) else c.size for c in d.children.values())
+    return [sizes[id(d)] for d in directories]
+
+
 ### Process the input
-log = open("2022/07/input.txt").readlines()
-root = Directory(name="/", children={}, parent=None)
-cur_dir = root
-cur_line = 0
-while cur_line < len(log):
-    cur_dir, lines_processed = process_command(log, cur_line, cur_dir, root)
-    cur_line += lines_processed
+def parse(text: str) -> Directory:
+    log = text.splitlines()
+    root = Directory(name="/", children={}, parent=None)
+    cur_dir = root
+    cur_line = 0
+    while cur_line < len(log):
+        cur_dir, lines_processed = process_command(log, cur_line, cur_dir, root)
+        cur_line += lines_processed
+
+    return root
 
 
 ## Part 1
-small_dirs = filter_fs_items(root, lambda i: isinstance(i, Directory) and i.size <= 100000)
-print(sum(map(lambda d: d.size, small_dirs)))
+def part1(root: Directory) -> int:
+    return sum(size for size in directory_sizes(root) if size <= 100000)
+
 
 ## Part 2
-used_disk_space = root.size
-free_disk_space = 70000000 - used_disk_space
-need_to_free = 30000000 - free_disk_space
-large_enough_dirs = filter_fs_items(root, lambda i: isinstance(i, Directory) and i.size >= need_to_free)
-print(min(map(lambda d: d.size, large_enough_dirs)))
+def part2(root: Directory) -> int:
+    sizes = directory_sizes(root)
+    used_disk_space = sizes[0]
+    free_disk_space = 70000000 - used_disk_space
+    need_to_free = 30000000 - free_disk_space
+    return min(size for size in sizes if size >= need_to_free)
+
+
+if __name__ == "__main__":
+    root = parse(open("2022/07/input.txt").read())
+    print(part1(root))
+    print(part2(root))
@@ -17,17 +17,31 @@ def in_bounds(tree_map: TreeMap, row: int, col: int) -> bool:
 def find_max_height_in_direction(
     tree_map: TreeMap, max_heights_map: MaxHeightMap, row: int, col: int, direction: int
 ) -> int:
+    """
+    Returns the height of the highest tree from (`row`, `col`) to the edge of the map in
+    `direction`, filling the height of the highest tree beyond every tree on the way.
+
+    Trees are followed towards the edge until one whose highest tree beyond is known (or the edge),
+    and then filled back from there.
+    """
     step = {UP: (-1, 0), RIGHT: (0, 1), DOWN: (1, 0), LEFT: (0, -1)}[direction]
-    n_row, n_col = row + step[0], col + step[1]
-    if max_heights_map[row][col][direction] is not None:
-        max_height = max_heights_map[row][col][direction]
-    elif not in_bounds(tree_map, n_row, n_col):
-        max_height = -1
-    else:
-        max_height = find_max_height_in_direction(tree_map, max_heights_map, n_row, n_col, direction)
+    path = [(row, col)]
+    while max_heights_map[path[-1][0]][path[-1][1]][direction] is None:
+        n_row, n_col = path[-1][0] + step[0], path[-1][1] + step[1]
+        if not in_bounds(tree_map, n_row, n_col):
+            break
+        path.append((n_row, n_col))
+
+    r, c = path.pop()
+    max_height = max_heights_map[r][c][direction]
+    if max_height is None:
+        max_height = max_heights_map[r][c][direction] = -1
+    max_height = max(max_height, tree_map[r][c])
+    for r, c in reversed(path):
+        max_heights_map[r][c][direction] = max_height
+        max_height = max(max_height, tree_map[r][c])
 
-    max_heights_map[row][col][direction] = max_height
-    return max(max_height, tree_map[row][col])
+    return max_height
 
 
 def find_max_heights_in_all_directions(tree_map: TreeMap, max_heights_map: MaxHeightMap, row: int, col: int):
@@ -56,13 +70,75 @@ def is_tree_visible_from_outside(tree_map: TreeMap, max_heights_map: MaxHeightMa
     )
 
 
-tree_map = [[int(t) for t in list(l.strip())] for l in open("2022/08/input.txt").readlines()]
-max_heights_map = build_max_heights_map(tree_map)
+def parse(text: str) -> TreeMap:
+    return [[int(t) for t in l] for l in text.splitlines()]
+
+
+### Part 1
+def part1(tree_map: TreeMap) -> int:
+    max_heights_map = build_max_heights_map(tree_map)
+    visible_trees = []
+    for r in range(len(tree_map)):
+        for c in range(len(tree_map[0])):
+            if is_tree_visible_from_outside(tree_map, max_heights_map, r, c):
+                visible_trees.append((r, c))
+
+    return len(visible_trees)
+
+
+### Part 2
+STEPS = {UP: (-1, 0), RIGHT: (0, 1), DOWN: (1, 0), LEFT: (0, -1)}
+
+
+def find_blockers_in_direction(tree_map: TreeMap, direction: int) -> list[list[Optional[tuple[int, int]]]]:
+    """
+    Returns the position of the first tree at least as tall as every tree when looking in
+    `direction`, `None` for trees that see all the way to the edge.
+
+    Trees are visited so that the trees next to them in `direction` are visited first. The trees a
+    tree's neighbor sees past are all shorter than that neighbor, so when the neighbor is shorter
+    than the tree, the search continues from the neighbor's blocker instead of checking them again.
+    """
+    d_row, d_col = STEPS[direction]
+    rows = range(len(tree_map)) if d_row <= 0 else range(len(tree_map) - 1, -1, -1)
+    cols = range(len(tree_map[0])) if d_col <= 0 else range(len(tree_map[0]) - 1, -1, -1)
+
+    blockers = [[None for _ in tree_map[0]] for _ in tree_map]
+    for r in rows:
+        for c in cols:
+            blocker = (r + d_row, c + d_col)
+            while (
+                blocker is not None
+                and in_bounds(tree_map, *blocker)
+                and tree_map[blocker[0]][blocker[1]] < tree_map[r][c]
+            ):
+                blocker = blockers[blocker[0]][blocker[1]]
+            blockers[r][c] = blocker if blocker is not None and in_bounds(tree_map, *blocker) else None
+
+    return blockers
+
+
+def viewing_distance(tree_map: TreeMap, row: int, col: int, direction: int, blocker: Optional[tuple[int, int]]) -> int:
+    if blocker is not None:
+        return abs(blocker[0] - row) + abs(blocker[1] - col)
+
+    return {UP: row, RIGHT: len(tree_map[0]) - 1 - col, DOWN: len(tree_map) - 1 - row, LEFT: col}[direction]
+
+
+def part2(tree_map: TreeMap) -> int:
+    blockers = {d: find_blockers_in_direction(tree_map, d) for d in (UP, RIGHT, DOWN, LEFT)}
+    max_scenic_score = 0
+    for r in range(len(tree_map)):
+        for c in range(len(tree_map[0])):
+            scenic_score = 1
+            for d in (UP, RIGHT, DOWN, LEFT):
+                scenic_score *= viewing_distance(tree_map, r, c, d, blockers[d][r][c])
+            max_scenic_score = max(max_scenic_score, scenic_score)
+
+    return max_scenic_score
 
-visible_trees = []
-for r in range(len(tree_map)):
-    for c in range(len(tree_map[0])):
-        if is_tree_visible_from_outside(tree_map, max_heights_map, r, c):
-            visible_trees.append((r, c))
 
-print(f"Total visible trees: {len(visible_trees)}")
+if __name__ == "__main__":
+    tree_map = parse(open("2022/08/input.txt").read())
+    print(f"Total visible trees: {part1(tree_map)}")
+    print(f"Highest scenic score: {part2(tree_map)}")
@@ -0,0 +1,21 @@
+"""
+A square map of tree heights (`0` to `9`). As in real inputs, trees tend to grow taller towards the
+middle of the map, with plenty of noise.
+"""
+import random
+
+from aoc.generators import scaled_side
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    side = scaled_side(99, scale)
+    middle = (side - 1) / 2
+    rows = []
+    for r in range(side):
+        row = []
+        for c in range(side):
+            closeness = 1 - max(abs(r - middle), abs(c - middle)) / max(middle, 1)
+            row.append(str(min(9, max(0, round(6 * closeness + rng.gauss(1.5, 2))))))
+        rows.append("".join(row))
+
+    return "\n".join(rows) + "\n"
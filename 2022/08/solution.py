@@ -1,65 +1,87 @@
 from functools import reduce
-from itertools import chain
 
-TreeMapEntry = list[int]
-TreeMap = list[list[int]]
+import numpy as np
+
+from aoc.grid import Grid
+
+TreeMap = Grid
 
 UP = 0
 RIGHT = 1
 DOWN = 2
 LEFT = 3
 DIRECTIONS = (UP, RIGHT, DOWN, LEFT)
-STEP_IN_DIRECTION = {UP: (-1, 0), RIGHT: (0, 1), DOWN: (1, 0), LEFT: (0, -1)}
 
+# Number of counterclockwise quarter turns that bring a direction to point left, so every direction
+# is handled by looking to the left in a rotated view of the map.
+ROTATIONS_TO_LEFT = {LEFT: 0, DOWN: 1, RIGHT: 2, UP: 3}
 
-def in_bounds(tree_map: TreeMap, row: int, col: int) -> bool:
-    return row >= 0 and row < len(tree_map) and col >= 0 and col < len(tree_map[0])
+MAX_HEIGHT = 9
 
 
-tree_map = [[int(t) for t in list(l.strip())] for l in open("2022/08/input.txt").readlines()]
-h, w = len(tree_map), len(tree_map[0])
-map_cords = tuple(chain.from_iterable([[(r, c) for c in range(w)] for r in range(h)]))
+def heights_from_direction(tree_map: TreeMap, direction: int) -> np.ndarray:
+    """
+    Returns a view of the tree heights rotated such that `direction` points to the left.
+    """
+    return np.rot90(tree_map.cells - ord("0"), ROTATIONS_TO_LEFT[direction])
 
 
-### Part 1
-def is_tree_visible_from_direction(tree_map: TreeMap, row: int, col: int, direction: int) -> bool:
-    step = STEP_IN_DIRECTION[direction]
-    n_row, n_col = row + step[0], col + step[1]
-    while in_bounds(tree_map, n_row, n_col):
-        if tree_map[row][col] <= tree_map[n_row][n_col]:
-            return False
-        n_row, n_col = n_row + step[0], n_col + step[1]
-    return True
+def from_direction(values: np.ndarray, direction: int) -> np.ndarray:
+    """
+    Rotates an array computed by `heights_from_direction(..., direction)` back to the map's layout.
+    """
+    return np.rot90(values, -ROTATIONS_TO_LEFT[direction])
 
 
-def is_tree_visible(tree_map: TreeMap, row: int, col: int) -> bool:
-    return any(map(lambda d: is_tree_visible_from_direction(tree_map, row, col, d), DIRECTIONS))
+def parse(text: str) -> TreeMap:
+    return Grid.from_text(text)
 
 
-visible_trees = list(filter(lambda p: is_tree_visible(tree_map, p[0], p[1]), map_cords))
-print(f"Total visible trees: {len(visible_trees)}")
+### Part 1
+def visible_from_left(heights: np.ndarray) -> np.ndarray:
+    """
+    Marks the trees taller than all trees to their left.
+    """
+    tallest_so_far = np.maximum.accumulate(heights.astype(np.int8), axis=1)
+    tallest_to_the_left = np.pad(tallest_so_far[:, :-1], ((0, 0), (1, 0)), constant_values=-1)
+    return heights > tallest_to_the_left
+
+
+def part1(tree_map: TreeMap) -> int:
+    visible = reduce(
+        np.logical_or,
+        (from_direction(visible_from_left(heights_from_direction(tree_map, d)), d) for d in DIRECTIONS),
+    )
+    return int(visible.sum())
 
 
 ### Part 2
-def visible_trees_in_direction(tree_map: TreeMap, row: int, col: int, direction: int) -> int:
-    step = STEP_IN_DIRECTION[direction]
-    n_row, n_col = row + step[0], col + step[1]
-    visible_trees = 0
-    while in_bounds(tree_map, n_row, n_col):
-        visible_trees += 1
-        if tree_map[row][col] <= tree_map[n_row][n_col]:
-            break
-        n_row, n_col = n_row + step[0], n_col + step[1]
+def visible_trees_to_the_left(heights: np.ndarray) -> np.ndarray:
+    """
+    Counts, for every tree, the trees it sees to its left: up to and including the first tree at
+    least as tall as itself, or up to the edge of the map.
+    """
+    cols = np.broadcast_to(np.arange(heights.shape[1]), heights.shape)
+    visible_trees = np.zeros(heights.shape, dtype=np.int64)
+    for height in range(MAX_HEIGHT + 1):
+        # Column of the closest blocking tree at or to the left of every tree, the map's edge
+        # (column 0) blocks the view of trees without a blocking tree.
+        blocking = np.maximum.accumulate(np.where(heights >= height, cols, 0), axis=1)
+        blocking_to_the_left = np.pad(blocking[:, :-1], ((0, 0), (1, 0)))
+        visible_trees = np.where(heights == height, cols - blocking_to_the_left, visible_trees)
+
     return visible_trees
 
 
-def tree_scenic_score(tree_map: TreeMap, row: int, col: int) -> int:
-    return reduce(
-        lambda x, y: x * y,
-        map(lambda d: visible_trees_in_direction(tree_map, row, col, d), DIRECTIONS),
-        1,
+def part2(tree_map: TreeMap) -> int:
+    scenic_scores = reduce(
+        np.multiply,
+        (from_direction(visible_trees_to_the_left(heights_from_direction(tree_map, d)), d) for d in DIRECTIONS),
     )
+    return int(scenic_scores.max())
 
 
-highest_score = max(map(lambda p: tree_scenic_score(tree_map, p[0], p[1]), map_cords))
-print(f"Highest scenic score: {highest_score}")
+if __name__ == "__main__":
+    tree_map = parse(open("2022/08/input.txt").read())
+    print(f"Total visible trees: {part1(tree_map)}")
+    print(f"Highest scenic score: {part2(tree_map)}")
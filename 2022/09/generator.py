@@ -0,0 +1,19 @@
+"""
+Rope motions: a direction (`U`, `D`, `L` or `R`) and a number of steps. As in real inputs, motions
+get longer along the file, from 1 or 2 steps at its start to up to 19 at its end.
+"""
+import random
+
+from aoc.generators import scaled
+
+MAX_STEPS = 19
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    count = scaled(2000, scale)
+    motions = []
+    for i in range(count):
+        longest = 2 + (MAX_STEPS - 2) * i // count
+        motions.append(f"{rng.choice('UDLR')} {rng.randint(1, longest)}")
+
+    return "\n".join(motions) + "\n"
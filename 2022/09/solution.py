@@ -43,12 +43,23 @@ def rope_knot_follow(leading: Position, following: Position) -> Position:
     return following[0] + step[0], following[1] + step[1]
 
 
-instructions = open("2022/09/input.txt").readlines()
+def parse(text: str) -> list[str]:
+    return text.splitlines()
+
 
 ### Part 1
-tail_positions = set(map(lambda rp: rp[-1], simulate_rope_movement(2, (0, 0), instructions)))
-print(f"Rope length: 2 knots, Unique tail positions: {len(tail_positions)} ")
+def part1(instructions: list[str]) -> int:
+    tail_positions = set(map(lambda rp: rp[-1], simulate_rope_movement(2, (0, 0), instructions)))
+    return len(tail_positions)
+
 
 ### Part 2
-tail_positions = set(map(lambda rp: rp[-1], simulate_rope_movement(10, (0, 0), instructions)))
-print(f"Rope length: 10 knots, Unique tail positions: {len(tail_positions)}")
+def part2(instructions: list[str]) -> int:
+    tail_positions = set(map(lambda rp: rp[-1], simulate_rope_movement(10, (0, 0), instructions)))
+    return len(tail_positions)
+
+
+if __name__ == "__main__":
+    instructions = parse(open("2022/09/input.txt").read())
+    print(f"Rope length: 2 knots, Unique tail positions: {part1(instructions)} ")
+    print(f"Rope length: 10 knots, Unique tail positions: {part2(instructions)}")
@@ -0,0 +1,29 @@
+"""
+CPU instructions: `noop` and `addx V`, running for exactly 240 cycles and keeping the sprite (`X`)
+on the screen.
+
+The CRT of the puzzle is 6 rows of 40 pixels, one per cycle, and the solution draws beyond it if
+the program runs any longer. So the program can't grow with the scale, which is ignored.
+"""
+import random
+
+CYCLES = 240
+SCREEN_WIDTH = 40
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    instructions = []
+    cycles, x = 0, 1
+    while cycles < CYCLES:
+        if cycles + 2 > CYCLES or rng.random() < 0.35:
+            instructions.append("noop")
+            cycles += 1
+            continue
+
+        v = 0
+        while v == 0 or not 0 <= x + v < SCREEN_WIDTH:
+            v = rng.randint(-15, 15)
+        instructions.append(f"addx {v}")
+        cycles, x = cycles + 2, x + v
+
+    return "\n".join(instructions) + "\n"
@@ -1,9 +1,6 @@
 from typing import Iterable
 
 
-instructions = [l.strip() for l in open("2022/10/input.txt")]
-
-
 def sample_cycle_if_needed(c, X, samples):
     if c == 20 or (c - 20) % 40 == 0:
         samples[c] = X
@@ -37,15 +34,27 @@ def execute_instructions(instructions: Iterable[str], samples, CRT):
         c += 1
 
 
-samples = {}
-CRT = [list("." * 40) for _ in range(6)]
-execute_instructions(instructions, samples, CRT)
+def parse(text: str) -> list[str]:
+    return [l.strip() for l in text.splitlines()]
+
 
 ### Part 1
-print(
-    "Sum of signal strengths: ",
-    sum(map(lambda sample: sample[0] * sample[1], samples.items())),
-)
+def part1(instructions: list[str]) -> int:
+    samples = {}
+    CRT = [list("." * 40) for _ in range(6)]
+    execute_instructions(instructions, samples, CRT)
+    return sum(map(lambda sample: sample[0] * sample[1], samples.items()))
+
 
 ### Part 2
-print("\n".join(["".join(row) for row in CRT]))
+def part2(instructions: list[str]) -> str:
+    samples = {}
+    CRT = [list("." * 40) for _ in range(6)]
+    execute_instructions(instructions, samples, CRT)
+    return "\n".join(["".join(row) for row in CRT])
+
+
+if __name__ == "__main__":
+    instructions = parse(open("2022/10/input.txt").read())
+    print("Sum of signal strengths: ", part1(instructions))
+    print(part2(instructions))
@@ -0,0 +1,38 @@
+"""
+Monkeys: the worry levels of the items each monkey starts with, how it changes them and to which of
+two other monkeys it throws them. The tests divide by distinct primes, as in real inputs, and one
+monkey squares the worry levels.
+
+Real inputs have 8 monkeys holding 1 to 8 items each, larger scales add monkeys.
+"""
+import random
+
+from aoc.generators import primes, scaled
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    count = max(2, scaled(8, scale))
+    dividers = primes(count, 2)
+    rng.shuffle(dividers)
+    squaring = rng.randrange(count)
+
+    monkeys = []
+    for i, divider in enumerate(dividers):
+        items = [rng.randint(50, 99) for _ in range(rng.randint(1, 8))]
+        if i == squaring:
+            operation = "old * old"
+        elif rng.random() < 0.3:
+            operation = f"old * {rng.randint(2, 19)}"
+        else:
+            operation = f"old + {rng.randint(1, 8)}"
+        targets = rng.sample([m for m in range(count) if m != i], 2)
+        monkeys.append(
+            f"Monkey {i}:\n"
+            f"  Starting items: {', '.join(map(str, items))}\n"
+            f"  Operation: new = {operation}\n"
+            f"  Test: divisible by {divider}\n"
+            f"    If true: throw to monkey {targets[0]}\n"
+            f"    If false: throw to monkey {targets[1]}\n"
+        )
+
+    return "\n".join(monkeys)
@@ -1,6 +1,11 @@
+import copy
 from dataclasses import dataclass
 import math
-import regex
+
+from aoc import tracing
+from aoc.lazy import lazy_import
+
+regex = lazy_import("regex")
 
 
 @dataclass
@@ -43,8 +48,8 @@ class Monkey:
         return self.next_monkey_true if item % self.divider == 0 else self.next_monkey_false
 
 
-def process_input(raw_input: str) -> list[Monkey]:
-    return [Monkey.from_descriptor(d) for d in raw_input.split("\n\n")]
+def parse(raw_input: str) -> list[Monkey]:
+    return [Monkey.from_descriptor(d) for d in raw_input.strip().split("\n\n")]
 
 
 def play_round(monkeys: list[Monkey], relief: bool = True, common_divisor: int = 0) -> list[int]:
@@ -64,19 +69,29 @@ def play_round(monkeys: list[Monkey], relief: bool = True, common_divisor: int =
     return inspection_counters
 
 
-raw_input = open("2022/11/input.txt").read()
-monkeys = process_input(raw_input)
+def monkey_business_level(counters: list[list[int]]) -> int:
+    total_counters = [sum(c) for c in zip(*counters)]
+    top1, top2 = sorted(total_counters, reverse=True)[0:2]
+    return top1 * top2
+
 
 ### Part 1
-counters = [play_round(monkeys) for _ in range(20)]
-total_counters = [sum(c) for c in zip(*counters)]
-top1, top2 = sorted(total_counters, reverse=True)[0:2]
-print(top1 * top2)
+def part1(monkeys: list[Monkey]) -> int:
+    monkeys = copy.deepcopy(monkeys)
+    counters = [play_round(monkeys) for _ in range(20)]
+    return monkey_business_level(counters)
 
 
 ### Part 2
-common_divisor = math.prod([m.divider for m in monkeys])
-counters = [play_round(monkeys, False, common_divisor) for _ in range(10000)]
-total_counters = [sum(c) for c in zip(*counters)]
-top1, top2 = sorted(total_counters, reverse=True)[0:2]
-print(top1 * top2)
+def part2(monkeys: list[Monkey]) -> int:
+    monkeys = copy.deepcopy(monkeys)
+    common_divisor = math.prod([m.divider for m in monkeys])
+    with tracing.span("rounds", rounds=10000):
+        counters = [play_round(monkeys, False, common_divisor) for _ in range(10000)]
+    return monkey_business_level(counters)
+
+
+if __name__ == "__main__":
+    monkeys = parse(open("2022/11/input.txt").read())
+    print(part1(monkeys))
+    print(part2(monkeys))
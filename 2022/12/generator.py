@@ -0,0 +1,71 @@
+"""
+A heightmap (`a` to `z`) with a start (`S`) and a best signal location (`E`). The map is a
+landscape of scattered rocky cells around valleys that slope up towards `E`: outside of the rocks,
+a cell's height only depends on how far from `E` it is, so the start (placed as far as possible)
+can always climb there. Rocks stand a few units above their surroundings and can mostly only be
+walked down from.
+
+Real maps are 40 rows of 80 cells, larger scales grow both sides.
+"""
+from collections import deque
+import random
+import string
+
+from aoc.generators import scaled_side
+
+ROCK_PROBABILITY = 0.3
+HEIGHTS = string.ascii_lowercase
+
+
+def distances_from(end: tuple[int, int], rocks: list[list[bool]]) -> list[list[int]]:
+    """
+    Returns the number of steps from `end` to every cell over cells that aren't rocks, -1 for cells
+    that can't be reached.
+    """
+    height, width = len(rocks), len(rocks[0])
+    distances = [[-1] * width for _ in range(height)]
+    distances[end[0]][end[1]] = 0
+    queue = deque([end])
+    while queue:
+        r, c = queue.popleft()
+        for nr, nc in ((r - 1, c), (r, c + 1), (r + 1, c), (r, c - 1)):
+            if 0 <= nr < height and 0 <= nc < width and not rocks[nr][nc] and distances[nr][nc] < 0:
+                distances[nr][nc] = distances[r][c] + 1
+                queue.append((nr, nc))
+
+    return distances
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    height, width = scaled_side(40, scale), max(2, scaled_side(80, scale))
+    while True:
+        rocks = [[rng.random() < ROCK_PROBABILITY for _ in range(width)] for _ in range(height)]
+        end = rng.randrange(height), rng.randrange(width)
+        rocks[end[0]][end[1]] = False
+        distances = distances_from(end, rocks)
+        farthest = max(max(row) for row in distances)
+        # Retry ends that rocks (almost) enclose.
+        if farthest >= (height + width) // 2:
+            break
+
+    # The number of steps in distance over which the height drops by one, such that cells in the
+    # farthest third of the valleys are all at the lowest height.
+    steps_per_height = max(1, 2 * farthest // (3 * (len(HEIGHTS) - 1)))
+    levels = [[max(0, len(HEIGHTS) - 1 - d // steps_per_height) if d >= 0 else None for d in row] for row in distances]
+    for r in range(height):
+        for c in range(width):
+            if levels[r][c] is None:
+                # Rocks, and cells that rocks cut off from the end.
+                neighbours = [
+                    levels[nr][nc]
+                    for nr, nc in ((r - 1, c), (r, c + 1), (r + 1, c), (r, c - 1))
+                    if 0 <= nr < height and 0 <= nc < width and levels[nr][nc] is not None
+                ]
+                base = max(neighbours, default=rng.randrange(len(HEIGHTS)))
+                levels[r][c] = min(len(HEIGHTS) - 1, base + rng.randint(2, 4))
+
+    rows = [[HEIGHTS[level] for level in row] for row in levels]
+    start = rng.choice([(r, c) for r in range(height) for c in range(width) if distances[r][c] == farthest])
+    rows[start[0]][start[1]] = "S"
+    rows[end[0]][end[1]] = "E"
+    return "\n".join("".join(row) for row in rows) + "\n"
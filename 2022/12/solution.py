@@ -1,61 +1,67 @@
-from collections import deque
-from itertools import product
 import string
 
-Grid = list[list[str]]
-Cell = tuple[int, int]
+import numpy as np
 
-neighbors_offsets = ((1, 0), (0, 1), (-1, 0), (0, -1))
+from aoc import counters
+from aoc.graph import Digraph, SearchStats, bfs
+from aoc.grid import ORTHOGONAL_OFFSETS, Grid
 
+# Height of the padding around the map, too high to ever climb to.
+UNREACHABLE_HEIGHT = 0xFF
 
-def can_move_to_cell(grid: Grid, src: Cell, dst: Cell) -> bool:
-    return (
-        0 <= dst[0] < len(grid)
-        and 0 <= dst[1] < len(grid[0])
-        and ord(grid[dst[0]][dst[1]]) <= ord(grid[src[0]][src[1]]) + 1
-    )
+# The climbing graph of the map along with its start and end nodes and all nodes at the lowest
+# elevation.
+HeightMap = tuple[Digraph, int, int, tuple[int, ...]]
 
 
-def get_grid_neighbors(grid: Grid, p: Cell) -> tuple[Cell]:
-    return tuple(
-        filter(
-            lambda c: can_move_to_cell(grid, p, c),
-            [(p[0] + o[0], p[1] + o[1]) for o in neighbors_offsets],
-        )
-    )
+def build_climbing_graph(grid: Grid) -> Digraph:
+    """
+    Returns a graph whose nodes are the flat indexes of the cells of `grid`, with an edge from each
+    cell to every neighbor that is at most one unit of height higher.
+    """
+    heights = grid.flat.astype(np.int16)
+    cells = grid.indexes(string.ascii_lowercase)
+    sources = np.repeat(cells, len(ORTHOGONAL_OFFSETS))
+    targets = (cells[:, np.newaxis] + grid.flat_offsets(ORTHOGONAL_OFFSETS)).reshape(-1)
+    can_climb = heights[targets] <= heights[sources] + 1
+    return Digraph.from_arrays(len(heights), sources[can_climb], targets[can_climb])
 
 
-def find_shortest_path(grid: Grid, start: tuple[Cell], end: Cell) -> tuple[int, dict[Cell, Cell]]:
-    if start == end:
-        return 0, {}
+def find_shortest_path(climbing_graph: Digraph, start: tuple[int, ...], end: int) -> int:
+    """
+    Returns the number of steps of the shortest path from any of the `start` cells to the `end`
+    cell, or -1 if `end` can't be reached.
+    """
+    stats = SearchStats()
+    steps = bfs(climbing_graph, start, target=end, stats=stats)[end]
+    counters.add("nodes_expanded", stats.nodes_expanded)
+    return steps
 
-    queue = deque(((c, 0) for c in start))
-    traceback = {start: None}
-    while len(queue) > 0:
-        cell, cell_distance = queue.popleft()
-        if cell == end:
-            return cell_distance, traceback
 
-        for n in get_grid_neighbors(grid, cell):
-            if n not in traceback:
-                queue.append((n, cell_distance + 1))
-                traceback[n] = cell
+def parse(text: str) -> HeightMap:
+    """
+    The start and end markers are replaced in the grid by their actual heights before building the
+    climbing graph.
+    """
+    grid = Grid.from_text(text, fill=UNREACHABLE_HEIGHT)
+    start_marker, end_marker = grid.find("S")[0], grid.find("E")[0]
+    grid[start_marker] = "a"
+    grid[end_marker] = "z"
+    lowest_cells = tuple(grid.indexes("a").tolist())
+    return build_climbing_graph(grid), grid.index(start_marker), grid.index(end_marker), lowest_cells
 
-    # Queue is empty end we never reached the target cell.
-    return -1, None
 
+def part1(height_map: HeightMap) -> int:
+    climbing_graph, start_marker, end_marker, _ = height_map
+    return find_shortest_path(climbing_graph, (start_marker,), end_marker)
 
-grid = [list(l.strip()) for l in open("2022/12/input.txt")]
-grid_indexes = tuple((r, c) for r, c in product(range(len(grid)), range(len(grid[0]))))
-start_marker = tuple(filter(lambda gi: grid[gi[0]][gi[1]] == "S", grid_indexes))[0]
-end_marker = tuple(filter(lambda gi: grid[gi[0]][gi[1]] == "E", grid_indexes))[0]
-grid[start_marker[0]][start_marker[1]] = "a"
-grid[end_marker[0]][end_marker[1]] = "z"
 
-start_cells = (start_marker,)
-shortest_path_len, traceback = find_shortest_path(grid, start_cells, end_marker)
-print(f"Shortest path (len = {shortest_path_len})")
+def part2(height_map: HeightMap) -> int:
+    climbing_graph, _, end_marker, lowest_cells = height_map
+    return find_shortest_path(climbing_graph, lowest_cells, end_marker)
 
-start_cells = tuple((r, c) for r, c in grid_indexes if grid[r][c] == "a")
-shortest_path_len, traceback = find_shortest_path(grid, start_cells, end_marker)
-print(f"Shortest path (len = {shortest_path_len})")
+
+if __name__ == "__main__":
+    height_map = parse(open("2022/12/input.txt").read())
+    print(f"Shortest path (len = {part1(height_map)})")
+    print(f"Shortest path (len = {part2(height_map)})")
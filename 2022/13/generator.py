@@ -0,0 +1,50 @@
+"""
+Pairs of packets: nested lists of integers (0 to 10). As in real inputs, the second packet of most
+pairs shares a prefix with the first one, so comparing them goes deep before finding a difference.
+"""
+import copy
+import json
+import random
+
+from aoc.generators import scaled
+
+MAX_DEPTH = 4
+
+
+def random_packet(rng: random.Random, depth: int = 0) -> list:
+    return [
+        random_packet(rng, depth + 1) if depth < MAX_DEPTH and rng.random() < 0.3 else rng.randint(0, 10)
+        for _ in range(rng.randint(0, 5))
+    ]
+
+
+def mutate(rng: random.Random, packet: list) -> list:
+    """
+    Returns a copy of `packet` with one change somewhere in it.
+    """
+    packet = copy.deepcopy(packet)
+    values = packet
+    while values and rng.random() < 0.6:
+        i = rng.randrange(len(values))
+        if not isinstance(values[i], list):
+            values[i] = rng.randint(0, 10) if rng.random() < 0.5 else [values[i]]
+            return packet
+        values = values[i]
+
+    if values and rng.random() < 0.5:
+        del values[rng.randrange(len(values)) :]
+    else:
+        values.append(random_packet(rng, MAX_DEPTH - 1) if rng.random() < 0.3 else rng.randint(0, 10))
+    return packet
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    pairs = []
+    for _ in range(scaled(150, scale)):
+        first = random_packet(rng)
+        second = mutate(rng, first) if rng.random() < 0.8 else random_packet(rng)
+        if rng.random() < 0.5:
+            first, second = second, first
+        pairs.append(f"{json.dumps(first, separators=(',', ':'))}\n{json.dumps(second, separators=(',', ':'))}\n")
+
+    return "\n".join(pairs)
@@ -16,22 +16,33 @@ def compare(v1, v2) -> int:
 
 
 ### Load input
-packet_pairs = [[eval(p.strip()) for p in pp.split("\n")] for pp in open("2022/13/input.txt").read().split("\n\n")]
+def parse(text: str) -> list[list]:
+    return [[eval(p.strip()) for p in pp.split("\n")] for pp in text.strip().split("\n\n")]
+
 
 ### Part 1
-right_order_pairs = list(
-    filter(
-        lambda i: compare(packet_pairs[i - 1][0], packet_pairs[i - 1][1]) <= 0,
-        range(1, len(packet_pairs) + 1),
+def part1(packet_pairs: list[list]) -> int:
+    right_order_pairs = list(
+        filter(
+            lambda i: compare(packet_pairs[i - 1][0], packet_pairs[i - 1][1]) <= 0,
+            range(1, len(packet_pairs) + 1),
+        )
     )
-)
-print(f"Sum of right order packet pairs indices: {sum(right_order_pairs)}")
+    return sum(right_order_pairs)
+
 
 ### Part 2
-dividers = [[[2]], [[6]]]
-sorted_packets = sorted(list(chain.from_iterable(packet_pairs)) + dividers, key=cmp_to_key(compare))
-dividers_indices = (
-    sorted_packets.index(dividers[0]) + 1,
-    sorted_packets.index(dividers[1]) + 1,
-)
-print(f"Decoder key for distress signal is: {dividers_indices[0] * dividers_indices[1]}")
+def part2(packet_pairs: list[list]) -> int:
+    dividers = [[[2]], [[6]]]
+    sorted_packets = sorted(list(chain.from_iterable(packet_pairs)) + dividers, key=cmp_to_key(compare))
+    dividers_indices = (
+        sorted_packets.index(dividers[0]) + 1,
+        sorted_packets.index(dividers[1]) + 1,
+    )
+    return dividers_indices[0] * dividers_indices[1]
+
+
+if __name__ == "__main__":
+    packet_pairs = parse(open("2022/13/input.txt").read())
+    print(f"Sum of right order packet pairs indices: {part1(packet_pairs)}")
+    print(f"Decoder key for distress signal is: {part2(packet_pairs)}")
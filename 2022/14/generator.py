@@ -0,0 +1,46 @@
+"""
+Rock paths of a cave's scan, points `x,y` joined by straight horizontal or vertical lines. As in
+real inputs, the rocks form ledges, cups and combs scattered below the sand source
+(`500,0`), and many paths are listed several times.
+
+Real caves are about 170 deep and as wide, larger scales grow both.
+"""
+import random
+
+from aoc.generators import scaled, scaled_side
+
+SOURCE_X = 500
+TOP = 13
+
+
+def ledge(rng: random.Random, x: int, y: int) -> list[tuple[int, int]]:
+    return [(x, y), (x + rng.randint(2, 6), y)]
+
+
+def cup(rng: random.Random, x: int, y: int) -> list[tuple[int, int]]:
+    width, depth = rng.randint(5, 14), rng.randint(3, 7)
+    return [(x, y), (x, y + depth), (x + width, y + depth), (x + width, y + rng.randint(0, depth - 1))]
+
+
+def comb(rng: random.Random, x: int, y: int) -> list[tuple[int, int]]:
+    base = y + 10
+    points = [(x, base)]
+    for tooth in range(rng.randint(3, 14)):
+        tooth_x = x + 2 * tooth
+        if tooth:
+            points.append((tooth_x, base))
+        points += [(tooth_x, base - rng.randint(2, 10)), (tooth_x, base)]
+    return points
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    depth = scaled_side(170, scale)
+    paths = []
+    for _ in range(scaled(60, scale)):
+        shape = rng.choices((ledge, cup, comb), weights=(4, 2, 1))[0]
+        x, y = SOURCE_X + rng.randint(-depth // 4, depth // 4), rng.randint(TOP, depth - 20)
+        path = " -> ".join(f"{px},{py}" for px, py in shape(rng, x, y))
+        paths += [path] * rng.choice((1, 1, 2, 3))
+
+    rng.shuffle(paths)
+    return "\n".join(paths) + "\n"
@@ -1,111 +1,99 @@
+from aoc import counters
+from aoc.grid import Grid
+
 SAND_SRC_COORDS = (500, 0)
-SAND_SRC_MARK = "S"
 AIR_MARK = "."
 ROCK_MARK = "#"
 SAND_UNIT_MARK = "o"
 
+# Padding around the cave, sand reaching it falls into the abyss.
+ABYSS_MARK = "~"
 
-def create_empty_cave_map(paths, initial_top_left, initial_bottom_right, extra_rows=0, extra_cols=0):
-    top_left = initial_top_left
-    bottom_right = initial_bottom_right
-    for p in paths:
-        for i in range(len(p)):
-            if p[i][0] < top_left[0]:
-                top_left = (p[i][0], 0)
-            if p[i][0] > bottom_right[0]:
-                bottom_right = (p[i][0], bottom_right[1])
-            if p[i][1] > bottom_right[1]:
-                bottom_right = (bottom_right[0], p[i][1])
-
-    rows = bottom_right[1] - top_left[1] + 1 + extra_rows
-    cols = bottom_right[0] - top_left[0] + 1 + extra_cols
-    cave_map = [["."] * cols for _ in range(rows)]
 
-    top_left = (top_left[0] - extra_cols // 2, top_left[1])
-    bottom_right = (bottom_right[0] + extra_cols // 2, bottom_right[1] + extra_rows)
-    return cave_map, top_left, bottom_right
+def create_cave_map(paths, floor):
+    """
+    Returns a map of the cave's rocks along with the `(x, y)` coordinates of its top left cell.
+
+    With a `floor` the map is wide enough to hold the whole pile of sand heaped on the floor (which
+    is as wide as twice its height), otherwise it spans the rocks only and sand falling past them
+    reaches the abyss around the map.
+    """
+    xs = [c[0] for p in paths for c in p] + [SAND_SRC_COORDS[0]]
+    max_y = max(c[1] for p in paths for c in p)
+    if floor:
+        max_y += 2
+        xs += [SAND_SRC_COORDS[0] - max_y, SAND_SRC_COORDS[0] + max_y]
+
+    top_left = (min(xs), 0)
+    cave_map = Grid.full((max_y + 1, max(xs) - top_left[0] + 1), AIR_MARK, fill=ABYSS_MARK)
+    for path in paths:
+        for (x1, y1), (x2, y2) in zip(path, path[1:]):
+            rows = slice(min(y1, y2), max(y1, y2) + 1)
+            cols = slice(min(x1, x2) - top_left[0], max(x1, x2) - top_left[0] + 1)
+            cave_map.cells[rows, cols] = ord(ROCK_MARK)
+    if floor:
+        cave_map.cells[max_y, :] = ord(ROCK_MARK)
 
+    return cave_map, top_left
 
-def get_value_at_map_coords(cave_map, top_left, coords):
-    c, r = coords[0] - top_left[0], coords[1] - top_left[1]
-    return cave_map[r][c]
 
+def _count_falls(sand_units, fall_path):
+    # Every cell a unit fell to was pushed on the path once, and popped once the unit came to rest.
+    counters.add("sand_units", sand_units)
+    counters.add("fall_moves", sand_units + len(fall_path) - 1)
 
-def set_value_at_map_coords(cave_map, top_left, coords, value):
-    c, r = coords[0] - top_left[0], coords[1] - top_left[1]
-    cave_map[r][c] = value
 
+def count_resting_sand_units(paths, floor):
+    """
+    Drops sand units from the source one by one until either a unit falls into the abyss or the
+    source gets blocked, and returns the number of units that came to rest.
 
-def set_path_values_on_map(cave_map, top_left, path):
-    for i in range(1, len(path)):
-        if path[i][0] == path[i - 1][0]:
-            d = 1 if path[i][1] > path[i - 1][1] else -1
-            s_coords = ((path[i][0], r) for r in range(path[i - 1][1], path[i][1] + d, d))
-        else:
-            d = 1 if path[i][0] > path[i - 1][0] else -1
-            s_coords = ((c, path[i][1]) for c in range(path[i - 1][0], path[i][0] + d, d))
-        for c in s_coords:
-            set_value_at_map_coords(cave_map, top_left, c, ROCK_MARK)
-
-
-def drop_sand_unit(cave_map, top_left, sand_source_coords):
-    if get_value_at_map_coords(cave_map, top_left, sand_source_coords) != SAND_SRC_MARK:
-        return None
-
-    sand_unit_pos = sand_source_coords
-    while True:
-        try:
-            if get_value_at_map_coords(cave_map, top_left, (sand_unit_pos[0], sand_unit_pos[1] + 1)) == AIR_MARK:
-                sand_unit_pos = sand_unit_pos[0], sand_unit_pos[1] + 1
-            elif get_value_at_map_coords(cave_map, top_left, (sand_unit_pos[0] - 1, sand_unit_pos[1] + 1)) == AIR_MARK:
-                sand_unit_pos = sand_unit_pos[0] - 1, sand_unit_pos[1] + 1
-            elif get_value_at_map_coords(cave_map, top_left, (sand_unit_pos[0] + 1, sand_unit_pos[1] + 1)) == AIR_MARK:
-                sand_unit_pos = sand_unit_pos[0] + 1, sand_unit_pos[1] + 1
-            else:
-                break
-        except IndexError:
-            sand_unit_pos = None
-            break
+    Every unit follows the path of the previous one up to the cell from which the previous unit
+    made its last move, so the path the units fall through is kept as a stack.
+    """
+    cave_map, top_left = create_cave_map(paths, floor)
+    cells = cave_map.flat.tolist()
+    air, abyss, sand = ord(AIR_MARK), ord(ABYSS_MARK), ord(SAND_UNIT_MARK)
 
-    if sand_unit_pos is not None:
-        set_value_at_map_coords(cave_map, top_left, sand_unit_pos, SAND_UNIT_MARK)
-    return sand_unit_pos
+    # Below, below to the left and below to the right, in the order sand tries them.
+    moves = cave_map.flat_offsets(((1, 0), (1, -1), (1, 1)))
 
+    src = cave_map.index((SAND_SRC_COORDS[1] - top_left[1], SAND_SRC_COORDS[0] - top_left[0]))
+    fall_path = [src]
+    sand_units = 0
+    while fall_path:
+        pos = fall_path[-1]
+        for m in moves:
+            if cells[pos + m] == air:
+                fall_path.append(pos + m)
+                break
+            if cells[pos + m] == abyss:
+                _count_falls(sand_units, fall_path)
+                return sand_units
+        else:
+            cells[pos] = sand
+            sand_units += 1
+            fall_path.pop()
 
-def create_cave_map(paths, floor):
-    extra_rows, extra_cols = 0, 0
-    if floor:
-        extra_rows, extra_cols = 2, 500
-
-    cave_map, top_left, bottom_right = create_empty_cave_map(
-        paths, SAND_SRC_COORDS, SAND_SRC_COORDS, extra_rows, extra_cols
-    )
-    set_value_at_map_coords(cave_map, top_left, SAND_SRC_COORDS, SAND_SRC_MARK)
-    for p in paths:
-        set_path_values_on_map(cave_map, top_left, p)
-    if floor:
-        floor_path = [[top_left[0], bottom_right[1]], bottom_right]
-        set_path_values_on_map(cave_map, top_left, floor_path)
+    _count_falls(sand_units, fall_path)
+    return sand_units
 
-    return cave_map, top_left
 
+def parse(text):
+    return [[[int(c) for c in s.split(",")] for s in p] for p in [l.strip().split(" -> ") for l in text.splitlines()]]
 
-paths = [
-    [[int(c) for c in s.split(",")] for s in p] for p in [l.strip().split(" -> ") for l in open("2022/14/input.txt")]
-]
 
 ### Part 1
-cave_map, top_left = create_cave_map(paths, False)
-sand_units = 0
-while drop_sand_unit(cave_map, top_left, SAND_SRC_COORDS) != None:
-    sand_units += 1
+def part1(paths):
+    return count_resting_sand_units(paths, False)
 
-print(f"Sand units dropped: {sand_units}")
 
 ### Part 2
-cave_map, top_left = create_cave_map(paths, True)
-sand_units = 0
-while drop_sand_unit(cave_map, top_left, SAND_SRC_COORDS) != None:
-    sand_units += 1
+def part2(paths):
+    return count_resting_sand_units(paths, True)
+
 
-print(f"Sand units dropped: {sand_units}")
+if __name__ == "__main__":
+    paths = parse(open("2022/14/input.txt").read())
+    print(f"Sand units dropped: {part1(paths)}")
+    print(f"Sand units dropped: {part2(paths)}")
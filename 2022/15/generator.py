@@ -0,0 +1,40 @@
+"""
+Sensors and the closest beacon each of them detected. Every sensor's beacon is one step closer to
+it than a hidden point, so the sensors cover everything around that point but not the point
+itself, and sensors at the four corners of the searched area (`0` to `4,000,000` on both axes)
+make sure it's the only uncovered point of the area: every other point of the area is closer to
+the corner beyond it than the hidden point is.
+
+The searched area is part of the puzzle rather than of the input, so larger scales add sensors to
+the same area.
+"""
+import random
+
+from aoc.generators import scaled
+
+MAX_COORD = 4_000_000
+
+
+def distance(a: tuple[int, int], b: tuple[int, int]) -> int:
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    hidden = rng.randint(1, MAX_COORD - 1), rng.randint(1, MAX_COORD - 1)
+    sensors = {(0, 0), (MAX_COORD, 0), (0, MAX_COORD), (MAX_COORD, MAX_COORD)}
+    while len(sensors) < 4 + scaled(30, scale):
+        sensor = rng.randint(0, MAX_COORD), rng.randint(0, MAX_COORD)
+        if distance(sensor, hidden) > 1:
+            sensors.add(sensor)
+
+    sensors = sorted(sensors)
+    rng.shuffle(sensors)
+    reports = []
+    for sensor in sensors:
+        reach = distance(sensor, hidden) - 1
+        dx = rng.randint(0, reach)
+        dx, dy = rng.choice((-1, 1)) * dx, rng.choice((-1, 1)) * (reach - dx)
+        beacon = sensor[0] + dx, sensor[1] + dy
+        reports.append(f"Sensor at x={sensor[0]}, y={sensor[1]}: closest beacon is at x={beacon[0]}, y={beacon[1]}")
+
+    return "\n".join(reports) + "\n"
@@ -1,26 +1,9 @@
 from itertools import chain, product
-import itertools
 import re
 
+import numpy as np
 
-def minimize_intervals(intervals):
-    if len(intervals) <= 1:
-        return intervals
-
-    intervals.sort(key=lambda x: x[0])
-    minimized = [intervals[0]]
-    for i in range(1, len(intervals)):
-        last_interval = minimized[-1]
-        current_interval = intervals[i]
-        if current_interval[0] <= last_interval[1]:
-            minimized[-1] = (
-                last_interval[0],
-                max(last_interval[1], current_interval[1]),
-            )
-        else:
-            minimized.append(current_interval)
-
-    return minimized
+from aoc.intervals import IntervalSet
 
 
 def parse_input(lines):
@@ -31,15 +14,16 @@ def parse_input(lines):
     }
 
 
-def get_row_coverage_by_sensors(sensors_to_beacons_distance, row):
-    row_coverage_ranges = []
-    for s, d in sensors_to_beacons_distance.items():
-        r = (d - abs(s[1] - row)) * 2 + 1
-        if r <= 0:
-            continue
-        row_coverage_ranges.append((s[0] - (r // 2), s[0] + r // 2 + 1))
+def get_row_coverage_by_sensors(sensors_to_beacons_distance, row) -> IntervalSet:
+    """
+    Returns the x coordinates in `row` covered by any of the sensors.
+    """
+    sensors = np.array(list(sensors_to_beacons_distance.keys())).reshape(-1, 2)
+    distances = np.array(list(sensors_to_beacons_distance.values()))
 
-    return minimize_intervals(row_coverage_ranges)
+    # Half the width of the part of the row each sensor covers, negative for sensors too far away.
+    reach = distances - np.abs(sensors[:, 1] - row)
+    return IntervalSet.from_intervals(np.column_stack([sensors[:, 0] - reach, sensors[:, 0] + reach + 1]))
 
 
 def get_sensor_boundary_lines(s, r):
@@ -78,34 +62,49 @@ def is_point_covered_by_sensor(s, d, p):
     return abs(s[0] - p[0]) + abs(s[1] - p[1]) <= d
 
 
-sensors_to_beacons = parse_input(open("2022/15/input.txt").readlines())
-sensors_to_beacons_distance = {s: abs(s[0] - b[0]) + abs(s[1] - b[1]) for s, b in sensors_to_beacons.items()}
+def find_uncovered_point(sensors_to_beacons_distance, min_x, max_x, min_y, max_y):
+    """
+    The single uncovered point must lie just outside the boundary of some sensors, so it is one of
+    the intersection points of their boundary lines.
+    """
+    lines = list(chain.from_iterable(get_sensor_boundary_lines(s, d) for s, d in sensors_to_beacons_distance.items()))
+    pos_lines, neg_lines = filter(lambda l: l[0] > 0, lines), filter(lambda l: l[0] < 0, lines)
+    all_intersection_points = {get_lines_intersection_point(*p) for p in product(pos_lines, neg_lines)}
+    for p in all_intersection_points:
+        if p[0] < min_x or p[0] > max_x or p[1] < min_y or p[1] > max_y:
+            continue
+
+        p_covered = False
+        for s, d in sensors_to_beacons_distance.items():
+            p_covered |= is_point_covered_by_sensor(s, d, p)
+            if p_covered:
+                break
+        if not p_covered:
+            return p
+
+    return None
+
+
+def parse(text):
+    return parse_input(text.splitlines())
+
 
 ### Part 1
-row = 2000000
-row_coverage_ranges = get_row_coverage_by_sensors(sensors_to_beacons_distance, row)
-beacons = set(sensors_to_beacons.values())
-row_coverage = sum([r[1] - r[0] - len([b for b in beacons if b[1] == row]) for r in row_coverage_ranges])
-print(f"Number of points covered by sensor in row {row} is: {row_coverage}")
+def part1(sensors_to_beacons, row=2000000):
+    sensors_to_beacons_distance = {s: abs(s[0] - b[0]) + abs(s[1] - b[1]) for s, b in sensors_to_beacons.items()}
+    row_coverage = get_row_coverage_by_sensors(sensors_to_beacons_distance, row)
+    beacons_in_row = {b[0] for b in sensors_to_beacons.values() if b[1] == row}
+    return row_coverage.size - sum(b in row_coverage for b in beacons_in_row)
+
 
 ### Part 2
-min_x, max_x = 0, 4000000
-min_y, max_y = 0, 4000000
-
-lines = list(chain.from_iterable(get_sensor_boundary_lines(s, d) for s, d in sensors_to_beacons_distance.items()))
-pos_lines, neg_lines = filter(lambda l: l[0] > 0, lines), filter(lambda l: l[0] < 0, lines)
-all_intersection_points = {get_lines_intersection_point(*p) for p in product(pos_lines, neg_lines)}
-for p in all_intersection_points:
-    if p[0] < min_x or p[0] > max_x or p[1] < min_y or p[1] > max_y:
-        continue
-
-    p_covered = False
-    for s, d in sensors_to_beacons_distance.items():
-        p_covered |= is_point_covered_by_sensor(s, d, p)
-        if p_covered:
-            break
-    if not p_covered:
-        break
-
-print(f"Point {p} is not covered by any sensor")
-print(f"The tuning frequency for a beacon in this point would be: {p[0] * 4000000 + p[1]}")
+def part2(sensors_to_beacons, max_coord=4000000):
+    sensors_to_beacons_distance = {s: abs(s[0] - b[0]) + abs(s[1] - b[1]) for s, b in sensors_to_beacons.items()}
+    p = find_uncovered_point(sensors_to_beacons_distance, 0, max_coord, 0, max_coord)
+    return p[0] * 4000000 + p[1]
+
+
+if __name__ == "__main__":
+    sensors_to_beacons = parse(open("2022/15/input.txt").read())
+    print(f"Number of points covered by sensor in row 2000000 is: {part1(sensors_to_beacons)}")
+    print(f"The tuning frequency for a beacon in the uncovered point would be: {part2(sensors_to_beacons)}")
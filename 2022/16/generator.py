@@ -0,0 +1,58 @@
+"""
+Valves, their flow rates and the tunnels between them. As in real inputs, the working valves (those
+with a positive flow rate) and the start valve `AA` are hubs, linked to each other by corridors of
+valves that are stuck closed and lead to exactly two others.
+
+The solutions walk every order of opening the working valves, which grows exponentially with their
+number, so larger scales add corridor valves proportionally but only add one working valve for every
+doubling of the scale (there are 15 of them in real inputs). Valve names are two letters, which
+caps the number of valves at 676.
+"""
+import itertools
+import math
+import random
+import string
+
+from aoc.generators import scaled
+
+START = "AA"
+MAX_VALVES = 26 * 26
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    working_count = max(1, 15 + round(math.log2(scale)))
+    stuck_count = min(scaled(30, scale), MAX_VALVES - 1 - working_count)
+    names = ["".join(n) for n in itertools.product(string.ascii_uppercase, repeat=2) if "".join(n) != START]
+    names = rng.sample(names, working_count + stuck_count)
+    hubs, stuck = [START] + names[:working_count], names[working_count:]
+
+    # A random tree over the hubs, plus more links to make loops, enough for corridors to be about
+    # two valves long.
+    links = [(hubs[i], rng.choice(hubs[:i])) for i in range(1, len(hubs))]
+    for _ in range(max(len(hubs) // 3, stuck_count // 2 - len(links))):
+        links.append(tuple(rng.sample(hubs, 2)))
+
+    # Spread the stuck valves over the links' corridors, at least one per corridor while they last.
+    corridors = [[a] for a, _ in links]
+    for i, valve in enumerate(stuck):
+        corridors[i if i < len(links) else rng.randrange(len(links))].append(valve)
+
+    tunnels = {valve: [] for valve in hubs + stuck}
+    for corridor, (_, b) in zip(corridors, links):
+        path = corridor + [b]
+        for v, w in zip(path, path[1:]):
+            if w not in tunnels[v]:
+                tunnels[v].append(w)
+                tunnels[w].append(v)
+
+    flow_rates = {valve: rng.randint(3, 25) for valve in hubs[1:]}
+    valves = list(tunnels)
+    rng.shuffle(valves)
+    lines = []
+    for valve in valves:
+        destinations = tunnels[valve]
+        rng.shuffle(destinations)
+        lead = "tunnels lead to valves" if len(destinations) > 1 else "tunnel leads to valve"
+        lines.append(f"Valve {valve} has flow rate={flow_rates.get(valve, 0)}; {lead} {', '.join(destinations)}")
+
+    return "\n".join(lines) + "\n"
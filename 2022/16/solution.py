@@ -1,6 +1,10 @@
 from dataclasses import dataclass
-from typing import Optional
-import regex
+
+from aoc import counters
+from aoc.graph import Digraph, NodeIndex, floyd_warshall
+from aoc.lazy import lazy_import
+
+regex = lazy_import("regex")
 
 
 @dataclass
@@ -11,26 +15,20 @@ class Valve:
 
 
 class TunnelSystem:
+    """
+    The valves and the tunnels connecting them, reduced to what matters for releasing pressure: the
+    valves with a positive flow rate (the "working" valves) and the time it takes to walk between
+    any two valves.
+    """
+
     def __init__(self, valves: list[Valve]):
         self._valves = {v.id: v for v in valves}
-        self._broken_valves = {v.id for v in valves if v.flow_rate == 0}
-        self._open_valves = set()
-
-    @property
-    def valves(self) -> set[str]:
-        return set(self._valves.keys())
-
-    @property
-    def broken_valves(self) -> set[str]:
-        return self._broken_valves
-
-    @property
-    def open_valves(self) -> set[str]:
-        return self._open_valves
-
-    @property
-    def flow_rate(self) -> int:
-        return sum([self._valves[vid].flow_rate for vid in self._open_valves])
+        self._index = NodeIndex(self._valves)
+        tunnels = Digraph.from_edges(
+            len(self._index), ((self._index[v.id], self._index[dst]) for v in valves for dst in v.tunnels_dst)
+        )
+        self._distances = floyd_warshall(tunnels).astype(int).tolist()
+        self.working_valves = [v.id for v in valves if v.flow_rate > 0]
 
     def __len__(self) -> int:
         return len(self._valves)
@@ -38,69 +36,88 @@ class TunnelSystem:
     def valve(self, vid: str) -> Valve:
         return self._valves[vid]
 
-    def open_valve(self, vid: str) -> None:
-        self._open_valves.add(vid)
+    def distance(self, src: str, dst: str) -> int:
+        return self._distances[self._index[src]][self._index[dst]]
 
-    def close_valve(self, vid: str) -> None:
-        self._open_valves.remove(vid)
+
+VALVE_PATTERN = r"Valve ([A-Z][A-Z]) has flow rate=(\d+); tunnels? leads? to valves?( ([A-Z][A-Z]),?)+"
 
 
 def parse_input(raw_input):
-    pattern = regex.compile(r"Valve ([A-Z][A-Z]) has flow rate=(\d+); tunnels? leads? to valves?( ([A-Z][A-Z]),?)+")
+    valve_pattern = regex.compile(VALVE_PATTERN)
     return [
         Valve(
             id=m.groups()[0],
             flow_rate=int(m.groups()[1]),
             tunnels_dst=set(m.captures(4)),
         )
-        for m in map(lambda l: pattern.match(l.strip()), raw_input)
+        for m in map(lambda l: valve_pattern.match(l.strip()), raw_input)
     ]
 
 
-def maximize_flow(ts: TunnelSystem, cur_v: str, max_time: int) -> int:
-    cache = {}
+def max_flow_by_opened_valves(ts: TunnelSystem, start: str, max_time: int) -> dict[int, int]:
+    """
+    Walks every order in which working valves can be opened within `max_time` minutes, starting at
+    valve `start`, and returns the most pressure released by opening each set of valves. Sets of
+    valves are bitmasks over `ts.working_valves`.
+    """
+    working_valves = ts.working_valves
+    flow_rates = [ts.valve(v).flow_rate for v in working_valves]
 
-    def _maximize_flow(v: str, ttl: int) -> tuple[int, tuple[str]]:
-        if ttl == 0 or len(ts.open_valves) == (len(ts) - len(ts.broken_valves)):
-            return ts.flow_rate * ttl, tuple()
+    # Minutes it takes to walk from a valve to a working valve and open it.
+    open_times = {v: [ts.distance(v, w) + 1 for w in working_valves] for v in [start] + working_valves}
 
-        k = (v, ttl, tuple(ts.open_valves))
-        if k in cache:
-            return cache[k]
+    max_flows: dict[int, int] = {}
+    walked = 0
 
-        max_flow = 0
-        max_flow_steps = None
-        if v not in ts.open_valves and v not in ts.broken_valves:
-            ts.open_valve(v)
-            max_flow, max_flow_steps = _maximize_flow(v, ttl - 1)
-            max_flow += ts.flow_rate
-            max_flow_steps = (v,) + max_flow_steps
-            ts.close_valve(v)
+    def _walk(v: str, ttl: int, opened: int, flow: int) -> None:
+        nonlocal walked
+        walked += 1
+        if max_flows.get(opened, -1) < flow:
+            max_flows[opened] = flow
 
-        for next_v in ts.valve(v).tunnels_dst:
-            next_v_max_flow, next_v_max_flow_steps = _maximize_flow(next_v, ttl - 1)
-            next_v_max_flow += ts.flow_rate
-            if next_v_max_flow > max_flow:
-                max_flow, max_flow_steps = next_v_max_flow, next_v_max_flow_steps
+        for i, open_time in enumerate(open_times[v]):
+            if opened & (1 << i) or open_time >= ttl:
+                continue
+            next_ttl = ttl - open_time
+            _walk(working_valves[i], next_ttl, opened | (1 << i), flow + next_ttl * flow_rates[i])
 
-        cache[k] = (max_flow, max_flow_steps)
-        return max_flow, max_flow_steps
+    _walk(start, max_time, 0, 0)
+    counters.add("states_walked", walked)
+    counters.add("valve_sets", len(max_flows))
+    return max_flows
 
-    return _maximize_flow(cur_v, max_time - 1)
 
+def parse(text: str) -> TunnelSystem:
+    return TunnelSystem(parse_input(text.splitlines()))
 
-raw_input = open("2022/16/input.txt").readlines()
-valves = parse_input(raw_input)
-tunnel_system = TunnelSystem(valves)
 
 ### Part 1
-max_flow, max_flow_steps = maximize_flow(tunnel_system, "AA", 30)
-print(f"Max flow: {max_flow}")
+def part1(tunnel_system: TunnelSystem) -> int:
+    return max(max_flow_by_opened_valves(tunnel_system, "AA", 30).values())
+
 
 # Part 2
-max_flow_human, human_steps = maximize_flow(tunnel_system, "AA", 26)
-for v in human_steps:
-    tunnel_system.valve(v).flow_rate = 0
-    tunnel_system.open_valve(v)
-max_flow_elephant, elephant_steps = maximize_flow(tunnel_system, "AA", 26)
-print(f"Max flow achieved: {max_flow_human + max_flow_elephant}")
+def part2(tunnel_system: TunnelSystem) -> int:
+    """
+    The human and the elephant open disjoint sets of valves, so the answer is the best pair of
+    disjoint valve sets each of them can open on their own.
+    """
+    max_flows = sorted(max_flow_by_opened_valves(tunnel_system, "AA", 26).items(), key=lambda i: -i[1])
+    best = 0
+    for human_valves, human_flow in max_flows:
+        if human_flow * 2 <= best:
+            break
+        for elephant_valves, elephant_flow in max_flows:
+            if human_flow + elephant_flow <= best:
+                break
+            if human_valves & elephant_valves == 0:
+                best = human_flow + elephant_flow
+
+    return best
+
+
+if __name__ == "__main__":
+    tunnel_system = parse(open("2022/16/input.txt").read())
+    print(f"Max flow: {part1(tunnel_system)}")
+    print(f"Max flow achieved: {part2(tunnel_system)}")
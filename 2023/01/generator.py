@@ -0,0 +1,28 @@
+"""
+Calibration document lines: lowercase letters mixed with digits and spelled out digits (`one` to
+`nine`), often overlapping (e.g. `twone`). Every line holds at least one actual digit.
+"""
+import random
+import string
+
+from aoc.generators import scaled
+
+SPELLED = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        pieces = [rng.choice(string.digits[1:])]
+        for _ in range(rng.randint(0, 7)):
+            kind = rng.random()
+            if kind < 0.3:
+                pieces.append(rng.choice(string.digits[1:]))
+            elif kind < 0.6:
+                pieces.append(rng.choice(SPELLED))
+            else:
+                pieces.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8))))
+        rng.shuffle(pieces)
+        lines.append("".join(pieces))
+
+    return "\n".join(lines) + "\n"
@@ -1,4 +1,6 @@
-import regex as re
+from aoc.lazy import lazy_import
+
+re = lazy_import("regex")
 
 
 def extract_calibration_values(line: str, allow_mnemonics: bool = False):
@@ -19,15 +21,25 @@ def extract_calibration_values(line: str, allow_mnemonics: bool = False):
     return int(d0 + d1)
 
 
+def parse(text: str) -> list[str]:
+    return text.splitlines()
+
+
 #### Part 1
-with open("2023/01/input.txt", "r") as f:
-    calibration_values = map(lambda l: extract_calibration_values(l, False), f)
-    s = sum(calibration_values)
-    print(f"Solution: {s}")
+def part1(lines: list[str]) -> int:
+    calibration_values = map(lambda l: extract_calibration_values(l, False), lines)
+    return sum(calibration_values)
 
 
 #### Part 2
-with open("2023/01/input.txt", "r") as f:
-    calibration_values = map(lambda l: extract_calibration_values(l, True), f)
-    s = sum(calibration_values)
-    print(f"Solution: {s}")
+def part2(lines: list[str]) -> int:
+    calibration_values = map(lambda l: extract_calibration_values(l, True), lines)
+    return sum(calibration_values)
+
+
+if __name__ == "__main__":
+    with open("2023/01/input.txt", "r") as f:
+        lines = parse(f.read())
+
+    print(f"Solution: {part1(lines)}")
+    print(f"Solution: {part2(lines)}")
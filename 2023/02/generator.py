@@ -0,0 +1,21 @@
+"""
+Games of cubes drawn from a bag: each game lists a few rounds of red, green and blue cube counts
+(1 to 20, so that some games are impossible with the bag of the puzzle).
+"""
+import random
+
+from aoc.generators import scaled
+
+COLORS = ("red", "green", "blue")
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    games = []
+    for game_id in range(1, scaled(100, scale) + 1):
+        rounds = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(COLORS, rng.randint(1, 3))
+            rounds.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        games.append(f"Game {game_id}: {'; '.join(rounds)}")
+
+    return "\n".join(games) + "\n"
@@ -42,20 +42,27 @@ def game_power(game: list[dict[str, int]]) -> int:
     return prod(min_set.values())
 
 
-with open("2023/02/input.txt", "r") as f:
-    valid_games = []
-    games_powers = []
-    for l in f:
+def parse(text: str) -> list[tuple[int, list[dict[str, int]]]]:
+    games = []
+    for l in text.splitlines():
         title, game_content = l.split(":")
         game_id = int(title[len(TITLE_PREFIX) :])
-        game = parse_game(game_content)
-        if is_game_possible(game):
-            valid_games.append(game_id)
+        games.append((game_id, parse_game(game_content)))
 
-        games_powers.append(game_power(game))
+    return games
 
-    s = sum(valid_games)
-    print(s)
 
-    s = sum(games_powers)
-    print(s)
+def part1(games: list[tuple[int, list[dict[str, int]]]]) -> int:
+    return sum(game_id for game_id, game in games if is_game_possible(game))
+
+
+def part2(games: list[tuple[int, list[dict[str, int]]]]) -> int:
+    return sum(game_power(game) for _, game in games)
+
+
+if __name__ == "__main__":
+    with open("2023/02/input.txt", "r") as f:
+        games = parse(f.read())
+
+    print(part1(games))
+    print(part2(games))
@@ -0,0 +1,33 @@
+"""
+An engine schematic: part numbers (1 to 3 digits) and symbols scattered over a square of `.`. About
+half of the symbols are `*`, as in real inputs, so that many of them have exactly two adjacent part
+numbers.
+
+Real schematics are 140 by 140, larger scales grow both sides.
+"""
+import random
+
+from aoc.generators import scaled_side
+
+SYMBOLS = "#+$@&%=-/"
+NUMBER_PROBABILITY = 0.065
+SYMBOL_PROBABILITY = 0.035
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    side = scaled_side(140, scale)
+    rows = []
+    for _ in range(side):
+        row = []
+        while len(row) < side:
+            kind = rng.random()
+            if kind < NUMBER_PROBABILITY:
+                # Followed by a `.`, so it doesn't run into a number placed right after it.
+                row += str(rng.randint(1, 999)) + "."
+            elif kind < NUMBER_PROBABILITY + SYMBOL_PROBABILITY:
+                row.append("*" if rng.random() < 0.5 else rng.choice(SYMBOLS))
+            else:
+                row.append(".")
+        rows.append("".join(row[:side]))
+
+    return "\n".join(rows) + "\n"
@@ -2,6 +2,8 @@ from typing import NamedTuple
 from collections import defaultdict
 from math import prod
 
+from aoc.grid import Grid
+
 ADJACENCY_OFFSETS: list[tuple[int, int]] = [
     (-1, -1),
     (-1, 0),
@@ -14,17 +16,11 @@ ADJACENCY_OFFSETS: list[tuple[int, int]] = [
 ]
 
 
-def get_adjacent_symbol(
-    rows: list[str], row: int, col: int
-) -> tuple[str, tuple[int, int]] | None:
-    indexes_to_check = filter(
-        lambda p: 0 <= p[0] < len(rows) and 0 <= p[1] < len(rows[0]),
-        [(row + offset[0], col + offset[1]) for offset in ADJACENCY_OFFSETS],
-    )
-    for r, c in indexes_to_check:
-        cur_char = rows[r][c]
+def get_adjacent_symbol(cells: list[str], deltas: list[int], index: int) -> tuple[str, int] | None:
+    for d in deltas:
+        cur_char = cells[index + d]
         if not cur_char.isdigit() and cur_char != ".":
-            return cur_char, (r, c)
+            return cur_char, index + d
 
     return None
 
@@ -36,22 +32,25 @@ class PartNumberDetails(NamedTuple):
     adjacent_symbol_position: tuple[int, int]
 
 
-def find_part_numbers(rows: list[str]) -> list[PartNumberDetails]:
+def find_part_numbers(schematic: Grid) -> list[PartNumberDetails]:
+    # The schematic is padded with "." so looking around cells at its edges needs no bounds checks
+    # and a number ending at the end of a row is followed by a "." like any other number.
+    cells = schematic.padded.tobytes().decode()
+    deltas = schematic.flat_offsets(ADJACENCY_OFFSETS)
+
     part_numbers: list[PartNumberDetails] = []
-    for i in range(len(rows)):
-        row = rows[i]
+    for i in range(schematic.height):
+        row_start = schematic.index((i, 0))
 
         cur_num: int = 0
         cur_num_position: tuple[int, int] | None = None
-        adjacent_symbol_info: tuple[str, tuple[int, int]] | None = None
-        for j in range(len(row)):
-            cur_char = row[j]
+        adjacent_symbol_info: tuple[str, int] | None = None
+        for j in range(schematic.width + 1):
+            cur_char = cells[row_start + j]
             if cur_char.isdigit():
                 cur_num = cur_num * 10 + int(cur_char)
                 cur_num_position = cur_num_position or (i, j)
-                adjacent_symbol_info = adjacent_symbol_info or get_adjacent_symbol(
-                    rows, i, j
-                )
+                adjacent_symbol_info = adjacent_symbol_info or get_adjacent_symbol(cells, deltas, row_start + j)
                 continue
             elif adjacent_symbol_info is not None:
                 part_numbers.append(
@@ -59,7 +58,7 @@ def find_part_numbers(rows: list[str]) -> list[PartNumberDetails]:
                         cur_num,
                         cur_num_position,
                         adjacent_symbol_info[0],
-                        adjacent_symbol_info[1],
+                        schematic.position(adjacent_symbol_info[1]),
                     )
                 )
 
@@ -70,20 +69,23 @@ def find_part_numbers(rows: list[str]) -> list[PartNumberDetails]:
     return part_numbers
 
 
+def parse(text: str) -> list[PartNumberDetails]:
+    return find_part_numbers(Grid.from_text(text, fill="."))
+
+
 def main():
     with open("input.txt", "r") as f:
-        rows = [r.replace("\n", ".") for r in f]
+        part_numbers = parse(f.read())
 
-    part_numbers = find_part_numbers(rows)
-    part_1(part_numbers)
-    part_2(part_numbers)
+    print("Part 1:", part1(part_numbers))
+    print("Part 2:", part2(part_numbers))
 
 
-def part_1(part_numbers: list[PartNumberDetails]) -> None:
-    print("Part 1:", sum([p.part_number for p in part_numbers]))
+def part1(part_numbers: list[PartNumberDetails]) -> int:
+    return sum([p.part_number for p in part_numbers])
 
 
-def part_2(part_numbers: list[PartNumberDetails]) -> None:
+def part2(part_numbers: list[PartNumberDetails]) -> int:
     gear_pos_to_part_numbers: dict[tuple[int, int], list[int]] = defaultdict(list)
     for p in part_numbers:
         if p.adjacent_symbol != "*":
@@ -91,12 +93,10 @@ def part_2(part_numbers: list[PartNumberDetails]) -> None:
         gear_pos_to_part_numbers[p.adjacent_symbol_position].append(p.part_number)
 
     gear_powers = [
-        prod(gear_pos_to_part_numbers[p])
-        for p in gear_pos_to_part_numbers
-        if len(gear_pos_to_part_numbers[p]) == 2
+        prod(gear_pos_to_part_numbers[p]) for p in gear_pos_to_part_numbers if len(gear_pos_to_part_numbers[p]) == 2
     ]
 
-    print("Part 2:", sum(gear_powers))
+    return sum(gear_powers)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,45 @@
+"""
+Scratchcards: 10 winning numbers and 25 numbers on each card (1 to 99, distinct on each side).
+
+As in real inputs, the cards come in runs that start with cards matching many numbers and end with
+cards matching none, no card winning copies of cards beyond the end of its run. The number of card
+copies therefore stays bounded within each run (about a million) rather than compounding from one
+run to the next, and total copies grow linearly with the number of cards.
+"""
+import random
+
+from aoc.generators import scaled
+
+WINNING_COUNT = 10
+NUMBERS_COUNT = 25
+
+
+def run_matches(rng: random.Random) -> list[int]:
+    length = rng.randint(12, 24)
+    matches = []
+    for i in range(length):
+        cap = min(WINNING_COUNT, length - 1 - i)
+        matches.append(cap if i < length // 3 and rng.random() < 0.6 else rng.randint(0, cap))
+    return matches
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    count = scaled(197, scale)
+    matches = []
+    while len(matches) < count:
+        matches += run_matches(rng)
+    # Cut the last run short, without winning copies of cards beyond the last one.
+    matches = [min(m, count - 1 - i) for i, m in enumerate(matches[:count])]
+
+    width = len(str(count))
+    cards = []
+    for card_id, matching in enumerate(matches, 1):
+        numbers = rng.sample(range(1, 100), WINNING_COUNT + NUMBERS_COUNT - matching)
+        winning = numbers[:WINNING_COUNT]
+        mine = winning[:matching] + numbers[WINNING_COUNT:]
+        rng.shuffle(mine)
+        cards.append(
+            f"Card {card_id:>{width}}: {' '.join(f'{n:2}' for n in winning)} | {' '.join(f'{n:2}' for n in mine)}"
+        )
+
+    return "\n".join(cards) + "\n"
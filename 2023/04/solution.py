@@ -1,11 +1,16 @@
 import re
 from collections import defaultdict
+from pathlib import Path
 
-LINE_PATTERN = re.compile(r"^Card\s+(\d+):((\s+\d+)+)\s+\|((\s+\d+)+)$")
+from aoc.inputs import PuzzleInput, load_input
 
+BYTES_INPUT = True
 
-def parse_line(l: str) -> tuple[int, set[int], set[int]]:
-    m = LINE_PATTERN.match(l.strip())
+LINE_PATTERN = re.compile(rb"^\s*Card\s+(\d+):((\s+\d+)+)\s+\|((\s+\d+)+)\s*$")
+
+
+def parse_line(l: memoryview) -> tuple[int, set[int], set[int]]:
+    m = LINE_PATTERN.match(l)
     assert m is not None
     card_id = int(m.group(1))
     winning_numbers = set(int(n) for n in m.group(2).split())
@@ -13,25 +18,26 @@ def parse_line(l: str) -> tuple[int, set[int], set[int]]:
     return card_id, winning_numbers, numbers
 
 
-def part1():
-    with open("input.txt", "r") as f:
-        parsed_lines = list(map(parse_line, f))
+Card = tuple[int, set[int], set[int]]
+
+
+def parse(puzzle_input: PuzzleInput) -> list[Card]:
+    return list(map(parse_line, puzzle_input.lines()))
 
+
+def part1(parsed_lines: list[Card]) -> int:
     total_points = 0
     for card_id, winning_numbers, numbers in parsed_lines:
         matches = len(winning_numbers.intersection(numbers))
         card_points = 2 ** (matches - 1) if matches > 0 else 0
         total_points += card_points
 
-    print(f"Total points: {total_points}")
+    return total_points
 
 
-def part2():
+def part2(parsed_lines: list[Card]) -> int:
     card_counters: dict[int, int] = defaultdict(lambda: 1)
 
-    with open("input.txt", "r") as f:
-        parsed_lines = list(map(parse_line, f))
-
     for card_id, winning_numbers, numbers in parsed_lines:
         count = card_counters[card_id]
         for i in range(count):
@@ -39,8 +45,11 @@ def part2():
             for j in range(card_id + 1, card_id + matches + 1):
                 card_counters[j] += 1
 
-    print(f"Total cards scratched: {sum(card_counters.values())}")
+    return sum(card_counters.values())
+
 
+if __name__ == "__main__":
+    parsed_lines = parse(load_input(Path("input.txt")))
 
-part1()
-part2()
+    print(f"Total points: {part1(parsed_lines)}")
+    print(f"Total cards scratched: {part2(parsed_lines)}")
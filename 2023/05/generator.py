@@ -0,0 +1,48 @@
+"""
+An almanac: ranges of seeds, then the maps from seeds to soil and on through to locations. As in
+real inputs, the source ranges of each map are consecutive pieces of a large span of the 32-bit
+numbers, shuffled around onto the same span so that destination ranges don't overlap either.
+
+Real almanacs have 10 seed ranges and about 30 ranges per map, larger scales add both.
+"""
+import random
+
+from aoc.generators import scaled
+
+CATEGORIES = ("seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location")
+MAX_NUMBER = 2**32
+
+
+def generate_map(rng: random.Random, count: int) -> list[str]:
+    start = rng.randrange(MAX_NUMBER // 4)
+    end = rng.randrange(MAX_NUMBER * 3 // 4, MAX_NUMBER)
+    cuts = sorted(rng.sample(range(start + 1, end), count - 1))
+    bounds = [start] + cuts + [end]
+    sources = list(zip(bounds, bounds[1:]))
+
+    # The same pieces, in a different order.
+    lengths = [b - a for a, b in sources]
+    order = list(range(count))
+    rng.shuffle(order)
+    destination_starts, position = [0] * count, start
+    for i in order:
+        destination_starts[i] = position
+        position += lengths[i]
+
+    ranges = [f"{d} {s} {length}" for d, (s, _), length in zip(destination_starts, sources, lengths)]
+    rng.shuffle(ranges)
+    return ranges
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    seeds = []
+    for _ in range(scaled(10, scale)):
+        start = rng.randrange(MAX_NUMBER)
+        seeds += [start, rng.randint(1, min(MAX_NUMBER - start, 500_000_000))]
+
+    sections = [f"seeds: {' '.join(map(str, seeds))}\n"]
+    for source, destination in zip(CATEGORIES, CATEGORIES[1:]):
+        ranges = generate_map(rng, max(1, scaled(30, scale)))
+        sections.append(f"{source}-to-{destination} map:\n" + "\n".join(ranges) + "\n")
+
+    return "\n".join(sections)
@@ -1,129 +1,86 @@
 from dataclasses import dataclass
-from bisect import bisect_left, insort_left
 
-SEEDS_LINE_PREFIX = "seeds: "
-
-
-@dataclass
-class RawRangeMapping:
-    source_start: int
-    dest_start: int
-    length: int
-
-    def is_source_index_within_range(self, source_index: int) -> bool:
-        return self.source_start <= source_index < self.source_start + self.length
+import numpy as np
 
-    def get_dest_index(self, source_index: int) -> int:
-        if not self.is_source_index_within_range(source_index):
-            raise ValueError(f"Source index {source_index} is not within range")
+from aoc.intervals import IntervalSet, OffsetMapping
 
-        return self.dest_start + (source_index - self.source_start)
+SEEDS_LINE_PREFIX = "seeds: "
 
 
 @dataclass
 class RawSectionMapping:
     source_type: str
     dest_type: str
-    range_mappings: list[RawRangeMapping]
-
-    def get_dest_index(self, source_index: int) -> tuple[int, int]:
-        i = bisect_left(self.range_mappings, source_index, key=lambda x: x.source_start)
-        range_left = self.range_mappings[i].dest_start - (source_index + 1) if i < len(self.range_mappings) else -1
-        if i == 0:
-            return source_index, range_left
-
-        range_mapping = self.range_mappings[i - 1]
-        if not range_mapping.is_source_index_within_range(source_index):
-            return source_index, range_left
-
-        return range_mapping.get_dest_index(source_index), range_left
-
-
-def load_input(input_file_name: str) -> tuple[list[int], dict[str, RawSectionMapping]]:
-    with open(input_file_name, "r") as f:
-        seeds_lines = f.readline().strip()
-        seeds_to_plant = [int(i) for i in seeds_lines[len(SEEDS_LINE_PREFIX) :].split(" ")]
-
-        sections_mappings: dict[str, RawSectionMapping] = {}
-        cur_section_mapping: RawSectionMapping | None = None
-        for line in f:
-            if line == "\n":
-                cur_section_mapping = None
-                continue
-
-            if cur_section_mapping is None:
-                source_type, dest_type = line.strip().split(" ")[0].split("-to-")
-                cur_section_mapping = RawSectionMapping(source_type, dest_type, [])
-                sections_mappings[source_type] = cur_section_mapping
-                continue
-
-            dest_start, source_start, length = [int(i) for i in line.strip().split(" ")]
-            insort_left(
-                cur_section_mapping.range_mappings,
-                RawRangeMapping(source_start, dest_start, length),
-                key=lambda x: x.source_start,
-            )
-
-    return seeds_to_plant, sections_mappings
 
+    # Maps source indexes to destination indexes, indexes not within any range map to themselves.
+    mapping: OffsetMapping
 
-def get_dest_id(
-    source_id: int, source_type: str, sections_mappings: dict[str, RawSectionMapping]
-) -> tuple[str, int, int] | None:
-    if source_type not in sections_mappings:
-        return None
 
-    s = sections_mappings[source_type]
-    dest_id, range_left = s.get_dest_index(source_id)
-    dest_type = s.dest_type
-    return dest_type, dest_id, range_left
+Almanac = tuple[list[int], dict[str, RawSectionMapping]]
 
 
-def get_deps_chain_for_seed(
-    seed_index: int, sections_mappings: dict[str, RawSectionMapping]
-) -> list[tuple[str, int, int]]:
-    deps_chain: list[tuple[str, int, int]] = []
-    cur_src_type, cur_src_index = "seed", seed_index
-    while True:
-        dest_id = get_dest_id(cur_src_index, cur_src_type, sections_mappings)
-        if dest_id is None:
-            break
+def parse(text: str) -> Almanac:
+    lines = text.splitlines()
+    seeds_lines = lines[0].strip()
+    seeds_to_plant = [int(i) for i in seeds_lines[len(SEEDS_LINE_PREFIX) :].split(" ")]
 
-        dst_type, dst_index, range_left = dest_id
-        deps_chain.append((cur_src_type, cur_src_index, range_left))
-        deps_chain.append((dst_type, dst_index, -1))
-        cur_src_type, cur_src_index = dst_type, dst_index
+    sections_mappings: dict[str, RawSectionMapping] = {}
+    section_header: str | None = None
+    section_ranges: list[tuple[int, int, int]] = []
+    for line in lines[1:] + [""]:
+        if line == "":
+            if section_header is not None:
+                source_type, dest_type = section_header.split(" ")[0].split("-to-")
+                sections_mappings[source_type] = RawSectionMapping(
+                    source_type, dest_type, OffsetMapping.from_ranges(section_ranges)
+                )
+            section_header, section_ranges = None, []
+            continue
 
-    return deps_chain
+        if section_header is None:
+            section_header = line.strip()
+            continue
 
+        dest_start, source_start, length = [int(i) for i in line.strip().split(" ")]
+        section_ranges.append((source_start, source_start + length, dest_start - source_start))
 
-def part1() -> None:
-    seeds_to_plant, sections_mappings = load_input("input.txt")
-    seeds_dep_chains: list[list[tuple[str, int]]] = [
-        get_deps_chain_for_seed(seed_index, sections_mappings) for seed_index in seeds_to_plant
-    ]
-    seeds_dep_chains.sort(key=lambda x: x[-1][1])
+    return seeds_to_plant, sections_mappings
 
-    print(f"Seed {seeds_dep_chains[0][0][1]} is the first seed to be planted @ location {seeds_dep_chains[0][-1][1]}")
 
+def get_seed_to_location_mapping(sections_mappings: dict[str, RawSectionMapping]) -> OffsetMapping:
+    """
+    Composes the mappings of all sections, from seeds through every dependency down to locations,
+    into a single mapping.
+    """
+    seed_to_location = OffsetMapping.from_ranges([])
+    cur_type = "seed"
+    while cur_type in sections_mappings:
+        section = sections_mappings[cur_type]
+        seed_to_location = seed_to_location.compose(section.mapping)
+        cur_type = section.dest_type
 
-def part2() -> None:
-    seeds_to_plant, sections_mappings = load_input("input.txt")
-    seeds_to_plant_ranges: list[tuple[int, int]] = []
-    for i in range(0, len(seeds_to_plant), 2):
-        seeds_to_plant_ranges.append((seeds_to_plant[i], seeds_to_plant[i + 1]))
+    return seed_to_location
 
-    seeds_dep_chains: list[list[tuple[str, int]]] = []
 
-    for seed_range_start, seed_range_len in seeds_to_plant_ranges:
-        for seed_index in range(seed_range_start, seed_range_start + seed_range_len):
-            seeds_dep_chains.append(get_deps_chain_for_seed(seed_index, sections_mappings))
+def part1(almanac: Almanac) -> int:
+    seeds_to_plant, sections_mappings = almanac
+    seed_to_location = get_seed_to_location_mapping(sections_mappings)
+    return int(seed_to_location(np.array(seeds_to_plant)).min())
 
-    seeds_dep_chains.sort(key=lambda x: x[-1][1])
 
-    print(f"Seed {seeds_dep_chains[0][0][1]} is the first seed to be planted @ location {seeds_dep_chains[0][-1][1]}")
+def part2(almanac: Almanac) -> int:
+    """
+    Maps the seed ranges as a whole, the lowest location is the start of the first mapped range.
+    """
+    seeds_to_plant, sections_mappings = almanac
+    seeds_to_plant_ranges = IntervalSet.from_intervals(
+        (seeds_to_plant[i], seeds_to_plant[i] + seeds_to_plant[i + 1]) for i in range(0, len(seeds_to_plant), 2)
+    )
+    locations = get_seed_to_location_mapping(sections_mappings).map_intervals(seeds_to_plant_ranges)
+    return int(locations.starts[0])
 
 
 if __name__ == "__main__":
-    part1()
-    part2()
+    almanac = parse(open("input.txt", "r").read())
+    print(f"Lowest location for the planted seeds: {part1(almanac)}")
+    print(f"Lowest location for the planted seed ranges: {part2(almanac)}")
@@ -0,0 +1,15 @@
+"""
+Two lists of location IDs (5 digit numbers) side by side. As in real inputs, the right list draws
+its IDs from a smaller pool, about half of which also appear in the left list, so IDs repeat.
+"""
+import random
+
+from aoc.generators import scaled
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    count = scaled(1000, scale)
+    left = [rng.randint(10000, 99999) for _ in range(count)]
+    pool = rng.sample(left, max(1, count // 4)) + [rng.randint(10000, 99999) for _ in range(max(1, count // 4))]
+    right = [rng.choice(pool) for _ in range(count)]
+    return "".join(f"{a}   {b}\n" for a, b in zip(left, right))
@@ -1,15 +1,28 @@
 from collections import Counter
 
+
 # Common
-with open("2024/01/input.txt", "r") as f:
-    l1, l2 = zip(*((int(r[0]), int(r[1])) for r in (l.split("   ") for l in f)))
+def parse(text: str) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    l1, l2 = zip(*((int(r[0]), int(r[1])) for r in (l.split("   ") for l in text.splitlines())))
+    return l1, l2
+
+
+#### Part 1
+def part1(lists: tuple[tuple[int, ...], tuple[int, ...]]) -> int:
+    l1, l2 = lists
+    return sum(abs(a - b) for a, b in zip(sorted(l1), sorted(l2)))
 
-#### Part 1    
-sum_diffs = sum(abs(a - b) for a, b in zip(sorted(l1), sorted(l2)))
-print("Part 1: The total distance between your lists is:", sum_diffs)
 
-    
 #### Part 2
-l2_counter = Counter(l2)
-sum_counts = sum(a * l2_counter.get(a, 0) for a in l1)
-print("Part 2: The lists total similarity score is:", sum_counts)
+def part2(lists: tuple[tuple[int, ...], tuple[int, ...]]) -> int:
+    l1, l2 = lists
+    l2_counter = Counter(l2)
+    return sum(a * l2_counter.get(a, 0) for a in l1)
+
+
+if __name__ == "__main__":
+    with open("2024/01/input.txt", "r") as f:
+        lists = parse(f.read())
+
+    print("Part 1: The total distance between your lists is:", part1(lists))
+    print("Part 2: The lists total similarity score is:", part2(lists))
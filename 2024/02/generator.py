@@ -0,0 +1,21 @@
+"""
+Reports of 5 to 8 levels. Most reports are gradually increasing or decreasing (by 1 to 3 between
+levels), and about half of them then get one or two bad levels.
+"""
+import random
+
+from aoc.generators import scaled
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    reports = []
+    for _ in range(scaled(1000, scale)):
+        direction = rng.choice((-1, 1))
+        levels = [rng.randint(25, 75)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + direction * rng.randint(1, 3))
+        for _ in range(rng.choice((0, 0, 1, 2))):
+            levels[rng.randrange(len(levels))] += rng.choice((-3, -1, 0, 2, 4, 7))
+        reports.append(" ".join(map(str, levels)))
+
+    return "\n".join(reports) + "\n"
@@ -0,0 +1,47 @@
+"""
+Corrupted memory: `mul(X,Y)` instructions (1 to 3 digit numbers), `do()` and `don't()` mixed with
+junk, some of which looks like instructions (e.g. `mul(4*`, `mul ( 2 , 4 )` or `why()`).
+
+Real inputs are 6 lines of about 3,000 characters, larger scales add lines.
+"""
+import random
+
+from aoc.generators import scaled
+
+JUNK = "!@#$%^&*()[]{}<>,;:'~+-/?  "
+WORDS = ("what", "when", "where", "who", "why", "how", "select", "from")
+
+
+def fragment(rng: random.Random) -> str:
+    kind = rng.random()
+    if kind < 0.25:
+        return f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+    if kind < 0.3:
+        return "do()"
+    if kind < 0.34:
+        return "don't()"
+    if kind < 0.4:
+        return rng.choice(
+            (
+                f"mul({rng.randint(1, 999)}*",
+                f"mul ( {rng.randint(1, 99)} , {rng.randint(1, 99)} )",
+                f"mul({rng.randint(1000, 9999)},{rng.randint(1, 9)})",
+                f"mul[{rng.randint(1, 99)},{rng.randint(1, 99)})",
+            )
+        )
+    if kind < 0.55:
+        return f"{rng.choice(WORDS)}({rng.choice(('', f'{rng.randint(1, 999)},{rng.randint(1, 999)}'))})"
+    return "".join(rng.choices(JUNK, k=rng.randint(1, 4)))
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    lines = []
+    for _ in range(scaled(6, scale)):
+        line = []
+        length = 0
+        while length < 3000:
+            line.append(fragment(rng))
+            length += len(line[-1])
+        lines.append("".join(line))
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,30 @@
+"""
+A word search of the letters `X`, `M`, `A` and `S`, with extra copies of `XMAS` (in all eight
+directions) and of `MAS` crosses written over the random letters.
+
+Real word searches are 140 by 140, larger scales grow both sides.
+"""
+import random
+
+from aoc.generators import scaled_side
+from aoc.grid import ADJACENT_OFFSETS
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    side = scaled_side(140, scale)
+    rows = [[rng.choice("XMAS") for _ in range(side)] for _ in range(side)]
+
+    def write(word: str, r: int, c: int, dr: int, dc: int) -> None:
+        if all(0 <= r + i * dr < side and 0 <= c + i * dc < side for i in range(len(word))):
+            for i, letter in enumerate(word):
+                rows[r + i * dr][c + i * dc] = letter
+
+    for _ in range(side * side // 50):
+        r, c = rng.randrange(side), rng.randrange(side)
+        if rng.random() < 0.5:
+            write("XMAS", r, c, *rng.choice(ADJACENT_OFFSETS))
+        else:
+            write(rng.choice(("MAS", "SAM")), r - 1, c - 1, 1, 1)
+            write(rng.choice(("MAS", "SAM")), r - 1, c + 1, 1, -1)
+
+    return "\n".join("".join(row) for row in rows) + "\n"
@@ -0,0 +1,34 @@
+"""
+Page ordering rules, then updates. As in real inputs, the 49 pages are ordered in a circle and every
+page must be printed before each of the 24 pages that follow it around the circle, so the rules
+totally order any pages that fit in a window of 25 consecutive pages, which is where the pages of
+each update are picked from. About half of the updates are printed out of order.
+
+The solution numbers pages below 100, so larger scales add updates but no pages.
+"""
+import random
+
+from aoc.generators import scaled
+
+PAGE_COUNT = 49
+FOLLOWING_COUNT = 24
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    pages = rng.sample(range(10, 100), PAGE_COUNT)
+    rules = [
+        f"{page}|{pages[(i + j) % PAGE_COUNT]}" for i, page in enumerate(pages) for j in range(1, FOLLOWING_COUNT + 1)
+    ]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(scaled(192, scale)):
+        start = rng.randrange(PAGE_COUNT)
+        window = [pages[(start + i) % PAGE_COUNT] for i in range(FOLLOWING_COUNT + 1)]
+        update = sorted(rng.sample(range(len(window)), rng.randrange(5, 24, 2)))
+        update = [window[i] for i in update]
+        if rng.random() < 0.5:
+            rng.shuffle(update)
+        updates.append(",".join(map(str, update)))
+
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
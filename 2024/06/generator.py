@@ -0,0 +1,52 @@
+"""
+A lab map of obstructions (`#`, about 5% of the cells) and a guard facing up (`^`), placed such
+that their patrol leads them off the map after a long walk.
+
+Real maps are 130 by 130, larger scales grow both sides.
+"""
+import random
+
+from aoc.generators import scaled_side
+
+OBSTRUCTION_PROBABILITY = 0.048
+CANDIDATE_STARTS = 50
+
+# Up, right, down and left: the order in which the guard turns.
+STEPS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+def patrol_length(rows: list[list[str]], start: tuple[int, int]) -> int:
+    """
+    Returns the number of moves of the guard's patrol until they leave the map, 0 if they never do.
+    """
+    side = len(rows)
+    (r, c), d = start, 0
+    visited = set()
+    while (r, c, d) not in visited:
+        visited.add((r, c, d))
+        nr, nc = r + STEPS[d][0], c + STEPS[d][1]
+        if not (0 <= nr < side and 0 <= nc < side):
+            return len(visited)
+        if rows[nr][nc] == "#":
+            d = (d + 1) % len(STEPS)
+        else:
+            r, c = nr, nc
+
+    return 0
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    side = scaled_side(130, scale)
+    while True:
+        rows = [["#" if rng.random() < OBSTRUCTION_PROBABILITY else "." for _ in range(side)] for _ in range(side)]
+
+        # Random patrols tend to leave the map quickly, real ones cover a good part of it. Starting
+        # from the best of a few free cells makes for longer patrols.
+        free = [(r, c) for r in range(side) for c in range(side) if rows[r][c] == "."]
+        starts = rng.sample(free, min(len(free), CANDIDATE_STARTS))
+        start = max(starts, key=lambda s: patrol_length(rows, s), default=None)
+        if start is not None and patrol_length(rows, start) > 0:
+            break
+
+    rows[start[0]][start[1]] = "^"
+    return "\n".join("".join(row) for row in rows) + "\n"
@@ -1,104 +1,113 @@
-from typing import Literal, NamedTuple, cast
+from typing import Literal, cast
+
+from aoc import tracing
+from aoc.grid import ORTHOGONAL_OFFSETS, Grid
 
-Location = tuple[int, int]
 Direction = Literal["^", "v", "<", ">"]
 DIRECTIONS: tuple[Direction, ...] = ("^", ">", "v", "<")
 
-class Position(NamedTuple):
-    location: Location
-    direction: Direction
+# Directions are indexed as in `DIRECTIONS`, which is ordered as `ORTHOGONAL_OFFSETS`. Turning right
+# moves to the next direction.
+DirectionIndex = int
+
+OBSTRUCTION = "#"
+
+# Padding around the map, reaching it means the guard left the map.
+OUTSIDE = "~"
 
+# The location of the guard as a flat index of the padded board along with their direction.
+Position = tuple[int, DirectionIndex]
 Path = list[Position]
 
 
-def get_initial_guard_position_and_direction(board: list[str]) -> Position:
-    for r in range(len(board)):
-        for c in range(len(board[r])):
-            if board[r][c] in DIRECTIONS:
-                d: Direction = cast(Direction, board[r][c])
-                return Position((r, c), d)
-            
+def get_initial_guard_position_and_direction(board: Grid) -> Position:
+    for r, c in board.find("".join(DIRECTIONS)):
+        d: Direction = cast(Direction, board[r, c])
+        return board.index((r, c)), DIRECTIONS.index(d)
+
     raise LookupError("Guard not found")
 
 
-def get_next_guard_position(board: list[str], cur_pos: Position) -> Position | None:
-    cur_loc, cur_dir = cur_pos
-    r, c = cur_loc
-    if cur_dir == "^":
-        next_loc = r - 1, c
-    elif cur_dir == "v":
-        next_loc = r + 1, c
-    elif cur_dir == "<":
-        next_loc = r, c - 1
-    elif cur_dir == ">":
-        next_loc = r, c + 1
-    else:
-        raise ValueError(f"Invalid direction: {cur_dir}")
-    
-    if not (0 <= next_loc[0] < len(board) and 0 <= next_loc[1] < len(board[0])):
-        return None
-    
-    if board[next_loc[0]][next_loc[1]] == "#":
-        next_dir = DIRECTIONS[(DIRECTIONS.index(cur_dir) + 1) % 4]
-        return Position(cur_loc, next_dir)
-    
-    return Position(next_loc, cur_dir)
-
-
-def is_location_valid(board: list[str], loc: Location) -> bool:
-    r, c = loc
-    return 0 <= r < len(board) and 0 <= c < len(board[0])
-
-    
-def get_patrol_path(board: list[str], start_pos: Position) -> tuple[Path, bool]:
+def get_patrol_path(board: Grid, start_pos: Position, cells: list[int] | None = None) -> tuple[Path, bool]:
+    """
+    Follows the guard from `start_pos` until they either leave the board or get into a loop.
+
+    Returns the path of the guard along with whether they are in a loop. `cells` is the flattened
+    board, as returned by `board.flat.tolist()`, to follow the guard on instead of the board itself.
+    """
+    cells = board.flat.tolist() if cells is None else cells
+    steps = board.flat_offsets(ORTHOGONAL_OFFSETS)
+    obstruction, outside = ord(OBSTRUCTION), ord(OUTSIDE)
+
     path = []
-    path_set = set()
-    cur_pos: Position | None = start_pos
-    loop = False
-    while cur_pos is not None and cur_pos not in path_set:
-        path.append(cur_pos)
-        path_set.add(cur_pos)
-        cur_pos = get_next_guard_position(board, cur_pos)
-        if cur_pos in path_set:
-            loop = True
-        
-    return path, loop
-
-with open("2024/06/input.txt", "r") as f:
-    board = [l.strip() for l in f.readlines()]
-    
-initial_pos = get_initial_guard_position_and_direction(board)
-path, _ = get_patrol_path(board, initial_pos)
+    visited = bytearray(len(cells) * len(DIRECTIONS))
+    loc, d = start_pos
+    while True:
+        state = loc * len(DIRECTIONS) + d
+        if visited[state]:
+            return path, True
+        visited[state] = 1
+        path.append((loc, d))
+
+        next_loc = loc + steps[d]
+        next_cell = cells[next_loc]
+        if next_cell == outside:
+            return path, False
+        elif next_cell == obstruction:
+            d = (d + 1) % len(DIRECTIONS)
+        else:
+            loc = next_loc
+
+
+def parse(text: str) -> Grid:
+    return Grid.from_text(text, fill=OUTSIDE)
+
 
 # Part 1
-unique_path_locations = {p.location for p in path}
-print(len(unique_path_locations))
+def part1(board: Grid) -> int:
+    initial_pos = get_initial_guard_position_and_direction(board)
+    path, _ = get_patrol_path(board, initial_pos)
+    unique_path_locations = {loc for loc, _ in path}
+    return len(unique_path_locations)
+
 
 # Part 2
-def find_potential_obstruction_locations(board: list[str], path: Path) -> set[Location]:
+def find_potential_obstruction_locations(board: Grid, path: Path) -> set[int]:
     initial_pos = path[0]
+    cells = board.flat.tolist()
     potential_obstruction_locations = set()
-    
-    for pos in path:
-        if pos == initial_pos:
-            continue
-        
-        loc = pos.location
-        
+
+    # The patrol is re-simulated from the start for every location, so trying the same location
+    # again (the guard visits it more than once) can't yield a different result.
+    candidate_locations = {loc for loc, d in path if (loc, d) != initial_pos}
+    for loc in candidate_locations:
         # Temporarily place an obstacle
-        original_row = board[loc[0]]
-        board[loc[0]] = original_row[:loc[1]] + "#" + original_row[loc[1] + 1:]
-        
+        original_cell = cells[loc]
+        cells[loc] = ord(OBSTRUCTION)
+
         # Re-simulate the patrol
-        _, loop = get_patrol_path(board, initial_pos)
-        
+        with tracing.span("re-simulate", location=loc):
+            _, loop = get_patrol_path(board, initial_pos, cells)
+
         # If the loop persists, add the location
         if loop:
             potential_obstruction_locations.add(loc)
-        
+
         # Restore the original board
-        board[loc[0]] = original_row
-    
+        cells[loc] = original_cell
+
     return potential_obstruction_locations
 
-print(len(find_potential_obstruction_locations(board, path)))
+
+def part2(board: Grid) -> int:
+    initial_pos = get_initial_guard_position_and_direction(board)
+    path, _ = get_patrol_path(board, initial_pos)
+    return len(find_potential_obstruction_locations(board, path))
+
+
+if __name__ == "__main__":
+    with open("2024/06/input.txt", "r") as f:
+        board = parse(f.read())
+
+    print(part1(board))
+    print(part2(board))
@@ -0,0 +1,43 @@
+"""
+Calibration equations: a test value, then 3 to 12 numbers of 1 to 3 digits, with as many equations
+of each length and numbers of each number of digits as in real inputs. As in real inputs, about half
+of the test values are the result of combining the numbers with `+` and `*`, a quarter with `+`, `*`
+and `||` (concatenation), and the last quarter are close misses, which can't be solved.
+"""
+import random
+
+from aoc.generators import scaled
+
+# The number of equations of real inputs with 3 to 12 numbers.
+COUNT_WEIGHTS = (25, 25, 243, 114, 98, 79, 78, 56, 71, 61)
+
+# The number of numbers of real inputs with 1 to 3 digits.
+DIGITS_WEIGHTS = (3285, 1611, 1271)
+
+# The number of equations of real inputs solved with `+` and `*`, needing `||` too, and unsolvable.
+SOLVABLE_WEIGHTS = (439, 197, 214)
+
+
+def evaluate(numbers: list[int], operators: list[str]) -> int:
+    result = numbers[0]
+    for operator, n in zip(operators, numbers[1:]):
+        result = result + n if operator == "+" else result * n if operator == "*" else int(f"{result}{n}")
+    return result
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    equations = []
+    for _ in range(scaled(850, scale)):
+        count = rng.choices(range(3, 13), COUNT_WEIGHTS)[0]
+        digits = rng.choices(range(1, 4), DIGITS_WEIGHTS, k=count)
+        numbers = [rng.randint(10 ** (d - 1), 10**d - 1) for d in digits]
+        kind = rng.choices(("+*", "||", "miss"), SOLVABLE_WEIGHTS)[0]
+        operators = [rng.choice(("+", "*")) for _ in range(count - 1)]
+        if kind == "||":
+            operators[rng.randrange(count - 1)] = "||"
+        value = evaluate(numbers, operators)
+        if kind == "miss":
+            value += rng.randint(1, 9)
+        equations.append(f"{value}: {' '.join(map(str, numbers))}")
+
+    return "\n".join(equations) + "\n"
@@ -1,59 +1,78 @@
-
-from functools import lru_cache
 from itertools import product
+import sys
+from typing import Sequence
+
+from aoc.memo import memo
+
 
 def parse_equation(equation: str) -> tuple[int, tuple[int, ...]]:
     res_str, factors_str = equation.split(": ")
-    factors =  tuple(int(f) for f in factors_str.split(" "))
+    factors = tuple(int(f) for f in factors_str.split(" "))
     return int(res_str), factors
 
 
-def load_equations(input_file: str) -> list[tuple[int, tuple[int, ...]]]:
-    with open(input_file, "r") as f:
-        return [parse_equation(l.strip()) for l in f.readlines()]
-    
-@lru_cache(maxsize=None)
+def parse(text: str) -> list[tuple[int, tuple[int, ...]]]:
+    return [parse_equation(l.strip()) for l in text.splitlines()]
+
+
+def combinations_size(combinations: Sequence) -> int:
+    """
+    Estimates the size of the combinations of operators (or of their key) from the first one, as
+    they all have the same length and share the operators, rather than walking millions of them.
+    """
+    return sys.getsizeof(combinations) + len(combinations) * (sys.getsizeof(combinations[0]) if combinations else 0)
+
+
+# Long equations have millions of combinations of operators, only keep those of the latest lengths.
+@memo(max_bytes=256 * 2**20, size=combinations_size, scope="process")
 def gen_operators(n: int, allowed_ops: tuple[str]) -> list[tuple[str, ...]]:
     return [tuple(comb) for comb in product(allowed_ops, repeat=n)]
 
+
 def evaluate_equation(equation: tuple[int, tuple[int, ...]], operators: tuple[str, ...]) -> int:
     _, factors = equation
     result = factors[0]
     for i, operator in enumerate(operators):
-        if operator == '+':
-            result += factors[i+1]
-        elif operator == '*':
-            result *= factors[i+1]
-        elif operator == '||':
-            result = int(str(result) + str(factors[i+1]))
+        if operator == "+":
+            result += factors[i + 1]
+        elif operator == "*":
+            result *= factors[i + 1]
+        elif operator == "||":
+            result = int(str(result) + str(factors[i + 1]))
         else:
             raise ValueError(f"Unknown operator {operator}")
-    
+
     return result
-    
+
+
+@memo(persistent=True)
 def equation_has_solution(equation: tuple[int, tuple[int, ...]], allowed_ops: tuple[str, ...]) -> bool:
     res, factors = equation
     possible_operators = gen_operators(len(factors) - 1, allowed_ops)
     for operators in possible_operators:
         if evaluate_equation(equation, operators) == res:
             return True
-        
+
     return False
-    
 
-equations = load_equations("2024/07/input.txt")
 
 # Part 1
-OPERATORS = ('+', '*')
-valid_equations = [eq for eq in equations if equation_has_solution(eq, OPERATORS)]
-s = sum([eq[0] for eq in valid_equations])
-print(s)
+def part1(equations: list[tuple[int, tuple[int, ...]]]) -> int:
+    OPERATORS = ("+", "*")
+    valid_equations = [eq for eq in equations if equation_has_solution(eq, OPERATORS)]
+    return sum([eq[0] for eq in valid_equations])
 
 
 # Part 2
-OPERATORS = ('+', '*', '||')
-valid_equations = [eq for eq in equations if equation_has_solution(eq, OPERATORS)]
-s = sum([eq[0] for eq in valid_equations])
-print(s)
+def part2(equations: list[tuple[int, tuple[int, ...]]]) -> int:
+    OPERATORS = ("+", "*", "||")
+    valid_equations = [eq for eq in equations if equation_has_solution(eq, OPERATORS)]
+    return sum([eq[0] for eq in valid_equations])
+
+
+if __name__ == "__main__":
+    with open("2024/07/input.txt", "r") as f:
+        equations = parse(f.read())
 
-   
+    print(part1(equations))
+    print(part2(equations))
@@ -0,0 +1,26 @@
+"""
+A map of antennas, each tuned to a frequency (a digit or a letter), over `.`. As in real inputs,
+antennas of the same frequency come in small groups of 3 or 4 and take about 10% of the map.
+
+Real maps are 50 by 50, larger scales grow both sides. There are only 62 frequencies, so larger
+maps get larger groups.
+"""
+import random
+import string
+
+from aoc.generators import scaled_side
+
+FREQUENCIES = string.digits + string.ascii_letters
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    side = scaled_side(50, scale)
+    cells = [(r, c) for r in range(side) for c in range(side)]
+    positions = rng.sample(cells, min(len(cells), len(cells) // 11 or 1))
+    frequencies = rng.sample(FREQUENCIES, min(len(FREQUENCIES), max(1, len(positions) // 4)))
+
+    rows = [["."] * side for _ in range(side)]
+    for i, (r, c) in enumerate(positions):
+        rows[r][c] = frequencies[i % len(frequencies)]
+
+    return "\n".join("".join(row) for row in rows) + "\n"
@@ -0,0 +1,4 @@
+"""
+Tooling shared by all Advent of Code solutions in this repository: a unified runner that loads
+a day's `solution.py` module and drives its `parse`, `part1` and `part2` functions.
+"""
@@ -0,0 +1,118 @@
+"""
+On-disk store of the results (answers and phase timings) of days, so that re-running days whose
+code and input didn't change returns their results right away instead of computing them again.
+
+A result is stored under a key derived from the input bytes and from the source of the solution,
+which covers the solution module along with the modules of the repository it imports, directly or
+not (e.g. `aoc.graph`), as found in their `import` statements. Third-party modules (e.g. numpy)
+are not part of the key, nor are modules imported in other ways (e.g. `aoc.lazy.lazy_import`).
+
+Entries live in `.aoc/answers/<module name>/<source hash>-<input hash>.json`. Whenever a result is
+stored for a solution whose source hash differs from that of an entry, the stale entry is deleted.
+"""
+import ast
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from aoc.solutions import CACHE_DIR, REPO_ROOT, Day
+from aoc.storage import digest, write_atomically
+
+ANSWERS_DIR = CACHE_DIR / "answers"
+
+
+def _module_file(module_name: str) -> Optional[Path]:
+    """
+    Returns the file of module `module_name` if it's a module of the repository.
+    """
+    path = REPO_ROOT.joinpath(*module_name.split("."))
+    for candidate in (path.with_suffix(".py"), path / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _imported_names(tree: ast.AST) -> Iterable[str]:
+    """
+    Yields the names of the modules imported by `tree`, including the packages they are in (as
+    their `__init__` modules run too) and the names imported from packages (as they may be
+    modules, e.g. `from aoc import grid`).
+    """
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+        else:
+            continue
+
+        for name in names:
+            parts = name.split(".")
+            yield from (".".join(parts[:i]) for i in range(1, len(parts) + 1))
+
+
+def local_imports(module_path: Path) -> list[Path]:
+    """
+    Returns the files of the repository modules imported by the module at `module_path`, directly
+    or through other repository modules, sorted.
+    """
+    found: set[Path] = set()
+    pending = [module_path]
+    while pending:
+        tree = ast.parse(pending.pop().read_bytes())
+        for name in _imported_names(tree):
+            path = _module_file(name)
+            if path is not None and path not in found:
+                found.add(path)
+                pending.append(path)
+
+    found.discard(module_path)
+    return sorted(found)
+
+
+def source_hash(module_path: Path) -> str:
+    """
+    Returns a hash of the source of the module at `module_path` and of the repository modules it
+    imports.
+    """
+    sources = hashlib.sha256()
+    for path in [module_path] + local_imports(module_path):
+        # Paths relative to the root so the hash doesn't depend on where the repository is.
+        label = path.relative_to(REPO_ROOT) if path.is_relative_to(REPO_ROOT) else path
+        sources.update(str(label).encode() + b"\0" + path.read_bytes() + b"\0")
+    return sources.hexdigest()[:32]
+
+
+def _entry_path(day: Day, data: Union[bytes, memoryview], source: str, answers_dir: Path) -> Path:
+    return answers_dir / day.module_name / f"{source}-{digest(data)}.json"
+
+
+def load_answers(day: Day, data: Union[bytes, memoryview], answers_dir: Path = ANSWERS_DIR) -> Optional[dict[str, Any]]:
+    """
+    Returns the stored result of the current solution of `day` on the input `data`, `None` if there
+    is none.
+    """
+    entry_path = _entry_path(day, data, source_hash(day.module_path), answers_dir)
+    try:
+        return json.loads(entry_path.read_text())
+    except (OSError, ValueError):
+        # Missing, or a truncated or otherwise unusable entry.
+        return None
+
+
+def store_answers(
+    day: Day, data: Union[bytes, memoryview], document: dict[str, Any], answers_dir: Path = ANSWERS_DIR
+) -> None:
+    """
+    Stores the result `document` of the current solution of `day` on the input `data`, deleting
+    the entries of other versions of the solution.
+    """
+    source = source_hash(day.module_path)
+    entry_path = _entry_path(day, data, source, answers_dir)
+    entry_path.parent.mkdir(parents=True, exist_ok=True)
+    for path in entry_path.parent.iterdir():
+        if not path.name.startswith(f"{source}-"):
+            path.unlink(missing_ok=True)
+
+    write_atomically(entry_path, json.dumps(document, indent=2) + "\n")
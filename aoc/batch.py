@@ -0,0 +1,156 @@
+"""
+Runs a single day on many inputs (e.g. one per user) for throughput.
+
+Inputs are spread over a pool of worker processes that each load the solution module once, when
+they start, and then run every input they get through the parse, part 1 and part 2 phases. Results
+are streamed back as inputs complete. The latency of an input is the time its phases took in the
+worker, excluding the time it waited in the pool's queue, while the throughput is the number of
+inputs solved per second of wall clock time over the whole batch.
+
+A worker killed by the kernel (e.g. for exceeding the CPU time limit of its budget, see
+`aoc.budgets`) breaks the whole pool. The inputs it and the other workers were solving are then
+solved again one by one in processes of their own, so that only the inputs that kill their process
+fail, and the remaining inputs go on in a fresh pool.
+"""
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+import multiprocessing
+from multiprocessing.queues import SimpleQueue
+from typing import Any, Iterator, Optional
+
+from aoc.bench import percentile
+from aoc.budgets import Budget, enforced, run_isolated
+from aoc.inputs import PuzzleInput
+from aoc.runner import run_phases
+from aoc.solutions import Day, load_solution
+
+LATENCY_PERCENTILES = (50, 90, 99)
+
+# The solution module loaded by a worker process, and the queue it reports the inputs it starts on.
+_solution: Optional[ModuleType] = None
+_started: Optional[SimpleQueue] = None
+
+
+@dataclass
+class InputResult:
+    path: Path
+    answers: dict[str, Any] = field(default_factory=dict)
+
+    # Time the phases took on this input, in seconds.
+    latency: float = 0
+
+    # The exception raised while solving this input, if any.
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class BatchResult:
+    day: Day
+    jobs: int
+    inputs: list[InputResult] = field(default_factory=list)
+
+    # Wall clock time of the whole batch, in seconds.
+    wall_time: float = 0
+
+    @property
+    def solved(self) -> list[InputResult]:
+        return [r for r in self.inputs if r.error is None]
+
+    @property
+    def throughput(self) -> float:
+        """
+        Inputs solved per second.
+        """
+        return len(self.solved) / self.wall_time if self.wall_time > 0 else 0
+
+    def latency_percentiles(self, percentiles: tuple[int, ...] = LATENCY_PERCENTILES) -> dict[int, float]:
+        latencies = [r.latency for r in self.solved]
+        return {p: percentile(latencies, p) for p in percentiles} if latencies else {}
+
+
+def input_paths(inputs_dir: Path) -> list[Path]:
+    """
+    Returns the input files in `inputs_dir` (skipping hidden ones), sorted by name.
+    """
+    return sorted(p for p in inputs_dir.iterdir() if p.is_file() and not p.name.startswith("."))
+
+
+def _load_solution(day: Day, started: Optional[SimpleQueue] = None) -> None:
+    global _solution, _started
+    _solution, _started = load_solution(day), started
+
+
+def _solve(path: Path, budget: Optional[Budget]) -> InputResult:
+    if _solution is None:
+        raise RuntimeError("Inputs are solved in processes initialized with _load_solution")
+    if _started is not None:
+        _started.put(path)
+    try:
+        with enforced(budget) if budget is not None else nullcontext():
+            # Inputs are solved once, so they aren't kept in the process's inputs (see `load_input`).
+            phases = run_phases(_solution, PuzzleInput(path))
+    except Exception as e:
+        return InputResult(path, error=e)
+
+    return InputResult(
+        path, {p.phase: p.answer for p in phases if p.phase != "parse"}, sum(p.wall_time for p in phases)
+    )
+
+
+def _solve_alone(day: Day, path: Path, budget: Optional[Budget]) -> InputResult:
+    _load_solution(day)
+    return _solve(path, budget)
+
+
+def run_batch(day: Day, paths: list[Path], jobs: int, budget: Optional[Budget] = None) -> Iterator[InputResult]:
+    """
+    Solves `day` on every input of `paths` on a pool of `jobs` worker processes, yielding the result
+    of every input as soon as it completes. Inputs that fail (e.g. by exceeding the `budget` of a
+    single input, or by getting their process killed) are yielded with the exception they raised,
+    while a solution that fails to load fails the whole batch.
+    """
+    # Fail right away, rather than in every worker, if the solution can't be loaded.
+    load_solution(day)
+
+    pending = list(paths)
+    while pending:
+        started: SimpleQueue = multiprocessing.SimpleQueue()
+        completed = set()
+        with concurrent.futures.ProcessPoolExecutor(
+            jobs, initializer=_load_solution, initargs=(day, started)
+        ) as executor:
+            futures = {executor.submit(_solve, path, budget): path for path in pending}
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    result = future.result()
+                    completed.add(futures[future])
+                    yield result
+            except BrokenProcessPool as e:
+                broken = e
+
+        pending = [p for p in pending if p not in completed]
+        if not pending:
+            break
+
+        interrupted = set()
+        while not started.empty():
+            interrupted.add(started.get())
+        interrupted.difference_update(completed)
+        if not interrupted:
+            # The pool broke before any input was started, which solving them again wouldn't fix.
+            for path in pending:
+                yield InputResult(path, error=broken)
+            break
+
+        for path in (p for p in pending if p in interrupted):
+            try:
+                result = run_isolated(_solve_alone, day, path, budget, budget=budget)
+            except Exception as e:
+                # The kernel killed the process solving the input.
+                result = InputResult(path, error=e)
+            yield result
+        pending = [p for p in pending if p not in interrupted]
@@ -0,0 +1,176 @@
+"""
+Benchmarks days repeatedly and compares their timings against a baseline stored in the repository.
+
+The baseline is a JSON document mapping every benchmarked day (`YEAR/DAY`) to the statistics of
+each of its phases, e.g.:
+    {
+        "meta": {"python": "3.11.7", "commit": "43f82ec...", "repeat": 5, "warmup": 1},
+        "days": {"2020/01": {"parse": {"median": 7.1e-05, "p95": 8.0e-05}, ...}, ...}
+    }
+Phases that add to counters (see `aoc.counters`) have their counts listed along with their
+statistics, e.g. `"part2": {"median": 0.21, "p95": 0.23, "counters": {"instructions_executed": 81231}}`.
+"""
+from dataclasses import dataclass, field
+import json
+import math
+import platform
+import statistics
+import subprocess
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from aoc import counters
+from aoc.inputs import load_input
+from aoc.runner import run_phases
+from aoc.solutions import PHASES, REPO_ROOT, Day, load_solution
+
+BASELINE_PATH = REPO_ROOT / "benchmarks" / "baseline.json"
+
+# Phases faster than this (in seconds) are dominated by timer and scheduling noise, so they are
+# never reported as regressions.
+NOISE_FLOOR = 1e-3
+
+
+def percentile(values: list[float], p: float) -> float:
+    """
+    Returns the `p`th percentile (0 < p <= 100) of `values` using the nearest-rank method.
+    """
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+@dataclass
+class PhaseStats:
+    median: float
+    p95: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> "PhaseStats":
+        return cls(median=statistics.median(samples), p95=percentile(samples, 95))
+
+
+@dataclass
+class DayBenchmark:
+    day: Day
+    phases: dict[str, PhaseStats] = field(default_factory=dict)
+
+    # The counts added by every phase (see `aoc.counters`), omitting phases that added none.
+    counters: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def to_json(self) -> dict[str, dict[str, Any]]:
+        document: dict[str, dict[str, Any]] = {}
+        for phase, s in self.phases.items():
+            document[phase] = {"median": s.median, "p95": s.p95}
+            if self.counters.get(phase):
+                document[phase]["counters"] = self.counters[phase]
+        return document
+
+
+@dataclass
+class Regression:
+    day: Day
+    phase: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def bench_day(day: Day, repeat: int = 5, warmup: int = 1) -> DayBenchmark:
+    """
+    Runs all phases of `day` `warmup + repeat` times and returns statistics of the wall time of
+    each phase over the last `repeat` runs, along with the counts every phase added in the last run.
+    Solutions add to counters only a few times per phase, so counting doesn't skew the timings.
+    """
+    solution = load_solution(day)
+    puzzle_input = load_input(day.input_path)
+
+    samples: dict[str, list[float]] = {phase: [] for phase in PHASES}
+    counters.enable()
+    try:
+        for i in range(warmup + repeat):
+            phases = run_phases(solution, puzzle_input)
+            if i < warmup:
+                continue
+
+            for p in phases:
+                samples[p.phase].append(p.wall_time)
+    finally:
+        counters.disable()
+
+    return DayBenchmark(
+        day,
+        {phase: PhaseStats.from_samples(s) for phase, s in samples.items()},
+        {p.phase: p.counters for p in phases if p.counters},
+    )
+
+
+def find_regressions(
+    benchmarks: Iterable[DayBenchmark], baseline: dict[str, Any], threshold: float
+) -> list[Regression]:
+    """
+    Compares the median timing of every phase against `baseline` and returns the phases that got
+    slower by more than `threshold` (a fraction, e.g. 0.2 for 20%). Days missing from the baseline
+    are skipped.
+    """
+    regressions = []
+    baseline_days = baseline.get("days", {})
+    for b in benchmarks:
+        baseline_phases = baseline_days.get(str(b.day))
+        if baseline_phases is None:
+            continue
+
+        for phase, stats in b.phases.items():
+            if phase not in baseline_phases:
+                continue
+
+            baseline_median = baseline_phases[phase]["median"]
+            if stats.median < NOISE_FLOOR and baseline_median < NOISE_FLOOR:
+                continue
+
+            if stats.median > baseline_median * (1 + threshold):
+                regressions.append(Regression(b.day, phase, baseline_median, stats.median))
+
+    return regressions
+
+
+def current_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def benchmarks_to_json(benchmarks: Iterable[DayBenchmark], repeat: int, warmup: int) -> dict[str, Any]:
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "commit": current_commit(),
+            "repeat": repeat,
+            "warmup": warmup,
+        },
+        "days": {str(b.day): b.to_json() for b in benchmarks},
+    }
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+
+    return json.loads(path.read_text())
+
+
+def save_baseline(document: dict[str, Any], path: Path = BASELINE_PATH) -> None:
+    """
+    Merges the benchmarked days of `document` into the baseline stored at `path`, keeping the
+    baseline of days that were not benchmarked this time.
+    """
+    baseline = load_baseline(path)
+    merged = {"meta": document["meta"], "days": {**baseline.get("days", {}), **document["days"]}}
+    merged["days"] = dict(sorted(merged["days"].items()))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(merged, indent=2) + "\n")
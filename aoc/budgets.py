@@ -0,0 +1,196 @@
+"""
+Time and memory budgets of days, so that a day that runs away (e.g. on a large synthetic input)
+fails on its own instead of hanging or exhausting the machine for the whole run.
+
+Budgets are declared in `pyproject.toml`, with defaults for all days and overrides per day:
+    [tool.aoc.budgets]
+    default = { time = 60, memory = 2048 }
+    "2020/15" = { time = 120 }
+where `time` is in seconds of wall clock time and `memory` in MiB of the process's data segment
+(its heap, as limited by `RLIMIT_DATA`), interpreter and imported modules included.
+
+A budget is enforced on the process running the day:
+  - Once the time budget is exhausted, `SIGALRM` interrupts the day by raising `BudgetExceeded`.
+    Signals are only handled between python bytecodes, so a day stuck in a long native call (e.g.
+    a numpy operation) is not interrupted right away. As a last resort, the process is killed by
+    the kernel once it used twice its time budget of CPU time (`RLIMIT_CPU`).
+  - Allocations beyond the memory budget fail, raising `BudgetExceeded` too.
+
+Days run with `run_isolated` get a process of their own, so that a day killed by the kernel fails
+with `BudgetExceeded` without taking down the processes running other days. These processes are
+started by a fork server rather than forked from the caller, which may be running other threads
+(e.g. those of `aoc.scheduler`) that could hold locks at the time of the fork, deadlocking the
+child.
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass
+import math
+import multiprocessing
+from multiprocessing.connection import Connection
+from pathlib import Path
+import resource
+import signal
+import time
+import tomllib
+import traceback
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from aoc.solutions import REPO_ROOT, Day
+
+CONFIG_PATH = REPO_ROOT / "pyproject.toml"
+
+T = TypeVar("T")
+
+_context = multiprocessing.get_context("forkserver")
+
+
+@dataclass
+class Budget:
+    # Wall clock time in seconds.
+    time: Optional[float] = None
+
+    # Data segment size in MiB.
+    memory: Optional[int] = None
+
+
+class BudgetExceeded(Exception):
+    def __init__(self, resource_name: str, limit: float, used: Optional[float] = None):
+        self.resource_name = resource_name
+        self.limit = limit
+        self.used = used
+        unit = "s" if resource_name == "time" else "MiB"
+        super().__init__(f"Exceeded its {resource_name} budget of {limit:g} {unit}")
+
+    def to_json(self) -> dict[str, Any]:
+        return {"budget_exceeded": self.resource_name, "limit": self.limit, "used": self.used}
+
+    def __reduce__(self):
+        # Raised in worker processes and pickled back to the parent.
+        return BudgetExceeded, (self.resource_name, self.limit, self.used)
+
+
+def load_budgets(path: Path = CONFIG_PATH) -> dict[str, Budget]:
+    """
+    Returns the budgets declared in `path`, keyed by `default` and by `YEAR/DAY`.
+    """
+    if not path.exists():
+        return {}
+
+    with open(path, "rb") as f:
+        declared = tomllib.load(f).get("tool", {}).get("aoc", {}).get("budgets", {})
+
+    budgets = {}
+    for key, values in declared.items():
+        unknown = set(values) - {"time", "memory"}
+        if unknown:
+            raise ValueError(f"Unknown budget of {key} in {path}: {', '.join(sorted(unknown))}")
+        # Days may be written either way, e.g. `2020/7` or `2020/07`.
+        budgets[key if key == "default" else str(Day.from_str(key))] = Budget(**values)
+
+    return budgets
+
+
+def budget_for(day: Day, budgets: dict[str, Budget]) -> Budget:
+    """
+    Returns the budget of `day`, its own budgets taking precedence over the default ones.
+    """
+    default, own = budgets.get("default", Budget()), budgets.get(str(day), Budget())
+    return Budget(
+        time=own.time if own.time is not None else default.time,
+        memory=own.memory if own.memory is not None else default.memory,
+    )
+
+
+@contextmanager
+def enforced(budget: Budget) -> Iterator[None]:
+    """
+    Enforces `budget` on the code in the `with` block, raising `BudgetExceeded` from it once it
+    exhausts its budget. The previous limits are restored when the block exits.
+    """
+    previous_limits = {r: resource.getrlimit(r) for r in (resource.RLIMIT_CPU, resource.RLIMIT_DATA)}
+    previous_handler = signal.getsignal(signal.SIGALRM)
+    start = time.perf_counter()
+
+    def on_alarm(signum, frame):
+        raise BudgetExceeded("time", budget.time, time.perf_counter() - start)
+
+    if budget.time is not None:
+        signal.signal(signal.SIGALRM, on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, budget.time)
+        used = resource.getrusage(resource.RUSAGE_SELF)
+        cpu_limit = math.ceil(used.ru_utime + used.ru_stime + 2 * budget.time) + 1
+        _lower_limit(resource.RLIMIT_CPU, cpu_limit)
+    if budget.memory is not None:
+        _lower_limit(resource.RLIMIT_DATA, budget.memory * 2**20)
+
+    try:
+        yield
+    except MemoryError as e:
+        if budget.memory is None:
+            raise
+        raise BudgetExceeded("memory", budget.memory) from e
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+        for r, limits in previous_limits.items():
+            resource.setrlimit(r, limits)
+
+
+def _lower_limit(r: int, soft_limit: int) -> None:
+    """
+    Sets the soft limit of resource `r`, unless the current soft limit is already lower. The hard
+    limit is left as is so that the previous soft limit can be restored.
+    """
+    soft, hard = resource.getrlimit(r)
+    if hard != resource.RLIM_INFINITY:
+        soft_limit = min(soft_limit, hard)
+    if soft == resource.RLIM_INFINITY or soft_limit < soft:
+        resource.setrlimit(r, (soft_limit, hard))
+
+
+def _call(connection: Connection, fn: Callable, args: tuple) -> None:
+    try:
+        outcome = (True, fn(*args))
+    except Exception as e:
+        outcome = (False, e)
+
+    try:
+        connection.send(outcome)
+    except Exception:
+        # A result or an exception that can't be pickled.
+        connection.send((False, RuntimeError(traceback.format_exc())))
+
+
+def run_isolated(fn: Callable[..., T], *args: Any, budget: Optional[Budget] = None) -> T:
+    """
+    Returns `fn(*args)` as called in a fresh process of its own, or raises the exception it raised
+    there. A process killed by the kernel only fails its own call, raising `BudgetExceeded` if it
+    was killed for exceeding the CPU time limit set for the time of `budget` (see `enforced`), and
+    `ChildProcessError` otherwise.
+
+    The process doesn't share the state of the caller, so `fn` must be a module level function,
+    and it and `args` must be picklable. Its environment variables are those of the caller at the
+    time of the first call, when the fork server started.
+    """
+    # The fork server starts on the first call. It imports the module of `fn` (and those it imports)
+    # once, so that the processes it starts don't import them again.
+    _context.set_forkserver_preload([fn.__module__])
+    receiver, sender = _context.Pipe(duplex=False)
+    process = _context.Process(target=_call, args=(sender, fn, args))
+    process.start()
+    sender.close()
+    try:
+        succeeded, value = receiver.recv()
+    except EOFError:
+        # The process died without sending anything.
+        process.join()
+        if process.exitcode == -signal.SIGXCPU and budget is not None and budget.time is not None:
+            raise BudgetExceeded("time", budget.time) from None
+        raise ChildProcessError(f"The process running {fn.__qualname__} died with exit code {process.exitcode}")
+    finally:
+        receiver.close()
+        process.join()
+
+    if not succeeded:
+        raise value
+    return value
@@ -0,0 +1,633 @@
+"""
+Command line interface of the solutions runner, invoked as `python -m aoc <command> ...`.
+"""
+import argparse
+import json
+import os
+from pathlib import Path
+import sys
+import time
+from typing import Optional, Sequence
+
+from aoc import (
+    batch,
+    bench,
+    budgets,
+    compare,
+    counters,
+    daemon,
+    distributed,
+    generators,
+    importtime,
+    memo,
+    profiling,
+    scaling,
+    scheduler,
+    tracing,
+)
+from aoc.runner import DayResult, run_day
+from aoc.solutions import PHASES, Day, all_days, select_days
+
+
+def format_duration(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f} us"
+    elif seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+
+def format_size(size: int) -> str:
+    return f"{size / 2**20:.1f} MiB"
+
+
+def format_budget_exceeded(e: budgets.BudgetExceeded) -> str:
+    return str(e) + (f" (after {format_duration(e.used)})" if e.resource_name == "time" and e.used else "")
+
+
+def print_day_result(result: DayResult) -> None:
+    print(f"***** {result.day}")
+    for phase, answer in result.answers.items():
+        # Multi-line answers (e.g. text drawn on a screen) start on their own line.
+        answer_str = str(answer)
+        print(f"{phase}:", ("\n" if "\n" in answer_str else "") + answer_str)
+
+    print(f"{'phase':<8}{'wall':>12}{'cpu':>12}{'peak rss':>12}")
+    for p in result.phases:
+        wall, cpu, rss = format_duration(p.wall_time), format_duration(p.cpu_time), format_size(p.peak_rss)
+        print(f"{p.phase:<8}{wall:>12}{cpu:>12}{rss:>12}" + ("  (cached)" if p.cached else ""))
+    print(f"{'total':<8}{format_duration(result.wall_time):>12}{format_duration(result.cpu_time):>12}")
+    for p in result.phases:
+        for name, count in p.counters.items():
+            print(f"{p.phase} {name}: {count:,}")
+
+
+def print_memory_reports(result: DayResult) -> None:
+    for p in result.phases:
+        if p.memory is None:
+            continue
+
+        m = p.memory
+        print(f"***** {result.day} {p.phase} memory: peak {format_size(m.peak)}, retained {format_size(m.retained)}")
+        for site in m.top_sites:
+            print(f"  {site.size / 2**10:>10.1f} KiB{site.count:>10} blocks  {site.location}")
+        if m.object_counts:
+            print("  new objects: " + ", ".join(f"{name} +{count}" for name, count in m.object_counts))
+
+
+def print_profiles(result: DayResult, top: int) -> None:
+    for p in result.phases:
+        if p.profile_path is None:
+            continue
+
+        print(f"***** {result.day} {p.phase} profile: {p.profile_path} (and .folded)")
+        print(profiling.top_functions(p.profile_path, top).strip("\n"))
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    if args.persistent_memos:
+        memo.enable_persistence()
+
+    if args.inputs is not None:
+        if args.year is None or args.day is None:
+            raise SystemExit("--inputs can only be used when running a single day")
+        if args.input is not None or args.sample or args.scale is not None:
+            raise SystemExit("--inputs can't be used along with --input, --sample or --scale")
+        if args.profile or args.memory or args.daemon or args.trace or args.counters:
+            raise SystemExit("--inputs can't be used along with --profile, --memory, --daemon, --trace or --counters")
+        day = Day(args.year, args.day)
+        budget = budgets.budget_for(day, budgets.load_budgets()) if args.budgets else None
+        return run_inputs(day, args.inputs, args.jobs, budget)
+
+    if args.sample:
+        if args.input is not None or args.scale is not None:
+            raise SystemExit("--sample can't be used along with --input or --scale")
+        if args.year is None or args.day is None:
+            raise SystemExit("--sample can only be used when running a single day")
+
+    if args.scale is not None:
+        if args.input is not None:
+            raise SystemExit("--input and --scale can't be used together")
+        if args.scale <= 0:
+            raise SystemExit("--scale must be positive")
+
+    # Synthetic inputs are mostly run once at every scale, caching them would only fill the disk.
+    # Their timings are not recorded either, as they would throw off the scheduling of real runs, nor
+    # are the timings of other inputs given with --input, of samples, the (slowed down) timings of
+    # profiled or memory traced runs or the timings of runs reusing the results of earlier ones
+    # through persistent memos.
+    parse_cache = args.parse_cache and args.scale is None
+    # Stored results hold the counters of the run that stored them, if any.
+    answer_cache = not args.force and args.scale is None and not args.counters
+    record_history = (
+        args.scale is None
+        and args.input is None
+        and not args.sample
+        and not args.profile
+        and not args.memory
+        and not args.persistent_memos
+    )
+    # Profiled and traced runs are slowed down (and traced ones use more memory), so they would
+    # exceed budgets that normal runs stay within.
+    day_budgets = budgets.load_budgets() if args.budgets and not args.profile and not args.memory else None
+    profile_dir = args.profile_dir if args.profile else None
+
+    if args.daemon and (args.year is None or args.day is None):
+        raise SystemExit("--daemon can only be used when running a single day")
+    if args.daemon and (args.profile or args.memory or args.trace or args.counters):
+        raise SystemExit("--daemon can't be used along with --profile, --memory, --trace or --counters")
+    if args.trace is not None:
+        tracing.enable("python -m aoc run")
+    if args.counters:
+        counters.enable()
+
+    if args.year is not None and args.day is not None:
+        day = Day(args.year, args.day)
+        input_path = day.sample_path if args.sample else args.input
+        if args.scale is not None:
+            input_path = generators.generated_input_path(day, args.scale, args.seed)
+        budget = budgets.budget_for(day, day_budgets) if day_budgets is not None else None
+        if args.daemon:
+            result = run_on_daemon(day, input_path, args.socket)
+        else:
+            try:
+                result = run_day(day, input_path, parse_cache, profile_dir, args.memory, answer_cache, budget)
+            except budgets.BudgetExceeded as e:
+                print(f"***** {day} BUDGET EXCEEDED: {format_budget_exceeded(e)}")
+                return 1
+        if args.trace is not None:
+            save_trace(result.trace + tracing.disable(), args.trace)
+        print_day_result(result)
+        print_memory_reports(result)
+        print_profiles(result, args.top)
+        if record_history:
+            scheduler.save_history([result])
+        return 0
+
+    if not args.all and args.year is None:
+        raise SystemExit("Specify a day to run (YEAR DAY), a year (YEAR) or --all")
+    if args.input is not None:
+        raise SystemExit("--input can only be used when running a single day")
+
+    days = all_days([args.year] if args.year is not None else None)
+    return run_many(
+        days,
+        args.jobs,
+        parse_cache,
+        args.scale,
+        args.seed,
+        profile_dir,
+        args.memory,
+        args.top,
+        record_history,
+        answer_cache,
+        day_budgets,
+        args.trace,
+        args.counters,
+    )
+
+
+def run_on_daemon(day: Day, input_path: Optional[Path], socket_path: Path) -> DayResult:
+    message = {"command": "run", "day": str(day), "input": str(input_path.resolve()) if input_path else None}
+    try:
+        response = daemon.request(message, socket_path)
+    except ConnectionError as e:
+        raise SystemExit(f"{e}, start one with: python -m aoc daemon")
+
+    if "error" in response:
+        raise SystemExit(f"{day} failed on the daemon:\n{response['error']}")
+    return DayResult.from_json(response["result"])
+
+
+def run_inputs(day: Day, inputs_dir: Path, jobs: int, budget: Optional[budgets.Budget] = None) -> int:
+    paths = batch.input_paths(inputs_dir)
+    result = batch.BatchResult(day, jobs)
+    wall_start = time.perf_counter()
+    for r in batch.run_batch(day, paths, jobs, budget):
+        result.inputs.append(r)
+        if isinstance(r.error, budgets.BudgetExceeded):
+            print(f"{r.path.name}: BUDGET EXCEEDED: {format_budget_exceeded(r.error)}")
+        elif r.error is not None:
+            print(f"{r.path.name}: FAILED: {r.error!r}")
+        else:
+            answers = ", ".join(f"{phase}: {answer}" for phase, answer in r.answers.items())
+            print(f"{r.path.name}: {answers} ({format_duration(r.latency)})")
+    result.wall_time = time.perf_counter() - wall_start
+
+    failures = len(result.inputs) - len(result.solved)
+    print(f"***** Ran {day} on {len(paths)} inputs on {jobs} workers in {format_duration(result.wall_time)}")
+    print(f"Throughput: {result.throughput:.1f} inputs/s" + (f", {failures} failed" if failures else ""))
+    percentiles = result.latency_percentiles()
+    if percentiles:
+        latencies = ", ".join(f"p{p} {format_duration(t)}" for p, t in percentiles.items())
+        print(f"Latency: {latencies}, max {format_duration(max(r.latency for r in result.solved))}")
+
+    return 1 if failures else 0
+
+
+def save_trace(events: list[dict], path: Path) -> None:
+    tracing.write_trace(events, path)
+    print(f"Trace saved to {path}, open it in https://ui.perfetto.dev or chrome://tracing", file=sys.stderr)
+
+
+def run_many(
+    days: list[Day],
+    jobs: int,
+    parse_cache: bool,
+    scale: Optional[float] = None,
+    seed: int = 0,
+    profile_dir: Optional[Path] = None,
+    trace_memory: bool = False,
+    top: int = 0,
+    record_history: bool = True,
+    answer_cache: bool = False,
+    day_budgets: Optional[dict[str, budgets.Budget]] = None,
+    trace_path: Optional[Path] = None,
+    count: bool = False,
+) -> int:
+    wall_start = time.perf_counter()
+    results, failures = [], 0
+    trace = trace_path is not None
+    for day, result in scheduler.run_days(
+        days, jobs, parse_cache, scale, seed, profile_dir, trace_memory, answer_cache, day_budgets, trace, count
+    ):
+        if isinstance(result, budgets.BudgetExceeded):
+            failures += 1
+            print(f"***** {day} BUDGET EXCEEDED: {format_budget_exceeded(result)}")
+            continue
+        if isinstance(result, BaseException):
+            failures += 1
+            print(f"***** {day} FAILED: {result!r}")
+            continue
+
+        results.append(result)
+        print_day_result(result)
+        print_memory_reports(result)
+        print_profiles(result, top)
+
+    if record_history:
+        scheduler.save_history(results)
+    if trace_path is not None:
+        save_trace(tracing.disable() + [event for r in results for event in r.trace], trace_path)
+    wall_time = time.perf_counter() - wall_start
+    sum_of_days = sum(r.wall_time for r in results)
+    slowest = max(results, key=lambda r: r.wall_time, default=None)
+    print(f"***** Ran {len(days)} days on {jobs} workers in {format_duration(wall_time)}")
+    print(f"Sum of day times: {format_duration(sum_of_days)}")
+    if slowest is not None:
+        print(f"Slowest day: {slowest.day} ({format_duration(slowest.wall_time)})")
+
+    return 1 if failures else 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    benchmarks = []
+    for day in select_days(args.days):
+        print(f"Benchmarking {day}...", file=sys.stderr)
+        benchmarks.append(bench.bench_day(day, args.repeat, args.warmup))
+
+    document = bench.benchmarks_to_json(benchmarks, args.repeat, args.warmup)
+    regressions = bench.find_regressions(benchmarks, bench.load_baseline(args.baseline), args.threshold)
+    document["regressions"] = [
+        {"day": str(r.day), "phase": r.phase, "baseline": r.baseline, "current": r.current, "ratio": r.ratio}
+        for r in regressions
+    ]
+
+    if args.json:
+        print(json.dumps(document, indent=2))
+    else:
+        print(f"{'day':<10}{'phase':<8}{'median':>12}{'p95':>12}")
+        for b in benchmarks:
+            for phase, stats in b.phases.items():
+                median, p95 = format_duration(stats.median), format_duration(stats.p95)
+                print(f"{str(b.day):<10}{phase:<8}{median:>12}{p95:>12}")
+        for r in regressions:
+            print(
+                f"REGRESSION {r.day} {r.phase}: {format_duration(r.baseline)} -> {format_duration(r.current)}"
+                f" ({r.ratio:.2f}x)"
+            )
+
+    if args.update_baseline:
+        bench.save_baseline(document, args.baseline)
+
+    return 1 if regressions else 0
+
+
+def cmd_daemon(args: argparse.Namespace) -> int:
+    if args.stop:
+        try:
+            daemon.request({"command": "stop"}, args.socket)
+        except ConnectionError as e:
+            raise SystemExit(str(e))
+        return 0
+
+    print(f"Serving on {args.socket}, stop with Ctrl+C or: python -m aoc daemon --stop", file=sys.stderr)
+    daemon.serve(args.socket)
+    return 0
+
+
+def cmd_coordinator(args: argparse.Namespace) -> int:
+    days = select_days(args.days)
+    if args.inputs is not None and len(days) != 1:
+        raise SystemExit("--inputs can only be used when running a single day")
+
+    jobs = distributed.make_jobs(days, args.inputs)
+    coordinator = distributed.Coordinator(jobs, distributed.parse_address(args.bind))
+    host, port = coordinator.socket.getsockname()[:2]
+    print(f"Serving {len(jobs)} jobs on {host}:{port}, start workers with: python -m aoc worker HOST:{port}")
+
+    wall_start = time.perf_counter()
+    workers, failures = set(), 0
+    coordinator.start()
+    for r in coordinator.results():
+        workers.add(r.worker)
+        name = f"{r.job.day} {r.job.name}"
+        if r.result is None:
+            failures += 1
+            print(f"***** {name} FAILED on {r.worker}:\n{r.error}")
+            continue
+
+        answers = ", ".join(f"{phase}: {answer}" for phase, answer in r.result.answers.items())
+        print(f"{name}: {answers} ({format_duration(r.result.wall_time)} on {r.worker})")
+    wall_time = time.perf_counter() - wall_start
+
+    print(f"***** Ran {len(jobs)} jobs on {len(workers)} workers in {format_duration(wall_time)}")
+    return 1 if failures else 0
+
+
+def cmd_worker(args: argparse.Namespace) -> int:
+    address = distributed.parse_address(args.coordinator)
+    try:
+        jobs_run = distributed.run_worker(address, budgets.load_budgets() if args.budgets else None)
+    except OSError as e:
+        raise SystemExit(f"Could not reach the coordinator at {args.coordinator}: {e}")
+
+    print(f"Ran {jobs_run} jobs", file=sys.stderr)
+    return 0
+
+
+def cmd_generate(args: argparse.Namespace) -> int:
+    if args.scale <= 0:
+        raise SystemExit("--scale must be positive")
+
+    text = generators.generate_input(Day.from_str(args.day), args.scale, args.seed)
+    if args.output is not None:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text)
+
+    return 0
+
+
+def cmd_scaling(args: argparse.Namespace) -> int:
+    results = []
+    for day in select_days(args.days):
+        if not generators.has_generator(day):
+            print(f"Skipping {day}: no input generator", file=sys.stderr)
+            continue
+
+        print(f"Measuring {day}...", file=sys.stderr)
+        results.append(scaling.measure_scaling(day, args.scales, args.seed, args.repeat, args.max_time))
+
+    print(f"{'day':<10}{'phase':<8}{'exponent':>10}{'budget':>8}")
+    exceeded = 0
+    for result in results:
+        for phase, fit in result.phases.items():
+            exponent = "-" if fit.exponent is None else f"{fit.exponent:.2f}"
+            budget = "-" if fit.budget is None else f"{fit.budget:g}"
+            over = fit.exceeds_budget(args.tolerance)
+            exceeded += over
+            print(f"{str(result.day):<10}{phase:<8}{exponent:>10}{budget:>8}" + ("  OVER BUDGET" if over else ""))
+
+    if args.csv is not None:
+        with open(args.csv, "w", newline="") as f:
+            scaling.write_csv(results, f)
+
+    return 1 if exceeded else 0
+
+
+def cmd_compare(args: argparse.Namespace) -> int:
+    day = Day.from_str(args.day)
+    input_path = generators.generated_input_path(day, args.scale, args.seed) if args.scale is not None else None
+    budget = budgets.budget_for(day, budgets.load_budgets()) if args.budgets else None
+    results = compare.compare_variants(day, input_path, args.repeat, budget)
+    if len(results) < 2:
+        print(f"{day} has a single implementation: {results[0].path.name}")
+        return 0
+
+    wrong = compare.mismatches(results)
+    name_width = max(len(r.path.name) for r in results) + 2
+    print(f"{'variant':<{name_width}}" + "".join(f"{h:>12}" for h in PHASES + ("total", "peak rss", "vs first")))
+    for r in results:
+        if r.error is not None:
+            error = format_budget_exceeded(r.error) if isinstance(r.error, budgets.BudgetExceeded) else repr(r.error)
+            print(f"{r.path.name:<{name_width}}FAILED: {error}")
+            continue
+
+        row = [format_duration(p.wall_time) for p in r.phases] + [format_duration(r.wall_time), format_size(r.peak_rss)]
+        speedup = f"{results[0].wall_time / r.wall_time:.2f}x" if results[0].error is None and r.wall_time else "-"
+        wrong_parts = [phase for path, phase in wrong if path == r.path]
+        print(
+            f"{r.path.name:<{name_width}}"
+            + "".join(f"{v:>12}" for v in row + [speedup])
+            + (f"  WRONG {', '.join(wrong_parts)}" if wrong_parts else "")
+        )
+
+    failed = sum(r.error is not None for r in results)
+    if not wrong and not failed:
+        print("All variants agree: " + ", ".join(f"{phase}: {a}" for phase, a in results[0].answers.items()))
+    return 1 if wrong or failed else 0
+
+
+def cmd_imports(args: argparse.Namespace) -> int:
+    failures = 0
+    for day in select_days(args.days):
+        try:
+            steps = importtime.measure_imports(day)
+        except RuntimeError as e:
+            failures += 1
+            print(f"***** {day} FAILED: {e}")
+            continue
+
+        print(f"***** {day} imports: {format_duration(sum(s.total for s in steps))}")
+        for s in steps:
+            packages = ", ".join(f"{name} {format_duration(t)}" for name, t in list(s.packages.items())[: args.top])
+            print(f"{s.step:<8}{format_duration(s.total):>12}  {packages}".rstrip())
+
+    return 1 if failures else 0
+
+
+def parse_scales(value: str) -> list[float]:
+    return [float(s) for s in value.split(",")]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m aoc", description="Advent of Code solutions runner")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run days and time each of their phases")
+    run_parser.add_argument("year", type=int, nargs="?", help="Year to run, all of its days unless DAY is given")
+    run_parser.add_argument("day", type=int, nargs="?")
+    run_parser.add_argument("--all", action="store_true", help="Run all days of all years")
+    run_parser.add_argument(
+        "--jobs", "-j", type=int, default=os.cpu_count(), help="Worker processes used when running multiple days"
+    )
+    run_parser.add_argument("--input", type=Path, help="Puzzle input to use instead of the day's input.txt")
+    run_parser.add_argument(
+        "--inputs", type=Path, help="Directory of puzzle inputs to run the day on all of, on the worker processes"
+    )
+    run_parser.add_argument("--sample", action="store_true", help="Run on the day's sample.txt instead of its input")
+    run_parser.add_argument(
+        "--no-parse-cache",
+        dest="parse_cache",
+        action="store_false",
+        help="Always parse the input instead of loading it from the parsed inputs cache",
+    )
+    run_parser.add_argument(
+        "--no-budgets",
+        dest="budgets",
+        action="store_false",
+        help="Don't enforce the time and memory budgets of days declared in pyproject.toml",
+    )
+    run_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Always run the solutions instead of returning the stored results of unchanged days",
+    )
+    run_parser.add_argument(
+        "--scale",
+        type=float,
+        help="Run on synthetic inputs this many times as large as the real ones instead of the puzzle inputs",
+    )
+    run_parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic inputs used with --scale")
+    run_parser.add_argument(
+        "--profile", action="store_true", help="Profile every phase, saving pstats and collapsed stacks files"
+    )
+    run_parser.add_argument("--profile-dir", type=Path, default=profiling.PROFILES_DIR, help="Where to save profiles")
+    run_parser.add_argument(
+        "--top", type=int, default=15, help="Functions listed in the cumulative time summary of every profile"
+    )
+    run_parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Trace the memory of every phase, reporting its peak, top allocation sites and new objects",
+    )
+    run_parser.add_argument(
+        "--persistent-memos",
+        action="store_true",
+        help="Reuse the results of persistent memos stored by earlier runs, and store new ones (see aoc.memo)",
+    )
+    run_parser.add_argument(
+        "--counters",
+        action="store_true",
+        help="Report the counters of the work done by every phase (nodes expanded, instructions executed, ...)",
+    )
+    run_parser.add_argument(
+        "--trace",
+        type=Path,
+        help="Save a timeline of the days, their phases and worker processes to this Chrome trace (JSON) file",
+    )
+    run_parser.add_argument(
+        "--daemon", action="store_true", help="Run the day on a running solver daemon (see the daemon command)"
+    )
+    run_parser.add_argument("--socket", type=Path, default=daemon.SOCKET_PATH, help="Socket of the solver daemon")
+    run_parser.set_defaults(handler=cmd_run)
+
+    daemon_parser = commands.add_parser(
+        "daemon", help="Serve runs from a long-lived process keeping solutions, inputs and parsed inputs warm"
+    )
+    daemon_parser.add_argument("--socket", type=Path, default=daemon.SOCKET_PATH, help="Socket to listen on")
+    daemon_parser.add_argument("--stop", action="store_true", help="Stop the daemon listening on the socket")
+    daemon_parser.set_defaults(handler=cmd_daemon)
+
+    coordinator_parser = commands.add_parser(
+        "coordinator", help="Hand days out to workers over TCP, possibly on other machines, and collect their results"
+    )
+    coordinator_parser.add_argument("days", nargs="*", help="Years (2020) or days (2020/7) to run, default: all")
+    coordinator_parser.add_argument(
+        "--inputs", type=Path, help="Directory of puzzle inputs to run the day on all of, instead of its input.txt"
+    )
+    coordinator_parser.add_argument(
+        "--bind",
+        default=f":{distributed.DEFAULT_PORT}",
+        help=f"HOST:PORT to listen on for workers, default: all interfaces on port {distributed.DEFAULT_PORT}",
+    )
+    coordinator_parser.set_defaults(handler=cmd_coordinator)
+
+    worker_parser = commands.add_parser("worker", help="Run the days handed out by a coordinator")
+    worker_parser.add_argument("coordinator", help="HOST:PORT of the coordinator")
+    worker_parser.add_argument(
+        "--no-budgets", dest="budgets", action="store_false", help="Don't enforce the time and memory budgets of days"
+    )
+    worker_parser.set_defaults(handler=cmd_worker)
+
+    generate_parser = commands.add_parser("generate", help="Generate a synthetic input of a day")
+    generate_parser.add_argument("day", help="Day to generate an input for (2020/7)")
+    generate_parser.add_argument("--scale", type=float, default=1, help="Size of the input relative to a real one")
+    generate_parser.add_argument("--seed", type=int, default=0)
+    generate_parser.add_argument("--output", "-o", type=Path, help="File to write the input to instead of stdout")
+    generate_parser.set_defaults(handler=cmd_generate)
+
+    bench_parser = commands.add_parser("bench", help="Benchmark days and detect regressions against a baseline")
+    bench_parser.add_argument("days", nargs="*", help="Years (2020) or days (2020/7) to benchmark, default: all")
+    bench_parser.add_argument("--repeat", type=int, default=5, help="Measured runs per day")
+    bench_parser.add_argument("--warmup", type=int, default=1, help="Unmeasured runs per day before measuring")
+    bench_parser.add_argument(
+        "--threshold", type=float, default=0.2, help="Slowdown of a phase median (a fraction) considered a regression"
+    )
+    bench_parser.add_argument("--baseline", type=Path, default=bench.BASELINE_PATH)
+    bench_parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline")
+    bench_parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    bench_parser.set_defaults(handler=cmd_bench)
+
+    scaling_parser = commands.add_parser(
+        "scaling", help="Fit how the time of every phase grows with the input size, on synthetic inputs"
+    )
+    scaling_parser.add_argument("days", nargs="*", help="Years (2020) or days (2020/7) to measure, default: all")
+    scaling_parser.add_argument(
+        "--scales",
+        type=parse_scales,
+        default=scaling.DEFAULT_SCALES,
+        help="Comma separated scales of the synthetic inputs, default: 1,2,4,8,16",
+    )
+    scaling_parser.add_argument("--seed", type=int, default=0)
+    scaling_parser.add_argument("--repeat", type=int, default=3, help="Runs per scale, the fastest one is kept")
+    scaling_parser.add_argument(
+        "--max-time", type=float, default=30, help="Skip larger scales once a run takes longer (seconds)"
+    )
+    scaling_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=scaling.DEFAULT_TOLERANCE,
+        help="How much a fitted exponent may exceed its budget before being reported",
+    )
+    scaling_parser.add_argument("--csv", type=Path, help="Write the timings and fitted exponents to this CSV file")
+    scaling_parser.set_defaults(handler=cmd_scaling)
+
+    compare_parser = commands.add_parser(
+        "compare", help="Run every implementation of a day on the same input, checking they agree and timing them"
+    )
+    compare_parser.add_argument("day", help="Day to compare the implementations of (2020/17)")
+    compare_parser.add_argument(
+        "--scale", type=float, help="Compare on a synthetic input this many times as large as the real one"
+    )
+    compare_parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic input used with --scale")
+    compare_parser.add_argument("--repeat", type=int, default=3, help="Runs per variant, the fastest one is kept")
+    compare_parser.add_argument(
+        "--no-budgets", dest="budgets", action="store_false", help="Don't enforce the day's time and memory budgets"
+    )
+    compare_parser.set_defaults(handler=cmd_compare)
+
+    imports_parser = commands.add_parser(
+        "imports", help="Report the time days spend importing modules, when loading and in every phase"
+    )
+    imports_parser.add_argument("days", nargs="*", help="Years (2020) or days (2020/7) to audit, default: all")
+    imports_parser.add_argument("--top", type=int, default=3, help="Slowest packages listed for every step")
+    imports_parser.set_defaults(handler=cmd_imports)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,119 @@
+"""
+Compares the implementations of days that ship more than one (e.g. `solution.py` and
+`solution_efficient.py`), to check they agree and see which one is faster.
+
+Every python module of a day's directory implementing the solution contract (see `aoc.solutions`)
+is a variant of the day, the day's solution module being the reference the others are checked
+against. Variants run on the same input, one at a time so they don't compete for CPU, each in a
+fresh process so that the peak RSS of one doesn't hide that of another.
+"""
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+import math
+from pathlib import Path
+from typing import Any, Optional
+
+from aoc.budgets import Budget, enforced, run_isolated
+from aoc.generators import GENERATOR_FILE_NAME
+from aoc.inputs import load_input
+from aoc.runner import PhaseResult, run_phases
+from aoc.solutions import PHASES, Day, load_module
+
+
+@dataclass
+class VariantResult:
+    path: Path
+
+    # Fastest run of every phase over the repeated runs, along with its answer.
+    phases: list[PhaseResult] = field(default_factory=list)
+
+    # The exception raised by the variant, if any.
+    error: Optional[BaseException] = None
+
+    @property
+    def answers(self) -> dict[str, Any]:
+        return {p.phase: p.answer for p in self.phases if p.phase != "parse"}
+
+    @property
+    def wall_time(self) -> float:
+        return sum(p.wall_time for p in self.phases)
+
+    @property
+    def peak_rss(self) -> int:
+        return max((p.peak_rss for p in self.phases), default=0)
+
+
+def variant_paths(day: Day) -> list[Path]:
+    """
+    Returns the modules of `day` implementing the solution contract, its solution module first.
+    """
+    primary = day.module_path
+    variants = []
+    for path in sorted(day.path.glob("*.py")):
+        if path == primary or path.name == GENERATOR_FILE_NAME or path.name.startswith("test_"):
+            continue
+
+        source = path.read_text()
+        if all(f"def {phase}(" in source for phase in PHASES):
+            variants.append(path)
+
+    return [primary] + variants
+
+
+def run_variant(day: Day, path: Path, input_path: Path, repeat: int, budget: Optional[Budget]) -> VariantResult:
+    """
+    Runs the variant of `day` at `path` `repeat` times on `input_path`, keeping the fastest run of
+    every phase.
+    """
+    module = load_module(path, f"aoc_{day.year}_{day.day:02d}_{path.stem.replace('-', '_')}")
+    puzzle_input = load_input(input_path)
+    fastest: dict[str, PhaseResult] = {}
+    try:
+        for _ in range(repeat):
+            with enforced(budget) if budget is not None else nullcontext():
+                phases = run_phases(module, puzzle_input)
+            for p in phases:
+                if p.wall_time < fastest.get(p.phase, PhaseResult(p.phase, math.inf, 0, 0)).wall_time:
+                    fastest[p.phase] = p
+    except Exception as e:
+        return VariantResult(path, error=e)
+
+    return VariantResult(path, [fastest[phase] for phase in PHASES])
+
+
+def compare_variants(
+    day: Day, input_path: Optional[Path] = None, repeat: int = 3, budget: Optional[Budget] = None
+) -> list[VariantResult]:
+    """
+    Runs every variant of `day` on its puzzle input (or on `input_path` if given), the solution
+    module first. With a `budget`, variants exceeding it fail with `aoc.budgets.BudgetExceeded`,
+    also when the kernel killed the process running them.
+    """
+    results = []
+    for path in variant_paths(day):
+        try:
+            result = run_isolated(run_variant, day, path, input_path or day.input_path, repeat, budget, budget=budget)
+        except Exception as e:
+            # The kernel killed the process running the variant.
+            result = VariantResult(path, error=e)
+        results.append(result)
+
+    return results
+
+
+def mismatches(results: list[VariantResult]) -> list[tuple[Path, str]]:
+    """
+    Returns the variants and parts whose answers differ from those of the first variant. Variants
+    that failed, or compared with a failed first variant, are left out.
+    """
+    if not results or results[0].error is not None:
+        return []
+
+    expected = results[0].answers
+    return [
+        (r.path, phase)
+        for r in results[1:]
+        if r.error is None
+        for phase, answer in r.answers.items()
+        if answer != expected[phase]
+    ]
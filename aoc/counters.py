@@ -0,0 +1,52 @@
+"""
+Counters of the work done by solutions (e.g. nodes expanded by a search or instructions executed
+by an interpreter), to explain why a phase got faster or slower beyond its wall time.
+
+Solutions add to named counters with `add`:
+    counters.add("instructions_executed", executed)
+Counting is disabled unless a run asks for counters (`run --counters`, benchmarks), in which case
+the counts are reported for every phase along with its timings. While disabled, `add` returns right
+away, but it is still a function call: hot loops should count in a local variable and add it once
+they're done rather than call `add` on every iteration.
+"""
+from collections import Counter
+from typing import Optional
+
+# Counts added since they were last collected, `None` while counting is disabled.
+_counts: Optional[Counter] = None
+
+
+def enable() -> None:
+    global _counts
+    _counts = Counter()
+
+
+def enabled() -> bool:
+    return _counts is not None
+
+
+def add(name: str, n: int = 1) -> None:
+    if _counts is not None:
+        _counts[name] += n
+
+
+def collect() -> dict[str, int]:
+    """
+    Returns the counts added so far and resets them, counting remaining enabled.
+    """
+    global _counts
+    if _counts is None:
+        return {}
+
+    counts, _counts = dict(_counts), Counter()
+    return counts
+
+
+def disable() -> dict[str, int]:
+    """
+    Stops counting, returning the counts added and not collected yet.
+    """
+    global _counts
+    counts = collect()
+    _counts = None
+    return counts
@@ -0,0 +1,181 @@
+"""
+A long-lived solver process that keeps everything warm between runs: the interpreter, imported
+libraries (e.g. `regex` or `sympy`), solution modules, inputs and parsed inputs. Running a day
+through it costs little more than the day's actual computation.
+
+Solution modules are reloaded when their source changes, and inputs re-read when the input file
+changes. Parsed inputs are kept in memory keyed by the source of the solution module and by the
+input, so a day is only parsed again when either of them changes. Changes to the shared `aoc`
+helpers (e.g. `aoc.grid`) are not picked up, the daemon needs to be restarted for them.
+
+Clients talk to the daemon over a Unix socket, one JSON request per connection, answered by one
+JSON response:
+  - `{"command": "run", "day": "2020/13", "input": null}` - Runs a day, optionally on another input
+    file, and responds with `{"result": ...}` (see `DayResult.to_json`) or `{"error": "..."}`.
+  - `{"command": "ping"}` - Responds with `{"pid": ...}`.
+  - `{"command": "stop"}` - Stops the daemon once it responded.
+"""
+from collections import OrderedDict
+import json
+import os
+from pathlib import Path
+import socket
+import socketserver
+import threading
+import traceback
+from types import ModuleType
+from typing import Any, Optional
+
+from aoc import memo
+from aoc.inputs import MAX_LOADED, PuzzleInput
+from aoc.runner import DayResult, PhaseResult, measure, peak_rss
+from aoc.solutions import CACHE_DIR, Day, load_solution, parse_input
+from aoc.storage import digest
+
+SOCKET_PATH = CACHE_DIR / "daemon.sock"
+
+
+class Solver:
+    """
+    Runs days, keeping solution modules, inputs and parsed inputs between runs.
+    """
+
+    def __init__(self) -> None:
+        # Day -> (source hash, module).
+        self._solutions: dict[Day, tuple[str, ModuleType]] = {}
+        # Path -> ((modification time, size), input), for the last `MAX_LOADED` inputs used.
+        self._inputs: "OrderedDict[Path, tuple[tuple[int, int], PuzzleInput]]" = OrderedDict()
+        # (Day, input path) -> (source hash, input hash, parsed input), for the last `MAX_LOADED` runs.
+        self._parsed: "OrderedDict[tuple[Day, Path], tuple[str, str, Any]]" = OrderedDict()
+
+    def solution(self, day: Day) -> tuple[str, ModuleType]:
+        source_hash = digest(day.module_path.read_bytes())
+        cached = self._solutions.get(day)
+        if cached is None or cached[0] != source_hash:
+            # Inputs parsed by the previous version of the solution can't be used anymore.
+            for key in [key for key in self._parsed if key[0] == day]:
+                del self._parsed[key]
+            cached = self._solutions[day] = (source_hash, load_solution(day))
+        return cached
+
+    def input(self, path: Path) -> PuzzleInput:
+        path = path.resolve()
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._inputs.get(path)
+        if cached is None or cached[0] != version:
+            cached = self._inputs[path] = (version, PuzzleInput(path))
+        self._inputs.move_to_end(path)
+        while len(self._inputs) > MAX_LOADED:
+            self._inputs.popitem(last=False)
+        return cached[1]
+
+    def run(self, day: Day, input_path: Optional[Path] = None) -> DayResult:
+        source_hash, solution = self.solution(day)
+        memo.start_run()
+        input_path = (input_path or day.input_path).resolve()
+        puzzle_input = self.input(input_path)
+        input_hash = digest(puzzle_input.data)
+
+        cached = self._parsed.get((day, input_path))
+        if cached is not None and cached[:2] == (source_hash, input_hash):
+            parsed = cached[2]
+            phases = [PhaseResult("parse", 0.0, 0.0, peak_rss(), cached=True)]
+        else:
+            parse_result, parsed = measure("parse", parse_input, solution, puzzle_input)
+            self._parsed[(day, input_path)] = (source_hash, input_hash, parsed)
+            phases = [parse_result]
+        self._parsed.move_to_end((day, input_path))
+        while len(self._parsed) > MAX_LOADED:
+            self._parsed.popitem(last=False)
+
+        for phase in ("part1", "part2"):
+            phase_result, answer = measure(phase, getattr(solution, phase), parsed)
+            phase_result.answer = answer
+            phases.append(phase_result)
+
+        memo.flush()
+        return DayResult(day, phases)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "SolverServer"
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            response = self.server.respond(request)
+        except Exception:
+            response = {"error": traceback.format_exc()}
+
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    """
+    Serves requests one at a time, so days never run concurrently within the daemon.
+    """
+
+    def __init__(self, socket_path: Path = SOCKET_PATH):
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if socket_path.exists():
+            if ping(socket_path) is not None:
+                raise RuntimeError(f"A daemon is already listening on {socket_path}")
+            socket_path.unlink()
+
+        super().__init__(str(socket_path), _Handler)
+        self.socket_path = socket_path
+        self.solver = Solver()
+
+    def respond(self, request: dict[str, Any]) -> dict[str, Any]:
+        command = request.get("command")
+        if command == "run":
+            input_path = Path(request["input"]) if request.get("input") else None
+            return {"result": self.solver.run(Day.from_str(request["day"]), input_path).to_json()}
+        elif command == "ping":
+            return {"pid": os.getpid()}
+        elif command == "stop":
+            # `shutdown()` waits for `serve_forever()` to return, which it can't do while this
+            # request is being handled.
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"stopped": True}
+
+        raise ValueError(f"Unknown command: {command}")
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def serve(socket_path: Path = SOCKET_PATH) -> None:
+    with SolverServer(socket_path) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def request(message: dict[str, Any], socket_path: Path = SOCKET_PATH) -> dict[str, Any]:
+    """
+    Sends a request to the daemon and returns its response. Raises `ConnectionError` if no daemon
+    is listening on `socket_path`.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise ConnectionError(f"No daemon is listening on {socket_path}") from e
+
+        s.sendall(json.dumps(message).encode() + b"\n")
+        with s.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def ping(socket_path: Path = SOCKET_PATH) -> Optional[int]:
+    """
+    Returns the process ID of the daemon listening on `socket_path`, `None` if there is none.
+    """
+    try:
+        return request({"command": "ping"}, socket_path)["pid"]
+    except ConnectionError:
+        return None
@@ -0,0 +1,267 @@
+"""
+Runs jobs (a day and an input) on workers spread over many machines, through a coordinator that
+hands them out over plain TCP.
+
+The coordinator listens for workers and keeps the queue of jobs. Workers connect to it, and then
+exchange newline-delimited JSON messages with it over their connection:
+  - The worker asks for a job with `{"type": "ready"}`, and the coordinator answers with
+    `{"type": "job", "id": 3, "day": "2020/07", "name": "input.txt", "input": "..."}`, or with
+    `{"type": "done"}` once every job completed, upon which the worker leaves. While all the
+    remaining jobs are being run by other workers, the coordinator holds its answer until one of
+    them completes or is handed back.
+  - Once it ran the job, the worker reports it with `{"type": "result", "id": 3, "result": {...}}`
+    (see `aoc.runner.DayResult.to_json`) or `{"type": "error", "id": 3, "error": "..."}`, which
+    asks for the next job too.
+
+Jobs carry the input itself, so workers only need a checkout of the repository, not the inputs.
+Workers may join at any time. A worker that leaves (or dies) in the middle of a job has its job
+handed to another worker, up to `MAX_ATTEMPTS` times.
+"""
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import queue
+import socket
+import socketserver
+import threading
+import time
+import traceback
+from types import ModuleType
+from typing import Any, Iterable, Iterator, Optional
+
+from aoc.batch import input_paths
+from aoc.budgets import Budget, budget_for, enforced, run_isolated
+from aoc.inputs import PuzzleInput, load_input
+from aoc.runner import DayResult, run_phases
+from aoc.solutions import Day, load_solution
+
+DEFAULT_PORT = 8642
+
+# Times a job is handed out before being failed, as workers running it keep leaving.
+MAX_ATTEMPTS = 3
+
+
+@dataclass
+class Job:
+    id: int
+    day: Day
+
+    # Name of the input, for reports.
+    name: str
+    text: str
+
+
+@dataclass
+class JobResult:
+    job: Job
+    result: Optional[DayResult] = None
+    error: Optional[str] = None
+
+    # Address of the worker that ran the job.
+    worker: str = ""
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    """
+    Parses a `HOST:PORT` address, the port defaulting to `DEFAULT_PORT`. An empty host listens on
+    all interfaces.
+    """
+    host, _, port = address.rpartition(":") if ":" in address else (address, "", "")
+    return host, int(port) if port else DEFAULT_PORT
+
+
+def make_jobs(days: list[Day], inputs_dir: Optional[Path] = None) -> list[Job]:
+    """
+    Returns a job for every day of `days` on its puzzle input, or, given `inputs_dir`, for every
+    day on every input of the directory.
+    """
+    jobs: list[Job] = []
+    for day in days:
+        for path in input_paths(inputs_dir) if inputs_dir is not None else [day.input_path]:
+            jobs.append(Job(len(jobs), day, path.name, load_input(path).text))
+
+    return jobs
+
+
+def _send(f, message: dict[str, Any]) -> None:
+    f.write(json.dumps(message).encode() + b"\n")
+    f.flush()
+
+
+class _WorkerHandler(socketserver.StreamRequestHandler):
+    server: "Coordinator"
+
+    def handle(self) -> None:
+        worker = "{}:{}".format(*self.client_address[:2])
+        job: Optional[Job] = None
+        try:
+            for line in self.rfile:
+                message = json.loads(line)
+                if job is not None and message.get("id") == job.id:
+                    if message["type"] == "result":
+                        self.server.complete(JobResult(job, DayResult.from_json(message["result"]), worker=worker))
+                    else:
+                        self.server.complete(JobResult(job, error=message["error"], worker=worker))
+                    job = None
+
+                job = self.server.take()
+                if job is None:
+                    _send(self.wfile, {"type": "done"})
+                    return
+                message = {"type": "job", "id": job.id, "day": str(job.day), "name": job.name, "input": job.text}
+                _send(self.wfile, message)
+        except (OSError, ValueError):
+            # The worker left, or sent something that isn't a message.
+            pass
+        finally:
+            if job is not None:
+                self.server.hand_back(job, worker)
+
+
+class Coordinator(socketserver.ThreadingTCPServer):
+    """
+    Hands `jobs` out to the workers connecting to `address`, once started, until all of them
+    completed. Results are read with `results()`.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, jobs: Iterable[Job], address: tuple[str, int] = ("", DEFAULT_PORT)):
+        super().__init__(address, _WorkerHandler)
+        self._pending = deque(jobs)
+        self._remaining = len(self._pending)
+        self._attempts: dict[int, int] = {}
+        self._in_flight: set[int] = set()
+        self._condition = threading.Condition()
+        self._results: queue.Queue[JobResult] = queue.Queue()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def take(self) -> Optional[Job]:
+        """
+        Returns the next job to run, waiting while all remaining jobs are running, or `None` once
+        every job completed.
+        """
+        with self._condition:
+            while not self._pending and self._in_flight:
+                self._condition.wait()
+            if not self._pending:
+                return None
+
+            job = self._pending.popleft()
+            self._in_flight.add(job.id)
+            self._attempts[job.id] = self._attempts.get(job.id, 0) + 1
+            return job
+
+    def complete(self, result: JobResult) -> None:
+        with self._condition:
+            self._in_flight.discard(result.job.id)
+            self._remaining -= 1
+            self._results.put(result)
+            self._condition.notify_all()
+
+    def hand_back(self, job: Job, worker: str) -> None:
+        """
+        Puts a job whose worker left back in the queue, or fails it once it was attempted
+        `MAX_ATTEMPTS` times.
+        """
+        if self._attempts[job.id] >= MAX_ATTEMPTS:
+            self.complete(JobResult(job, error=f"Workers left while running it {MAX_ATTEMPTS} times", worker=worker))
+            return
+
+        with self._condition:
+            self._in_flight.discard(job.id)
+            self._pending.appendleft(job)
+            self._condition.notify_all()
+
+    def start(self) -> None:
+        """
+        Starts serving workers in the background.
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def results(self) -> Iterator[JobResult]:
+        """
+        Yields the result of every job as soon as it completes, until all of them did, and then stops
+        serving workers.
+        """
+        try:
+            while True:
+                with self._condition:
+                    if self._remaining == 0 and self._results.empty():
+                        return
+                yield self._results.get()
+        finally:
+            self.shutdown()
+            self._thread.join()
+
+
+def _connect(address: tuple[str, int], timeout: float) -> socket.socket:
+    """
+    Connects to the coordinator, retrying until `timeout` seconds passed so that workers may be
+    started before it.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return socket.create_connection(address)
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.2)
+
+
+# The solution modules loaded by a worker, or by the process running one of its jobs.
+_solutions: dict[Day, ModuleType] = {}
+
+
+def _solution(day: Day) -> ModuleType:
+    if day not in _solutions:
+        _solutions[day] = load_solution(day)
+    return _solutions[day]
+
+
+def _run_job(day: Day, text: str, budget: Optional[Budget]) -> DayResult:
+    with enforced(budget) if budget is not None else nullcontext():
+        return DayResult(day, run_phases(_solution(day), PuzzleInput.from_bytes(text.encode())))
+
+
+def run_worker(
+    address: tuple[str, int], budgets: Optional[dict[str, Budget]] = None, connect_timeout: float = 10
+) -> int:
+    """
+    Runs the jobs handed out by the coordinator at `address` until it has no more of them, enforcing
+    the `budgets` of days if given. Returns the number of jobs run.
+
+    With budgets, every job runs in a process of its own (see `aoc.budgets.run_isolated`), so that
+    the worker outlives a job the kernel kills for exceeding its budget and reports it as failed.
+    """
+    jobs_run = 0
+    with _connect(address, connect_timeout) as s, s.makefile("rwb") as f:
+        _send(f, {"type": "ready"})
+        for line in f:
+            message = json.loads(line)
+            if message["type"] == "done":
+                break
+
+            day = Day.from_str(message["day"])
+            try:
+                # Fails the job right away if the solution can't be loaded.
+                _solution(day)
+                if budgets is None:
+                    result = _run_job(day, message["input"], None)
+                else:
+                    budget = budget_for(day, budgets)
+                    result = run_isolated(_run_job, day, message["input"], budget, budget=budget)
+                _send(f, {"type": "result", "id": message["id"], "result": result.to_json()})
+            except Exception:
+                _send(f, {"type": "error", "id": message["id"], "error": traceback.format_exc()})
+            jobs_run += 1
+
+    return jobs_run
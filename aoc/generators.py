@@ -0,0 +1,101 @@
+"""
+Seeded generators of synthetic puzzle inputs, for stressing solutions on inputs much larger than
+the real ones.
+
+A day provides a generator by adding a `generator.py` module next to its solution that exposes:
+  - `generate(rng, scale)` - Returns the text of a valid puzzle input, drawing all of its randomness
+    from the `random.Random` instance `rng`. At a `scale` of 1 the input is about as large as a
+    real one, larger scales grow it proportionally (e.g. 100 times more lines, or a grid of 100
+    times the area).
+
+Generated inputs are deterministic for a given day, scale and seed, and are stored in
+`.aoc/generated/` (keyed by the generator's source as well) so that runs at large scales don't
+generate them again.
+"""
+import math
+from pathlib import Path
+import random
+from types import ModuleType
+
+from aoc.solutions import CACHE_DIR, Day, load_module
+from aoc.storage import digest, write_atomically
+
+GENERATOR_FILE_NAME = "generator.py"
+GENERATED_DIR = CACHE_DIR / "generated"
+
+
+def scaled(count: int, scale: float) -> int:
+    """
+    Returns `count` (e.g. the number of lines of a real input) grown by `scale`, at least 1.
+    """
+    return max(1, round(count * scale))
+
+
+def scaled_side(side: int, scale: float) -> int:
+    """
+    Returns the side of a square (e.g. of a grid) whose area is `scale` times that of a square of
+    the given `side`, at least 1.
+    """
+    return max(1, round(side * math.sqrt(scale)))
+
+
+def primes(count: int, minimum: int) -> list[int]:
+    """
+    Returns the first `count` primes not smaller than `minimum`.
+    """
+    limit = max(100, 2 * (minimum + count * 20))
+    while True:
+        sieve = bytearray([1]) * limit
+        sieve[:2] = b"\0\0"
+        for i in range(2, int(limit**0.5) + 1):
+            if sieve[i]:
+                sieve[i * i :: i] = bytearray(len(sieve[i * i :: i]))
+        found = [p for p in range(minimum, limit) if sieve[p]]
+        if len(found) >= count:
+            return found[:count]
+        limit *= 2
+
+
+def generator_path(day: Day) -> Path:
+    return day.path / GENERATOR_FILE_NAME
+
+
+def has_generator(day: Day) -> bool:
+    return generator_path(day).exists()
+
+
+def load_generator(day: Day) -> ModuleType:
+    path = generator_path(day)
+    if not path.exists():
+        raise LookupError(f"No input generator found for {day}")
+
+    module = load_module(path, f"aoc_{day.year}_{day.day:02d}_generator")
+    if not callable(getattr(module, "generate", None)):
+        raise AttributeError(f"Input generator of {day} is missing: generate")
+
+    return module
+
+
+def generate_input(day: Day, scale: float = 1, seed: int = 0) -> str:
+    """
+    Returns a synthetic input of `day` at the given `scale`.
+    """
+    if scale <= 0:
+        raise ValueError(f"Scale must be positive, got {scale}")
+
+    return load_generator(day).generate(random.Random(f"{day}/{seed}"), scale)
+
+
+def generated_input_path(day: Day, scale: float = 1, seed: int = 0, generated_dir: Path = GENERATED_DIR) -> Path:
+    """
+    Returns the path of a synthetic input of `day` at the given `scale`, generating it first unless
+    the same generator already generated it.
+    """
+    source_hash = digest(generator_path(day).read_bytes())[:12]
+    path = generated_dir / str(day.year) / f"{day.day:02d}" / f"x{scale:g}-seed{seed}-{source_hash}.txt"
+    if not path.exists():
+        text = generate_input(day, scale, seed)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomically(path, text)
+
+    return path
@@ -0,0 +1,290 @@
+"""
+Graph searches shared by the days whose puzzles are graph problems.
+
+Graphs are directed, their nodes are the integers `0..n-1` (see `NodeIndex` for mapping labels to
+them) and their edges are kept in compressed sparse row (CSR) form: the edges leaving node `v` are
+`targets[offsets[v]:offsets[v + 1]]`, with the matching `weights`. The arrays are plain lists as
+the searches access them element by element, which is faster on lists than on NumPy arrays.
+
+All searches optionally fill a `SearchStats` with the number of nodes they expanded and the peak
+size of their frontier.
+"""
+from dataclasses import dataclass
+import heapq
+import math
+from collections import deque
+from typing import Callable, Generic, Hashable, Iterable, Optional, Sequence, TypeVar
+
+import numpy as np
+
+Label = TypeVar("Label", bound=Hashable)
+
+
+@dataclass
+class SearchStats:
+    nodes_expanded: int = 0
+    frontier_peak: int = 0
+
+
+class NodeIndex(Generic[Label]):
+    """
+    Assigns consecutive node numbers to labels (e.g. valve names) in order of first appearance.
+    """
+
+    def __init__(self, labels: Iterable[Label] = ()):
+        self.labels: list[Label] = []
+        self._nodes: dict[Label, int] = {}
+        for label in labels:
+            self[label]
+
+    def __getitem__(self, label: Label) -> int:
+        node = self._nodes.get(label)
+        if node is None:
+            node = self._nodes[label] = len(self.labels)
+            self.labels.append(label)
+        return node
+
+    def __contains__(self, label: Label) -> bool:
+        return label in self._nodes
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+
+class Digraph:
+    def __init__(self, offsets: list[int], targets: list[int], weights: Optional[list[float]] = None):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights if weights is not None else [1] * len(targets)
+
+        # Built by `neighbour_set()` on demand.
+        self._neighbour_sets: dict[int, set[int]] = {}
+
+    @classmethod
+    def from_arrays(
+        cls, num_nodes: int, sources: np.ndarray, targets: np.ndarray, weights: Optional[np.ndarray] = None
+    ) -> "Digraph":
+        """
+        Builds a graph with `num_nodes` nodes and an edge from `sources[i]` to `targets[i]` (weighing
+        `weights[i]`) for every `i`.
+        """
+        order = np.argsort(sources, kind="stable")
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_nodes), out=offsets[1:])
+        return cls(
+            offsets.tolist(),
+            np.asarray(targets)[order].tolist(),
+            np.asarray(weights)[order].tolist() if weights is not None else None,
+        )
+
+    @classmethod
+    def from_edges(cls, num_nodes: int, edges: Iterable[Sequence[float]]) -> "Digraph":
+        """
+        Builds a graph from `(source, target)` or `(source, target, weight)` edges.
+        """
+        edges = list(edges)
+        weighted = len(edges) > 0 and len(edges[0]) == 3
+        edges_array = np.array(edges).reshape(-1, 3 if weighted else 2)
+        return cls.from_arrays(
+            num_nodes,
+            edges_array[:, 0].astype(np.int64),
+            edges_array[:, 1].astype(np.int64),
+            edges_array[:, 2] if weighted else None,
+        )
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def neighbours(self, node: int) -> list[int]:
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def edges(self, node: int) -> Iterable[tuple[int, float]]:
+        start, end = self.offsets[node], self.offsets[node + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def neighbour_set(self, node: int) -> set[int]:
+        neighbour_set = self._neighbour_sets.get(node)
+        if neighbour_set is None:
+            neighbour_set = self._neighbour_sets[node] = set(self.neighbours(node))
+        return neighbour_set
+
+    def has_edge(self, source: int, target: int) -> bool:
+        return target in self.neighbour_set(source)
+
+    def reversed(self) -> "Digraph":
+        sources = np.repeat(np.arange(len(self)), np.diff(self.offsets))
+        return Digraph.from_arrays(len(self), np.array(self.targets, dtype=np.int64), sources, np.array(self.weights))
+
+
+def bfs(
+    graph: Digraph, sources: Iterable[int], target: Optional[int] = None, stats: Optional[SearchStats] = None
+) -> list[int]:
+    """
+    Returns the number of edges on the shortest path from any of the `sources` to every node, -1 for
+    unreachable nodes. With a `target`, the search stops as soon as the target's distance is known
+    (nodes that weren't reached by then are left at -1).
+    """
+    offsets, targets = graph.offsets, graph.targets
+    distances = [-1] * len(graph)
+    queue: deque[int] = deque()
+    for s in sources:
+        distances[s] = 0
+        queue.append(s)
+
+    expanded, frontier_peak = 0, len(queue)
+    while queue:
+        node = queue.popleft()
+        if node == target:
+            break
+
+        expanded += 1
+        next_distance = distances[node] + 1
+        for n in targets[offsets[node] : offsets[node + 1]]:
+            if distances[n] < 0:
+                distances[n] = next_distance
+                queue.append(n)
+        frontier_peak = max(frontier_peak, len(queue))
+
+    if stats is not None:
+        stats.nodes_expanded, stats.frontier_peak = expanded, frontier_peak
+    return distances
+
+
+def reachable(graph: Digraph, sources: Iterable[int], stats: Optional[SearchStats] = None) -> list[int]:
+    """
+    Returns all nodes reachable from `sources` (including them).
+    """
+    return [n for n, d in enumerate(bfs(graph, sources, stats=stats)) if d >= 0]
+
+
+def dijkstra(
+    graph: Digraph, sources: Iterable[int], target: Optional[int] = None, stats: Optional[SearchStats] = None
+) -> list[float]:
+    """
+    Returns the weight of the lightest path from any of the `sources` to every node, `math.inf` for
+    unreachable nodes. Edge weights must not be negative. With a `target`, the search stops as soon
+    as the target's distance is known.
+    """
+    distances = [math.inf] * len(graph)
+    heap: list[tuple[float, int]] = []
+    for s in sources:
+        distances[s] = 0
+        heap.append((0, s))
+    heapq.heapify(heap)
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    expanded, frontier_peak = 0, len(heap)
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if distance > distances[node]:
+            # A stale entry of a node that was already reached through a lighter path.
+            continue
+        if node == target:
+            break
+
+        expanded += 1
+        for i in range(offsets[node], offsets[node + 1]):
+            n, n_distance = targets[i], distance + weights[i]
+            if n_distance < distances[n]:
+                distances[n] = n_distance
+                heapq.heappush(heap, (n_distance, n))
+        frontier_peak = max(frontier_peak, len(heap))
+
+    if stats is not None:
+        stats.nodes_expanded, stats.frontier_peak = expanded, frontier_peak
+    return distances
+
+
+def astar(
+    graph: Digraph,
+    source: int,
+    target: int,
+    heuristic: Callable[[int], float],
+    stats: Optional[SearchStats] = None,
+) -> float:
+    """
+    Returns the weight of the lightest path from `source` to `target`, `math.inf` if there is none.
+    `heuristic(node)` estimates the weight of the lightest path from `node` to `target` and must
+    never overestimate it.
+    """
+    distances: dict[int, float] = {source: 0}
+    heap: list[tuple[float, float, int]] = [(heuristic(source), 0, source)]
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    expanded, frontier_peak = 0, 1
+    result = math.inf
+    while heap:
+        _, distance, node = heapq.heappop(heap)
+        if distance > distances[node]:
+            continue
+        if node == target:
+            result = distance
+            break
+
+        expanded += 1
+        for i in range(offsets[node], offsets[node + 1]):
+            n, n_distance = targets[i], distance + weights[i]
+            if n_distance < distances.get(n, math.inf):
+                distances[n] = n_distance
+                heapq.heappush(heap, (n_distance + heuristic(n), n_distance, n))
+        frontier_peak = max(frontier_peak, len(heap))
+
+    if stats is not None:
+        stats.nodes_expanded, stats.frontier_peak = expanded, frontier_peak
+    return result
+
+
+def floyd_warshall(graph: Digraph) -> np.ndarray:
+    """
+    Returns an `(n, n)` array of the weights of the lightest paths between all pairs of nodes,
+    `inf` for pairs with no path between them.
+    """
+    n = len(graph)
+    distances = np.full((n, n), np.inf)
+    sources = np.repeat(np.arange(n), np.diff(graph.offsets))
+    np.minimum.at(distances, (sources, np.array(graph.targets, dtype=np.int64)), np.array(graph.weights, dtype=float))
+    np.fill_diagonal(distances, 0)
+    for k in range(n):
+        np.minimum(distances, distances[:, k, np.newaxis] + distances[np.newaxis, k, :], out=distances)
+
+    return distances
+
+
+def topological_sort(graph: Digraph, nodes: Optional[Iterable[int]] = None) -> list[int]:
+    """
+    Returns the nodes of the graph ordered such that every edge goes from an earlier node to a later
+    one. With `nodes`, only they (and the edges between them) are sorted.
+
+    Raises `ValueError` if the graph has a cycle.
+    """
+    included = set(range(len(graph)) if nodes is None else nodes)
+    successors = {node: graph.neighbour_set(node) & included for node in included}
+
+    # Fast path for (nearly) totally ordered nodes, e.g. when every pair of nodes has an edge between
+    # them: ordering by the number of successors is then already topological, which is cheap to
+    # verify with set operations. Self-loops are left to Kahn's algorithm to report.
+    order = sorted(included, key=lambda n: len(successors[n]), reverse=True)
+    placed: set[int] = set()
+    for node in order:
+        if node in successors[node] or not successors[node].isdisjoint(placed):
+            break
+        placed.add(node)
+    else:
+        return order
+
+    # Kahn's algorithm.
+    in_degrees = dict.fromkeys(included, 0)
+    for node_successors in successors.values():
+        for n in node_successors:
+            in_degrees[n] += 1
+
+    order = [n for n, in_degree in in_degrees.items() if in_degree == 0]
+    for node in order:
+        for n in successors[node]:
+            in_degrees[n] -= 1
+            if in_degrees[n] == 0:
+                order.append(n)
+
+    if len(order) != len(included):
+        raise ValueError("Graph has a cycle")
+
+    return order
@@ -0,0 +1,179 @@
+"""
+A character map backed by a NumPy `uint8` array, shared by the days whose input is a grid.
+
+The cells are surrounded by `pad` rows and columns of a `fill` value, so looking at the neighbours
+of any cell (up to `pad` steps away) never leaves the array. Bounds checks become either a check
+for the fill value or nothing at all when the fill value can never match what is looked for.
+
+Besides `(row, col)` positions of the unpadded grid, cells can be addressed by their index in the
+flattened padded array (`flat`). Moving by an offset is then a single addition of its flat delta
+(see `flat_offsets`) which makes for fast scalar loops over a `flat.tolist()` copy.
+"""
+from typing import Iterable, Union
+
+import numpy as np
+
+Position = tuple[int, int]
+Offset = tuple[int, int]
+Value = Union[str, int]
+
+# Clockwise, starting at north.
+ORTHOGONAL_OFFSETS: tuple[Offset, ...] = ((-1, 0), (0, 1), (1, 0), (0, -1))
+ADJACENT_OFFSETS: tuple[Offset, ...] = ((-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1))
+
+
+def to_byte(value: Value) -> int:
+    return ord(value) if isinstance(value, str) else value
+
+
+def to_bytes(values: Union[str, Iterable[Value]]) -> list[int]:
+    return [to_byte(v) for v in values]
+
+
+class Grid:
+    def __init__(self, cells: np.ndarray, pad: int = 1, fill: Value = 0):
+        """
+        Creates a grid holding a copy of the 2D array `cells`, padded with `pad` cells of `fill`
+        on every side.
+        """
+        if cells.ndim != 2:
+            raise ValueError(f"Grid cells must be a 2D array, got shape {cells.shape}")
+
+        self.height, self.width = cells.shape
+        self.pad = pad
+        self.fill = to_byte(fill)
+        self.padded = np.full((self.height + 2 * pad, self.width + 2 * pad), self.fill, dtype=np.uint8)
+        self.cells[:] = cells
+
+    @classmethod
+    def from_text(cls, text: str, pad: int = 1, fill: Value = 0) -> "Grid":
+        lines = text.splitlines()
+        if any(len(l) != len(lines[0]) for l in lines):
+            raise ValueError("Grid rows must all be of the same length")
+
+        cells = np.frombuffer("".join(lines).encode(), dtype=np.uint8).reshape(len(lines), len(lines[0]))
+        return cls(cells, pad, fill)
+
+    @classmethod
+    def full(cls, shape: tuple[int, int], value: Value, pad: int = 1, fill: Value = 0) -> "Grid":
+        return cls(np.full(shape, to_byte(value), dtype=np.uint8), pad, fill)
+
+    def copy(self) -> "Grid":
+        return Grid(self.cells, self.pad, self.fill)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.height, self.width
+
+    @property
+    def cells(self) -> np.ndarray:
+        """
+        A (writable) view of the grid without its padding.
+        """
+        p = self.pad
+        return self.padded[p : p + self.height, p : p + self.width]
+
+    @property
+    def flat(self) -> np.ndarray:
+        """
+        A (writable) view of the padded grid as a 1D array, indexed by `index()`.
+        """
+        return self.padded.reshape(-1)
+
+    @property
+    def stride(self) -> int:
+        return self.width + 2 * self.pad
+
+    def __getitem__(self, pos: Position) -> str:
+        return chr(self.cells[pos])
+
+    def __setitem__(self, pos: Position, value: Value) -> None:
+        self.cells[pos] = to_byte(value)
+
+    def in_bounds(self, pos: Position) -> bool:
+        return 0 <= pos[0] < self.height and 0 <= pos[1] < self.width
+
+    def index(self, pos: Position) -> int:
+        return (pos[0] + self.pad) * self.stride + pos[1] + self.pad
+
+    def position(self, index: int) -> Position:
+        r, c = divmod(index, self.stride)
+        return r - self.pad, c - self.pad
+
+    def flat_offsets(self, offsets: Iterable[Offset]) -> list[int]:
+        return [dr * self.stride + dc for dr, dc in offsets]
+
+    def mask(self, values: Union[str, Iterable[Value]]) -> np.ndarray:
+        """
+        Returns a boolean array, shaped as the grid, marking the cells holding any of `values`.
+        """
+        return np.isin(self.cells, to_bytes(values))
+
+    def find(self, values: Union[str, Iterable[Value]]) -> list[Position]:
+        """
+        Returns the positions of all cells holding any of `values`, in row-major order.
+        """
+        return [(int(r), int(c)) for r, c in zip(*np.nonzero(self.mask(values)))]
+
+    def indexes(self, values: Union[str, Iterable[Value]]) -> np.ndarray:
+        """
+        Same as `find` but returns flat indexes.
+        """
+        rows, cols = np.nonzero(self.mask(values))
+        return (rows + self.pad) * self.stride + cols + self.pad
+
+    def count(self, values: Union[str, Iterable[Value]]) -> int:
+        return int(self.mask(values).sum())
+
+    def shifted(self, offset: Offset) -> np.ndarray:
+        """
+        Returns a view, shaped as the grid, where every cell holds the value of its neighbour at
+        `offset`. Neighbours outside the grid hold the fill value.
+        """
+        dr, dc = offset
+        if max(abs(dr), abs(dc)) > self.pad:
+            raise ValueError(f"Offset {offset} reaches beyond the grid padding ({self.pad})")
+
+        r, c = self.pad + dr, self.pad + dc
+        return self.padded[r : r + self.height, c : c + self.width]
+
+    def neighbour_count(
+        self, values: Union[str, Iterable[Value]], offsets: Iterable[Offset] = ADJACENT_OFFSETS
+    ) -> np.ndarray:
+        """
+        Returns, for every cell, how many of its neighbours at `offsets` hold any of `values`.
+        """
+        values = to_bytes(values)
+        counts = np.zeros(self.shape, dtype=np.uint8)
+        for o in offsets:
+            counts += np.isin(self.shifted(o), values)
+        return counts
+
+    def neighbour_table(self, indexes: np.ndarray, offsets: Iterable[Offset] = ADJACENT_OFFSETS) -> np.ndarray:
+        """
+        Returns a `(len(indexes), len(offsets))` array of the flat indexes of the neighbours at
+        `offsets` of the cells at the flat `indexes`.
+        """
+        return np.asarray(indexes)[:, np.newaxis] + np.array(self.flat_offsets(offsets))
+
+    def sight_table(
+        self, indexes: np.ndarray, values: Union[str, Iterable[Value]], offsets: Iterable[Offset] = ADJACENT_OFFSETS
+    ) -> np.ndarray:
+        """
+        Like `neighbour_table` but looks along each offset for the first cell holding any of
+        `values`. Lines of sight that leave the grid end at the padding cell just past its edge, so
+        the grid cells must not hold the fill value.
+        """
+        values = to_bytes(values)
+        table = self.neighbour_table(indexes, offsets)
+        deltas = np.array(self.flat_offsets(offsets))
+        while True:
+            cur = self.flat[table]
+            searching = ~np.isin(cur, values) & (cur != self.fill)
+            if not searching.any():
+                return table
+
+            table = np.where(searching, table + deltas, table)
+
+    def to_text(self) -> str:
+        return "\n".join(row.tobytes().decode() for row in self.cells)
@@ -0,0 +1,101 @@
+"""
+Import time audit of solutions: which modules a day imports, and when.
+
+A day is run in a fresh interpreter started with `-X importtime`, which reports the time spent
+importing every module on stderr. Markers written to stderr between the steps of the run split the
+imports into the ones made while loading the solution module (`import`) and the ones made while
+running each phase, e.g. by modules imported with `aoc.lazy.lazy_import`. The runner's own imports,
+made before loading the solution, are left out.
+
+Times are the `self` times reported by `-X importtime` (excluding nested imports), summed per
+top-level package (e.g. every `sympy.*` module counts as `sympy`).
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+import subprocess
+import sys
+from typing import Iterable, Optional
+
+from aoc.solutions import PHASES, REPO_ROOT, Day
+
+MARKER = "aoc-importtime-step:"
+
+# Run in the child interpreter, with the year, day and input path as arguments.
+_CHILD_SCRIPT = f"""
+import sys
+from pathlib import Path
+from aoc.solutions import Day, load_solution, parse_input
+from aoc.inputs import load_input
+
+day = Day(int(sys.argv[1]), int(sys.argv[2]))
+puzzle_input = load_input(Path(sys.argv[3]) if sys.argv[3] else day.input_path)
+
+print("{MARKER}import", file=sys.stderr, flush=True)
+solution = load_solution(day)
+print("{MARKER}parse", file=sys.stderr, flush=True)
+parsed = parse_input(solution, puzzle_input)
+for phase in ("part1", "part2"):
+    print("{MARKER}" + phase, file=sys.stderr, flush=True)
+    getattr(solution, phase)(parsed)
+"""
+
+STEPS = ("import",) + PHASES
+
+
+@dataclass
+class StepImports:
+    step: str
+
+    # Seconds spent importing the modules of every top-level package, slowest first.
+    packages: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total(self) -> float:
+        return sum(self.packages.values())
+
+
+def parse_importtime(lines: Iterable[str]) -> dict[str, StepImports]:
+    """
+    Parses `-X importtime` output split by step markers, returning the imports of every step.
+    Imports reported before the first marker are left out.
+    """
+    steps: dict[str, StepImports] = {}
+    current: Optional[StepImports] = None
+    for line in lines:
+        if line.startswith(MARKER):
+            step = line[len(MARKER) :].strip()
+            current = steps[step] = StepImports(step)
+            continue
+
+        if current is None or not line.startswith("import time:"):
+            continue
+
+        self_time, _, name = line[len("import time:") :].split("|")
+        if not self_time.strip().isdigit():
+            # The header line.
+            continue
+
+        package = name.strip().split(".")[0]
+        current.packages[package] = current.packages.get(package, 0) + int(self_time) / 1e6
+
+    for imports in steps.values():
+        imports.packages = dict(sorted(imports.packages.items(), key=lambda item: item[1], reverse=True))
+    return steps
+
+
+def measure_imports(day: Day, input_path: Optional[Path] = None) -> list[StepImports]:
+    """
+    Runs `day` in a fresh interpreter and returns the imports made by each step of the run. Raises
+    `RuntimeError` if the run fails.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD_SCRIPT, str(day.year), str(day.day), str(input_path or "")],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"{day} failed:\n{process.stderr.splitlines()[-1] if process.stderr else ''}")
+
+    steps = parse_importtime(process.stderr.splitlines())
+    return [steps.get(step, StepImports(step)) for step in STEPS]
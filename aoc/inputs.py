@@ -0,0 +1,103 @@
+"""
+Loading of puzzle inputs.
+
+Inputs are memory-mapped once per process and shared by everything that needs them (the runner,
+the benchmarks, the parsed inputs cache), so repeated runs of a day neither re-read the file nor
+decode it again. The raw bytes are exposed as zero-copy `memoryview`s, with iterators over their
+lines and blank-line separated blocks, for solutions that parse the bytes rather than a decoded
+`str` (see `aoc.solutions.parse_input`).
+
+A process keeps the last `MAX_LOADED` inputs it loaded, so that long-lived processes (the daemon,
+batch and distributed workers) going over many inputs don't keep all of them mapped.
+"""
+from collections import OrderedDict
+import mmap
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+MAX_LOADED = 16
+
+
+class PuzzleInput:
+    def __init__(self, path: Path):
+        self.path: Optional[Path] = path
+        with open(path, "rb") as f:
+            try:
+                self._buffer: Union[mmap.mmap, bytes] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can't be mapped.
+                self._buffer = b""
+        self._text: Optional[str] = None
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PuzzleInput":
+        """
+        Returns an input that isn't stored in a file, e.g. one received by a distributed worker.
+        """
+        puzzle_input = cls.__new__(cls)
+        puzzle_input.path, puzzle_input._buffer, puzzle_input._text = None, data, None
+        return puzzle_input
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def data(self) -> memoryview:
+        return memoryview(self._buffer)
+
+    @property
+    def text(self) -> str:
+        """
+        The input decoded as UTF-8. Decoded on first access only.
+        """
+        if self._text is None:
+            self._text = str(self.data, "utf-8")
+        return self._text
+
+    def lines(self) -> Iterator[memoryview]:
+        """
+        Yields a view of every line of the input, without its line terminator.
+        """
+        buffer, data, size, start = self._buffer, self.data, len(self._buffer), 0
+        while start < size:
+            end = buffer.find(b"\n", start)
+            if end == -1:
+                end = size
+            yield data[start : end - 1 if end > start and buffer[end - 1] == ord("\r") else end]
+            start = end + 1
+
+    def blocks(self) -> Iterator[list[memoryview]]:
+        """
+        Yields the lines of every block of the input, blocks being separated by blank lines.
+        """
+        block: list[memoryview] = []
+        for line in self.lines():
+            if len(line):
+                block.append(line)
+            elif block:
+                yield block
+                block = []
+
+        if block:
+            yield block
+
+
+_loaded: "OrderedDict[Path, PuzzleInput]" = OrderedDict()
+
+
+def load_input(path: Path) -> PuzzleInput:
+    """
+    Returns the input stored at `path`, mapping it into memory unless it's among the last
+    `MAX_LOADED` inputs loaded by this process. The file is expected not to change while the
+    process is running.
+    """
+    path = Path(path).resolve()
+    if path in _loaded:
+        _loaded.move_to_end(path)
+    else:
+        _loaded[path] = PuzzleInput(path)
+        while len(_loaded) > MAX_LOADED:
+            # Unmapped once no view of the evicted input is left.
+            _loaded.popitem(last=False)
+
+    return _loaded[path]
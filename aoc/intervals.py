@@ -0,0 +1,207 @@
+"""
+Sets of integer intervals and piecewise offset mappings over integers.
+
+Intervals are half-open, `[start, end)`. An `IntervalSet` keeps its intervals sorted, disjoint and
+merged (no two of them touch) in a pair of NumPy arrays, so membership tests are binary searches and
+set operations are a handful of vectorized passes over the intervals' boundaries, whatever their
+number.
+"""
+from typing import Iterable, Iterator, Union
+
+import numpy as np
+
+Interval = tuple[int, int]
+Values = Union[int, np.ndarray]
+
+
+class IntervalSet:
+    def __init__(self, starts: np.ndarray, ends: np.ndarray):
+        """
+        Creates a set from already normalized (sorted, disjoint and merged) intervals, use
+        `from_intervals` otherwise.
+        """
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.ends = np.asarray(ends, dtype=np.int64)
+
+    @classmethod
+    def from_intervals(cls, intervals: Union[Iterable[Interval], np.ndarray]) -> "IntervalSet":
+        """
+        Creates a set covering all of the (possibly overlapping, unordered) `intervals`, given as
+        `(start, end)` pairs or as an `(n, 2)` array. Empty intervals are ignored.
+        """
+        intervals = np.asarray(intervals if isinstance(intervals, np.ndarray) else list(intervals), dtype=np.int64)
+        intervals = intervals.reshape(-1, 2)
+        intervals = intervals[intervals[:, 0] < intervals[:, 1]]
+        if len(intervals) == 0:
+            return cls.empty()
+
+        intervals = intervals[np.argsort(intervals[:, 0], kind="stable")]
+        starts, ends = intervals[:, 0], np.maximum.accumulate(intervals[:, 1])
+
+        # An interval starts a new merged interval unless it starts within (or right at the end of)
+        # one of the intervals before it.
+        new = np.ones(len(starts), dtype=bool)
+        new[1:] = starts[1:] > ends[:-1]
+        last = np.append(np.nonzero(new)[0][1:] - 1, len(starts) - 1)
+        return cls(starts[new], ends[last])
+
+    @classmethod
+    def empty(cls) -> "IntervalSet":
+        return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    @classmethod
+    def union_all(cls, sets: Iterable["IntervalSet"]) -> "IntervalSet":
+        sets = list(sets)
+        if not sets:
+            return cls.empty()
+
+        starts = np.concatenate([s.starts for s in sets])
+        ends = np.concatenate([s.ends for s in sets])
+        return cls.from_intervals(np.column_stack([starts, ends]))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[Interval]:
+        return zip(self.starts.tolist(), self.ends.tolist())
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return np.array_equal(self.starts, other.starts) and np.array_equal(self.ends, other.ends)
+
+    @property
+    def size(self) -> int:
+        """
+        The number of integers in the set.
+        """
+        return int((self.ends - self.starts).sum())
+
+    def __contains__(self, value: int) -> bool:
+        i = np.searchsorted(self.starts, value, side="right") - 1
+        return bool(i >= 0 and value < self.ends[i])
+
+    def contains(self, values: Values) -> np.ndarray:
+        """
+        Vectorized membership test of `values`.
+        """
+        i = np.searchsorted(self.starts, values, side="right") - 1
+        return (i >= 0) & (values < self.ends[np.maximum(i, 0)]) if len(self) else np.zeros(np.shape(values), bool)
+
+    def _combine(self, other: "IntervalSet", keep) -> "IntervalSet":
+        """
+        Splits the number line at the boundaries of both sets and keeps the pieces for which
+        `keep(in_self, in_other)` holds.
+        """
+        bounds = np.unique(np.concatenate([self.starts, self.ends, other.starts, other.ends]))
+        if len(bounds) < 2:
+            return IntervalSet.empty()
+
+        piece_starts, piece_ends = bounds[:-1], bounds[1:]
+        kept = keep(self.contains(piece_starts), other.contains(piece_starts))
+        return IntervalSet.from_intervals(np.column_stack([piece_starts[kept], piece_ends[kept]]))
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        return IntervalSet.union_all([self, other])
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        return self._combine(other, np.logical_and)
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        return self._combine(other, lambda a, b: a & ~b)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+
+class OffsetMapping:
+    """
+    A mapping of integers that adds a constant offset to all integers of a piece of the number line,
+    with a different offset per piece. The pieces are separated by the sorted `bounds`: piece `i` is
+    `[bounds[i - 1], bounds[i])`, the first and last pieces extending to infinity.
+    """
+
+    def __init__(self, bounds: np.ndarray, offsets: np.ndarray):
+        self.bounds = np.asarray(bounds, dtype=np.int64)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        assert len(self.offsets) == len(self.bounds) + 1
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[tuple[int, int, int]]) -> "OffsetMapping":
+        """
+        Creates a mapping from non-overlapping `(start, end, offset)` ranges, integers outside of them
+        are mapped to themselves.
+        """
+        ranges = sorted(ranges)
+        bounds: list[int] = []
+        offsets = [0]
+        for start, end, offset in ranges:
+            if bounds and bounds[-1] == start:
+                offsets[-1] = offset
+            else:
+                bounds.append(start)
+                offsets.append(offset)
+            bounds.append(end)
+            offsets.append(0)
+
+        return cls(np.array(bounds, dtype=np.int64), np.array(offsets, dtype=np.int64))
+
+    def offset(self, values: Values) -> Values:
+        return self.offsets[np.searchsorted(self.bounds, values, side="right")]
+
+    def __call__(self, values: Values) -> Values:
+        return values + self.offset(values)
+
+    def map_intervals(self, intervals: IntervalSet) -> IntervalSet:
+        """
+        Returns the set of all integers the integers of `intervals` are mapped to.
+        """
+        # Split the intervals at the bounds of the pieces they cross, each part is shifted as a whole.
+        cuts = np.unique(np.concatenate([intervals.starts, intervals.ends, self.bounds]))
+        part_starts, part_ends = cuts[:-1], cuts[1:]
+        inside = intervals.contains(part_starts)
+        part_starts, part_ends = part_starts[inside], part_ends[inside]
+        offsets = self.offset(part_starts)
+        return IntervalSet.from_intervals(np.column_stack([part_starts + offsets, part_ends + offsets]))
+
+    def compose(self, then: "OffsetMapping") -> "OffsetMapping":
+        """
+        Returns the mapping of `x` to `then(self(x))`.
+        """
+        # The composed mapping changes its offset where `self` does and where `self` maps integers
+        # onto one of the bounds of `then`, i.e. at `b - offset` for every bound `b` of `then` and
+        # every offset of `self` whose piece contains `b - offset`.
+        candidates = (then.bounds[np.newaxis, :] - self.offsets[:, np.newaxis]).ravel()
+        pieces = np.repeat(np.arange(len(self.offsets)), len(then.bounds))
+        in_piece = np.searchsorted(self.bounds, candidates, side="right") == pieces
+        bounds = np.unique(np.concatenate([self.bounds, candidates[in_piece]]))
+
+        offsets = np.empty(len(bounds) + 1, dtype=np.int64)
+        offsets[0] = self.offsets[0] + then.offsets[0]
+        offsets[1:] = self.offset(bounds) + then.offset(self(bounds))
+        return OffsetMapping(bounds, offsets).simplified()
+
+    def simplified(self) -> "OffsetMapping":
+        """
+        Returns the same mapping without bounds between pieces of equal offsets.
+        """
+        changes = self.offsets[1:] != self.offsets[:-1]
+        return OffsetMapping(self.bounds[changes], np.append(self.offsets[:1], self.offsets[1:][changes]))
+
+
+def overlap(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Tests, for every `i`, whether intervals `a[i]` and `b[i]` (given as `(n, 2)` arrays) overlap.
+    """
+    return (a[:, 0] < b[:, 1]) & (b[:, 0] < a[:, 1])
+
+
+def contain(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Tests, for every `i`, whether interval `a[i]` contains interval `b[i]` (given as `(n, 2)` arrays).
+    """
+    return (a[:, 0] <= b[:, 0]) & (b[:, 1] <= a[:, 1])
@@ -0,0 +1,29 @@
+"""
+Lazy imports of heavyweight modules, so that a solution only pays for importing them when it runs a
+path that uses them (e.g. `sympy` in one part only), rather than whenever the solution is loaded.
+
+    regex = lazy_import("regex")
+
+binds `regex` to a placeholder module that imports the real one on first attribute access. Module
+level code must not access the module's attributes (e.g. compile patterns), or it is imported right
+away; such work should be done by the functions using it instead.
+"""
+import importlib
+import sys
+from types import ModuleType
+
+
+class LazyModule(ModuleType):
+    def __getattr__(self, attr: str):
+        module = importlib.import_module(self.__name__)
+        # Later accesses are served by the placeholder's own dict, without going through here.
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Returns module `name` (e.g. `sympy.ntheory.modular`), imported on first attribute access unless
+    it was already imported.
+    """
+    return sys.modules.get(name) or LazyModule(name)
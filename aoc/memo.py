@@ -0,0 +1,367 @@
+"""
+Memoization of solution functions, bounded so that memory stays in check on large inputs.
+
+    @memo()
+    def count_paths(cave: str, visited: frozenset[str]) -> int: ...
+
+    @memo(max_bytes=64 * 2**20)
+    def gen_operators(n: int, allowed_ops: tuple[str, ...]) -> list[tuple[str, ...]]: ...
+
+    @memo(key=lambda grid, start: (grid.tobytes(), start))
+    def walk(grid: np.ndarray, start: int) -> int: ...
+
+Results are evicted least recently used first, once a memo holds more than `max_entries` results
+or results whose estimated size exceeds `max_bytes` (see `estimate_size`). Without either limit a
+memo is unbounded, like `functools.cache`.
+
+Results are keyed by the function's arguments, which must be hashable. Functions taking
+unhashable arguments (e.g. numpy arrays, lists) pass a `key` function instead, which is given the
+arguments of every call and returns a hashable key for them.
+
+A memo's scope sets how long its results are kept:
+  - `"run"` (the default): results only hold for a single input, and are cleared by the runner
+    before every run of a solution's phases. Repeated runs (e.g. benchmarks) don't reuse the
+    results of earlier ones, nor do results of earlier inputs pile up in long-lived processes.
+  - `"process"`: results don't depend on the input (e.g. the neighbors of a point), and are kept
+    for as long as the process lives.
+
+Every memoized function has `stats()` returning its hits, misses, evictions and size, and
+`clear()`. While counting is enabled (see `aoc.counters`), the hits, misses and evictions of
+memos are reported as counters of the phase they happened in.
+
+Memos of pure functions whose results are worth keeping across runs (e.g. subproblems shared by
+many inputs of a batch) may be declared `persistent`. Once persistence is enabled (`run
+--persistent-memos`, see `enable_persistence`), the results of persistent memos are stored in a
+SQLite database, and results missing from memory are looked up there before being computed. Stored
+results are keyed by the function (its file and qualified name) and by its pickled key, and are
+only reused while the source of the function's module (see `aoc.answers.source_hash`) is unchanged;
+results of earlier versions of a module are deleted once it runs. Results are written in batches,
+at the latest when the runner is done with a run. Persistence is disabled unless enabled, so that
+benchmarks and regular runs never reuse results of earlier runs.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+import functools
+import os
+from pathlib import Path
+import pickle
+import sqlite3
+import sys
+from typing import Any, Callable, Hashable, Optional, Protocol, cast
+import weakref
+
+from aoc import counters
+from aoc.answers import source_hash
+from aoc.solutions import CACHE_DIR, REPO_ROOT
+
+PERSISTENT_MEMOS_PATH = CACHE_DIR / "memos.sqlite"
+
+# The database of persistent memos when persistence is enabled. Being in the environment, it's
+# inherited by worker processes.
+PERSISTENT_MEMOS_ENV = "AOC_PERSISTENT_MEMOS"
+
+# Results stored in memory before being written to the database.
+_WRITE_BATCH_SIZE = 1000
+
+SCOPES = ("run", "process")
+
+_MISSING = object()
+
+# Separates positional from keyword arguments in keys.
+_KWARGS_MARK = object()
+
+
+@dataclass
+class MemoStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    # Results held, and their estimated size in bytes (only estimated when bounded by bytes).
+    entries: int = 0
+    bytes: int = 0
+
+    # Misses found in the persistent memos database.
+    persisted_hits: int = 0
+
+
+class Memoized(Protocol):
+    """
+    A memoized function, with the statistics of its memo and a way to clear it.
+    """
+
+    stats: Callable[[], MemoStats]
+    clear: Callable[[], None]
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        ...
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Returns the size of `value` in bytes along with the objects it holds through (possibly nested)
+    tuples, lists, sets and dicts. Objects held more than once are only counted once.
+    """
+    seen: set[int] = set()
+    size = 0
+    pending = [value]
+    while pending:
+        v = pending.pop()
+        if id(v) in seen:
+            continue
+        seen.add(id(v))
+        size += sys.getsizeof(v)
+        if isinstance(v, dict):
+            pending.extend(v.keys())
+            pending.extend(v.values())
+        elif isinstance(v, (tuple, list, set, frozenset)):
+            pending.extend(v)
+
+    return size
+
+
+class _Database:
+    """
+    The persistent memos database, as opened by a single process.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Worker processes of a batch share the database, waiting for each other's writes.
+        self.connection = sqlite3.connect(path, timeout=60)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS memos"
+            " (function TEXT, version TEXT, key BLOB, value BLOB, PRIMARY KEY (function, key)) WITHOUT ROWID"
+        )
+        self.pending: list[tuple[str, str, bytes, bytes]] = []
+        self.checked: set[tuple[str, str]] = set()
+
+    def load(self, function: str, version: str, key: bytes) -> Any:
+        if (function, version) not in self.checked:
+            # Results of earlier versions of the function are never reused.
+            with self.connection:
+                self.connection.execute("DELETE FROM memos WHERE function = ? AND version != ?", (function, version))
+            self.checked.add((function, version))
+
+        row = self.connection.execute(
+            "SELECT value FROM memos WHERE function = ? AND version = ? AND key = ?", (function, version, key)
+        ).fetchone()
+        return pickle.loads(row[0]) if row is not None else _MISSING
+
+    def store(self, function: str, version: str, key: bytes, value: Any) -> None:
+        self.pending.append((function, version, key, pickle.dumps(value)))
+        if len(self.pending) >= _WRITE_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO memos VALUES (?, ?, ?, ?)", self.pending)
+        self.pending.clear()
+
+
+# The persistent memos database opened by this process, along with the process id, as connections
+# can't be used by forked processes.
+_database: Optional[tuple[int, _Database]] = None
+
+
+def _persistent_database() -> Optional[_Database]:
+    global _database
+    path = os.environ.get(PERSISTENT_MEMOS_ENV)
+    if path is None:
+        return None
+
+    if _database is None or _database[0] != os.getpid() or _database[1].path != Path(path):
+        _database = (os.getpid(), _Database(Path(path)))
+    return _database[1]
+
+
+def enable_persistence(path: Path = PERSISTENT_MEMOS_PATH) -> None:
+    """
+    Enables persistent memos, stored in the database at `path`, in this process and the processes
+    it starts.
+    """
+    os.environ[PERSISTENT_MEMOS_ENV] = str(path)
+
+
+def disable_persistence() -> None:
+    flush()
+    os.environ.pop(PERSISTENT_MEMOS_ENV, None)
+
+
+def flush() -> None:
+    """
+    Writes the results of persistent memos not written to the database yet.
+    """
+    if _database is not None and _database[0] == os.getpid():
+        _database[1].flush()
+
+
+class _Memo:
+    def __init__(
+        self,
+        fn: Callable,
+        max_entries: Optional[int],
+        max_bytes: Optional[int],
+        size: Callable[[Any], int],
+        scope: str,
+        persistent: bool,
+    ):
+        self.fn = fn
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = size
+        self.scope = scope
+        self.persistent = persistent
+        self._version: Optional[tuple[str, str]] = None
+        self.entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.sizes: dict[Hashable, int] = {}
+        self.stats = MemoStats()
+        self.reported = MemoStats()
+
+    def store(self, key: Hashable, value: Any) -> None:
+        # A recursive call may have stored the same key while the value was being computed.
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if self.max_bytes is not None:
+            self.stats.bytes -= self.sizes.get(key, 0)
+            self.sizes[key] = self.size(key) + self.size(value)
+            self.stats.bytes += self.sizes[key]
+
+        while len(self.entries) > 1 and (
+            (self.max_entries is not None and len(self.entries) > self.max_entries)
+            or (self.max_bytes is not None and self.stats.bytes > self.max_bytes)
+        ):
+            evicted, _ = self.entries.popitem(last=False)
+            self.stats.bytes -= self.sizes.pop(evicted, 0)
+            self.stats.evictions += 1
+
+    @property
+    def version(self) -> tuple[str, str]:
+        """
+        The name of the function in the persistent memos database along with its source version.
+        """
+        if self._version is None:
+            path = Path(self.fn.__code__.co_filename).resolve()
+            label = path.relative_to(REPO_ROOT) if path.is_relative_to(REPO_ROOT) else path
+            self._version = (f"{label}:{self.fn.__qualname__}", source_hash(path))
+        return self._version
+
+    def load_persisted(self, key: Hashable) -> Any:
+        database = _persistent_database()
+        if database is None:
+            return _MISSING
+
+        value = database.load(*self.version, pickle.dumps(key))
+        if value is not _MISSING:
+            self.stats.persisted_hits += 1
+        return value
+
+    def persist(self, key: Hashable, value: Any) -> None:
+        database = _persistent_database()
+        if database is not None:
+            database.store(*self.version, pickle.dumps(key), value)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.sizes.clear()
+        self.stats.bytes = 0
+
+    def add_counters(self) -> None:
+        name = self.fn.__qualname__
+        for stat in ("hits", "misses", "evictions", "persisted_hits"):
+            new = getattr(self.stats, stat) - getattr(self.reported, stat)
+            if new:
+                counters.add(f"{name}.memo_{stat}", new)
+                setattr(self.reported, stat, getattr(self.stats, stat))
+
+
+# Every memo of the solutions loaded, for the runner to clear and report. Memos are forgotten along
+# with the solution modules defining them.
+_memos: "weakref.WeakSet[_Memo]" = weakref.WeakSet()
+
+
+def memo(
+    *,
+    key: Optional[Callable[..., Hashable]] = None,
+    max_entries: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    size: Callable[[Any], int] = estimate_size,
+    scope: str = "run",
+    persistent: bool = False,
+) -> Callable[[Callable], Memoized]:
+    """
+    Returns a decorator memoizing a function (see the module's documentation). `size` estimates the
+    size in bytes of keys and results when bounded by `max_bytes`. The keys and results of
+    `persistent` memos must be picklable.
+    """
+    if scope not in SCOPES:
+        raise ValueError(f"Unknown memo scope {scope!r}, expected one of: {', '.join(SCOPES)}")
+
+    def decorate(fn: Callable) -> Memoized:
+        state = _Memo(fn, max_entries, max_bytes, size, scope, persistent)
+        entries, stats = state.entries, state.stats
+        bounded = max_entries is not None or max_bytes is not None
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if key is not None:
+                k = key(*args, **kwargs)
+            else:
+                k = args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+            try:
+                value = entries.get(k, _MISSING)
+            except TypeError as e:
+                raise TypeError(f"Arguments of {fn.__qualname__} can't be memoized, pass a key: {e}") from e
+
+            if value is not _MISSING:
+                stats.hits += 1
+                if bounded:
+                    entries.move_to_end(k)
+                return value
+
+            stats.misses += 1
+            if persistent:
+                value = state.load_persisted(k)
+                if value is not _MISSING:
+                    state.store(k, value)
+                    return value
+
+            value = fn(*args, **kwargs)
+            state.store(k, value)
+            if persistent:
+                state.persist(k, value)
+            return value
+
+        def memo_stats() -> MemoStats:
+            return MemoStats(stats.hits, stats.misses, stats.evictions, len(entries), stats.bytes, stats.persisted_hits)
+
+        memoized = cast(Memoized, wrapper)
+        memoized.stats = memo_stats
+        memoized.clear = state.clear
+        _memos.add(state)
+        return memoized
+
+    return decorate
+
+
+def start_run() -> None:
+    """
+    Clears the results of run scoped memos, and resets the statistics of all memos.
+    """
+    for state in _memos:
+        if state.scope == "run":
+            state.clear()
+        state.stats.hits = state.stats.misses = state.stats.evictions = state.stats.persisted_hits = 0
+        state.reported = MemoStats()
+
+
+def add_counters() -> None:
+    """
+    Adds the hits, misses and evictions of every memo since they were last added to the counters.
+    """
+    for state in _memos:
+        state.add_counters()
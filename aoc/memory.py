@@ -0,0 +1,142 @@
+"""
+Memory usage reports of solution phases, for finding the phases that are memory-bound rather than
+CPU-bound.
+
+A phase is traced with `tracemalloc` from start to end, reporting:
+  - The peak of the memory traced while the phase ran, and how much of it the phase still held
+    when it returned (e.g. the parsed input, or caches left behind).
+  - The source lines that allocated the most memory around the peak. Memory that is freed before
+    the phase returns (e.g. intermediate results) is often what makes the peak, so a background
+    thread snapshots the traced allocations whenever they grow well beyond the last snapshot and
+    the sites are taken from the largest snapshot.
+  - How many more objects of each type the garbage collector tracks after the phase than before
+    it. Only container objects (lists, dicts, tuples, instances, ...) are tracked by the garbage
+    collector, so atomic objects such as ints and strings are not counted.
+
+Tracing slows phases down, typically by a factor of 2 or more.
+"""
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import gc
+from pathlib import Path
+import threading
+import tracemalloc
+import _weakrefset
+from typing import Iterator, Optional
+
+from aoc.solutions import REPO_ROOT
+
+
+@dataclass
+class AllocationSite:
+    # `path:line`, paths of the repository being relative to its root.
+    location: str
+    size: int
+    count: int
+
+
+@dataclass
+class MemoryReport:
+    peak: int = 0
+    retained: int = 0
+    top_sites: list[AllocationSite] = field(default_factory=list)
+
+    # Type names along with how many more objects of them there are after the phase than before,
+    # largest increase first.
+    object_counts: list[tuple[str, int]] = field(default_factory=list)
+
+
+# How often the peak sampler checks the traced memory, in seconds, and by how much it must have grown
+# since the last snapshot for another one to be taken.
+SAMPLE_INTERVAL = 0.01
+SNAPSHOT_GROWTH = 1.2
+
+# Allocations made by the tooling around the traced code rather than by the code itself.
+_IGNORED_FILES = (
+    tracemalloc.__file__,
+    threading.__file__,
+    _weakrefset.__file__,
+    __file__,
+    str(Path(__file__).with_name("runner.py")),
+)
+
+
+class PeakSampler(threading.Thread):
+    """
+    Keeps a snapshot of the traced allocations taken close to their peak.
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self._snapshot_size = 0
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(SAMPLE_INTERVAL):
+            self.sample()
+
+    def sample(self) -> None:
+        size = tracemalloc.get_traced_memory()[0]
+        if tracemalloc.is_tracing() and size > self._snapshot_size * SNAPSHOT_GROWTH:
+            self.snapshot, self._snapshot_size = tracemalloc.take_snapshot(), size
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+def object_counts() -> Counter:
+    return Counter(type(o).__name__ for o in gc.get_objects())
+
+
+def format_location(frame: tracemalloc.Frame) -> str:
+    path = Path(frame.filename)
+    if path.is_relative_to(REPO_ROOT):
+        path = path.relative_to(REPO_ROOT)
+    return f"{path}:{frame.lineno}"
+
+
+@contextmanager
+def traced(top: int = 10) -> Iterator[MemoryReport]:
+    """
+    Traces the memory allocated within the `with` block, filling the yielded report (with up to
+    `top` allocation sites and object types) when the block exits.
+    """
+    report = MemoryReport()
+
+    # The sampler runs while objects are counted at both ends of the phase, so that its own objects
+    # are counted in both. It only snapshots allocations while they are traced.
+    sampler = PeakSampler()
+    sampler.start()
+    try:
+        gc.collect()
+        counts_before = object_counts()
+        tracemalloc.start()
+        try:
+            yield report
+
+            # The end of the phase may well be its peak, e.g. when it returns a large structure.
+            sampler.sample()
+            report.retained, report.peak = tracemalloc.get_traced_memory()
+            # No snapshot is taken of a phase that allocated nothing.
+            if sampler.snapshot is not None:
+                snapshot = sampler.snapshot.filter_traces([tracemalloc.Filter(False, f) for f in _IGNORED_FILES])
+                report.top_sites = [
+                    AllocationSite(format_location(s.traceback[0]), s.size, s.count)
+                    for s in snapshot.statistics("lineno")[:top]
+                ]
+                del snapshot
+        finally:
+            tracemalloc.stop()
+            sampler.snapshot = None
+
+        gc.collect()
+        counts = object_counts()
+        counts.subtract(counts_before)
+        # The report's own objects.
+        counts.subtract({"Counter": 1, "AllocationSite": len(report.top_sites)})
+        report.object_counts = [(name, n) for name, n in counts.most_common(top) if n > 0]
+    finally:
+        sampler.stop()
@@ -0,0 +1,88 @@
+"""
+On-disk cache of parsed puzzle inputs.
+
+A parsed input is stored under a key derived from the input bytes and from the source of the
+solution module that parsed it (along with the python version, which pickles depend on), so warm
+runs load it instead of parsing again. The whole module source is hashed rather than only its
+`parse` function since parsing usually goes through helpers and classes defined next to it, along
+with the repository modules it imports (e.g. `aoc.grid`, see `aoc.answers.source_hash`).
+
+Entries live in `.aoc/parsed/<module name>/<parser hash>-<input hash>.pickle`. Whenever an input is
+parsed by a module whose source hash differs from that of an entry, the stale entry is deleted.
+"""
+import pickle
+import platform
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Union
+
+from aoc.answers import source_hash
+from aoc.inputs import PuzzleInput
+from aoc.solutions import CACHE_DIR, parse_input
+from aoc.storage import digest, write_atomically
+
+PARSE_CACHE_DIR = CACHE_DIR / "parsed"
+
+
+def parser_hash(solution: ModuleType) -> str:
+    if solution.__file__ is None:
+        raise ValueError(f"{solution.__name__} wasn't loaded from a file")
+    return digest(platform.python_version().encode() + b"\0" + source_hash(Path(solution.__file__)).encode())
+
+
+def input_hash(data: Union[bytes, memoryview]) -> str:
+    return digest(data)
+
+
+def _entries_dir(solution: ModuleType, cache_dir: Path) -> Path:
+    return cache_dir / solution.__name__
+
+
+def evict_stale(solution: ModuleType, cache_dir: Path = PARSE_CACHE_DIR) -> int:
+    """
+    Deletes the cached inputs of `solution` that were parsed by a different version of its source.
+    Returns the number of deleted entries.
+    """
+    entries_dir = _entries_dir(solution, cache_dir)
+    if not entries_dir.exists():
+        return 0
+
+    current = parser_hash(solution)
+    stale = [p for p in entries_dir.iterdir() if not p.name.startswith(f"{current}-")]
+    for path in stale:
+        path.unlink(missing_ok=True)
+
+    return len(stale)
+
+
+def cached_parse(
+    solution: ModuleType, puzzle_input: PuzzleInput, cache_dir: Path = PARSE_CACHE_DIR
+) -> tuple[Any, bool]:
+    """
+    Returns `puzzle_input` parsed by `solution` (see `aoc.solutions.parse_input`), loading it from
+    the cache if it was parsed before. Also returns whether the value was loaded from the cache.
+
+    Parsed values that can't be pickled (including structures nested too deep to be pickled) are
+    returned without being cached.
+    """
+    entries_dir = _entries_dir(solution, cache_dir)
+    entry_path = entries_dir / f"{parser_hash(solution)}-{input_hash(puzzle_input.data)}.pickle"
+    if entry_path.exists():
+        try:
+            with open(entry_path, "rb") as f:
+                return pickle.load(f), True
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            # A truncated or otherwise unusable entry; parse again and overwrite it.
+            pass
+
+    parsed = parse_input(solution, puzzle_input)
+    try:
+        data = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+        return parsed, False
+
+    evict_stale(solution, cache_dir)
+    entries_dir.mkdir(parents=True, exist_ok=True)
+
+    write_atomically(entry_path, data)
+    return parsed, False
@@ -0,0 +1,123 @@
+"""
+Profiling of solution phases with `cProfile`.
+
+Every profiled phase is saved twice in the profiles directory (`.aoc/profiles/<YEAR>/<DAY>/` by
+default):
+  - `<phase>.pstats` - The raw profile, for `python -m pstats` or tools such as snakeviz.
+  - `<phase>.folded` - Collapsed stacks (`frame;frame;frame microseconds` lines) for flame graph
+    tools such as `flamegraph.pl`, speedscope or inferno.
+
+`cProfile` only records which function called which rather than whole stacks, so collapsed stacks
+are reconstructed by walking the call graph from its roots, splitting the time of every function
+among its callers in proportion to the time spent under each of them. Recursive calls are folded
+into the first occurrence of the function on the stack. Call graphs with many shared callees (e.g.
+the import machinery) have exponentially many paths, so paths holding less than `MIN_STACK_SHARE`
+of the profiled time end at their first frame, which holds the time of the calls beneath it.
+"""
+import cProfile
+import io
+from pathlib import Path
+import pstats
+from typing import TextIO
+
+from aoc.solutions import CACHE_DIR, REPO_ROOT
+
+PROFILES_DIR = CACHE_DIR / "profiles"
+
+# Fraction of the profiled time below which a path isn't walked any deeper. Flame graphs can't show
+# frames this narrow anyway.
+MIN_STACK_SHARE = 1e-3
+
+# `(file name, line number, function name)`, as keyed by `pstats`.
+Function = tuple[str, int, str]
+
+# `(primitive calls, calls, own time, cumulative time, callers)` of a function, the callers mapping
+# to the same figures (without callers) for the calls they made.
+Entry = tuple[int, int, float, float, dict[Function, tuple[int, int, float, float]]]
+
+
+def _entries(stats: pstats.Stats) -> dict[Function, Entry]:
+    # Left out of the type stubs of `pstats`.
+    return getattr(stats, "stats")
+
+
+def frame_label(function: Function) -> str:
+    file_name, line, name = function
+    if file_name == "~":
+        # Built-ins, e.g. `<method 'append' of 'list' objects>`.
+        return name
+
+    path = Path(file_name)
+    if path.is_relative_to(REPO_ROOT):
+        path = path.relative_to(REPO_ROOT)
+    return f"{name} ({path}:{line})"
+
+
+def collapsed_stacks(stats: pstats.Stats) -> dict[tuple[str, ...], float]:
+    """
+    Returns the time (in seconds) spent in every stack of frame labels, outermost frame first.
+    """
+    # `callees[f]` maps every function called by `f` to the total time spent under those calls.
+    entries = _entries(stats)
+    callees: dict[Function, dict[Function, float]] = {f: {} for f in entries}
+    for function, (_, _, _, _, callers) in entries.items():
+        for caller, (_, _, _, cumulative_time) in callers.items():
+            if caller in callees:
+                callees[caller][function] = cumulative_time
+
+    stacks: dict[tuple[str, ...], float] = {}
+    # The profiler's own `disable()` call is recorded as a root too.
+    roots = [f for f, (_, _, _, _, callers) in entries.items() if not callers and "_lsprof" not in f[2]]
+
+    min_time = MIN_STACK_SHARE * sum(entries[root][3] for root in roots)
+
+    # Walks `(function, stack above it, time spent under this path)` with an explicit stack, as call
+    # graphs of recursive solutions get deep.
+    pending: list[tuple[Function, tuple[str, ...], float]] = [(root, (), entries[root][3]) for root in roots]
+    while pending:
+        function, parents, time = pending.pop()
+        _, _, own_time, cumulative_time, _ = entries[function]
+        stack = parents + (frame_label(function),)
+        if time < min_time:
+            stacks[stack] = stacks.get(stack, 0) + time
+            continue
+
+        share = time / cumulative_time if cumulative_time > 0 else 0
+        stacks[stack] = stacks.get(stack, 0) + own_time * share
+
+        for callee, callee_time in callees[function].items():
+            if callee_time * share <= 0 or frame_label(callee) in stack:
+                continue
+            pending.append((callee, stack, callee_time * share))
+
+    return stacks
+
+
+def write_collapsed(stats: pstats.Stats, f: TextIO) -> None:
+    for stack, time in sorted(collapsed_stacks(stats).items()):
+        microseconds = round(time * 1e6)
+        if microseconds > 0:
+            f.write(f"{';'.join(stack)} {microseconds}\n")
+
+
+def save_profile(profile: cProfile.Profile, profile_dir: Path, phase: str) -> Path:
+    """
+    Saves the profile of `phase` in both formats and returns the path of its pstats file.
+    """
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    pstats_path = profile_dir / f"{phase}.pstats"
+    profile.dump_stats(pstats_path)
+    with open(profile_dir / f"{phase}.folded", "w") as f:
+        write_collapsed(pstats.Stats(profile), f)
+
+    return pstats_path
+
+
+def top_functions(pstats_path: Path, count: int = 15) -> str:
+    """
+    Returns a report of the `count` functions with the highest cumulative time in a saved profile.
+    """
+    report = io.StringIO()
+    stats = pstats.Stats(str(pstats_path), stream=report)
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(count)
+    return report.getvalue()
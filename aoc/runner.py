@@ -0,0 +1,226 @@
+"""
+Runs a day's solution phase by phase, measuring each phase on its own.
+"""
+import cProfile
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+import resource
+import sys
+import time
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+from aoc import counters, memo, tracing
+from aoc.answers import load_answers, store_answers
+from aoc.budgets import Budget, enforced
+from aoc.inputs import PuzzleInput, load_input
+from aoc.memory import MemoryReport, traced
+from aoc.parse_cache import cached_parse
+from aoc.profiling import save_profile
+from aoc.solutions import PHASES, Day, load_solution, parse_input
+
+# `ru_maxrss` is reported in kilobytes on Linux and in bytes on macOS.
+_RU_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+@dataclass
+class PhaseResult:
+    phase: str
+
+    # Elapsed wall clock and process CPU time of the phase, in seconds.
+    wall_time: float
+    cpu_time: float
+
+    # High-water mark of the process resident set size at the end of the phase, in bytes.
+    peak_rss: int
+
+    # Value returned by the phase, `None` for the parse phase.
+    answer: Any = None
+
+    # Whether the phase was skipped by loading its result from the parsed inputs cache.
+    cached: bool = False
+
+    # The saved profile of the phase (see `aoc.profiling`) if it was profiled.
+    profile_path: Optional[Path] = None
+
+    # The memory usage of the phase (see `aoc.memory`) if it was traced.
+    memory: Optional[MemoryReport] = None
+
+    # The counts the phase added to counters (see `aoc.counters`) if counting was enabled.
+    counters: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class DayResult:
+    day: Day
+    phases: list[PhaseResult] = field(default_factory=list)
+
+    # The trace events recorded by the process that ran the day (see `aoc.tracing`), if traced.
+    trace: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def answers(self) -> dict[str, Any]:
+        return {p.phase: p.answer for p in self.phases if p.phase != "parse"}
+
+    @property
+    def wall_time(self) -> float:
+        return sum(p.wall_time for p in self.phases)
+
+    @property
+    def cpu_time(self) -> float:
+        return sum(p.cpu_time for p in self.phases)
+
+    def to_json(self) -> dict[str, Any]:
+        """
+        Returns the day's timings and answers as a JSON document, with answers other than numbers
+        and strings (e.g. a numpy integer) converted to strings. Profiles, memory reports and trace
+        events are left out.
+        """
+        return {
+            "day": str(self.day),
+            "phases": [
+                {
+                    "phase": p.phase,
+                    "wall_time": p.wall_time,
+                    "cpu_time": p.cpu_time,
+                    "peak_rss": p.peak_rss,
+                    "answer": p.answer if isinstance(p.answer, (int, float, str, type(None))) else str(p.answer),
+                    "cached": p.cached,
+                    "counters": p.counters,
+                }
+                for p in self.phases
+            ],
+        }
+
+    @classmethod
+    def from_json(cls, document: dict[str, Any]) -> "DayResult":
+        return cls(Day.from_str(document["day"]), [PhaseResult(**p) for p in document["phases"]])
+
+
+def peak_rss() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RU_MAXRSS_UNIT
+
+
+def measure(
+    phase: str, fn: Callable, *args, profile: Optional[cProfile.Profile] = None, trace_memory: bool = False
+) -> tuple[PhaseResult, Any]:
+    """
+    Invokes `fn(*args)` and measures it, under `profile` if given and tracing its memory
+    allocations with `trace_memory`. The call is recorded as a span while tracing is enabled, and
+    the counts it adds are collected while counting is enabled.
+
+    Returns the measurements of the call along with its return value.
+    """
+    # Counts added outside of phases (e.g. while loading the solution) are not the phase's.
+    counters.collect()
+    with traced() if trace_memory else nullcontext() as memory, tracing.span(phase, "phase"):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        value = profile.runcall(fn, *args) if profile is not None else fn(*args)
+        wall_time, cpu_time = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    if counters.enabled():
+        memo.add_counters()
+    return PhaseResult(phase, wall_time, cpu_time, peak_rss(), memory=memory, counters=counters.collect()), value
+
+
+def run_phases(
+    solution: ModuleType,
+    puzzle_input: PuzzleInput,
+    parse_cache: bool = False,
+    profile_dir: Optional[Path] = None,
+    trace_memory: bool = False,
+) -> list[PhaseResult]:
+    """
+    Runs the parse, part 1 and part 2 phases of a loaded `solution` module on `puzzle_input`. With
+    `parse_cache` the parsed input is loaded from (or stored in) the on-disk parsed inputs cache.
+    With a `profile_dir` every phase is profiled and its profile saved there, and with
+    `trace_memory` the memory usage of every phase is reported. The parsed inputs cache is never
+    used by either, so that parsing is profiled (or traced) too.
+
+    The results of run scoped memos (see `aoc.memo`) are cleared first, so that none of them are
+    reused from an earlier run, and those of persistent memos are written once done.
+    """
+    memo.start_run()
+    profiles = {phase: cProfile.Profile() for phase in PHASES} if profile_dir is not None else {}
+    if parse_cache and profile_dir is None and not trace_memory:
+        parse_result, (parsed, cached) = measure("parse", cached_parse, solution, puzzle_input)
+        parse_result.cached = cached
+    else:
+        parse_result, parsed = measure(
+            "parse", parse_input, solution, puzzle_input, profile=profiles.get("parse"), trace_memory=trace_memory
+        )
+    phases = [parse_result]
+    for phase in ("part1", "part2"):
+        phase_result, answer = measure(
+            phase, getattr(solution, phase), parsed, profile=profiles.get(phase), trace_memory=trace_memory
+        )
+        phase_result.answer = answer
+        phases.append(phase_result)
+
+    if profile_dir is not None:
+        for phase_result in phases:
+            phase_result.profile_path = save_profile(profiles[phase_result.phase], profile_dir, phase_result.phase)
+
+    memo.flush()
+    return phases
+
+
+def run_day(
+    day: Day,
+    input_path: Optional[Path] = None,
+    parse_cache: bool = False,
+    profile_dir: Optional[Path] = None,
+    trace_memory: bool = False,
+    answer_cache: bool = False,
+    budget: Optional[Budget] = None,
+) -> DayResult:
+    """
+    Runs the solution of `day` on its puzzle input (or on `input_path` if given) and measures the
+    parse, part 1 and part 2 phases separately. With a `profile_dir`, the phases are profiled and
+    their profiles saved in its `<YEAR>/<DAY>/` subdirectory. With `trace_memory`, their memory
+    usage is reported too.
+
+    With `answer_cache`, the result of an earlier run of the same solution source on the same input
+    is returned (with all of its phases marked as cached) without running the solution, and new
+    results are stored for later runs. The answers cache is never used by profiled or traced runs.
+
+    With a `budget`, the solution raises `aoc.budgets.BudgetExceeded` once it exhausts it.
+
+    While tracing is enabled (see `aoc.tracing`), the events recorded by the run are collected
+    into the result.
+    """
+    with tracing.span(str(day), "day"):
+        result = _run_day(day, input_path, parse_cache, profile_dir, trace_memory, answer_cache, budget)
+    result.trace = tracing.collect()
+    return result
+
+
+def _run_day(
+    day: Day,
+    input_path: Optional[Path],
+    parse_cache: bool,
+    profile_dir: Optional[Path],
+    trace_memory: bool,
+    answer_cache: bool,
+    budget: Optional[Budget],
+) -> DayResult:
+    with tracing.span("input", "phase"):
+        puzzle_input = load_input(input_path or day.input_path)
+    answer_cache = answer_cache and profile_dir is None and not trace_memory
+    if answer_cache:
+        document = load_answers(day, puzzle_input.data)
+        if document is not None:
+            result = DayResult.from_json(document)
+            for p in result.phases:
+                p.cached = True
+            return result
+
+    with tracing.span("load", "phase"):
+        solution = load_solution(day)
+    if profile_dir is not None:
+        profile_dir = profile_dir / str(day.year) / f"{day.day:02d}"
+    with enforced(budget) if budget is not None else nullcontext():
+        result = DayResult(day, run_phases(solution, puzzle_input, parse_cache, profile_dir, trace_memory))
+    if answer_cache:
+        store_answers(day, puzzle_input.data, result.to_json())
+    return result
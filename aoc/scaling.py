@@ -0,0 +1,132 @@
+"""
+Estimates how the running time of a day's phases grows with the size of its input.
+
+A day is run on synthetic inputs (see `aoc.generators`) of increasing scales, and for every phase a
+power law `time = c * size^k` is fitted to the timings by least squares over `log(time)` against
+`log(size)`, where the size is the input's length in bytes. The fitted exponent `k` is the phase's
+empirical complexity: about 1 for linear phases, 2 for quadratic ones and so on.
+
+A solution module may declare the exponents its phases are expected to stay within, e.g.:
+    SCALING_BUDGET = {"parse": 1, "part1": 1, "part2": 2}
+Phases whose fitted exponent exceeds their budget by more than a tolerance are reported.
+"""
+import csv
+from dataclasses import dataclass, field
+import math
+from typing import Iterable, Optional, TextIO
+
+from aoc.bench import NOISE_FLOOR
+from aoc.generators import generated_input_path
+from aoc.inputs import load_input
+from aoc.runner import run_phases
+from aoc.solutions import PHASES, Day, load_solution
+
+DEFAULT_SCALES = (1, 2, 4, 8, 16)
+
+# Fitted exponents are noisy, especially for fast phases, so they may exceed their budget by this
+# much before being reported.
+DEFAULT_TOLERANCE = 0.25
+
+
+@dataclass
+class ScalingPoint:
+    scale: float
+    input_size: int
+
+    # Fastest wall time of every phase over the repeated runs, in seconds.
+    times: dict[str, float]
+
+
+@dataclass
+class PhaseScaling:
+    phase: str
+
+    # `None` when the phase can't be fitted, e.g. when it's too fast to time reliably.
+    exponent: Optional[float]
+    budget: Optional[float] = None
+
+    def exceeds_budget(self, tolerance: float = DEFAULT_TOLERANCE) -> bool:
+        return self.exponent is not None and self.budget is not None and self.exponent > self.budget + tolerance
+
+
+@dataclass
+class DayScaling:
+    day: Day
+    points: list[ScalingPoint] = field(default_factory=list)
+    phases: dict[str, PhaseScaling] = field(default_factory=dict)
+
+
+def fit_exponent(sizes: list[float], times: list[float]) -> Optional[float]:
+    """
+    Returns the exponent `k` of the power law `time = c * size^k` best fitting the samples, `None`
+    if there are fewer than two distinct sizes or any time isn't positive.
+    """
+    if len(set(sizes)) < 2 or any(t <= 0 for t in times):
+        return None
+
+    xs, ys = [math.log(s) for s in sizes], [math.log(t) for t in times]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+def measure_scaling(
+    day: Day,
+    scales: Iterable[float] = DEFAULT_SCALES,
+    seed: int = 0,
+    repeat: int = 3,
+    max_time: Optional[float] = None,
+) -> DayScaling:
+    """
+    Runs `day` `repeat` times on a synthetic input of each of the `scales` (in increasing order)
+    and fits the growth of every phase. With `max_time`, larger scales are skipped once a single
+    run takes longer than that many seconds.
+    """
+    solution = load_solution(day)
+    budgets = getattr(solution, "SCALING_BUDGET", {})
+
+    points = []
+    for scale in sorted(scales):
+        puzzle_input = load_input(generated_input_path(day, scale, seed))
+        times = {phase: math.inf for phase in PHASES}
+        for _ in range(repeat):
+            for p in run_phases(solution, puzzle_input):
+                times[p.phase] = min(times[p.phase], p.wall_time)
+        points.append(ScalingPoint(scale, len(puzzle_input), times))
+
+        if max_time is not None and sum(times.values()) > max_time:
+            break
+
+    phases = {}
+    for phase in PHASES:
+        # Timings under the noise floor don't tell anything about growth.
+        timed = [p for p in points if p.times[phase] >= NOISE_FLOOR]
+        exponent = fit_exponent([p.input_size for p in timed], [p.times[phase] for p in timed])
+        phases[phase] = PhaseScaling(phase, exponent, budgets.get(phase))
+
+    return DayScaling(day, points, phases)
+
+
+def write_csv(results: Iterable[DayScaling], f: TextIO) -> None:
+    """
+    Writes one row per day, phase and scale, along with the phase's fitted exponent and budget
+    (empty when unknown).
+    """
+    writer = csv.writer(f)
+    writer.writerow(["day", "phase", "scale", "input_size", "seconds", "exponent", "budget"])
+    for result in results:
+        for point in result.points:
+            for phase, seconds in point.times.items():
+                fit = result.phases[phase]
+                writer.writerow(
+                    [
+                        str(result.day),
+                        phase,
+                        f"{point.scale:g}",
+                        point.input_size,
+                        f"{seconds:.6g}",
+                        "" if fit.exponent is None else f"{fit.exponent:.3f}",
+                        "" if fit.budget is None else f"{fit.budget:g}",
+                    ]
+                )
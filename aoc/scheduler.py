@@ -0,0 +1,130 @@
+"""
+Runs many days in parallel on a process pool.
+
+Days are submitted longest-first (the LPT heuristic) based on how long they took in earlier runs,
+so the slowest days start right away and the short ones fill the gaps around them. With enough
+workers the total wall clock time approaches the time of the slowest single day.
+"""
+import concurrent.futures
+from functools import partial
+import json
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from aoc import counters, tracing
+from aoc.bench import load_baseline
+from aoc.budgets import Budget, budget_for, run_isolated
+from aoc.generators import generated_input_path
+from aoc.runner import DayResult, run_day
+from aoc.solutions import CACHE_DIR, Day
+
+HISTORY_PATH = CACHE_DIR / "history.json"
+
+
+def load_history(path: Path = HISTORY_PATH) -> dict[str, float]:
+    """
+    Returns the wall time (in seconds) of the last recorded run of every day, keyed by `YEAR/DAY`.
+    """
+    if not path.exists():
+        return {}
+
+    return json.loads(path.read_text())
+
+
+def save_history(results: Iterable[DayResult], path: Path = HISTORY_PATH) -> None:
+    history = load_history(path)
+    history.update({str(r.day): r.wall_time for r in results})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(dict(sorted(history.items())), indent=2) + "\n")
+
+
+def expected_duration(day: Day, history: dict[str, float], baseline: dict) -> float:
+    """
+    Estimates how long `day` takes to run: its last recorded run, otherwise the sum of its phase
+    medians in the benchmark baseline. Days that were never timed are assumed to be the slowest so
+    they are not left to run last.
+    """
+    if str(day) in history:
+        return history[str(day)]
+
+    baseline_phases = baseline.get("days", {}).get(str(day))
+    if baseline_phases:
+        return sum(stats["median"] for stats in baseline_phases.values())
+
+    return float("inf")
+
+
+def schedule(days: Iterable[Day], history: Optional[dict[str, float]] = None) -> list[Day]:
+    """
+    Orders `days` longest-first according to their expected duration.
+    """
+    history = load_history() if history is None else history
+    baseline = load_baseline()
+    return sorted(days, key=lambda d: expected_duration(d, history, baseline), reverse=True)
+
+
+def _run_day(
+    day: Day,
+    parse_cache: bool,
+    scale: Optional[float],
+    seed: int,
+    profile_dir: Optional[Path],
+    trace_memory: bool,
+    answer_cache: bool,
+    budget: Optional[Budget],
+    trace: bool,
+    count: bool,
+) -> DayResult:
+    """
+    Runs `day` in a worker, on a synthetic input if a `scale` is given. The input is generated by
+    the worker so that generating the inputs of many days runs in parallel too.
+    """
+    if trace:
+        tracing.enable("worker")
+    if count:
+        counters.enable()
+    input_path = generated_input_path(day, scale, seed) if scale is not None else None
+    return run_day(day, input_path, parse_cache, profile_dir, trace_memory, answer_cache, budget)
+
+
+def run_days(
+    days: Iterable[Day],
+    jobs: int,
+    parse_cache: bool = False,
+    scale: Optional[float] = None,
+    seed: int = 0,
+    profile_dir: Optional[Path] = None,
+    trace_memory: bool = False,
+    answer_cache: bool = False,
+    budgets: Optional[dict[str, Budget]] = None,
+    trace: bool = False,
+    count: bool = False,
+) -> Iterator[tuple[Day, Union[DayResult, BaseException]]]:
+    """
+    Runs `days` on a pool of `jobs` worker processes and yields every day as soon as it completes,
+    along with its result or the exception it raised. With a `scale`, days run on synthetic inputs
+    of that scale (see `aoc.generators`) rather than on their puzzle inputs. With a `profile_dir`,
+    the phases of every day are profiled, and their memory usage is reported with `trace_memory`.
+    With `answer_cache`, days whose code and input didn't change return their stored results (see
+    `aoc.runner.run_day`). With `budgets` (see `aoc.budgets`), days that exhaust their budget are
+    yielded with the `BudgetExceeded` they raised, also when the kernel killed their worker. With
+    `trace`, the trace events of every day (see `aoc.tracing`) are recorded by its worker, and with
+    `count` its counters (see `aoc.counters`).
+
+    Every day runs in a fresh worker process of its own (see `aoc.budgets.run_isolated`) so module
+    state and peak RSS measurements of one day do not leak into another, and a worker killed while
+    running a day doesn't fail the others.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {}
+        for day in schedule(days):
+            budget = budget_for(day, budgets) if budgets is not None else None
+            args = (day, parse_cache, scale, seed, profile_dir, trace_memory, answer_cache, budget, trace, count)
+            futures[executor.submit(partial(run_isolated, _run_day, *args, budget=budget))] = day
+
+        for future in concurrent.futures.as_completed(futures):
+            day = futures[future]
+            try:
+                yield day, future.result()
+            except Exception as e:
+                yield day, e
@@ -0,0 +1,151 @@
+"""
+Discovery and loading of daily solution modules.
+
+Every day lives in its own `<YEAR>/<DAY>/` directory and exposes three functions from its
+solution module:
+  - `parse(text)` - Converts the raw puzzle input into whatever structure the day works on.
+  - `part1(parsed)` - Returns the answer to the first part of the puzzle.
+  - `part2(parsed)` - Returns the answer to the second part of the puzzle.
+
+Both parts receive the same parsed object and must not mutate it. Solution modules may also
+declare a `SCALING_BUDGET` for their phases, see `aoc.scaling`, and set `BYTES_INPUT = True` to have
+`parse` receive the `aoc.inputs.PuzzleInput` itself (e.g. to go over its lines as bytes) rather
+than its text. Such a `parse` must not keep views of the input in the parsed object.
+"""
+from dataclasses import dataclass
+import importlib.util
+from pathlib import Path
+import sys
+from types import ModuleType
+from typing import Any, Iterable, Optional
+
+from aoc.inputs import PuzzleInput
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PRIMARY_MODULE_NAME = "solution.py"
+INPUT_FILE_NAME = "input.txt"
+SAMPLE_FILE_NAME = "sample.txt"
+PHASES = ("parse", "part1", "part2")
+
+# Local (git-ignored) state of the tooling, e.g. the timings of earlier runs.
+CACHE_DIR = REPO_ROOT / ".aoc"
+
+
+@dataclass(frozen=True, order=True)
+class Day:
+    year: int
+    day: int
+
+    @property
+    def path(self) -> Path:
+        return REPO_ROOT / str(self.year) / f"{self.day:02d}"
+
+    @property
+    def input_path(self) -> Path:
+        return self.path / INPUT_FILE_NAME
+
+    @property
+    def sample_path(self) -> Path:
+        """
+        The example input given in the puzzle's description, if the day has one.
+        """
+        return self.path / SAMPLE_FILE_NAME
+
+    @property
+    def module_path(self) -> Path:
+        """
+        The module implementing this day. Other `solution*.py` modules of the day are variants of it
+        (see `aoc.compare`).
+        """
+        return self.path / PRIMARY_MODULE_NAME
+
+    @property
+    def module_name(self) -> str:
+        return f"aoc_{self.year}_{self.day:02d}_{self.module_path.stem.replace('-', '_')}"
+
+    def __str__(self):
+        return f"{self.year}/{self.day:02d}"
+
+    @classmethod
+    def from_str(cls, day_str: str) -> "Day":
+        """
+        Parses a day in `YEAR/DAY` format (e.g. `2020/7` or `2020/07`).
+        """
+        year, day = day_str.split("/")
+        return cls(int(year), int(day))
+
+
+def all_days(years: Optional[Iterable[int]] = None) -> list[Day]:
+    """
+    Returns all days that have a solution module, optionally limited to the given `years`, sorted
+    chronologically.
+    """
+    days = []
+    for year_path in REPO_ROOT.glob("[0-9][0-9][0-9][0-9]"):
+        if years is not None and int(year_path.name) not in years:
+            continue
+
+        for day_path in year_path.glob("[0-9][0-9]"):
+            if (day_path / PRIMARY_MODULE_NAME).exists():
+                days.append(Day(int(year_path.name), int(day_path.name)))
+
+    return sorted(days)
+
+
+def select_days(specs: Iterable[str]) -> list[Day]:
+    """
+    Resolves day specifications given on the command line. Each spec is either a year (`2020`),
+    selecting all of its days, or a single day (`2020/7`). No specs select all days.
+    """
+    specs = list(specs)
+    if not specs:
+        return all_days()
+
+    days: set[Day] = set()
+    for spec in specs:
+        if "/" in spec:
+            days.add(Day.from_str(spec))
+        else:
+            days.update(all_days([int(spec)]))
+
+    return sorted(days)
+
+
+def load_module(path: Path, module_name: str) -> ModuleType:
+    """
+    Imports the python file at `path` as a module named `module_name`. Day directories are not
+    python packages (and their names are not valid identifiers) so they are loaded by path.
+    """
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+
+    # Dataclasses (and pickle) look the defining module up in `sys.modules`.
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+
+    return module
+
+
+def load_solution(day: Day) -> ModuleType:
+    """
+    Loads the solution module of `day` and verifies it implements the solution contract.
+    """
+    module = load_module(day.module_path, day.module_name)
+    missing = [phase for phase in PHASES if not callable(getattr(module, phase, None))]
+    if missing:
+        raise AttributeError(f"Solution for {day} is missing: {', '.join(missing)}")
+
+    return module
+
+
+def parse_input(solution: ModuleType, puzzle_input: PuzzleInput) -> Any:
+    """
+    Parses `puzzle_input` with the `parse` function of a loaded `solution` module, passing it the
+    input's text unless the module parses the input's bytes (see `BYTES_INPUT` above).
+    """
+    return solution.parse(puzzle_input if getattr(solution, "BYTES_INPUT", False) else puzzle_input.text)
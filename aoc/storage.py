@@ -0,0 +1,28 @@
+"""
+Helpers shared by the stores of `.aoc/` (stored answers, parsed inputs and generated inputs) and by
+the daemon, which key their entries by digests of their contents.
+"""
+import hashlib
+import os
+from pathlib import Path
+from typing import Union
+
+
+def digest(data: Union[bytes, memoryview]) -> str:
+    """
+    Returns a digest of `data`, short enough to be part of file names.
+    """
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+def write_atomically(path: Path, data: Union[str, bytes]) -> None:
+    """
+    Writes `data` to `path` through a temporary file renamed over it, so that processes running in
+    parallel (e.g. days of a parallel run) never read a partially written file.
+    """
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    if isinstance(data, str):
+        tmp_path.write_text(data)
+    else:
+        tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
@@ -0,0 +1,63 @@
+from pathlib import Path
+import tempfile
+import unittest
+from unittest import mock
+
+from aoc.answers import load_answers, local_imports, source_hash, store_answers
+from aoc.solutions import REPO_ROOT, Day
+
+SOLUTION_TEMPLATE = """
+from aoc.graph import Digraph
+from aoc import grid
+import numpy as np
+
+def parse(text):
+    return [int(l) * {factor} for l in text.splitlines()]
+"""
+
+
+class TestAnswers(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmp.name)
+        self.answers_dir = self.tmp_path / "answers"
+        self.day = Day(1900, 1)
+        path = mock.patch.object(Day, "path", new_callable=mock.PropertyMock, return_value=self.tmp_path)
+        path.start()
+        self.addCleanup(path.stop)
+        self.write_solution(1)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write_solution(self, factor: int):
+        (self.tmp_path / "solution.py").write_text(SOLUTION_TEMPLATE.format(factor=factor))
+
+    def test_local_imports(self):
+        aoc_dir = REPO_ROOT / "aoc"
+        self.assertEqual(
+            local_imports(self.day.module_path),
+            [aoc_dir / "__init__.py", aoc_dir / "graph.py", aoc_dir / "grid.py"],
+        )
+
+    def test_source_hash_follows_the_solution(self):
+        before = source_hash(self.day.module_path)
+        self.assertEqual(source_hash(self.day.module_path), before)
+        self.write_solution(2)
+        self.assertNotEqual(source_hash(self.day.module_path), before)
+
+    def test_stored_answers_are_keyed_by_source_and_input(self):
+        document = {"day": "1900/01", "phases": []}
+        self.assertIsNone(load_answers(self.day, b"1\n", self.answers_dir))
+        store_answers(self.day, b"1\n", document, self.answers_dir)
+        self.assertEqual(load_answers(self.day, b"1\n", self.answers_dir), document)
+        self.assertIsNone(load_answers(self.day, b"2\n", self.answers_dir))
+
+        self.write_solution(2)
+        self.assertIsNone(load_answers(self.day, b"1\n", self.answers_dir))
+        store_answers(self.day, b"1\n", document, self.answers_dir)
+        self.assertEqual(len(list((self.answers_dir / self.day.module_name).iterdir())), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+from pathlib import Path
+import signal
+import tempfile
+import unittest
+from unittest import mock
+
+from aoc import batch, inputs
+from aoc.batch import BatchResult, InputResult, input_paths, run_batch
+from aoc.generators import generate_input
+from aoc.inputs import PuzzleInput
+from aoc.runner import PhaseResult, run_day
+from aoc.solutions import Day
+
+
+run_phases = batch.run_phases
+
+
+def run_phases_or_get_killed(solution, puzzle_input: PuzzleInput) -> list[PhaseResult]:
+    # A solution stuck in native code on this input, which the kernel kills once it exhausts its CPU time.
+    if puzzle_input.text == "killer\n":
+        os.kill(os.getpid(), signal.SIGXCPU)
+    return run_phases(solution, puzzle_input)
+
+
+class TestBatch(unittest.TestCase):
+    def test_every_input_is_solved(self):
+        day = Day(2020, 1)
+        with tempfile.TemporaryDirectory() as tmp:
+            for seed in range(3):
+                (Path(tmp) / f"input-{seed}.txt").write_text(generate_input(day, 1, seed))
+            (Path(tmp) / "invalid.txt").write_text("x\n")
+            (Path(tmp) / ".hidden").write_text("")
+
+            paths = input_paths(Path(tmp))
+            self.assertEqual([p.name for p in paths], ["input-0.txt", "input-1.txt", "input-2.txt", "invalid.txt"])
+            results = {r.path.name: r for r in run_batch(day, paths, jobs=2)}
+            self.assertEqual(set(results), {p.name for p in paths})
+            self.assertIsInstance(results["invalid.txt"].error, ValueError)
+            for seed in range(3):
+                result = results[f"input-{seed}.txt"]
+                self.assertIsNone(result.error)
+                self.assertEqual(result.answers, run_day(day, Path(tmp) / f"input-{seed}.txt").answers)
+
+    def test_killed_worker_fails_its_input_alone(self):
+        day = Day(2020, 1)
+        with tempfile.TemporaryDirectory() as tmp:
+            for seed in range(6):
+                (Path(tmp) / f"input-{seed}.txt").write_text(generate_input(day, 1, seed))
+            (Path(tmp) / "killer.txt").write_text("killer\n")
+
+            # Worker processes are forked with the patched function.
+            with mock.patch.object(batch, "run_phases", run_phases_or_get_killed):
+                results = {r.path.name: r for r in run_batch(day, input_paths(Path(tmp)), jobs=2)}
+
+        self.assertEqual(len(results), 7)
+        self.assertIsNotNone(results.pop("killer.txt").error)
+        self.assertTrue(all(r.error is None for r in results.values()))
+
+    def test_inputs_are_not_kept(self):
+        day = Day(2020, 1)
+        batch._load_solution(day)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "input.txt"
+            path.write_text(generate_input(day, 1, 0))
+            self.assertIsNone(batch._solve(path, None).error)
+            self.assertNotIn(path.resolve(), inputs._loaded)
+
+    def test_summary(self):
+        inputs = [InputResult(Path(f"{i}.txt"), latency=i / 100) for i in range(1, 101)]
+        inputs.append(InputResult(Path("invalid.txt"), error=ValueError()))
+        result = BatchResult(Day(2020, 1), jobs=2, inputs=inputs, wall_time=2)
+        self.assertEqual(result.throughput, 50)
+        self.assertEqual(result.latency_percentiles(), {50: 0.5, 90: 0.9, 99: 0.99})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+from unittest import TestCase
+
+from aoc import bench
+from aoc.solutions import Day
+
+
+class PercentileTests(TestCase):
+    def test_single_value(self):
+        self.assertEqual(bench.percentile([3.0], 95), 3.0)
+
+    def test_median_rank(self):
+        self.assertEqual(bench.percentile([4.0, 1.0, 3.0, 2.0], 50), 2.0)
+
+    def test_p95_of_twenty_values(self):
+        self.assertEqual(bench.percentile([float(i) for i in range(1, 21)], 95), 19.0)
+
+
+class FindRegressionsTests(TestCase):
+    def setUp(self):
+        self.day = Day(2020, 1)
+        self.baseline = {"days": {"2020/01": {"part1": {"median": 0.5, "p95": 0.6}}}}
+
+    def _benchmark(self, median: float) -> bench.DayBenchmark:
+        return bench.DayBenchmark(self.day, {"part1": bench.PhaseStats(median, median)})
+
+    def test_within_threshold(self):
+        self.assertEqual(bench.find_regressions([self._benchmark(0.55)], self.baseline, 0.2), [])
+
+    def test_beyond_threshold(self):
+        regressions = bench.find_regressions([self._benchmark(0.7)], self.baseline, 0.2)
+        self.assertEqual([(r.day, r.phase) for r in regressions], [(self.day, "part1")])
+
+    def test_below_noise_floor(self):
+        baseline = {"days": {"2020/01": {"part1": {"median": 1e-5, "p95": 1e-5}}}}
+        self.assertEqual(bench.find_regressions([self._benchmark(1e-4)], baseline, 0.2), [])
+
+    def test_day_missing_from_baseline(self):
+        self.assertEqual(bench.find_regressions([self._benchmark(10.0)], {}, 0.2), [])
@@ -0,0 +1,93 @@
+import os
+from pathlib import Path
+import pickle
+import resource
+import signal
+import tempfile
+import unittest
+from unittest import mock
+
+from aoc import scheduler
+from aoc.budgets import Budget, BudgetExceeded, budget_for, enforced, load_budgets, run_isolated
+from aoc.runner import DayResult
+from aoc.scheduler import run_days
+from aoc.solutions import Day
+
+CONFIG = """
+[tool.aoc.budgets]
+default = { time = 60, memory = 1024 }
+"2020/7" = { time = 5 }
+"""
+
+
+def kill_self(signum: int) -> None:
+    os.kill(os.getpid(), signum)
+
+
+def run_day_or_get_killed(day: Day, *args) -> DayResult:
+    # A day stuck in native code, which the kernel kills once it exhausts its CPU time.
+    if day == Day(2020, 3):
+        kill_self(signal.SIGXCPU)
+    return DayResult(day)
+
+
+class TestBudgets(unittest.TestCase):
+    def test_day_budgets_override_the_default(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "pyproject.toml"
+            path.write_text(CONFIG)
+            budgets = load_budgets(path)
+
+        self.assertEqual(budget_for(Day(2020, 7), budgets), Budget(time=5, memory=1024))
+        self.assertEqual(budget_for(Day(2020, 8), budgets), Budget(time=60, memory=1024))
+        self.assertEqual(budget_for(Day(2020, 8), {}), Budget())
+
+    def test_time_budget(self):
+        with self.assertRaises(BudgetExceeded) as cm:
+            with enforced(Budget(time=0.1)):
+                while True:
+                    pass
+        self.assertEqual(cm.exception.resource_name, "time")
+        self.assertGreaterEqual(cm.exception.used, 0.1)
+
+    def test_memory_budget(self):
+        limits = resource.getrlimit(resource.RLIMIT_DATA)
+        with self.assertRaises(BudgetExceeded) as cm:
+            with enforced(Budget(memory=512)):
+                bytearray(2**30)
+        self.assertEqual(cm.exception.resource_name, "memory")
+        self.assertEqual(resource.getrlimit(resource.RLIMIT_DATA), limits)
+
+    def test_within_budget(self):
+        with enforced(Budget(time=10, memory=4096)):
+            self.assertEqual(sum(range(1000)), 499500)
+
+    def test_pickled_from_workers(self):
+        e = pickle.loads(pickle.dumps(BudgetExceeded("time", 1, 1.5)))
+        self.assertEqual(e.to_json(), {"budget_exceeded": "time", "limit": 1, "used": 1.5})
+
+    def test_day_exceeding_its_budget(self):
+        budgets = {"2020/15": Budget(time=0.5)}
+        ((day, result),) = run_days([Day(2020, 15)], jobs=1, budgets=budgets)
+        self.assertIsInstance(result, BudgetExceeded)
+
+    def test_run_isolated(self):
+        self.assertEqual(run_isolated(sum, [1, 2]), 3)
+        with self.assertRaises(ValueError):
+            run_isolated(int, "x")
+        with self.assertRaises(BudgetExceeded):
+            run_isolated(kill_self, signal.SIGXCPU, budget=Budget(time=1))
+        with self.assertRaises(ChildProcessError):
+            run_isolated(kill_self, signal.SIGKILL, budget=Budget(time=1))
+
+    def test_killed_day_fails_alone(self):
+        days = [Day(2020, d) for d in (1, 3, 5, 9)]
+        with mock.patch.object(scheduler, "_run_day", run_day_or_get_killed):
+            results = dict(run_days(days, jobs=2, budgets={"default": Budget(time=10)}))
+
+        self.assertIsInstance(results.pop(Day(2020, 3)), BudgetExceeded)
+        self.assertEqual(results, {d: DayResult(d) for d in days if d != Day(2020, 3)})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+from pathlib import Path
+import unittest
+
+from aoc.compare import VariantResult, compare_variants, mismatches, variant_paths
+from aoc.runner import PhaseResult
+from aoc.solutions import Day
+
+
+def variant(name, part1, part2):
+    phases = [PhaseResult("parse", 0, 0, 0), PhaseResult("part1", 0, 0, 0, part1), PhaseResult("part2", 0, 0, 0, part2)]
+    return VariantResult(Path(name), phases)
+
+
+class TestCompare(unittest.TestCase):
+    def test_variant_paths(self):
+        day = Day(2020, 17)
+        self.assertEqual([p.name for p in variant_paths(day)], ["solution.py", "solution_efficient.py"])
+        self.assertEqual([p.name for p in variant_paths(Day(2022, 8))], ["solution.py", "dynamic_solution.py"])
+        self.assertEqual([p.name for p in variant_paths(Day(2020, 1))], ["solution.py"])
+
+    def test_mismatches(self):
+        results = [variant("a.py", 1, 2), variant("b.py", 1, 3), VariantResult(Path("c.py"), error=ValueError())]
+        self.assertEqual(mismatches(results), [(Path("b.py"), "part2")])
+        self.assertEqual(mismatches(results[2:] + results[:2]), [])
+
+    def test_variants_agree(self):
+        results = compare_variants(Day(2022, 2), repeat=1)
+        self.assertEqual([r.path.name for r in results], ["solution.py", "solution2.py"])
+        self.assertTrue(all(r.error is None for r in results))
+        self.assertEqual(mismatches(results), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from aoc import counters
+from aoc.bench import bench_day
+from aoc.runner import run_day
+from aoc.solutions import Day
+
+
+class TestCounters(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(counters.disable)
+
+    def test_counts_are_not_kept_while_disabled(self):
+        counters.add("steps", 3)
+        self.assertFalse(counters.enabled())
+        self.assertEqual(counters.collect(), {})
+
+    def test_collect_resets_counts(self):
+        counters.enable()
+        counters.add("steps", 3)
+        counters.add("steps")
+        counters.add("nodes", 2)
+        self.assertEqual(counters.collect(), {"steps": 4, "nodes": 2})
+        self.assertTrue(counters.enabled())
+        self.assertEqual(counters.disable(), {})
+
+    def test_counts_of_every_phase(self):
+        counters.enable()
+        counters.add("unrelated")
+        result = run_day(Day(2020, 8))
+        parse, part1, part2 = result.phases
+        self.assertEqual(parse.counters, {})
+        self.assertEqual(part1.counters["instructions_executed"], 213)
+        self.assertGreater(part2.counters["instructions_executed"], part1.counters["instructions_executed"])
+        self.assertEqual(result.to_json()["phases"][1]["counters"], part1.counters)
+
+    def test_benchmark_counts(self):
+        document = bench_day(Day(2020, 8), repeat=2, warmup=0).to_json()
+        self.assertNotIn("counters", document["parse"])
+        self.assertEqual(document["part1"]["counters"], {"instructions_executed": 213})
+        self.assertFalse(counters.enabled())
+
+
+if __name__ == "__main__":
+    unittest.main()
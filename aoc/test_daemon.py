@@ -0,0 +1,100 @@
+from pathlib import Path
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from aoc.daemon import Solver, SolverServer, ping, request
+from aoc.runner import DayResult
+from aoc.solutions import Day
+
+SOLUTION_TEMPLATE = """
+def parse(text):
+    return [int(l) * {factor} for l in text.splitlines()]
+
+
+def part1(numbers):
+    return sum(numbers)
+
+
+def part2(numbers):
+    return max(numbers)
+"""
+
+
+class TestSolver(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmp.name)
+        self.day = Day(1900, 1)
+        path = mock.patch.object(Day, "path", new_callable=mock.PropertyMock, return_value=self.tmp_path)
+        path.start()
+        self.addCleanup(path.stop)
+        self.write_solution(1)
+        self.day.input_path.write_text("1\n2\n")
+        self.solver = Solver()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write_solution(self, factor: int):
+        (self.tmp_path / "solution.py").write_text(SOLUTION_TEMPLATE.format(factor=factor))
+
+    def test_parsed_input_is_kept(self):
+        first, second = self.solver.run(self.day), self.solver.run(self.day)
+        self.assertEqual(first.answers, {"part1": 3, "part2": 2})
+        self.assertEqual(second.answers, first.answers)
+        self.assertFalse(first.phases[0].cached)
+        self.assertTrue(second.phases[0].cached)
+
+    def test_changed_solution_is_reloaded(self):
+        self.solver.run(self.day)
+        self.write_solution(10)
+        result = self.solver.run(self.day)
+        self.assertEqual(result.answers, {"part1": 30, "part2": 20})
+        self.assertFalse(result.phases[0].cached)
+
+    def test_changed_input_is_read_again(self):
+        self.solver.run(self.day)
+        self.day.input_path.write_text("1\n2\n3\n")
+        result = self.solver.run(self.day)
+        self.assertEqual(result.answers, {"part1": 6, "part2": 3})
+        self.assertFalse(result.phases[0].cached)
+
+    @mock.patch("aoc.daemon.MAX_LOADED", 2)
+    def test_parsed_inputs_are_bounded(self):
+        paths = [self.tmp_path / f"input{i}.txt" for i in range(3)]
+        for path in paths:
+            path.write_text("1\n2\n")
+            self.solver.run(self.day, path)
+        self.assertTrue(self.solver.run(self.day, paths[2]).phases[0].cached)
+        self.assertFalse(self.solver.run(self.day, paths[0]).phases[0].cached)
+
+    def test_result_round_trip(self):
+        result = self.solver.run(self.day)
+        self.assertEqual(DayResult.from_json(result.to_json()), result)
+
+
+class TestSolverServer(unittest.TestCase):
+    def test_serves_runs_until_stopped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            socket_path = Path(tmp) / "daemon.sock"
+            with SolverServer(socket_path) as server:
+                thread = threading.Thread(target=server.serve_forever)
+                thread.start()
+
+                self.assertIsNotNone(ping(socket_path))
+                response = request({"command": "run", "day": "2020/01"}, socket_path)
+                self.assertEqual(set(DayResult.from_json(response["result"]).answers), {"part1", "part2"})
+                self.assertIn("error", request({"command": "run", "day": "1900/01"}, socket_path))
+
+                request({"command": "stop"}, socket_path)
+                thread.join(timeout=5)
+                self.assertFalse(thread.is_alive())
+
+            self.assertFalse(socket_path.exists())
+            self.assertIsNone(ping(socket_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+
+from aoc.runner import run_day
+from aoc.solutions import Day, load_module
+
+# Deeper than python recursion can go, so that solutions recursing once per level fail.
+DEPTH = 100_000
+
+
+def load_variant(day: Day, name: str = "solution"):
+    return load_module(day.path / f"{name}.py", f"aoc_test_deep_inputs_{day.year}_{day.day:02d}_{name}")
+
+
+class TestDeepInputs(unittest.TestCase):
+    def setUp(self):
+        self.assertGreater(DEPTH, sys.getrecursionlimit())
+
+    def test_2020_08_jump_chain(self):
+        # Every instruction leads to the next one, up to a jump back to the first one.
+        solution = load_variant(Day(2020, 8), "solution_o_of_n")
+        lines = ["acc +1"] * DEPTH + [f"jmp -{DEPTH}", "acc +1000"]
+        program = solution.parse("\n".join(lines))
+        self.assertEqual(solution.part1(program), DEPTH)
+        self.assertEqual(solution.part2(program), DEPTH + 1000)
+
+    def test_2020_10_adapter_chain(self):
+        # Adapters 3 jolts apart, all of them required.
+        solution = load_variant(Day(2020, 10))
+        adapters = solution.parse("\n".join(str(3 * i) for i in range(1, DEPTH + 1)))
+        self.assertEqual(solution.part2(adapters), 1)
+
+    def test_2022_07_directory_chain(self):
+        # Directories nested in each other, each holding a file of size 1.
+        solution = load_variant(Day(2022, 7))
+        lines = ["$ cd /"] + ["$ ls", "dir d", "1 f", "$ cd d"] * DEPTH
+        root = solution.parse("\n".join(lines))
+        self.assertEqual(root.size, DEPTH)
+        self.assertEqual(solution.part1(root), DEPTH * (DEPTH + 1) // 2)
+
+        # Through the runner, the parsed input being too deep to be pickled into the parse cache.
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = Path(tmp) / "input.txt"
+            input_path.write_text("\n".join(lines))
+            result = run_day(Day(2022, 7), input_path, parse_cache=True)
+        self.assertEqual(result.answers["part1"], DEPTH * (DEPTH + 1) // 2)
+
+    def test_2022_08_wide_map(self):
+        # A single row of trees, every one of them visible from above and below.
+        solution = load_variant(Day(2022, 8), "dynamic_solution")
+        tree_map = solution.parse("0" * DEPTH)
+        self.assertEqual(solution.part1(tree_map), DEPTH)
+        self.assertEqual(solution.part2(tree_map), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
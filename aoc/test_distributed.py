@@ -0,0 +1,58 @@
+import json
+import multiprocessing
+from pathlib import Path
+import socket
+import tempfile
+import unittest
+
+from aoc.distributed import Coordinator, make_jobs, parse_address, run_worker
+from aoc.generators import generate_input
+from aoc.runner import run_day
+from aoc.solutions import Day
+
+
+class TestDistributed(unittest.TestCase):
+    def test_parse_address(self):
+        self.assertEqual(parse_address("example.com:1234"), ("example.com", 1234))
+        self.assertEqual(parse_address(":1234"), ("", 1234))
+        self.assertEqual(parse_address("example.com"), ("example.com", 8642))
+
+    def test_jobs_run_on_several_workers(self):
+        day = Day(2020, 1)
+        with tempfile.TemporaryDirectory() as tmp:
+            for seed in range(6):
+                (Path(tmp) / f"input-{seed}.txt").write_text(generate_input(day, 1, seed))
+            (Path(tmp) / "invalid.txt").write_text("x\n")
+            jobs = make_jobs([day], Path(tmp))
+            expected = {p.name: run_day(day, p).answers for p in Path(tmp).glob("input-*.txt")}
+
+        coordinator = Coordinator(jobs, ("localhost", 0))
+        self.addCleanup(coordinator.server_close)
+        coordinator.start()
+
+        # A worker that takes a job and leaves without running it, which hands the job to another one.
+        with socket.create_connection(("localhost", coordinator.port)) as s, s.makefile("rwb") as f:
+            f.write(json.dumps({"type": "ready"}).encode() + b"\n")
+            f.flush()
+            self.assertEqual(json.loads(f.readline())["type"], "job")
+
+        workers = [
+            multiprocessing.Process(target=run_worker, args=(("localhost", coordinator.port),)) for _ in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+
+        results = {r.job.name: r for r in coordinator.results()}
+        for worker in workers:
+            worker.join(timeout=10)
+            self.assertEqual(worker.exitcode, 0)
+
+        self.assertEqual(set(results), {job.name for job in jobs})
+        self.assertIn("ValueError", results["invalid.txt"].error)
+        for name, answers in expected.items():
+            self.assertIsNone(results[name].error)
+            self.assertEqual(results[name].result.answers, answers)
+
+
+if __name__ == "__main__":
+    unittest.main()
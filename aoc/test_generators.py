@@ -0,0 +1,46 @@
+from pathlib import Path
+import tempfile
+import unittest
+
+from aoc.generators import generate_input, generated_input_path, has_generator, primes, scaled, scaled_side
+from aoc.inputs import PuzzleInput
+from aoc.solutions import Day, all_days, load_solution, parse_input
+
+
+class TestGenerators(unittest.TestCase):
+    def test_scaling(self):
+        self.assertEqual(scaled(1000, 10), 10000)
+        self.assertEqual(scaled(5, 0.01), 1)
+        self.assertEqual(scaled_side(100, 100), 1000)
+
+    def test_primes(self):
+        self.assertEqual(primes(5, 10), [11, 13, 17, 19, 23])
+        self.assertEqual(len(primes(1000, 2)), 1000)
+
+    def test_deterministic_per_seed(self):
+        day = Day(2020, 10)
+        self.assertEqual(generate_input(day, 2, seed=1), generate_input(day, 2, seed=1))
+        self.assertNotEqual(generate_input(day, 2, seed=1), generate_input(day, 2, seed=2))
+
+    def test_scale_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            generate_input(Day(2020, 10), 0)
+
+    def test_generated_inputs_are_stored(self):
+        day = Day(2020, 10)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = generated_input_path(day, 3, 1, Path(tmp))
+            self.assertEqual(path.read_text(), generate_input(day, 3, 1))
+            self.assertEqual(generated_input_path(day, 3, 1, Path(tmp)), path)
+            self.assertNotEqual(generated_input_path(day, 3, 2, Path(tmp)), path)
+
+    def test_generated_inputs_parse(self):
+        for day in all_days():
+            if not has_generator(day):
+                continue
+            with self.subTest(day=str(day)):
+                parse_input(load_solution(day), PuzzleInput.from_bytes(generate_input(day, 1).encode()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import math
+import unittest
+
+import numpy as np
+
+from aoc.graph import Digraph, NodeIndex, SearchStats, astar, bfs, dijkstra, floyd_warshall, topological_sort
+
+
+class TestGraph(unittest.TestCase):
+    def setUp(self):
+        # 0 -> 1 -> 3, 0 -> 2 -> 3 where the path through 2 is lighter, 4 is unreachable.
+        self.graph = Digraph.from_edges(5, [(0, 1, 1), (1, 3, 5), (0, 2, 2), (2, 3, 1)])
+
+    def test_csr_layout(self):
+        self.assertEqual(self.graph.offsets, [0, 2, 3, 4, 4, 4])
+        self.assertEqual(sorted(self.graph.edges(0)), [(1, 1), (2, 2)])
+        self.assertEqual(self.graph.reversed().neighbours(3), [1, 2])
+
+    def test_bfs(self):
+        stats = SearchStats()
+        self.assertEqual(bfs(self.graph, [0], stats=stats), [0, 1, 1, 2, -1])
+        self.assertEqual(stats.nodes_expanded, 4)
+        self.assertEqual(stats.frontier_peak, 2)
+
+    def test_dijkstra(self):
+        self.assertEqual(dijkstra(self.graph, [0]), [0, 1, 2, 3, math.inf])
+        self.assertEqual(dijkstra(self.graph, [0], target=3)[3], 3)
+
+    def test_astar(self):
+        self.assertEqual(astar(self.graph, 0, 3, lambda n: 0), 3)
+        self.assertEqual(astar(self.graph, 0, 4, lambda n: 0), math.inf)
+
+    def test_floyd_warshall(self):
+        distances = floyd_warshall(self.graph)
+        self.assertEqual(distances[0, 3], 3)
+        self.assertEqual(distances[1, 3], 5)
+        self.assertTrue(np.isinf(distances[3, 0]))
+
+    def test_topological_sort(self):
+        order = topological_sort(self.graph)
+        for source in range(len(self.graph)):
+            for target in self.graph.neighbours(source):
+                self.assertLess(order.index(source), order.index(target))
+
+        self.assertEqual(topological_sort(self.graph, [3, 1, 0]), [0, 1, 3])
+        with self.assertRaises(ValueError):
+            topological_sort(Digraph.from_edges(2, [(0, 1), (1, 0)]))
+        with self.assertRaises(ValueError):
+            topological_sort(Digraph.from_edges(1, [(0, 0)]))
+
+    def test_node_index(self):
+        index = NodeIndex(["AA", "BB"])
+        self.assertEqual((index["BB"], index["CC"], len(index)), (1, 2, 3))
+        self.assertEqual(index.labels, ["AA", "BB", "CC"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+
+from aoc.grid import ORTHOGONAL_OFFSETS, Grid
+
+TEXT = """\
+#.#
+.L.
+L.#"""
+
+
+class TestGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid.from_text(TEXT)
+
+    def test_from_text(self):
+        self.assertEqual(self.grid.shape, (3, 3))
+        self.assertEqual(self.grid.padded.shape, (5, 5))
+        self.assertEqual(self.grid[1, 1], "L")
+        self.assertEqual(self.grid.to_text(), TEXT)
+
+    def test_uneven_rows(self):
+        with self.assertRaises(ValueError):
+            Grid.from_text("ab\nc")
+
+    def test_flat_indexes(self):
+        index = self.grid.index((2, 0))
+        self.assertEqual(self.grid.position(index), (2, 0))
+        self.assertEqual(chr(self.grid.flat[index]), "L")
+        self.assertEqual(self.grid.indexes("L").tolist(), [self.grid.index((1, 1)), index])
+
+    def test_shifted(self):
+        # Every cell looking at the cell above it, the top row looks at the padding.
+        np.testing.assert_array_equal(self.grid.shifted((-1, 0))[0], [0, 0, 0])
+        self.assertEqual(chr(self.grid.shifted((-1, 0))[1, 2]), "#")
+        with self.assertRaises(ValueError):
+            self.grid.shifted((2, 0))
+
+    def test_neighbour_count(self):
+        np.testing.assert_array_equal(self.grid.neighbour_count("#"), [[0, 2, 0], [1, 3, 2], [0, 1, 0]])
+
+    def test_sight_table(self):
+        seats = self.grid.indexes("L#")
+        table = self.grid.sight_table(seats, "L#", ORTHOGONAL_OFFSETS)
+
+        # The seat at the top left sees the seats at the top right and bottom left corners, looking
+        # up it sees the padding past the edge.
+        top_left = table[0]
+        self.assertEqual(self.grid.position(top_left[1]), (0, 2))
+        self.assertEqual(self.grid.position(top_left[2]), (2, 0))
+        self.assertEqual(self.grid.position(top_left[0]), (-1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import sys
+import unittest
+
+from aoc.importtime import MARKER, measure_imports, parse_importtime
+from aoc.lazy import lazy_import
+from aoc.solutions import Day
+
+IMPORTTIME_OUTPUT = f"""import time: self [us] | cumulative | imported package
+import time:       100 |        100 | aoc.solutions
+{MARKER}import
+import time:       300 |        300 |   regex._regex
+import time:       200 |        500 | regex
+{MARKER}part1
+import time:      1000 |       1000 | sympy.ntheory
+Traceback (most recent call last):
+"""
+
+
+class TestImportTime(unittest.TestCase):
+    def test_parse_importtime(self):
+        steps = parse_importtime(IMPORTTIME_OUTPUT.splitlines())
+        self.assertEqual(set(steps), {"import", "part1"})
+        self.assertEqual(steps["import"].packages, {"regex": 500e-6})
+        self.assertEqual(steps["part1"].packages, {"sympy": 1000e-6})
+        self.assertAlmostEqual(steps["part1"].total, 1000e-6)
+
+    def test_lazy_imports_are_made_by_the_phase_using_them(self):
+        steps = {s.step: s for s in measure_imports(Day(2020, 13))}
+        self.assertNotIn("sympy", steps["import"].packages)
+        self.assertIn("sympy", steps["part2"].packages)
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_imported_on_first_use(self):
+        sys.modules.pop("colorsys", None)
+        colorsys = lazy_import("colorsys")
+        self.assertNotIn("colorsys", sys.modules)
+        self.assertEqual(colorsys.rgb_to_hsv(1, 0, 0), (0, 1, 1))
+        self.assertIn("colorsys", sys.modules)
+        self.assertIs(lazy_import("colorsys"), sys.modules["colorsys"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+from pathlib import Path
+import tempfile
+import unittest
+from unittest import mock
+
+from aoc import inputs
+from aoc.inputs import PuzzleInput, load_input
+
+
+class TestPuzzleInput(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write_input(self, data: bytes, name: str = "input.txt") -> Path:
+        path = self.tmp_path / name
+        path.write_bytes(data)
+        return path
+
+    def test_text(self):
+        puzzle_input = PuzzleInput(self.write_input("ab\r\ncd\n\nçf".encode()))
+        self.assertEqual(puzzle_input.text, "ab\r\ncd\n\nçf")
+        self.assertIs(puzzle_input.text, puzzle_input.text)
+
+    def test_lines_and_blocks(self):
+        puzzle_input = PuzzleInput(self.write_input(b"ab\r\ncd\n\n\nef\n"))
+        self.assertEqual([bytes(l) for l in puzzle_input.lines()], [b"ab", b"cd", b"", b"", b"ef"])
+        self.assertEqual([[bytes(l) for l in b] for b in puzzle_input.blocks()], [[b"ab", b"cd"], [b"ef"]])
+        self.assertTrue(all(isinstance(l, memoryview) for l in puzzle_input.lines()))
+
+    def test_from_bytes(self):
+        puzzle_input = PuzzleInput.from_bytes(b"1\n2")
+        self.assertEqual(([bytes(l) for l in puzzle_input.lines()], puzzle_input.text), ([b"1", b"2"], "1\n2"))
+
+    def test_empty_input(self):
+        puzzle_input = PuzzleInput(self.write_input(b""))
+        self.assertEqual((puzzle_input.text, len(puzzle_input), list(puzzle_input.lines())), ("", 0, []))
+
+    def test_loaded_once_per_process(self):
+        path = self.write_input(b"1\n")
+        self.assertIs(load_input(path), load_input(self.tmp_path / "." / "input.txt"))
+
+    def test_loaded_inputs_are_bounded(self):
+        paths = [self.write_input(b"1\n", f"input{i}.txt") for i in range(3)]
+        with mock.patch.object(inputs, "MAX_LOADED", 2), mock.patch.object(inputs, "_loaded", inputs._loaded.copy()):
+            first = load_input(paths[0])
+            load_input(paths[1])
+            self.assertIs(load_input(paths[0]), first)
+            load_input(paths[2])
+            self.assertIs(load_input(paths[0]), first)
+            self.assertNotIn(paths[1].resolve(), inputs._loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import random
+import unittest
+
+import numpy as np
+
+from aoc.intervals import IntervalSet, OffsetMapping
+
+
+def covered(intervals):
+    return {v for start, end in intervals for v in range(start, end)}
+
+
+class TestIntervalSet(unittest.TestCase):
+    def random_intervals(self, rng, n=8):
+        return [(s, s + rng.randint(0, 6)) for s in (rng.randint(-20, 20) for _ in range(n))]
+
+    def test_from_intervals_merges(self):
+        s = IntervalSet.from_intervals([(5, 7), (0, 2), (1, 3), (3, 4), (9, 9)])
+        self.assertEqual(list(s), [(0, 4), (5, 7)])
+        self.assertEqual(s.size, 6)
+
+    def test_membership(self):
+        s = IntervalSet.from_intervals([(0, 2), (5, 7)])
+        self.assertEqual([v in s for v in range(-1, 8)], [v in {0, 1, 5, 6} for v in range(-1, 8)])
+        self.assertEqual(s.contains(np.array([1, 2, 6])).tolist(), [True, False, True])
+        self.assertEqual(IntervalSet.empty().contains(np.array([1])).tolist(), [False])
+
+    def test_set_operations(self):
+        rng = random.Random(2023)
+        for _ in range(200):
+            a_intervals, b_intervals = self.random_intervals(rng), self.random_intervals(rng)
+            a, b = IntervalSet.from_intervals(a_intervals), IntervalSet.from_intervals(b_intervals)
+            a_values, b_values = covered(a_intervals), covered(b_intervals)
+            self.assertEqual(covered(a | b), a_values | b_values)
+            self.assertEqual(covered(a & b), a_values & b_values)
+            self.assertEqual(covered(a - b), a_values - b_values)
+
+
+class TestOffsetMapping(unittest.TestCase):
+    def test_call(self):
+        m = OffsetMapping.from_ranges([(0, 5, 10), (5, 7, -5), (10, 12, 1)])
+        self.assertEqual(m(np.arange(-1, 13)).tolist(), [-1, 10, 11, 12, 13, 14, 0, 1, 7, 8, 9, 11, 12, 12])
+
+    def test_compose_and_map_intervals(self):
+        rng = random.Random(5)
+        for _ in range(100):
+            first = OffsetMapping.from_ranges([(0, 10, rng.randint(-15, 15)), (12, 20, rng.randint(-15, 15))])
+            second = OffsetMapping.from_ranges([(rng.randint(-20, 0), rng.randint(1, 25), rng.randint(-15, 15))])
+            values = np.arange(-40, 40)
+            composed = first.compose(second)
+            self.assertEqual(composed(values).tolist(), second(first(values)).tolist())
+
+            intervals = [(-5, 3), (8, 14)]
+            mapped = composed.map_intervals(IntervalSet.from_intervals(intervals))
+            self.assertEqual(covered(mapped), set(composed(np.array(sorted(covered(intervals)))).tolist()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+from pathlib import Path
+import tempfile
+import unittest
+
+from aoc import counters, memo as memo_module
+from aoc.memo import estimate_size, memo
+
+
+class TestMemo(unittest.TestCase):
+    def test_hits_and_misses(self):
+        calls = []
+
+        @memo()
+        def square(n: int, offset: int = 0) -> int:
+            calls.append(n)
+            return n * n + offset
+
+        self.assertEqual([square(2), square(3), square(2), square(2, offset=1)], [4, 9, 4, 5])
+        self.assertEqual(calls, [2, 3, 2])
+        stats = square.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions, stats.entries), (1, 3, 0, 3))
+
+        square.clear()
+        square(2)
+        self.assertEqual(calls, [2, 3, 2, 2])
+
+    def test_least_recently_used_are_evicted(self):
+        @memo(max_entries=2)
+        def identity(n: int) -> int:
+            return n
+
+        for n in (1, 2, 1, 3):
+            identity(n)
+        self.assertEqual(identity.stats().evictions, 1)
+        identity(1)
+        self.assertEqual(identity.stats().hits, 2)
+        identity(2)
+        self.assertEqual(identity.stats().misses, 4)
+
+    def test_bounded_by_bytes(self):
+        @memo(max_bytes=5_000)
+        def zeros(n: int) -> list[int]:
+            return [0] * n
+
+        for n in range(100, 110):
+            zeros(n)
+        stats = zeros.stats()
+        self.assertLessEqual(stats.bytes, 5_000)
+        self.assertGreater(stats.evictions, 0)
+        self.assertEqual(stats.entries + stats.evictions, 10)
+
+    def test_unhashable_arguments(self):
+        @memo()
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        with self.assertRaisesRegex(TypeError, "pass a key"):
+            total([1, 2])
+
+        @memo(key=tuple)
+        def keyed_total(values: list[int]) -> int:
+            return sum(values)
+
+        self.assertEqual(keyed_total([1, 2]) + keyed_total([1, 2]), 6)
+        self.assertEqual(keyed_total.stats().hits, 1)
+
+    def test_run_scope(self):
+        @memo()
+        def run_scoped(n: int) -> int:
+            return n
+
+        @memo(scope="process")
+        def process_scoped(n: int) -> int:
+            return n
+
+        run_scoped(1)
+        process_scoped(1)
+        memo_module.start_run()
+        self.assertEqual(run_scoped.stats().entries, 0)
+        self.assertEqual(process_scoped.stats().entries, 1)
+        self.assertEqual(process_scoped.stats().misses, 0)
+
+        with self.assertRaises(ValueError):
+            memo(scope="forever")
+
+    def test_counters(self):
+        @memo()
+        def counted(n: int) -> int:
+            return n
+
+        counters.enable()
+        self.addCleanup(counters.disable)
+        counted(1)
+        counted(1)
+        memo_module.add_counters()
+        memo_module.add_counters()
+        name = counted.__qualname__
+        counts = {n: c for n, c in counters.collect().items() if n.startswith(name)}
+        self.assertEqual(counts, {f"{name}.memo_hits": 1, f"{name}.memo_misses": 1})
+
+    def test_persistent(self):
+        calls = []
+
+        @memo(persistent=True)
+        def square(n: int) -> int:
+            calls.append(n)
+            return n * n
+
+        square(2)
+        with tempfile.TemporaryDirectory() as tmp:
+            memo_module.enable_persistence(Path(tmp) / "memos.sqlite")
+            self.addCleanup(memo_module.disable_persistence)
+            square(3)
+            memo_module.flush()
+
+            memo_module.start_run()
+            self.assertEqual([square(2), square(3)], [4, 9])
+            self.assertEqual(calls, [2, 3, 2])
+            self.assertEqual(square.stats().persisted_hits, 1)
+
+    def test_estimate_size(self):
+        shared = (1, 2, 3)
+        self.assertLess(estimate_size([shared, shared]), estimate_size([shared, (1, 2, 4)]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import threading
+import time
+import tracemalloc
+import unittest
+from unittest import mock
+
+from aoc.memory import PeakSampler, traced
+
+
+class Point:
+    pass
+
+
+class TestTraced(unittest.TestCase):
+    def test_peak_of_freed_memory(self):
+        with traced() as report:
+            hog = [bytearray(1000) for _ in range(10_000)]
+            # Gives the sampler time to snapshot the allocations before they are freed.
+            time.sleep(0.1)
+            del hog
+
+        self.assertGreater(report.peak, 10_000_000)
+        self.assertLess(report.retained, 1_000_000)
+        self.assertIn("test_memory.py", report.top_sites[0].location)
+        self.assertGreater(report.top_sites[0].size, 5_000_000)
+
+    def test_new_objects(self):
+        with traced() as report:
+            kept = [Point() for _ in range(1000)]
+
+        self.assertIn(("Point", 1000), report.object_counts)
+        self.assertGreater(report.retained, 0)
+        del kept
+
+    def test_nothing_allocated(self):
+        # The sampler takes no snapshot of a block allocating nothing.
+        with mock.patch.object(PeakSampler, "sample"), traced() as report:
+            pass
+
+        self.assertLess(report.peak, 1000)
+        self.assertEqual(report.top_sites, [])
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_exception(self):
+        threads = threading.active_count()
+        with self.assertRaises(ValueError), traced():
+            raise ValueError()
+
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(threading.active_count(), threads)
+
+
+if __name__ == "__main__":
+    unittest.main()
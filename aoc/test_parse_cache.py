@@ -0,0 +1,71 @@
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from aoc.inputs import PuzzleInput
+from aoc.parse_cache import cached_parse
+from aoc.solutions import load_module
+
+SOLUTION_TEMPLATE = """
+def parse(text):
+    return [int(l) * {factor} for l in text.splitlines()]
+"""
+
+HELPER_SOLUTION = """
+from aoc_test_parse_cache_helpers import FACTOR
+
+def parse(text):
+    return [int(l) * FACTOR for l in text.splitlines()]
+"""
+
+
+class TestCachedParse(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmp.name)
+        self.cache_dir = self.tmp_path / "parsed"
+        self.module_path = self.tmp_path / "solution.py"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def load_solution(self, factor: int):
+        self.module_path.write_text(SOLUTION_TEMPLATE.format(factor=factor))
+        return load_module(self.module_path, "aoc_test_parse_cache_solution")
+
+    def test_warm_run_loads_from_cache(self):
+        solution = self.load_solution(1)
+        self.assertEqual(cached_parse(solution, PuzzleInput.from_bytes(b"1\n2\n"), self.cache_dir), ([1, 2], False))
+        self.assertEqual(cached_parse(solution, PuzzleInput.from_bytes(b"1\n2\n"), self.cache_dir), ([1, 2], True))
+        self.assertEqual(cached_parse(solution, PuzzleInput.from_bytes(b"3\n"), self.cache_dir), ([3], False))
+
+    def test_parser_change_evicts_stale_entries(self):
+        cached_parse(self.load_solution(1), PuzzleInput.from_bytes(b"1\n2\n"), self.cache_dir)
+        solution = self.load_solution(10)
+        self.assertEqual(cached_parse(solution, PuzzleInput.from_bytes(b"1\n2\n"), self.cache_dir), ([10, 20], False))
+        self.assertEqual(len(list((self.cache_dir / solution.__name__).iterdir())), 1)
+
+    def test_helper_change_misses_the_cache(self):
+        # The solution imports a helper module of the "repository", as days import `aoc.grid`.
+        for patch in (mock.patch("aoc.answers.REPO_ROOT", self.tmp_path), mock.patch.object(sys, "path", sys.path[:])):
+            patch.start()
+            self.addCleanup(patch.stop)
+        sys.path.insert(0, str(self.tmp_path))
+        self.addCleanup(sys.modules.pop, "aoc_test_parse_cache_helpers", None)
+
+        helper_path = self.tmp_path / "aoc_test_parse_cache_helpers.py"
+        self.module_path.write_text(HELPER_SOLUTION)
+        helper_path.write_text("FACTOR = 1\n")
+        solution = load_module(self.module_path, "aoc_test_parse_cache_solution")
+        self.assertEqual(cached_parse(solution, PuzzleInput.from_bytes(b"1\n"), self.cache_dir), ([1], False))
+
+        helper_path.write_text("FACTOR = 10\n")
+        sys.modules.pop("aoc_test_parse_cache_helpers")
+        solution = load_module(self.module_path, "aoc_test_parse_cache_solution")
+        self.assertEqual(cached_parse(solution, PuzzleInput.from_bytes(b"1\n"), self.cache_dir), ([10], False))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import cProfile
+from pathlib import Path
+import pstats
+import random
+import tempfile
+import time
+import types
+import unittest
+
+from aoc.profiling import collapsed_stacks, save_profile, top_functions
+
+
+def leaf():
+    time.sleep(0.02)
+
+
+def middle():
+    leaf()
+    leaf()
+
+
+def recursive(n):
+    if n > 0:
+        recursive(n - 1)
+    else:
+        leaf()
+
+
+def root():
+    middle()
+    recursive(3)
+
+
+def step(chain):
+    if chain:
+        chain[0](chain[1:])
+
+
+def layered_chains(width, depth, count):
+    """
+    Returns a function making `count` calls through `depth` layers of `width` functions each, every
+    function calling each function of the next layer at some point, so that the call graph has
+    `width ** depth` paths.
+    """
+    layers = [
+        [types.FunctionType(step.__code__.replace(co_name=f"step_{l}_{i}"), globals()) for i in range(width)]
+        for l in range(depth)
+    ]
+    rng = random.Random(0)
+    chains = [[rng.choice(layer) for layer in layers] for _ in range(count)]
+    return lambda: [step(chain) for chain in chains]
+
+
+def labels(stack):
+    return tuple(frame.split(" ")[0] for frame in stack)
+
+
+class TestCollapsedStacks(unittest.TestCase):
+    def setUp(self):
+        self.profile = cProfile.Profile()
+        self.profile.runcall(root)
+
+    def test_stacks_follow_calls(self):
+        stacks = {labels(stack): time for stack, time in collapsed_stacks(pstats.Stats(self.profile)).items()}
+        self.assertIn(("root", "middle", "leaf"), stacks)
+        self.assertIn(("root", "recursive", "leaf"), stacks)
+        self.assertFalse(any("_lsprof" in frame for stack in stacks for frame in stack))
+
+        # Twice as many calls to `leaf` under `middle` than under the recursion.
+        under_middle = sum(t for s, t in stacks.items() if s[:3] == ("root", "middle", "leaf"))
+        under_recursion = sum(t for s, t in stacks.items() if s[:3] == ("root", "recursive", "leaf"))
+        self.assertAlmostEqual(under_middle / under_recursion, 2, delta=0.5)
+
+    def test_shared_callees(self):
+        profile = cProfile.Profile()
+        profile.runcall(layered_chains(width=4, depth=15, count=2000))
+        stats = pstats.Stats(profile)
+
+        start = time.perf_counter()
+        stacks = collapsed_stacks(stats)
+        self.assertLess(time.perf_counter() - start, 5)
+
+        # Paths cut short keep the time spent under them.
+        total = sum(entry[3] for (_, _, name), entry in stats.stats.items() if name == "<lambda>")
+        self.assertAlmostEqual(sum(stacks.values()), total, delta=total * 0.01)
+
+    def test_saved_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            pstats_path = save_profile(self.profile, Path(tmp), "part1")
+            self.assertEqual(pstats_path, Path(tmp) / "part1.pstats")
+            folded = (Path(tmp) / "part1.folded").read_text().splitlines()
+            self.assertTrue(all(line.rsplit(" ", 1)[1].isdigit() for line in folded))
+            self.assertIn("middle", top_functions(pstats_path, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
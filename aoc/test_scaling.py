@@ -0,0 +1,49 @@
+import io
+import unittest
+
+from aoc.scaling import DayScaling, PhaseScaling, ScalingPoint, fit_exponent, write_csv
+from aoc.solutions import Day
+
+
+class TestFitExponent(unittest.TestCase):
+    def test_power_laws(self):
+        sizes = [100, 200, 400, 800]
+        self.assertAlmostEqual(fit_exponent(sizes, [s * 1e-6 for s in sizes]), 1)
+        self.assertAlmostEqual(fit_exponent(sizes, [s**2 * 1e-9 for s in sizes]), 2)
+        self.assertAlmostEqual(fit_exponent(sizes, [5e-3] * len(sizes)), 0)
+
+    def test_unfittable(self):
+        self.assertIsNone(fit_exponent([100, 100], [1.0, 2.0]))
+        self.assertIsNone(fit_exponent([100], [1.0]))
+        self.assertIsNone(fit_exponent([100, 200], [0.0, 1.0]))
+
+
+class TestBudget(unittest.TestCase):
+    def test_exceeds_budget(self):
+        self.assertFalse(PhaseScaling("part1", 1.2, 1).exceeds_budget(0.25))
+        self.assertTrue(PhaseScaling("part1", 1.3, 1).exceeds_budget(0.25))
+        self.assertFalse(PhaseScaling("part1", 3.0, None).exceeds_budget())
+        self.assertFalse(PhaseScaling("part1", None, 1).exceeds_budget())
+
+
+class TestCsv(unittest.TestCase):
+    def test_rows(self):
+        result = DayScaling(
+            Day(1999, 1),
+            [ScalingPoint(1, 10, {"part1": 0.5}), ScalingPoint(2, 20, {"part1": 1.0})],
+            {"part1": PhaseScaling("part1", 1.0, None)},
+        )
+        f = io.StringIO()
+        write_csv([result], f)
+        self.assertEqual(
+            f.getvalue().splitlines(),
+            [
+                "day,phase,scale,input_size,seconds,exponent,budget",
+                "1999/01,part1,1,10,0.5,1.000,",
+                "1999/01,part1,2,20,1,1.000,",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+
+from aoc.scheduler import expected_duration, schedule
+from aoc.solutions import Day
+
+
+class TestSchedule(unittest.TestCase):
+    def test_history_takes_precedence_over_baseline(self):
+        baseline = {"days": {"1999/01": {"parse": {"median": 1.0}, "part1": {"median": 2.0}}}}
+        self.assertEqual(expected_duration(Day(1999, 1), {"1999/01": 0.5}, baseline), 0.5)
+        self.assertEqual(expected_duration(Day(1999, 1), {}, baseline), 3.0)
+
+    def test_unknown_days_are_scheduled_first(self):
+        days = [Day(1999, 1), Day(1999, 2), Day(1999, 3)]
+        history = {"1999/01": 1.0, "1999/02": 5.0}
+        self.assertEqual(schedule(days, history)[0], Day(1999, 3))
+
+    def test_longest_first(self):
+        days = [Day(1999, 1), Day(1999, 2), Day(1999, 3)]
+        history = {"1999/01": 1.0, "1999/02": 5.0, "1999/03": 2.0}
+        self.assertEqual(schedule(days, history), [Day(1999, 2), Day(1999, 3), Day(1999, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+from pathlib import Path
+import tempfile
+import unittest
+
+from aoc.storage import digest, write_atomically
+
+
+class TestDigest(unittest.TestCase):
+    def test_views_digest_as_their_bytes(self):
+        self.assertEqual(digest(memoryview(b"abc")[1:]), digest(b"bc"))
+        self.assertNotEqual(digest(b"abc"), digest(b"abd"))
+
+
+class TestWriteAtomically(unittest.TestCase):
+    def test_replaces_without_leaving_temporary_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "entry.json"
+            write_atomically(path, "old")
+            write_atomically(path, b"new")
+            self.assertEqual(path.read_text(), "new")
+            self.assertEqual(list(Path(tmp).iterdir()), [path])
+
+
+if __name__ == "__main__":
+    unittest.main()
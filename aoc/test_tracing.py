@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+import tempfile
+import unittest
+
+from aoc import tracing
+from aoc.runner import run_day
+from aoc.scheduler import run_days
+from aoc.solutions import Day
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(tracing.disable)
+
+    def test_spans_are_not_recorded_while_disabled(self):
+        with tracing.span("step"):
+            pass
+        self.assertFalse(tracing.enabled())
+        self.assertEqual(tracing.collect(), [])
+
+    def test_nested_spans(self):
+        tracing.enable("test")
+        with tracing.span("outer"):
+            with tracing.span("inner", step=1):
+                pass
+
+        metadata, inner, outer = tracing.disable()
+        self.assertEqual(metadata["args"], {"name": "test"})
+        self.assertEqual((inner["name"], inner["args"]), ("inner", {"step": 1}))
+        self.assertEqual(outer["name"], "outer")
+        self.assertLessEqual(outer["ts"], inner["ts"])
+        self.assertGreaterEqual(outer["ts"] + outer["dur"], inner["ts"] + inner["dur"])
+        self.assertEqual(tracing.collect(), [])
+
+    def test_day_spans(self):
+        tracing.enable("test")
+        result = run_day(Day(2020, 1))
+        spans = {e["name"]: e for e in result.trace if e["ph"] == "X"}
+        self.assertEqual(set(spans), {"2020/01", "input", "load", "parse", "part1", "part2"})
+        day = spans["2020/01"]
+        for name in ("input", "load", "parse", "part1", "part2"):
+            self.assertGreaterEqual(spans[name]["ts"], day["ts"])
+            self.assertLessEqual(spans[name]["ts"] + spans[name]["dur"], day["ts"] + day["dur"])
+
+    def test_days_are_traced_by_their_workers(self):
+        results = [result for _, result in run_days([Day(2020, 1), Day(2020, 2)], jobs=2, trace=True)]
+        pids = set()
+        for result in results:
+            (metadata,) = [e for e in result.trace if e["ph"] == "M"]
+            self.assertEqual(metadata["args"], {"name": "worker"})
+            self.assertIn(str(result.day), {e["name"] for e in result.trace})
+            pids.add(metadata["pid"])
+        self.assertEqual(len(pids), 2)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "trace.json"
+            tracing.write_trace([e for r in results for e in r.trace], path)
+            self.assertEqual(len(json.loads(path.read_text())["traceEvents"]), sum(len(r.trace) for r in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Timelines of runs, written in the Chrome Trace Event format so that they can be opened in Perfetto
+(https://ui.perfetto.dev) or chrome://tracing.
+
+While tracing is enabled, spans are recorded as complete ("X") events on the timeline of the
+process (and thread) recording them: the runner records a span for every day, and nested within
+it, one for loading its input, one for loading its solution module and one for every phase. When
+days run on a pool of worker processes, every worker records the spans of the day it runs, which
+are handed back to the parent along with the day's result, so that the timeline shows how days and
+phases of different workers overlap.
+
+Solutions may record nested spans of their own around steps worth seeing on the timeline:
+    with tracing.span("re-simulate", location=loc):
+        ...
+Spans cost next to nothing while tracing is disabled, which it is unless a run is traced.
+
+Timestamps are read from `time.perf_counter_ns`, a system-wide monotonic clock, so that spans of
+different processes line up.
+"""
+from contextlib import nullcontext
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Iterable, Optional
+
+# Events recorded by this process, `None` while tracing is disabled.
+_events: Optional[list[dict[str, Any]]] = None
+
+_DISABLED_SPAN = nullcontext()
+
+
+class _Span:
+    def __init__(self, name: str, category: str, args: dict[str, Any]):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info) -> None:
+        end = time.perf_counter_ns()
+        if _events is None:
+            return
+        event = {
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": self.start / 1000,
+            "dur": (end - self.start) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+        }
+        if self.args:
+            event["args"] = self.args
+        _events.append(event)
+
+
+def enable(process_name: str) -> None:
+    """
+    Starts recording spans in this process, whose timeline is labeled `process_name`.
+    """
+    global _events
+    _events = [{"name": "process_name", "ph": "M", "pid": os.getpid(), "args": {"name": process_name}}]
+
+
+def enabled() -> bool:
+    return _events is not None
+
+
+def collect() -> list[dict[str, Any]]:
+    """
+    Returns the events recorded so far by this process and forgets them, tracing remaining enabled.
+    """
+    global _events
+    if _events is None:
+        return []
+
+    events, _events = _events, []
+    return events
+
+
+def disable() -> list[dict[str, Any]]:
+    """
+    Stops recording spans, returning the events recorded and not collected yet.
+    """
+    global _events
+    events = collect()
+    _events = None
+    return events
+
+
+def span(name: str, category: str = "solution", **args: Any):
+    """
+    Returns a context manager recording a span named `name` over its `with` block, with `args`
+    shown along with it on the timeline. Arguments must be JSON serializable.
+    """
+    if _events is None:
+        return _DISABLED_SPAN
+    return _Span(name, category, args)
+
+
+def write_trace(events: Iterable[dict[str, Any]], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"traceEvents": list(events), "displayTimeUnit": "ms"}))
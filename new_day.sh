@@ -30,19 +30,63 @@ then
     exit 1
 fi
 
+DAY_DIR="${YEAR}/$(printf '%02d' "$((10#${DAY}))")"
+if [ -e "${DAY_DIR}" ]
+then
+    echo "'${DAY_DIR}' already exists"
+    exit 1
+fi
+
 echo "Preparing env for AoC ${YEAR} day ${DAY}"
 
 git checkout -b aoc-${YEAR}-day-${DAY}
-if [ ! -d "${YEAR}" ]
-then
-    mkdir "${YEAR}"
-fi
-mkdir "${YEAR}/${DAY}"
-touch "${YEAR}/${DAY}/input.txt"
-touch "${YEAR}/${DAY}/solution.py"
+mkdir -p "${DAY_DIR}"
+touch "${DAY_DIR}/input.txt"
+touch "${DAY_DIR}/sample.txt"
+
+cat > "${DAY_DIR}/solution.py" << SOLUTION
+def parse(text: str) -> list[str]:
+    return text.splitlines()
+
+
+# Part 1
+def part1(lines: list[str]):
+    return None
+
+
+# Part 2
+def part2(lines: list[str]):
+    return None
+
+
+if __name__ == "__main__":
+    from aoc.cli import main
+
+    raise SystemExit(main(["run", "${YEAR}", "${DAY}"]))
+SOLUTION
+
+cat > "${DAY_DIR}/generator.py" << 'GENERATOR'
+"""
+Synthetic inputs for benchmarks and scaling runs (see `aoc.generators`).
+
+This stub repeats the sample input, which is only valid for puzzles whose input is a list of
+independent lines. Replace it with a generator of inputs that look like real ones.
+"""
+from pathlib import Path
+import random
+
+from aoc.generators import scaled
+
+SAMPLE_PATH = Path(__file__).with_name("sample.txt")
+
+
+def generate(rng: random.Random, scale: float) -> str:
+    return SAMPLE_PATH.read_text() * scaled(1, scale)
+GENERATOR
 
 echo "You env for AoC ${YEAR} day ${DAY} is ready"
-echo "Paste your puzzle input into: '${YEAR}/${DAY}/input.txt'"
-echo "Write your solution to the puzzle in:  '${YEAR}/${DAY}/solution.py'"
-echo "To run your solution execute: 'python ${YEAR}/${DAY}/solution.py'"
+echo "Paste your puzzle input into: '${DAY_DIR}/input.txt' and its example into '${DAY_DIR}/sample.txt'"
+echo "Write your solution to the puzzle in:  '${DAY_DIR}/solution.py'"
+echo "To run your solution execute: 'python -m aoc run ${YEAR} ${DAY}' (add '--sample' to run on the example) or 'PYTHONPATH=. python ${DAY_DIR}/solution.py'"
+echo "To benchmark it execute: 'python -m aoc bench ${YEAR}/${DAY}' or 'python -m aoc scaling ${YEAR}/${DAY}'"
 echo "Time is ticking.... Goodluck!"